@@ -339,6 +339,83 @@ KEY_ASPECTS: Dict[str, Type[_Aspect]] = {{
     schema_class_file.write_text("\n".join(schema_classes_lines))
 
 
+_lazy_schema_types = """
+import threading
+
+_SCHEMA_FILE = os.path.join(os.path.dirname(__file__), "schema.avsc")
+_SCHEMAS_LOCK = threading.Lock()
+
+
+def _load_schemas() -> Dict[str, RecordSchema]:
+    # Parsing the merged schema is by far the most expensive part of importing
+    # this module, so we defer it until a schema is actually needed.
+    with _SCHEMAS_LOCK:
+        if not __SCHEMAS:
+            names, _ = __get_names_and_schema(__read_file(_SCHEMA_FILE))
+            # Fill the dict in a single update, since get_schema_type reads it without the lock.
+            __SCHEMAS.update(dict((n.fullname.lstrip("."), n) for n in six.itervalues(names.names)))
+    return __SCHEMAS
+
+
+def get_schema_type(fullname: str) -> RecordSchema:
+    return (__SCHEMAS or _load_schemas())[fullname]
+
+
+class _LazyRecordSchema:
+    # Stands in for RECORD_SCHEMA until it is first accessed, at which point
+    # the real schema replaces it on the class.
+
+    def __init__(self, fullname: str) -> None:
+        self.fullname = fullname
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> RecordSchema:
+        schema = get_schema_type(self.fullname)
+        setattr(self.owner, self.name, schema)
+        return schema
+"""
+
+
+def make_schema_loading_lazy(schema_class_file: Path) -> None:
+    """
+    Rewrites the avrogen output so that the merged avro schema is only parsed
+    the first time a RECORD_SCHEMA is accessed, rather than at import time.
+    """
+
+    contents = schema_class_file.read_text()
+
+    # Drop the eager parsing of the merged schema.
+    contents, num_eager = re.subn(
+        r"^(_SCHEMA_JSON_STR = __read_file\(.*\)|__NAMES, _SCHEMA = .*)$\n",
+        "",
+        contents,
+        flags=re.MULTILINE,
+    )
+    assert num_eager == 2
+
+    # Replace get_schema_type() and the __SCHEMAS initialization that follows it.
+    contents, num_getters = re.subn(
+        r"^def get_schema_type\(.*?^__SCHEMAS = dict\(.*?\)$",
+        _lazy_schema_types.strip(),
+        contents,
+        flags=re.MULTILINE | re.DOTALL,
+    )
+    assert num_getters == 1
+
+    contents, num_records = re.subn(
+        r'^(\s+)RECORD_SCHEMA = get_schema_type\(("[\w.]+")\)$',
+        r"\1RECORD_SCHEMA = _LazyRecordSchema(\2)",
+        contents,
+        flags=re.MULTILINE,
+    )
+    assert num_records > 0
+
+    schema_class_file.write_text(contents)
+
+
 def write_urn_classes(key_aspects: List[dict], urn_dir: Path) -> None:
     urn_dir.mkdir()
 
@@ -757,6 +834,7 @@ def generate(
         list(aspects.values()),
         Path(outdir) / "schema_classes.py",
     )
+    make_schema_loading_lazy(Path(outdir) / "schema_classes.py")
 
     if enable_custom_loader:
         # Move schema_classes.py -> _schema_classes.py
@@ -777,7 +855,7 @@ from datahub.utilities._custom_package_loader import get_custom_models_package
 
 _custom_package_path = get_custom_models_package()
 
-if TYPE_CHECKING or not _custom_package_path:
+if TYPE_CHECKING or (not _custom_package_path and IS_SPHINX_BUILD):
     from ._schema_classes import *
 
     # Required explicitly because __all__ doesn't include _ prefixed names.
@@ -789,6 +867,45 @@ if TYPE_CHECKING or not _custom_package_path:
         for _cls in list(globals().values()):
             if hasattr(_cls, "__module__") and "datahub.metadata._schema_classes" in _cls.__module__:
                 _cls.__module__ = __name__
+elif not _custom_package_path:
+    # The generated classes are only loaded when one of them is first accessed (PEP 562),
+    # so that importing this module is cheap for code paths that never touch them.
+
+    def _load_schema_classes():
+        _schema_classes = importlib.import_module("._schema_classes", __package__)
+        globals().update(
+            {
+                name: value
+                for name, value in vars(_schema_classes).items()
+                if not name.startswith("_") or name == "__SCHEMA_TYPES"
+            }
+        )
+        return _schema_classes
+
+    def __getattr__(name: str):
+        if name == "__all__":
+            # Keeps `from datahub.metadata.schema_classes import *` working. The generated
+            # classes and aspect maps are exported, not the helpers they are built from.
+            _schema_classes = _load_schema_classes()
+            globals()["__all__"] = [
+                cls_name
+                for cls_name, cls in vars(_schema_classes).items()
+                if not cls_name.startswith("_")
+                and isinstance(cls, type)
+                and cls.__module__ == _schema_classes.__name__
+            ] + ["ASPECT_CLASSES", "ASPECT_NAME_MAP", "KEY_ASPECTS"]
+            return globals()["__all__"]
+        if name.startswith("__") and name != "__SCHEMA_TYPES":
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        _load_schema_classes()
+        try:
+            return globals()[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    def __dir__():
+        _load_schema_classes()
+        return list(globals().keys())
 else:
     _custom_package = importlib.import_module(_custom_package_path)
     globals().update(_custom_package.__dict__)
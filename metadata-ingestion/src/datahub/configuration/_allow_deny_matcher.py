@@ -0,0 +1,150 @@
+import functools
+import re
+from typing import Callable, List, Optional, Pattern, Sequence, Tuple
+
+# Results of AllowDenyPattern.allowed are memoized per matcher, up to this many names.
+_ALLOWED_CACHE_SIZE = 100_000
+
+# Patterns that use these constructs can't be safely merged into a single regex:
+# backreferences are numbered across the whole expression, and inline global flags
+# either fail to compile (Python 3.11+) or leak into every other alternative.
+_UNMERGEABLE_REGEX = re.compile(r"\\\d|\(\?P=|\(\?[aiLmsux]+\)")
+
+# Constructs that can inspect characters after the end of a match. A pattern that
+# matches a string and has none of these also matches every extension of it.
+_LOOKAHEAD_TOKENS = ("$", "\\Z", "\\b", "\\B", "(?=", "(?!")
+
+_LITERAL_HEAD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-"
+)
+
+_Matcher = Callable[[str], bool]
+
+
+def _compile_union(patterns: Sequence[str], flags: int) -> Optional[_Matcher]:
+    if not patterns:
+        return None
+
+    # Compile each pattern on its own first, so that invalid patterns raise
+    # exactly as they would have when matched one at a time.
+    compiled = [re.compile(pattern, flags) for pattern in patterns]
+    if len(compiled) == 1:
+        single = compiled[0]
+        return lambda string: single.match(string) is not None
+
+    if not any(_UNMERGEABLE_REGEX.search(pattern) for pattern in patterns):
+        try:
+            merged = re.compile(
+                "|".join(f"(?:{pattern})" for pattern in patterns), flags
+            )
+        except re.error:
+            pass
+        else:
+            return lambda string: merged.match(string) is not None
+
+    return lambda string: any(regex.match(string) for regex in compiled)
+
+
+def _literal_head(pattern: str) -> Optional[List[Optional[str]]]:
+    """
+    Returns the characters that every match of the pattern must start with, where
+    None stands for "any character". Returns None if the pattern is too complex to
+    analyze, which callers must treat as "could match anything".
+    """
+
+    if "|" in pattern or "(?" in pattern:
+        return None
+
+    head: List[Optional[str]] = []
+    i = 1 if pattern.startswith("^") else 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char in "*?{":
+            # The previous token is optional, so it can't be part of the head.
+            if head:
+                head.pop()
+            break
+        elif char == "+":
+            break
+        elif char == ".":
+            head.append(None)
+            i += 1
+        elif char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            head.append(pattern[i + 1])
+            i += 2
+        elif char in _LITERAL_HEAD_CHARS:
+            head.append(char)
+            i += 1
+        else:
+            break
+    return head
+
+
+def _chars_compatible(expected: str, actual: str, ignore_case: bool) -> bool:
+    if expected == actual:
+        return True
+    if ignore_case:
+        # Unicode case folding in `re` is more involved than str.lower, so we
+        # only rule out mismatches between ASCII characters.
+        if not expected.isascii() or not actual.isascii():
+            return True
+        return expected.lower() == actual.lower()
+    return False
+
+
+class AllowDenyMatcher:
+    """
+    A compiled form of an AllowDenyPattern.
+
+    All allow (and all deny) regexes are merged into a single alternation, so that
+    a lookup does one regex match per list instead of one per pattern. Lookups are
+    memoized. Instances are shared between equal patterns via `get_matcher`.
+    """
+
+    def __init__(self, allow: Tuple[str, ...], deny: Tuple[str, ...], flags: int):
+        self._allow_patterns = allow
+        self._deny_patterns = deny
+        self._flags = flags
+
+        self._allow = _compile_union(allow, flags)
+        self._deny = _compile_union(deny, flags)
+
+        self._monotone_deny: List[Pattern] = [
+            re.compile(pattern, flags)
+            for pattern in deny
+            if not any(token in pattern for token in _LOOKAHEAD_TOKENS)
+        ]
+        self._allow_heads = [_literal_head(pattern) for pattern in allow]
+
+        self.allowed: _Matcher = functools.lru_cache(maxsize=_ALLOWED_CACHE_SIZE)(
+            self._allowed
+        )
+
+    def _allowed(self, string: str) -> bool:
+        if self._deny is not None and self._deny(string):
+            return False
+        return self._allow is not None and self._allow(string)
+
+    def may_allow_prefix(self, prefix: str) -> bool:
+        # A deny pattern without lookahead-style assertions that matches the prefix
+        # also matches every string that starts with it.
+        if any(regex.match(prefix) for regex in self._monotone_deny):
+            return False
+
+        ignore_case = bool(self._flags & re.IGNORECASE)
+        for head in self._allow_heads:
+            if head is None:
+                return True
+            if all(
+                expected is None or _chars_compatible(expected, actual, ignore_case)
+                for expected, actual in zip(head, prefix)
+            ):
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def get_matcher(
+    allow: Tuple[str, ...], deny: Tuple[str, ...], flags: int
+) -> AllowDenyMatcher:
+    return AllowDenyMatcher(allow, deny, flags)
@@ -10,6 +10,7 @@ from pydantic import BaseModel, Extra, ValidationError
 from pydantic.fields import Field
 from typing_extensions import Protocol, runtime_checkable
 
+from datahub.configuration._allow_deny_matcher import AllowDenyMatcher, get_matcher
 from datahub.configuration._config_enum import ConfigEnum
 from datahub.configuration.pydantic_migration_helpers import PYDANTIC_VERSION_2
 from datahub.utilities.dedup_list import deduplicate_list
@@ -242,15 +243,22 @@ class AllowDenyPattern(ConfigModel):
     def allow_all(cls) -> "AllowDenyPattern":
         return AllowDenyPattern()
 
+    def _matcher(self) -> AllowDenyMatcher:
+        # Keyed on the pattern contents rather than cached on the instance, so that
+        # in-place edits to allow/deny are picked up and equality is unaffected.
+        return get_matcher(tuple(self.allow), tuple(self.deny), self.regex_flags)
+
     def allowed(self, string: str) -> bool:
-        for deny_pattern in self.deny:
-            if re.match(deny_pattern, string, self.regex_flags):
-                return False
+        return self._matcher().allowed(string)
 
-        return any(
-            re.match(allow_pattern, string, self.regex_flags)
-            for allow_pattern in self.allow
-        )
+    def may_allow_prefix(self, prefix: str) -> bool:
+        """
+        Returns False only if no string starting with `prefix` can be allowed.
+        This is conservative: a True result doesn't guarantee that any such string
+        is allowed. Sources use this to skip listing the contents of a container
+        (e.g. a schema) whose entities would all be filtered out.
+        """
+        return self._matcher().may_allow_prefix(prefix)
 
     def is_fully_specified_allow_list(self) -> bool:
         """
@@ -0,0 +1,367 @@
+"""Single-pass serialization of codegen classes into their JSON representations.
+
+The default path for emitting an aspect is `pre_json_transform(obj.to_obj())`, which
+validates the whole object against its avro schema, converts it into a dict, and
+then walks the dict a second time to rewrite union keys into the rest.li format.
+The serializers in this module are compiled once per avro schema, and produce the
+same output as the default path in a single walk over the object. Any value that
+does not take the common path (e.g. ambiguous unions or invalid data) is handed
+back to avrogen's converter, so behavior and error handling are unchanged.
+
+Setting the `DATAHUB_EMITTER_USE_ORJSON` environment variable switches `json_dumps`
+over to orjson, if it is installed.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from avro import schema as avro_schema
+from avrogen import avrojson
+from avrogen.dict_wrapper import DictWrapper
+
+from datahub.cli.env_utils import get_boolean_env_variable
+from datahub.emitter.serialization_helper import pre_json_transform
+
+logger = logging.getLogger(__name__)
+
+_RESTLI_FROM_PATTERN = "com.linkedin.pegasus2avro."
+_RESTLI_TO_PATTERN = "com.linkedin."
+_FIELD_DISCRIMINATOR = "fieldDiscriminator"
+
+_Converter = Callable[[Any], Any]
+_MISSING = object()
+
+
+def _get_orjson() -> Optional[Any]:
+    if not get_boolean_env_variable("DATAHUB_EMITTER_USE_ORJSON"):
+        return None
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        logger.warning(
+            "DATAHUB_EMITTER_USE_ORJSON is set, but orjson is not installed. "
+            "Falling back to the standard json module."
+        )
+        return None
+
+
+_orjson = _get_orjson()
+
+
+def json_dumps(obj: Any) -> str:
+    """Serializes an already-converted object to a JSON string."""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+class _SchemaSerializer:
+    def __init__(self, restli: bool, tuples: bool) -> None:
+        assert not (restli and tuples), "rest.li output never uses tuple unions"
+        self.restli = restli
+        self.tuples = tuples
+
+        self._lock = threading.Lock()
+        # Record converters by schema fullname. These are only read or written
+        # while holding the lock, since they may be partially built.
+        self._records: Dict[str, _Converter] = {}
+        self._by_class: Dict[type, _Converter] = {}
+
+    def _avro_converter(self) -> avrojson.AvroJsonConverter:
+        return avrojson.get_global_json_converter(self.tuples)
+
+    def _slow_path(
+        self, datum: Any, schema: avro_schema.Schema, within_array: bool
+    ) -> Any:
+        converter = self._avro_converter()
+        if not converter.validate(schema, datum):
+            raise avrojson.AvroTypeException(schema, datum)
+        result = converter._generic_to_json(
+            datum, schema, was_within_array=within_array
+        )
+        if self.restli:
+            result = pre_json_transform(result)
+        return result
+
+    def serialize(self, obj: DictWrapper) -> Any:
+        converter = self._by_class.get(type(obj))
+        if converter is None:
+            if self._avro_converter().use_logical_types:
+                # We don't replicate the logical type conversions.
+                converter = self._make_full_slow_path(type(obj).RECORD_SCHEMA)
+            else:
+                with self._lock:
+                    converter = self._compile(type(obj).RECORD_SCHEMA, False)
+            self._by_class[type(obj)] = converter
+        return converter(obj)
+
+    def _make_full_slow_path(self, schema: avro_schema.Schema) -> _Converter:
+        return lambda datum: self._slow_path(datum, schema, False)
+
+    def _compile(self, schema: avro_schema.Schema, within_array: bool) -> _Converter:
+        schema_type = schema.type
+        if schema_type in ("record", "error", "request"):
+            return self._compile_record(schema)
+        elif schema_type in ("union", "error_union"):
+            return self._compile_union(schema, within_array)
+        elif schema_type == "array":
+            return self._compile_array(schema)
+        elif schema_type == "map":
+            return self._compile_map(schema, within_array)
+        elif schema_type == "enum":
+            return self._compile_enum(schema, within_array)
+        elif schema_type in avrojson._PRIMITIVE_TYPES:
+            return self._compile_primitive(schema, within_array)
+        else:
+            return lambda datum: self._slow_path(datum, schema, within_array)
+
+    def _compile_primitive(
+        self, schema: avro_schema.Schema, within_array: bool
+    ) -> _Converter:
+        slow_path = self._slow_path
+        schema_type = schema.type
+
+        if schema_type == "null":
+
+            def _null(datum: Any) -> Any:
+                if datum is None:
+                    return None
+                return slow_path(datum, schema, within_array)
+
+            return _null
+
+        elif schema_type == "string":
+
+            def _string(datum: Any) -> Any:
+                if isinstance(datum, str):
+                    return datum
+                return slow_path(datum, schema, within_array)
+
+            return _string
+
+        elif schema_type == "bytes":
+            tuples = self.tuples
+
+            def _bytes(datum: Any) -> Any:
+                if isinstance(datum, bytes):
+                    return datum if tuples else datum.decode()
+                elif isinstance(datum, str) and not tuples:
+                    return datum
+                return slow_path(datum, schema, within_array)
+
+            return _bytes
+
+        else:
+            validate = schema.validate
+
+            def _primitive(datum: Any) -> Any:
+                if validate(datum) is not None:
+                    return datum
+                return slow_path(datum, schema, within_array)
+
+            return _primitive
+
+    def _compile_enum(
+        self, schema: avro_schema.EnumSchema, within_array: bool
+    ) -> _Converter:
+        symbols = set(schema.symbols)
+        slow_path = self._slow_path
+
+        def _enum(datum: Any) -> Any:
+            if isinstance(datum, str) and datum in symbols:
+                return datum
+            return slow_path(datum, schema, within_array)
+
+        return _enum
+
+    def _compile_array(self, schema: avro_schema.ArraySchema) -> _Converter:
+        items = self._compile(schema.items, True)
+        slow_path = self._slow_path
+
+        def _array(datum: Any) -> Any:
+            if isinstance(datum, list):
+                return [items(item) for item in datum]
+            return slow_path(datum, schema, False)
+
+        return _array
+
+    def _compile_map(
+        self, schema: avro_schema.MapSchema, within_array: bool
+    ) -> _Converter:
+        values = self._compile(schema.values, False)
+        slow_path = self._slow_path
+        restli = self.restli
+
+        def _map(datum: Any) -> Any:
+            if not isinstance(datum, dict) or (
+                # pre_json_transform treats single-key dicts and dicts with a
+                # field discriminator specially, so we leave those to it.
+                restli
+                and (
+                    _FIELD_DISCRIMINATOR in datum
+                    or (
+                        len(datum) == 1
+                        and str(next(iter(datum))).startswith(_RESTLI_FROM_PATTERN)
+                    )
+                )
+            ):
+                return slow_path(datum, schema, within_array)
+
+            result = {}
+            for key, value in datum.items():
+                if not isinstance(key, str):
+                    return slow_path(datum, schema, within_array)
+                converted = values(value)
+                if converted is None and restli:
+                    continue
+                result[key] = converted
+            return result
+
+        return _map
+
+    def _compile_record(self, schema: avro_schema.RecordSchema) -> _Converter:
+        fullname = schema.fullname
+        if fullname in self._records:
+            return self._records[fullname]
+
+        avro_converter = self._avro_converter()
+        slow_path = self._slow_path
+        restli = self.restli
+        has_field_discriminator = restli and any(
+            field.name == _FIELD_DISCRIMINATOR for field in schema.fields
+        )
+        accepted_classes: Set[type] = set()
+        # (name, converter, has_default, default)
+        fields: List[Tuple[str, _Converter, bool, Any]] = []
+
+        def _record(datum: Any) -> Any:
+            datum_class = type(datum)
+            if datum_class not in accepted_classes:
+                datum_schema = getattr(datum_class, "RECORD_SCHEMA", None)
+                if (
+                    isinstance(datum, DictWrapper)
+                    and datum_schema is not None
+                    and datum_schema.fullname == fullname
+                ):
+                    accepted_classes.add(datum_class)
+                else:
+                    return slow_path(datum, schema, False)
+
+            inner = datum._inner_dict
+            result = {}
+            for name, converter, has_default, default in fields:
+                if has_default:
+                    value = inner.get(name, _MISSING)
+                    if value is _MISSING:
+                        value = default
+                    if value is None and default is None:
+                        continue
+                else:
+                    value = inner.get(name)
+
+                converted = converter(value)
+                if converted is None and restli:
+                    continue
+                result[name] = converted
+
+            if has_field_discriminator and _FIELD_DISCRIMINATOR in result:
+                # Unions with aliases are represented without the discriminator
+                # in rest.li. See serialization_helper for details.
+                field = result[_FIELD_DISCRIMINATOR]
+                return {field: result.get(field)}
+            return result
+
+        # Register before compiling the fields, in case the schema is recursive.
+        self._records[fullname] = _record
+        for field in schema.fields:
+            default = (
+                avro_converter.from_json_object(field.default, field.type)
+                if field.has_default
+                else None
+            )
+            fields.append(
+                (
+                    field.name,
+                    self._compile(field.type, False),
+                    field.has_default,
+                    default,
+                )
+            )
+        return _record
+
+    def _compile_union(
+        self, schema: avro_schema.UnionSchema, within_array: bool
+    ) -> _Converter:
+        avro_converter = self._avro_converter()
+        slow_path = self._slow_path
+        tuples = self.tuples
+
+        def _branch_name(branch: avro_schema.Schema) -> str:
+            name = avro_converter._fullname(branch)
+            if self.restli and name.startswith(_RESTLI_FROM_PATTERN):
+                name = name.replace(_RESTLI_FROM_PATTERN, _RESTLI_TO_PATTERN, 1)
+            return name
+
+        wrap = (
+            tuples or within_array or not avro_converter._is_unambiguous_union(schema)
+        )
+        allows_null = any(branch.type == "null" for branch in schema.schemas)
+        record_branches: Dict[str, Tuple[str, _Converter]] = {}
+        other_branches: List[Tuple[str, _Converter]] = []
+        for branch in schema.schemas:
+            if branch.type == "null":
+                continue
+            branch_converter = self._compile(branch, False)
+            if branch.type in ("record", "error", "request"):
+                record_branches[branch.fullname] = (
+                    _branch_name(branch),
+                    branch_converter,
+                )
+            other_branches.append((_branch_name(branch), branch_converter))
+        single_branch = other_branches[0] if len(other_branches) == 1 else None
+
+        def _union(datum: Any) -> Any:
+            if datum is None:
+                if allows_null:
+                    return None
+                return slow_path(datum, schema, within_array)
+
+            datum_schema = getattr(type(datum), "RECORD_SCHEMA", None)
+            if datum_schema is not None:
+                branch = record_branches.get(datum_schema.fullname)
+            else:
+                branch = single_branch
+            if branch is None:
+                # Picking a branch requires validating against each candidate.
+                return slow_path(datum, schema, within_array)
+
+            branch_name, branch_converter = branch
+            converted = branch_converter(datum)
+            if not wrap:
+                return converted
+            elif tuples:
+                return (branch_name, converted)
+            return {branch_name: converted}
+
+        return _union
+
+
+_restli_serializer = _SchemaSerializer(restli=True, tuples=False)
+_avro_json_serializer = _SchemaSerializer(restli=False, tuples=False)
+_avro_tuples_serializer = _SchemaSerializer(restli=False, tuples=True)
+
+
+def to_restli_obj(obj: DictWrapper) -> Any:
+    """Equivalent to `pre_json_transform(obj.to_obj())`."""
+    return _restli_serializer.serialize(obj)
+
+
+def to_avro_obj(obj: DictWrapper, tuples: bool = False) -> Any:
+    """Equivalent to `obj.to_obj(tuples=tuples)`."""
+    if tuples:
+        return _avro_tuples_serializer.serialize(obj)
+    return _avro_json_serializer.serialize(obj)
@@ -10,6 +10,7 @@ from confluent_kafka.serialization import SerializationContext, StringSerializer
 from datahub.configuration.common import ConfigModel
 from datahub.configuration.kafka import KafkaProducerConnectionConfig
 from datahub.configuration.validate_field_rename import pydantic_renamed_field
+from datahub.emitter.fast_serialization import to_avro_obj
 from datahub.emitter.generic_emitter import Emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.closeable import Closeable
@@ -68,7 +69,7 @@ class DatahubKafkaEmitter(Closeable, Emitter):
         def convert_mce_to_dict(
             mce: MetadataChangeEvent, ctx: SerializationContext
         ) -> dict:
-            return mce.to_obj(tuples=True)
+            return to_avro_obj(mce, tuples=True)
 
         mce_avro_serializer = AvroSerializer(
             schema_str=getMetadataChangeEventSchema(),
@@ -80,7 +81,9 @@ class DatahubKafkaEmitter(Closeable, Emitter):
             mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper],
             ctx: SerializationContext,
         ) -> dict:
-            return mcp.to_obj(tuples=True)
+            if isinstance(mcp, MetadataChangeProposalWrapper):
+                return mcp.to_obj(tuples=True)
+            return to_avro_obj(mcp, tuples=True)
 
         mcp_avro_serializer = AvroSerializer(
             schema_str=getMetadataChangeProposalSchema(),
@@ -3,7 +3,8 @@ import json
 from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
 
 from datahub.emitter.aspect import ASPECT_MAP, JSON_CONTENT_TYPE
-from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.emitter.fast_serialization import json_dumps, to_avro_obj, to_restli_obj
+from datahub.emitter.serialization_helper import post_json_transform
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
     DictWrapper,
@@ -23,7 +24,7 @@ _ENTITY_TYPE_UNSET = "ENTITY_TYPE_UNSET"
 
 
 def _make_generic_aspect(codegen_obj: DictWrapper) -> GenericAspectClass:
-    serialized = json.dumps(pre_json_transform(codegen_obj.to_obj()))
+    serialized = json_dumps(to_restli_obj(codegen_obj))
     return GenericAspectClass(
         value=serialized.encode(),
         contentType=JSON_CONTENT_TYPE,
@@ -149,15 +150,20 @@ class MetadataChangeProposalWrapper:
         # not contain nested JSON strings. Instead, it unpacks the JSON
         # string into an object.
 
-        obj = self.make_mcp().to_obj(tuples=tuples)
-        if simplified_structure:
-            # Undo the double JSON serialization that happens in the MCP aspect.
-            if (
-                obj.get("aspect")
-                and obj["aspect"].get("contentType") == JSON_CONTENT_TYPE
-            ):
-                obj["aspect"] = {"json": json.loads(obj["aspect"]["value"])}
-        return obj
+        if simplified_structure and self.aspect is not None:
+            # Skip the double JSON serialization that happens in the MCP aspect,
+            # instead of serializing the aspect only to parse it again.
+            mcp = self._make_mcp_without_aspects()
+            if isinstance(self.entityKeyAspect, DictWrapper):
+                mcp.entityKeyAspect = _make_generic_aspect(self.entityKeyAspect)
+            # The placeholder keeps the aspect in the same position within the dict.
+            mcp.aspect = GenericAspectClass(value=b"", contentType=JSON_CONTENT_TYPE)
+
+            obj = to_avro_obj(mcp, tuples=tuples)
+            obj["aspect"] = {"json": to_restli_obj(self.aspect)}
+            return obj
+
+        return to_avro_obj(self.make_mcp(), tuples=tuples)
 
     @classmethod
     def from_obj(
@@ -3,7 +3,16 @@ import json
 import logging
 import os
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import requests
 from deprecated import deprecated
@@ -12,6 +21,7 @@ from requests.exceptions import HTTPError, RequestException
 
 from datahub.cli.cli_utils import get_system_auth
 from datahub.configuration.common import ConfigurationError, OperationalError
+from datahub.emitter.fast_serialization import json_dumps, to_restli_obj
 from datahub.emitter.generic_emitter import Emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.request_helper import make_curl_command
@@ -44,6 +54,38 @@ _DEFAULT_RETRY_MAX_TIMES = int(
     os.getenv("DATAHUB_REST_EMITTER_DEFAULT_RETRY_MAX_TIMES", "4")
 )
 
+# The max payload size for a single ingestProposalBatch request. The server's
+# default limit is 16MB, so we leave a bit of headroom for the envelope.
+_MAX_BATCH_INGEST_PAYLOAD_SIZE = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_SIZE", 15 * 1024 * 1024)
+)
+# The max number of proposals in a single ingestProposalBatch request.
+BATCH_INGEST_MAX_PAYLOAD_LENGTH = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_LENGTH", 200)
+)
+# Older servers don't have the ingestProposalBatch action. Depending on the
+# version, rest.li responds with either a 404 or a 400 for unknown actions.
+_BATCH_INGEST_UNSUPPORTED_STATUS_CODES = {400, 404, 405}
+
+
+class BatchEmitError(OperationalError):
+    """Raised by emit_mcps when a request fails.
+
+    The first num_emitted MCPs were written by the num_requests requests that
+    succeeded before the failure, and the rest were not written.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        info: Optional[dict],
+        num_emitted: int,
+        num_requests: int,
+    ):
+        super().__init__(message, info)
+        self.num_emitted = num_emitted
+        self.num_requests = num_requests
+
 
 class DataHubRestEmitter(Closeable, Emitter):
     _gms_server: str
@@ -76,6 +118,9 @@ class DataHubRestEmitter(Closeable, Emitter):
         self._token = token
         self.server_config: Dict[str, Any] = {}
 
+        # None means that we haven't tried a batch request against this server yet.
+        self.batch_ingest_supported: Optional[bool] = None
+
         self._session = requests.Session()
 
         self._session.headers.update(
@@ -223,8 +268,7 @@ class DataHubRestEmitter(Closeable, Emitter):
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
 
-        raw_mce_obj = mce.proposedSnapshot.to_obj()
-        mce_obj = pre_json_transform(raw_mce_obj)
+        mce_obj = to_restli_obj(mce.proposedSnapshot)
         snapshot_fqn = (
             f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
         )
@@ -238,7 +282,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             "entity": {"value": {snapshot_fqn: mce_obj}},
             "systemMetadata": system_metadata_obj,
         }
-        payload = json.dumps(snapshot)
+        payload = json_dumps(snapshot)
 
         self._emit_generic(url, payload)
 
@@ -247,11 +291,97 @@ class DataHubRestEmitter(Closeable, Emitter):
     ) -> None:
         url = f"{self._gms_server}/aspects?action=ingestProposal"
 
-        mcp_obj = pre_json_transform(mcp.to_obj())
-        payload = json.dumps({"proposal": mcp_obj})
+        mcp_obj = _mcp_to_restli_obj(mcp)
+        payload = json_dumps({"proposal": mcp_obj})
 
         self._emit_generic(url, payload)
 
+    def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+    ) -> int:
+        """Emit a list of MCPs using the ingestProposalBatch endpoint.
+
+        The MCPs are split into chunks that respect both the max number of
+        proposals and the max payload size per request. If the server does not
+        support batch ingestion, this falls back to emitting each MCP individually.
+
+        Returns:
+            The number of HTTP requests that were made.
+
+        Raises:
+            BatchEmitError: If a request fails. The error records how many of the
+                MCPs were written by the requests before it.
+        """
+
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        if self.batch_ingest_supported is False:
+            return self._emit_mcps_individually(mcps, num_emitted=0, num_requests=0)
+
+        mcp_objs = [_mcp_to_restli_obj(mcp) for mcp in mcps]
+
+        # Split into chunks, respecting both the size and length limits.
+        chunks: List[List[str]] = []
+        current_chunk: List[str] = []
+        current_chunk_size = 0
+        for mcp_obj in mcp_objs:
+            mcp_payload = json_dumps(mcp_obj)
+            # The +2 accounts for the comma and space separating proposals.
+            mcp_size = len(mcp_payload) + 2
+            if current_chunk and (
+                len(current_chunk) >= BATCH_INGEST_MAX_PAYLOAD_LENGTH
+                or current_chunk_size + mcp_size > _MAX_BATCH_INGEST_PAYLOAD_SIZE
+            ):
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_chunk_size = 0
+            current_chunk.append(mcp_payload)
+            current_chunk_size += mcp_size
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        requests_made = 0
+        emitted = 0
+        for chunk in chunks:
+            payload = '{"proposals": [' + ", ".join(chunk) + "]}"
+            try:
+                self._emit_generic(url, payload)
+            except OperationalError as e:
+                if self.batch_ingest_supported is None and _is_batch_unsupported(e):
+                    logger.info(
+                        "The DataHub server does not support batch ingestion; "
+                        "falling back to emitting MCPs individually"
+                    )
+                    self.batch_ingest_supported = False
+                    return self._emit_mcps_individually(
+                        mcps, num_emitted=emitted, num_requests=requests_made
+                    )
+                raise BatchEmitError(e.message, e.info, emitted, requests_made) from e
+            self.batch_ingest_supported = True
+            requests_made += 1
+            emitted += len(chunk)
+
+        return requests_made
+
+    def _emit_mcps_individually(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        num_emitted: int,
+        num_requests: int,
+    ) -> int:
+        # Emits the MCPs from num_emitted onwards, one request each.
+        for mcp in mcps[num_emitted:]:
+            try:
+                self.emit_mcp(mcp)
+            except OperationalError as e:
+                raise BatchEmitError(
+                    e.message, e.info, num_emitted, num_requests
+                ) from e
+            num_emitted += 1
+            num_requests += 1
+        return num_requests
+
     @deprecated
     def emit_usage(self, usageStats: UsageAggregation) -> None:
         url = f"{self._gms_server}/usageStats?action=batchIngest"
@@ -309,5 +439,27 @@ class DataHubRestEmitter(Closeable, Emitter):
         self._session.close()
 
 
+def _mcp_to_restli_obj(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> dict:
+    if isinstance(mcp, MetadataChangeProposalWrapper):
+        return to_restli_obj(mcp.make_mcp())
+    return to_restli_obj(mcp)
+
+
+def _is_batch_unsupported(e: OperationalError) -> bool:
+    cause = e.__cause__
+    if not isinstance(cause, HTTPError) or cause.response is None:
+        return False
+    if cause.response.status_code not in _BATCH_INGEST_UNSUPPORTED_STATUS_CODES:
+        return False
+    # A 400 can also be a validation failure, so only treat it as missing support
+    # if the server complained about the action itself.
+    return (
+        cause.response.status_code != 400
+        or "ingestProposalBatch" in cause.response.text
+    )
+
+
 """This class exists as a pass-through for backwards compatibility"""
 DatahubRestEmitter = DataHubRestEmitter
@@ -7,6 +7,7 @@ from typing import Collection, Dict, Iterable, List, Optional, Set
 
 from datahub.emitter.mce_builder import make_schema_field_urn
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import BaseUsageConfig, UsageAggregator
 from datahub.metadata.schema_classes import (
@@ -76,7 +77,7 @@ class LineageEdge:
 
 
 @dataclass
-class SqlParsingBuilder:
+class SqlParsingBuilder(Closeable):
     # Open question: does it make sense to iterate over out_tables? When will we have multiple?
 
     generate_lineage: bool = True
@@ -90,8 +91,9 @@ class SqlParsingBuilder:
         default_factory=FileBackedDict, init=False
     )
 
-    # TODO: Replace with FileBackedDict approach like in BigQuery usage
-    _usage_aggregator: UsageAggregator[DatasetUrn] = field(init=False)
+    _usage_aggregator: Optional[UsageAggregator[DatasetUrn]] = field(
+        default=None, init=False
+    )
 
     def __post_init__(self) -> None:
         if self.usage_config:
@@ -145,7 +147,11 @@ class SqlParsingBuilder:
                     user=user,
                 )
 
-        if self.generate_usage_statistics and query_timestamp is not None:
+        if (
+            self.generate_usage_statistics
+            and self._usage_aggregator is not None
+            and query_timestamp is not None
+        ):
             upstream_fields = compute_upstream_fields(result)
             for upstream_urn in upstreams_to_ingest:
                 self._usage_aggregator.aggregate_event(
@@ -217,10 +223,16 @@ class SqlParsingBuilder:
             )
 
     def _gen_usage_statistics_workunits(self) -> Iterable[MetadataWorkUnit]:
+        assert self._usage_aggregator is not None
         yield from self._usage_aggregator.generate_workunits(
             resource_urn_builder=lambda urn: urn, user_urn_builder=lambda urn: urn
         )
 
+    def close(self) -> None:
+        self._lineage_map.close()
+        if self._usage_aggregator is not None:
+            self._usage_aggregator.close()
+
 
 def _merge_lineage_data(
     downstream_urn: DatasetUrn,
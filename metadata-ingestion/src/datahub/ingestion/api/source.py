@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -24,7 +25,6 @@ from pydantic import BaseModel
 
 from datahub.configuration.common import ConfigModel
 from datahub.configuration.source_common import PlatformInstanceConfigMixin
-from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope, WorkUnit
 from datahub.ingestion.api.report import Report
@@ -39,6 +39,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 from datahub.utilities.type_annotations import get_class_from_annotation
+from datahub.utilities.urns.urn import guess_entity_type
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +75,12 @@ class SourceReport(Report):
     warnings: LossyDict[str, LossyList[str]] = field(default_factory=LossyDict)
     failures: LossyDict[str, LossyList[str]] = field(default_factory=LossyDict)
 
+    # Seconds spent in get_workunits_internal and in each workunit processor,
+    # not counting the time spent waiting on the stages before it.
+    workunit_processor_seconds: Dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
     def report_workunit(self, wu: WorkUnit) -> None:
         self.events_produced += 1
 
@@ -82,14 +89,18 @@ class SourceReport(Report):
 
             # Specialized entity reporting.
             if not isinstance(wu.metadata, MetadataChangeEvent):
-                mcps = [wu.metadata]
+                entityType = wu.metadata.entityType
+                aspectNames = [wu.metadata.aspectName]
             else:
-                mcps = list(mcps_from_mce(wu.metadata))
-
-            for mcp in mcps:
-                entityType = mcp.entityType
-                aspectName = mcp.aspectName
-
+                # Same as the entity type and aspect names of mcps_from_mce, but
+                # without building a MetadataChangeProposalWrapper for every aspect.
+                entityType = guess_entity_type(urn)
+                aspectNames = [
+                    aspect.get_aspect_name()
+                    for aspect in wu.metadata.proposedSnapshot.aspects
+                ]
+
+            for aspectName in aspectNames:
                 if urn not in self._urns_seen:
                     self._urns_seen.add(urn)
                     self.entities[entityType].append(urn)
@@ -240,15 +251,35 @@ class Source(Closeable, metaclass=ABCMeta):
     def _apply_workunit_processors(
         workunit_processors: Sequence[Optional[MetadataWorkUnitProcessor]],
         stream: Iterable[MetadataWorkUnit],
+        report: Optional[SourceReport] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        for processor in workunit_processors:
-            if processor is not None:
-                stream = processor(stream)
+        """Chains the processors onto the stream. If a report is passed, the time
+        spent in each stage is added to report.workunit_processor_seconds."""
+
+        if report is None:
+            for processor in workunit_processors:
+                if processor is not None:
+                    stream = processor(stream)
+            return stream
+
+        processors = [p for p in workunit_processors if p is not None]
+        stages = ["get_workunits_internal", *map(_get_processor_name, processors)]
+        downstream_stages: List[Optional[str]] = [*stages[1:], None]
+
+        stream = _timed_workunit_stage(stream, report, stages[0], downstream_stages[0])
+        for processor, stage, downstream_stage in zip(
+            processors, stages[1:], downstream_stages[1:]
+        ):
+            stream = _timed_workunit_stage(
+                processor(stream), report, stage, downstream_stage
+            )
         return stream
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         return self._apply_workunit_processors(
-            self.get_workunit_processors(), self.get_workunits_internal()
+            self.get_workunit_processors(),
+            self.get_workunits_internal(),
+            self.get_report(),
         )
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
@@ -295,14 +326,43 @@ class Source(Closeable, metaclass=ABCMeta):
         if isinstance(config, PlatformInstanceConfigMixin) and config.platform_instance:
             platform_instance = config.platform_instance
 
-        browse_path_processor = partial(
+        return partial(
             auto_browse_path_v2,
             platform=platform,
             platform_instance=platform_instance,
             drop_dirs=[s for s in browse_path_drop_dirs if s is not None],
             dry_run=dry_run,
         )
-        return lambda stream: browse_path_processor(stream)
+
+
+def _get_processor_name(processor: Callable) -> str:
+    while isinstance(processor, partial):
+        processor = processor.func
+    return getattr(processor, "__qualname__", type(processor).__name__)
+
+
+def _timed_workunit_stage(
+    stream: Iterable[MetadataWorkUnit],
+    report: SourceReport,
+    stage: str,
+    downstream_stage: Optional[str],
+) -> Iterable[MetadataWorkUnit]:
+    # The stages are chained generators, so the time measured by the downstream
+    # stage includes the time spent here. It's subtracted from the downstream
+    # stage, which leaves every stage with just its own time.
+    iterator = iter(stream)
+    while True:
+        start = time.perf_counter()
+        try:
+            wu = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            report.workunit_processor_seconds[stage] += elapsed
+            if downstream_stage is not None:
+                report.workunit_processor_seconds[downstream_stage] -= elapsed
+        yield wu
 
 
 class TestableSource(Source):
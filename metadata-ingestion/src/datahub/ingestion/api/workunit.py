@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Optional, Type, TypeVar, Union, overload
 
 from deprecated import deprecated
@@ -34,6 +34,16 @@ class MetadataWorkUnit(WorkUnit):
     # like auto_status_aspect and auto_stale_entity_removal.
     is_primary_source: bool = True
 
+    # The aspect decoded from a raw MetadataChangeProposal, and the serialized
+    # value it was decoded from. Decoding is a full JSON parse, so it's only done
+    # again if the serialized value is replaced.
+    _decoded_aspect: Optional[_Aspect] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _decoded_aspect_value: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @overload
     def __init__(
         self, id: str, mce: MetadataChangeEvent, *, is_primary_source: bool = True
@@ -128,14 +138,10 @@ class MetadataWorkUnit(WorkUnit):
             aspects = [self.metadata.aspect]
         elif isinstance(self.metadata, MetadataChangeProposal):
             aspects = []
-            # Best effort attempt to deserialize MetadataChangeProposalClass
             if self.metadata.aspectName == aspect_cls.ASPECT_NAME:
-                try:
-                    mcp = MetadataChangeProposalWrapper.try_from_mcpc(self.metadata)
-                    if mcp:
-                        aspects = [mcp.aspect]
-                except Exception:
-                    pass
+                aspect = self._decode_mcp_raw_aspect(self.metadata)
+                if aspect:
+                    aspects = [aspect]
         else:
             raise ValueError(f"Unexpected type {type(self.metadata)}")
 
@@ -144,6 +150,20 @@ class MetadataWorkUnit(WorkUnit):
             logger.warning(f"Found multiple aspects of type {aspect_cls} in MCE {self}")
         return aspects[-1] if aspects else None
 
+    def _decode_mcp_raw_aspect(self, mcpc: MetadataChangeProposal) -> Optional[_Aspect]:
+        value = mcpc.aspect.value if mcpc.aspect else None
+        if value is None or value is not self._decoded_aspect_value:
+            self._decoded_aspect = None
+            self._decoded_aspect_value = value
+            # Best effort attempt to deserialize MetadataChangeProposalClass
+            try:
+                mcp = MetadataChangeProposalWrapper.try_from_mcpc(mcpc)
+                if mcp:
+                    self._decoded_aspect = mcp.aspect
+            except Exception:
+                pass
+        return self._decoded_aspect
+
     def decompose_mce_into_mcps(self) -> Iterable["MetadataWorkUnit"]:
         from datahub.emitter.mcp_builder import mcps_from_mce
 
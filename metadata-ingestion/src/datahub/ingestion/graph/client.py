@@ -5,12 +5,13 @@ import json
 import logging
 import textwrap
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from json.decoder import JSONDecodeError
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
@@ -19,6 +20,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 from avro.schema import RecordSchema
@@ -28,10 +30,11 @@ from requests.models import HTTPError
 from datahub.cli.cli_utils import get_url_and_token
 from datahub.configuration.common import ConfigModel, GraphError, OperationalError
 from datahub.emitter.aspect import TIMESERIES_ASPECT_MAP
-from datahub.emitter.mce_builder import DEFAULT_ENV, Aspect
+from datahub.emitter.mce_builder import DEFAULT_ENV, Aspect, AspectAbstract
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
 from datahub.emitter.serialization_helper import post_json_transform
+from datahub.ingestion.api.report import Report
 from datahub.ingestion.graph.filters import (
     RemovedStatusFilter,
     SearchFilterRule,
@@ -60,6 +63,7 @@ from datahub.metadata.schema_classes import (
     TelemetryClientIdClass,
 )
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.prefetch_iter import prefetch_iter
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 if TYPE_CHECKING:
@@ -78,6 +82,34 @@ logger = logging.getLogger(__name__)
 _MISSING_SERVER_ID = "missing"
 _GRAPH_DUMMY_RUN_ID = "__datahub-graph-client"
 
+# Keeps the urn list of a BATCH_GET request well below the server's request header size.
+_MAX_BATCH_GET_IDS_LENGTH = 8000
+
+# GraphQL entity types that expose raw aspects via `aspects(input: AspectParams)`.
+_GRAPHQL_TYPES_WITH_RAW_ASPECTS = [
+    "Assertion",
+    "Chart",
+    "Container",
+    "CorpGroup",
+    "CorpUser",
+    "Dashboard",
+    "DataFlow",
+    "DataHubRole",
+    "DataJob",
+    "DataProduct",
+    "Dataset",
+    "Domain",
+    "GlossaryNode",
+    "GlossaryTerm",
+    "MLFeature",
+    "MLFeatureTable",
+    "MLModel",
+    "MLModelGroup",
+    "MLPrimaryKey",
+    "Notebook",
+    "Tag",
+]
+
 
 class DatahubClientConfig(ConfigModel):
     """Configuration class for holding connectivity to datahub gms"""
@@ -98,6 +130,20 @@ class DatahubClientConfig(ConfigModel):
 DataHubGraphConfig = DatahubClientConfig
 
 
+@dataclass
+class AspectPrefetchReport(Report):
+    prefetch_requests: int = 0
+    aspects_prefetched: int = 0
+    aspects_served: int = 0
+    aspects_unused: int = 0
+    hit_rate: Optional[float] = None
+    prefetch_time: PerfTimer = field(default_factory=PerfTimer)
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        self.hit_rate = self.aspects_served / max(self.aspects_prefetched, 1)
+
+
 @dataclass
 class RelatedEntity:
     urn: str
@@ -144,6 +190,11 @@ class DataHubGraph(DatahubRestEmitter):
 
         self.server_id = _MISSING_SERVER_ID
 
+        # Aspects fetched by prefetch_aspects, keyed by (urn, aspect name).
+        # A None value means that the entity does not have the aspect.
+        self._prefetched_aspects: Dict[Tuple[str, str], Optional[AspectAbstract]] = {}
+        self._aspect_prefetch_report = AspectPrefetchReport()
+
     def test_connection(self) -> None:
         super().test_connection()
 
@@ -276,6 +327,12 @@ class DataHubGraph(DatahubRestEmitter):
                 'Cannot get a timeseries aspect using "get_aspect". Use "get_latest_timeseries_value" instead.'
             )
 
+        if version == 0 and (entity_urn, aspect) in self._prefetched_aspects:
+            self._aspect_prefetch_report.aspects_served += 1
+            return cast(
+                Optional[Aspect], self._prefetched_aspects.pop((entity_urn, aspect))
+            )
+
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -452,6 +509,120 @@ class DataHubGraph(DatahubRestEmitter):
         response.raise_for_status()
         return response.json()
 
+    def get_entities_raw(
+        self, entity_urns: List[str], aspects: List[str]
+    ) -> Dict[str, Dict]:
+        """Batch version of `get_entity_raw`.
+
+        The urns are split across as many requests as needed to keep the request urls
+        within the server's limits.
+
+        :param entity_urns: The urns of the entities
+        :param aspects: The names of the aspects to fetch for each entity
+        :return: A map of urn to the raw entity response. Entities that don't exist are
+            typically still present, with only their key aspect.
+        :raises HttpError: if the HTTP response is not a 200
+        """
+        assert aspects, "aspects must be a non-empty list"
+
+        endpoint_prefix = f"{self.config.server}/entitiesV2?ids=List("
+        endpoint_suffix = ")&aspects=List(" + ",".join(aspects) + ")"
+
+        results: Dict[str, Dict] = {}
+        encoded_urns: List[str] = []
+        encoded_length = 0
+
+        def _fetch() -> None:
+            endpoint = endpoint_prefix + ",".join(encoded_urns) + endpoint_suffix
+            response = self._session.get(endpoint)
+            response.raise_for_status()
+            results.update(response.json().get("results", {}))
+
+        for urn in entity_urns:
+            encoded_urn = Urn.url_encode(urn)
+            if (
+                encoded_urns
+                and encoded_length + len(encoded_urn) > _MAX_BATCH_GET_IDS_LENGTH
+            ):
+                _fetch()
+                encoded_urns = []
+                encoded_length = 0
+            encoded_urns.append(encoded_urn)
+            encoded_length += len(encoded_urn) + 1
+        if encoded_urns:
+            _fetch()
+
+        return results
+
+    def prefetch_aspects(
+        self, entity_urns: List[str], aspect_types: List[Type[Aspect]]
+    ) -> int:
+        """Fetch the latest version of the given aspects for many entities in bulk.
+
+        The next `get_aspect` call (or helper like `get_ownership`) for each prefetched
+        entity and aspect is served from memory instead of making a request. Each
+        prefetched aspect is served only once, so later calls see fresh server state.
+        Callers should call `clear_prefetched_aspects` once they're done, to drop the
+        aspects they didn't need.
+
+        :param entity_urns: The urns of the entities
+        :param aspect_types: The type classes of the aspects to prefetch. Timeseries aspects are not supported.
+        :return: The number of (entity, aspect) pairs that were prefetched.
+        """
+
+        aspect_types_by_name = {
+            aspect_type.ASPECT_NAME: aspect_type
+            for aspect_type in aspect_types
+            if aspect_type.ASPECT_NAME not in TIMESERIES_ASPECT_MAP
+        }
+        if not entity_urns or not aspect_types_by_name:
+            return 0
+
+        num_prefetched = 0
+        with self._aspect_prefetch_report.prefetch_time:
+            entities = self.get_entities_raw(
+                list(dict.fromkeys(entity_urns)), list(aspect_types_by_name)
+            )
+        for urn, response_json in entities.items():
+            raw_aspects = response_json.get("aspects", {})
+            for aspect_name, aspect_type in aspect_types_by_name.items():
+                aspect_json = raw_aspects.get(aspect_name)
+                self._prefetched_aspects[(urn, aspect_name)] = (
+                    aspect_type.from_obj(post_json_transform(aspect_json)["value"])
+                    if aspect_json
+                    else None
+                )
+                num_prefetched += 1
+
+        self._aspect_prefetch_report.prefetch_requests += 1
+        self._aspect_prefetch_report.aspects_prefetched += num_prefetched
+        return num_prefetched
+
+    def clear_prefetched_aspects(
+        self, entity_urns: List[str], aspect_types: List[Type[Aspect]]
+    ) -> int:
+        """Drop prefetched aspects that haven't been served yet.
+
+        :param entity_urns: The urns of the entities that were prefetched
+        :param aspect_types: The type classes of the aspects that were prefetched
+        :return: The number of (entity, aspect) pairs that were dropped.
+        """
+        num_unused = 0
+        for urn in entity_urns:
+            for aspect_type in aspect_types:
+                key = (urn, aspect_type.ASPECT_NAME)
+                if key in self._prefetched_aspects:
+                    del self._prefetched_aspects[key]
+                    num_unused += 1
+
+        self._aspect_prefetch_report.aspects_unused += num_unused
+        return num_unused
+
+    @property
+    def aspect_prefetch_report(self) -> AspectPrefetchReport:
+        """Statistics about the aspects fetched by `prefetch_aspects`."""
+        return self._aspect_prefetch_report
+
     @deprecated(
         reason="Use get_aspect for a single aspect or get_entity_semityped for a full entity."
     )
@@ -709,6 +880,7 @@ class DataHubGraph(DatahubRestEmitter):
         status: RemovedStatusFilter = RemovedStatusFilter.NOT_SOFT_DELETED,
         batch_size: int = 10000,
         extraFilters: Optional[List[SearchFilterRule]] = None,
+        prefetch_depth: int = 0,
     ) -> Iterable[str]:
         """Fetch all urns that match all of the given filters.
 
@@ -727,10 +899,146 @@ class DataHubGraph(DatahubRestEmitter):
             Note that this requires browsePathV2 aspects (added in 0.10.4+).
         :param status: Filter on the deletion status of the entity. The default is only return non-soft-deleted entities.
         :param extraFilters: Additional filters to apply. If specified, the results will match all of the filters.
+        :param prefetch_depth: Number of pages to fetch in the background while the caller
+            consumes the current one. By default, pages are fetched only when they are needed.
+            The background thread shares this client's HTTP session, so only set this if the
+            caller does not use the same client while iterating.
 
         :return: An iterable of urns that match the filters.
         """
 
+        for entity in self._scroll_entities_by_filter(
+            entity_selection="urn",
+            entity_types=entity_types,
+            platform=platform,
+            platform_instance=platform_instance,
+            env=env,
+            query=query,
+            container=container,
+            status=status,
+            batch_size=batch_size,
+            extraFilters=extraFilters,
+            prefetch_depth=prefetch_depth,
+        ):
+            yield entity["urn"]
+
+    def get_entities_by_filter(
+        self,
+        *,
+        aspects: List[Type[Aspect]],
+        entity_types: Optional[List[str]] = None,
+        platform: Optional[str] = None,
+        platform_instance: Optional[str] = None,
+        env: Optional[str] = None,
+        query: Optional[str] = None,
+        container: Optional[str] = None,
+        status: RemovedStatusFilter = RemovedStatusFilter.NOT_SOFT_DELETED,
+        batch_size: int = 1000,
+        extraFilters: Optional[List[SearchFilterRule]] = None,
+        prefetch_depth: int = 0,
+    ) -> Iterable[Tuple[str, Dict[str, Optional[Aspect]]]]:
+        """Fetch all urns that match the given filters, along with the requested aspects.
+
+        This takes the same filters as `get_urns_by_filter`. The aspects are fetched as part of
+        each search page, which avoids a `get_aspect` call per urn. Entity types whose GraphQL
+        type does not expose raw aspects fall back to one `get_entity_raw` call per urn. In both
+        cases, the aspects are fetched along with the page, in the background if prefetch_depth
+        is set.
+
+        :param aspects: The aspect type classes to fetch (e.g. [datahub.metadata.schema_classes.StatusClass]).
+            Timeseries aspects are not supported.
+        :param prefetch_depth: Number of pages to fetch in the background while the caller
+            consumes the current one. By default, pages are fetched only when they are needed.
+            The background thread shares this client's HTTP session, so only set this if the
+            caller does not use the same client while iterating.
+
+        :return: An iterable of (urn, aspects) tuples, where aspects maps each requested aspect name
+            to its value, or to None if the entity does not have that aspect.
+        :raises TypeError: if any of the aspect types is a timeseries aspect
+        """
+
+        assert aspects, "aspects must be a non-empty list"
+        aspect_types = {aspect_type.ASPECT_NAME: aspect_type for aspect_type in aspects}
+        for aspect_name in aspect_types:
+            if aspect_name in TIMESERIES_ASPECT_MAP:
+                raise TypeError(
+                    f"Cannot fetch timeseries aspect {aspect_name} using get_entities_by_filter."
+                )
+
+        raw_aspects_selection = " ".join(
+            f"... on {graphql_type} {{ aspects(input: {{aspectNames: $aspectNames}}) "
+            "{ aspectName payload } }"
+            for graphql_type in _GRAPHQL_TYPES_WITH_RAW_ASPECTS
+        )
+
+        def _resolve_aspects(page: List[dict]) -> List[dict]:
+            for entity in page:
+                raw_aspects: Dict[str, Any]
+                if entity.get("aspects") is not None:
+                    raw_aspects = {
+                        raw_aspect["aspectName"]: json.loads(raw_aspect["payload"])
+                        for raw_aspect in entity["aspects"]
+                        if raw_aspect.get("payload")
+                    }
+                else:
+                    response_json = self.get_entity_raw(
+                        entity["urn"], list(aspect_types)
+                    )
+                    raw_aspects = {
+                        aspect_name: aspect_json["value"]
+                        for aspect_name, aspect_json in response_json.get(
+                            "aspects", {}
+                        ).items()
+                    }
+
+                entity["aspects"] = {
+                    aspect_name: (
+                        aspect_type.from_obj(
+                            post_json_transform(raw_aspects[aspect_name])
+                        )
+                        if aspect_name in raw_aspects
+                        else None
+                    )
+                    for aspect_name, aspect_type in aspect_types.items()
+                }
+            return page
+
+        for entity in self._scroll_entities_by_filter(
+            entity_selection=f"urn {raw_aspects_selection}",
+            extra_variable_definitions="$aspectNames: [String!],",
+            extra_variables={"aspectNames": list(aspect_types)},
+            process_page=_resolve_aspects,
+            entity_types=entity_types,
+            platform=platform,
+            platform_instance=platform_instance,
+            env=env,
+            query=query,
+            container=container,
+            status=status,
+            batch_size=batch_size,
+            extraFilters=extraFilters,
+            prefetch_depth=prefetch_depth,
+        ):
+            yield entity["urn"], entity["aspects"]
+
+    def _scroll_entities_by_filter(
+        self,
+        *,
+        entity_selection: str,
+        entity_types: Optional[List[str]],
+        platform: Optional[str],
+        platform_instance: Optional[str],
+        env: Optional[str],
+        query: Optional[str],
+        container: Optional[str],
+        status: RemovedStatusFilter,
+        batch_size: int,
+        extraFilters: Optional[List[SearchFilterRule]],
+        prefetch_depth: int,
+        extra_variable_definitions: str = "",
+        extra_variables: Optional[Dict[str, Any]] = None,
+        process_page: Optional[Callable[[List[dict]], List[dict]]] = None,
+    ) -> Iterable[dict]:
         types = self._get_types(entity_types)
 
         # Add the query default of * if no query is specified.
@@ -741,13 +1049,15 @@ class DataHubGraph(DatahubRestEmitter):
             platform, platform_instance, env, container, status, extraFilters
         )
 
-        graphql_query = textwrap.dedent(
-            """
+        graphql_query = (
+            textwrap.dedent(
+                """
             query scrollUrnsWithFilters(
                 $types: [EntityType!],
                 $query: String!,
                 $orFilters: [AndFilterInput!],
                 $batchSize: Int!,
+                %s
                 $scrollId: String) {
 
                 scrollAcrossEntities(input: {
@@ -764,12 +1074,14 @@ class DataHubGraph(DatahubRestEmitter):
                     nextScrollId
                     searchResults {
                         entity {
-                            urn
+                            %s
                         }
                     }
                 }
             }
             """
+            )
+            % (extra_variable_definitions, entity_selection)
         )
 
         variables = {
@@ -777,14 +1089,58 @@ class DataHubGraph(DatahubRestEmitter):
             "query": query,
             "orFilters": orFilters,
             "batchSize": batch_size,
+            **(extra_variables or {}),
         }
 
-        for entity in self._scroll_across_entities(graphql_query, variables):
-            yield entity["urn"]
+        return self._scroll_across_entities(
+            graphql_query,
+            variables,
+            prefetch_depth=prefetch_depth,
+            process_page=process_page,
+        )
 
     def _scroll_across_entities(
-        self, graphql_query: str, variables_orig: dict
+        self,
+        graphql_query: str,
+        variables_orig: dict,
+        prefetch_depth: int = 0,
+        process_page: Optional[Callable[[List[dict]], List[dict]]] = None,
     ) -> Iterable[dict]:
+        # Pages are processed in the prefetch thread, so that any follow-up
+        # requests for a page overlap with the caller consuming the previous one.
+        raw_pages: Iterable[List[dict]] = self._scroll_pages(
+            graphql_query, variables_orig
+        )
+        if process_page is not None:
+            raw_pages = map(process_page, raw_pages)
+
+        num_pages = 0
+        num_entities = 0
+        wait_timer = PerfTimer()
+        with PerfTimer() as total_timer:
+            pages = prefetch_iter(raw_pages, depth=prefetch_depth)
+            while True:
+                with wait_timer:
+                    page = next(pages, None)
+                if page is None:
+                    break
+
+                num_pages += 1
+                num_entities += len(page)
+                yield from page
+
+        if num_pages > 1:
+            elapsed = total_timer.elapsed_seconds()
+            logger.info(
+                f"Scrolled {num_entities} entities in {num_pages} pages in {elapsed:.2f}s "
+                f"({num_entities / max(elapsed, 1e-6):.1f} entities/s), "
+                f"of which {wait_timer.elapsed_seconds():.2f}s was spent waiting on pages "
+                f"(prefetch depth {prefetch_depth})"
+            )
+
+    def _scroll_pages(
+        self, graphql_query: str, variables_orig: dict
+    ) -> Iterator[List[dict]]:
         variables = variables_orig.copy()
         first_iter = True
         scroll_id: Optional[str] = None
@@ -792,14 +1148,19 @@ class DataHubGraph(DatahubRestEmitter):
             first_iter = False
             variables["scrollId"] = scroll_id
 
-            response = self.execute_graphql(
-                graphql_query,
-                variables=variables,
-            )
+            with PerfTimer() as page_timer:
+                response = self.execute_graphql(
+                    graphql_query,
+                    variables=variables,
+                )
             data = response["scrollAcrossEntities"]
             scroll_id = data["nextScrollId"]
-            for entry in data["searchResults"]:
-                yield entry["entity"]
+            page = [entry["entity"] for entry in data["searchResults"]]
+            logger.debug(
+                f"Fetched scrollAcrossEntities page of {len(page)} entities "
+                f"in {page_timer.elapsed_seconds():.3f}s"
+            )
+            yield page
 
             if scroll_id:
                 logger.debug(
@@ -8,7 +8,7 @@ import sys
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import click
 import humanfriendly
@@ -21,7 +21,12 @@ from datahub.configuration.common import (
     PipelineExecutionError,
 )
 from datahub.ingestion.api.committable import CommitPolicy
-from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.common import (
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+    WorkUnit,
+)
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
@@ -33,6 +38,12 @@ from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
 )
 from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
+from datahub.ingestion.run.pipeline_stages import (
+    STAGE_JOIN_TIMEOUT_SECONDS,
+    PipelineStageReport,
+    StageQueue,
+    start_stage,
+)
 from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
@@ -145,6 +156,9 @@ class CliReport(Report):
     thread_count: Optional[int] = None
     peak_thread_count: Optional[int] = None
 
+    # Only populated when the pipeline runs with pipelined_execution enabled.
+    pipeline_stages: Optional[Dict[str, PipelineStageReport]] = None
+
     def compute_stats(self) -> None:
         try:
             mem_usage = psutil.Process(os.getpid()).memory_info().rss
@@ -404,61 +418,10 @@ class Pipeline:
                         self.ctx, self.config.failure_log.log_config
                     )
                 )
-                for wu in itertools.islice(
-                    self.source.get_workunits(),
-                    self.preview_workunits if self.preview_mode else None,
-                ):
-                    try:
-                        if self._time_to_print() and not self.no_progress:
-                            self.pretty_print_summary(currently_running=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to print summary {e}")
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_start(wu)
-                    try:
-                        record_envelopes = self.extractor.get_records(wu)
-                        for record_envelope in self.transform(record_envelopes):
-                            if not self.dry_run:
-                                try:
-                                    self.sink.write_record_async(
-                                        record_envelope, callback
-                                    )
-                                except Exception as e:
-                                    # In case the sink's error handling is bad, we still want to report the error.
-                                    self.sink.report.report_failure(
-                                        f"Failed to write record: {e}"
-                                    )
-
-                    except RuntimeError:
-                        raise
-                    except SystemExit:
-                        raise
-                    except Exception as e:
-                        logger.error(
-                            "Failed to process some records. Continuing.",
-                            exc_info=e,
-                        )
-                        # TODO: Transformer errors should cause the pipeline to fail.
-
-                    self.extractor.close()
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_end(wu)
-                self.source.close()
-                # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-                for record_envelope in self.transform(
-                    [
-                        RecordEnvelope(
-                            record=EndOfStream(),
-                            metadata={"workunit_id": "end-of-stream"},
-                        )
-                    ]
-                ):
-                    if not self.dry_run and not isinstance(
-                        record_envelope.record, EndOfStream
-                    ):
-                        # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                        self.sink.write_record_async(record_envelope, callback)
+                if self.config.flags.pipelined_execution:
+                    self._run_pipelined(callback)
+                else:
+                    self._run_serial(callback)
 
                 self.sink.close()
                 self.process_commits()
@@ -475,6 +438,151 @@ class Pipeline:
 
                 self._notify_reporters_on_ingestion_completion()
 
+    def _run_serial(self, callback: WriteCallback) -> None:
+        for wu in itertools.islice(
+            self.source.get_workunits(),
+            self.preview_workunits if self.preview_mode else None,
+        ):
+            try:
+                if self._time_to_print() and not self.no_progress:
+                    self.pretty_print_summary(currently_running=True)
+            except Exception as e:
+                logger.warning(f"Failed to print summary {e}")
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            for record_envelope in self._extract_and_transform(wu):
+                if not self.dry_run:
+                    try:
+                        self.sink.write_record_async(record_envelope, callback)
+                    except Exception as e:
+                        # In case the sink's error handling is bad, we still want to report the error.
+                        self.sink.report.report_failure(f"Failed to write record: {e}")
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+        self.source.close()
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(),
+                    metadata={"workunit_id": "end-of-stream"},
+                )
+            ]
+        ):
+            if not self.dry_run and not isinstance(record_envelope.record, EndOfStream):
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _extract_and_transform(self, wu: WorkUnit) -> List[RecordEnvelope]:
+        record_envelopes: List[RecordEnvelope] = []
+        try:
+            for record_envelope in self.transform(self.extractor.get_records(wu)):
+                record_envelopes.append(record_envelope)
+        except RuntimeError:
+            raise
+        except SystemExit:
+            raise
+        except Exception as e:
+            logger.error(
+                "Failed to process some records. Continuing.",
+                exc_info=e,
+            )
+            # TODO: Transformer errors should cause the pipeline to fail.
+
+        self.extractor.close()
+        return record_envelopes
+
+    def _run_pipelined(self, callback: WriteCallback) -> None:
+        """Runs the source, the extractor + transformers, and the sink submission as
+        three stages connected by bounded queues.
+
+        Each stage processes work units strictly in order, so the per-urn ordering
+        that the source's workunit processors and the transformers rely on is preserved.
+        """
+
+        queue_size = self.config.flags.pipelined_execution_queue_size
+        stop_event = threading.Event()
+        source_report = PipelineStageReport()
+        transform_report = PipelineStageReport()
+        sink_report = PipelineStageReport()
+        self.cli_report.pipeline_stages = {
+            "source": source_report,
+            "transform": transform_report,
+            "sink": sink_report,
+        }
+
+        workunits: StageQueue[WorkUnit] = StageQueue(queue_size, stop_event)
+        # A None work unit denotes the records produced at the end of the stream.
+        records: StageQueue[
+            Tuple[Optional[WorkUnit], List[RecordEnvelope]]
+        ] = StageQueue(queue_size, stop_event)
+
+        def _source_stage() -> Iterable[WorkUnit]:
+            return itertools.islice(
+                self.source.get_workunits(),
+                self.preview_workunits if self.preview_mode else None,
+            )
+
+        def _transform_stage() -> Iterable[
+            Tuple[Optional[WorkUnit], List[RecordEnvelope]]
+        ]:
+            for wu in workunits.consume(transform_report):
+                yield wu, self._extract_and_transform(wu)
+
+            self.source.close()
+            # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+            yield None, list(
+                self.transform(
+                    [
+                        RecordEnvelope(
+                            record=EndOfStream(),
+                            metadata={"workunit_id": "end-of-stream"},
+                        )
+                    ]
+                )
+            )
+
+        stages = [
+            start_stage("source", source_report, _source_stage, workunits),
+            start_stage("transform", transform_report, _transform_stage, records),
+        ]
+
+        try:
+            for wu, record_envelopes in records.consume(sink_report):
+                with sink_report.busy():
+                    sink_report.items_processed += 1
+                    try:
+                        if self._time_to_print() and not self.no_progress:
+                            self.pretty_print_summary(currently_running=True)
+                    except Exception as e:
+                        logger.warning(f"Failed to print summary {e}")
+
+                    if self.dry_run:
+                        continue
+
+                    if wu is not None:
+                        self.sink.handle_work_unit_start(wu)
+                    for record_envelope in record_envelopes:
+                        if isinstance(record_envelope.record, EndOfStream):
+                            # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                            continue
+                        try:
+                            self.sink.write_record_async(record_envelope, callback)
+                        except Exception as e:
+                            # In case the sink's error handling is bad, we still want to report the error.
+                            self.sink.report.report_failure(
+                                f"Failed to write record: {e}"
+                            )
+                    if wu is not None:
+                        self.sink.handle_work_unit_end(wu)
+        finally:
+            # On success, the stage threads have already exited. Otherwise, this
+            # makes them bail out the next time they touch a queue.
+            stop_event.set()
+            for stage in stages:
+                stage.join(timeout=STAGE_JOIN_TIMEOUT_SECONDS)
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
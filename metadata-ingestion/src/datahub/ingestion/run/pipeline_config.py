@@ -58,6 +58,19 @@ class FlagsConfig(ConfigModel):
         ),
     )
 
+    pipelined_execution: bool = Field(
+        default=False,
+        description=(
+            "Run source iteration, extraction/transformation, and sink submission as separate stages "
+            "on their own threads, connected by bounded queues. Work units are still processed in order."
+        ),
+    )
+
+    pipelined_execution_queue_size: int = Field(
+        default=1000,
+        description="The max number of work units buffered between stages when `pipelined_execution` is enabled.",
+    )
+
     generate_memory_profiles: Optional[str] = Field(
         default=None,
         description=(
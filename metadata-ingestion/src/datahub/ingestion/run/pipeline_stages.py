@@ -0,0 +1,202 @@
+import contextlib
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from datahub.ingestion.api.report import Report
+from datahub.utilities.perf_timer import PerfTimer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often blocked queue operations wake up to check whether the pipeline is stopping.
+_STAGE_QUEUE_POLL_INTERVAL_SECONDS = 0.5
+
+# How long shutdown waits for each stage thread to exit. Stages that are blocked on
+# a queue exit within the poll interval, but a stage may be busy in the source.
+STAGE_JOIN_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class PipelineStageReport(Report):
+    items_processed: int = 0
+
+    # Busy time is spent doing the stage's work. Idle time is spent blocked on
+    # either an empty input queue or a full output queue.
+    _busy_timer: PerfTimer = field(default_factory=PerfTimer)
+    _idle_timer: PerfTimer = field(default_factory=PerfTimer)
+
+    busy_time_seconds: float = 0
+    idle_time_seconds: float = 0
+
+    @contextlib.contextmanager
+    def busy(self) -> Iterator[None]:
+        with self._busy_timer:
+            yield
+
+    @contextlib.contextmanager
+    def waiting(self) -> Iterator[None]:
+        # A stage may block on its input queue while in the middle of its own work,
+        # so the busy timer must be paused while we wait.
+        busy_running = (
+            self._busy_timer.start_time is not None
+            and self._busy_timer.end_time is None
+            and not self._busy_timer.paused
+        )
+        if busy_running:
+            self._busy_timer.pause()
+        try:
+            with self._idle_timer:
+                yield
+        finally:
+            if busy_running:
+                self._busy_timer.start()
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        self.busy_time_seconds = round(self._busy_timer.elapsed_seconds(), 3)
+        self.idle_time_seconds = round(self._idle_timer.elapsed_seconds(), 3)
+
+
+class _StageDone:
+    pass
+
+
+_END_OF_ITEMS = object()
+
+
+@dataclass
+class _StageFailure:
+    exc: BaseException
+
+
+class PipelineStopped(Exception):
+    """Raised inside a stage thread when the pipeline is shutting down early."""
+
+
+class StageQueue(Generic[T]):
+    """A bounded queue between two pipeline stages.
+
+    Besides the items themselves, the queue carries an end-of-input marker and
+    any exception raised by the producer, so that failures surface in the consumer.
+    """
+
+    def __init__(self, maxsize: int, stop_event: threading.Event) -> None:
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._stop_event = stop_event
+
+    def put(self, item: Any, report: PipelineStageReport) -> None:
+        with report.waiting():
+            while True:
+                if self._stop_event.is_set():
+                    raise PipelineStopped()
+                try:
+                    self._queue.put(item, timeout=_STAGE_QUEUE_POLL_INTERVAL_SECONDS)
+                    return
+                except queue.Full:
+                    pass
+
+    def finish(self, report: PipelineStageReport) -> None:
+        self.put(_StageDone(), report)
+
+    def fail(self, exc: BaseException, report: PipelineStageReport) -> None:
+        self.put(_StageFailure(exc), report)
+
+    def consume(self, report: PipelineStageReport) -> Iterator[T]:
+        """Yields items until the producer finishes, re-raising producer failures."""
+
+        while True:
+            with report.waiting():
+                while True:
+                    if self._stop_event.is_set():
+                        raise PipelineStopped()
+                    try:
+                        item = self._queue.get(
+                            timeout=_STAGE_QUEUE_POLL_INTERVAL_SECONDS
+                        )
+                        break
+                    except queue.Empty:
+                        pass
+
+            if isinstance(item, _StageDone):
+                return
+            elif isinstance(item, _StageFailure):
+                raise item.exc
+            yield item
+
+
+class PipelineStage(Generic[T]):
+    """Runs produce() on a background thread, feeding its items into output.
+
+    Time spent inside produce() counts as busy time for the stage, while time
+    spent waiting for room in the output queue counts as idle time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        report: PipelineStageReport,
+        produce: Callable[[], Iterable[T]],
+        output: StageQueue[T],
+    ) -> None:
+        self.name = name
+        self._report = report
+        self._produce = produce
+        self._output = output
+        # Set if the stage failed after the pipeline had already stopped, so the
+        # failure could not be passed on to the consumer.
+        self.undelivered_failure: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"pipeline-stage-{name}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            items = iter(self._produce())
+            while True:
+                with self._report.busy():
+                    item = next(items, _END_OF_ITEMS)
+                if item is _END_OF_ITEMS:
+                    break
+                self._report.items_processed += 1
+                self._output.put(item, self._report)
+            self._output.finish(self._report)
+        except PipelineStopped:
+            logger.debug(f"Pipeline stage {self.name} stopped early")
+        except BaseException as e:
+            logger.debug(f"Pipeline stage {self.name} failed: {e}")
+            try:
+                self._output.fail(e, self._report)
+            except PipelineStopped:
+                self.undelivered_failure = e
+
+    def join(self, timeout: float) -> None:
+        """Waits for the stage thread to exit, and logs failures that were not passed on."""
+
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                f"Pipeline stage {self.name} did not stop within {timeout} seconds"
+            )
+        if self.undelivered_failure is not None:
+            logger.error(
+                f"Pipeline stage {self.name} failed while the pipeline was stopping",
+                exc_info=self.undelivered_failure,
+            )
+
+
+def start_stage(
+    name: str,
+    report: PipelineStageReport,
+    produce: Callable[[], Iterable[T]],
+    output: StageQueue[T],
+) -> PipelineStage[T]:
+    stage = PipelineStage(name, report, produce, output)
+    stage.start()
+    return stage
@@ -1,6 +1,8 @@
 import logging
 import os
-from typing import Union
+from typing import List, Tuple, Union
+
+from pydantic.fields import Field
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -13,15 +15,24 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
 
 logger = logging.getLogger(__name__)
 
+_LiteRecord = Union[MetadataChangeEvent, MetadataChangeProposalWrapper]
+
 
 class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
+    batch_size: int = Field(
+        default=1000,
+        description="Number of records to buffer and write in a single transaction. "
+        "If a batch fails, its records are retried one at a time. "
+        "Set to 1 to write every record on its own.",
+    )
 
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(self.config.dict(exclude={"batch_size"}))
+        self.pending: List[Tuple[RecordEnvelope[_LiteRecord], WriteCallback]] = []
 
     def write_record_async(
         self,
@@ -39,8 +50,21 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
 
+        if self.config.batch_size <= 1:
+            self._write_record(record_envelope, write_callback)  # type: ignore
+            return
+
+        self.pending.append((record_envelope, write_callback))  # type: ignore
+        if len(self.pending) >= self.config.batch_size:
+            self._flush()
+
+    def _write_record(
+        self,
+        record_envelope: RecordEnvelope[_LiteRecord],
+        write_callback: WriteCallback,
+    ) -> None:
         try:
-            self.datahub_lite.write(record)
+            self.datahub_lite.write(record_envelope.record)
             self.report.report_record_written(record_envelope)
         except Exception as e:
             self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
@@ -50,6 +74,30 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             if write_callback:
                 write_callback.on_success(record_envelope, success_metadata={})
 
+    def _flush(self) -> None:
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+
+        try:
+            self.datahub_lite.write_batch(
+                [record_envelope.record for record_envelope, _ in pending]
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to write a batch of {len(pending)} records, "
+                f"retrying them one at a time: {e}"
+            )
+            for record_envelope, write_callback in pending:
+                self._write_record(record_envelope, write_callback)
+            return
+
+        for record_envelope, write_callback in pending:
+            self.report.report_record_written(record_envelope)
+            if write_callback:
+                write_callback.on_success(record_envelope, success_metadata={})
+
     def close(self):
         if self.datahub_lite:
+            self._flush()
             self.datahub_lite.close()
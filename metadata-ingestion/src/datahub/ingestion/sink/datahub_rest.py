@@ -1,11 +1,13 @@
 import concurrent.futures
 import contextlib
+import copy
+import datetime
 import functools
 import logging
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import auto
-from typing import Optional, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -14,7 +16,7 @@ from datahub.configuration.common import (
     OperationalError,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.rest_emitter import BatchEmitError, DatahubRestEmitter
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import (
     NoopWriteCallback,
@@ -28,7 +30,10 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
 )
-from datahub.utilities.advanced_thread_executor import PartitionExecutor
+from datahub.utilities.advanced_thread_executor import (
+    BatchPartitionExecutor,
+    PartitionExecutor,
+)
 from datahub.utilities.server_config_util import set_gms_config
 
 logger = logging.getLogger(__name__)
@@ -37,15 +42,20 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    ASYNC_BATCH = auto()
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
     mode: SyncOrAsync = SyncOrAsync.ASYNC
 
-    # These only apply in async mode.
+    # These only apply in async modes.
     max_threads: int = 15
     max_pending_requests: int = 500
 
+    # These only apply in async batch mode.
+    max_per_batch: int = 100
+    max_batch_wait_sec: float = 5
+
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
@@ -53,8 +63,33 @@ class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
 
+    # These are only populated in async batch mode.
+    async_batches_prepared: int = 0
+    async_batches_requests: int = 0
+    async_batch_records_written: int = 0
+    async_batch_records_per_second: int = 0
+    async_batch_records_fallback: int = 0
+    async_batch_size_histogram: Dict[str, int] = field(default_factory=dict)
+
+    def report_batch(self, batch_size: int) -> None:
+        self.async_batches_prepared += 1
+
+        # Bucket by powers of two e.g. "1", "2", "3-4", "5-8", ...
+        upper = 1
+        while upper < batch_size:
+            upper *= 2
+        lower = upper // 2 + 1
+        bucket = str(upper) if lower >= upper else f"{lower}-{upper}"
+        self.async_batch_size_histogram[bucket] = (
+            self.async_batch_size_histogram.get(bucket, 0) + 1
+        )
+
     def compute_stats(self) -> None:
         super().compute_stats()
+        if self.total_duration_in_seconds:
+            self.async_batch_records_per_second = int(
+                self.async_batch_records_written / self.total_duration_in_seconds
+            )
 
 
 def _get_urn(record_envelope: RecordEnvelope) -> Optional[str]:
@@ -68,6 +103,17 @@ def _get_urn(record_envelope: RecordEnvelope) -> Optional[str]:
     return None
 
 
+def _copy_error(e: BaseException) -> BaseException:
+    # Failures are annotated with the urn of each record, so records that failed
+    # together must not share an error.
+    if not isinstance(e, OperationalError):
+        return e
+    copied = copy.copy(e)
+    copied.info = dict(e.info)
+    copied.__cause__ = e.__cause__
+    return copied.with_traceback(e.__traceback__)
+
+
 def _get_partition_key(record_envelope: RecordEnvelope) -> str:
     urn = _get_urn(record_envelope)
     if urn:
@@ -112,10 +158,22 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         set_env_variables_override_config(self.config.server, self.config.token)
         logger.debug("Setting gms config")
         set_gms_config(gms_config)
-        self.executor = PartitionExecutor(
-            max_workers=self.config.max_threads,
-            max_pending=self.config.max_pending_requests,
-        )
+        self.executor: Union[PartitionExecutor, BatchPartitionExecutor]
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self.executor = BatchPartitionExecutor(
+                max_workers=self.config.max_threads,
+                max_pending=self.config.max_pending_requests,
+                process_batch=self._emit_batch_wrapper,
+                max_per_batch=self.config.max_per_batch,
+                min_process_interval=datetime.timedelta(
+                    seconds=self.config.max_batch_wait_sec
+                ),
+            )
+        else:
+            self.executor = PartitionExecutor(
+                max_workers=self.config.max_threads,
+                max_pending=self.config.max_pending_requests,
+            )
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
@@ -178,6 +236,74 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         # TODO: Add timing metrics
         self.emitter.emit(record)
 
+    def _emit_batch_wrapper(
+        self, records: List[Tuple[RecordEnvelope]]
+    ) -> Sequence[Optional[BaseException]]:
+        # MCEs can't be sent via ingestProposalBatch, so those are emitted individually.
+        results: List[Optional[BaseException]] = [None] * len(records)
+        mcp_indexes: List[int] = []
+        for i, (record_envelope,) in enumerate(records):
+            record = record_envelope.record
+            if isinstance(
+                record, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+            ):
+                mcp_indexes.append(i)
+            else:
+                try:
+                    self.emitter.emit(record)
+                except Exception as e:
+                    results[i] = e
+
+        if not mcp_indexes:
+            return results
+        self.report.report_batch(len(mcp_indexes))
+
+        if self.emitter.batch_ingest_supported is False:
+            self._emit_individually(records, mcp_indexes, results)
+            return results
+
+        try:
+            self.report.async_batches_requests += self.emitter.emit_mcps(
+                [records[i][0].record for i in mcp_indexes]
+            )
+            self.report.async_batch_records_written += len(mcp_indexes)
+        except BatchEmitError as e:
+            self.report.async_batches_requests += e.num_requests
+            self.report.async_batch_records_written += e.num_emitted
+            if self.emitter.batch_ingest_supported is False:
+                # The server doesn't support batches, and emit_mcps stopped at the
+                # first record that it failed to emit on its own.
+                results[mcp_indexes[e.num_emitted]] = e
+                self._emit_individually(
+                    records, mcp_indexes[e.num_emitted + 1 :], results
+                )
+            else:
+                # The server processes each request in a single transaction, so the
+                # failure applies to the records of the failed request and those
+                # after it. The records of earlier requests were written.
+                for i in mcp_indexes[e.num_emitted :]:
+                    results[i] = _copy_error(e)
+        except Exception as e:
+            for i in mcp_indexes:
+                results[i] = _copy_error(e)
+        return results
+
+    def _emit_individually(
+        self,
+        records: List[Tuple[RecordEnvelope]],
+        indexes: List[int],
+        results: List[Optional[BaseException]],
+    ) -> None:
+        # Emitting individually lets us report failures per record.
+        self.report.async_batch_records_fallback += len(indexes)
+        for i in indexes:
+            try:
+                self.emitter.emit_mcp(records[i][0].record)
+                self.report.async_batches_requests += 1
+                self.report.async_batch_records_written += 1
+            except Exception as e:
+                results[i] = e
+
     def write_record_async(
         self,
         record_envelope: RecordEnvelope[
@@ -190,7 +316,19 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            assert isinstance(self.executor, BatchPartitionExecutor)
+            partition_key = _get_partition_key(record_envelope)
+            self.executor.submit(
+                partition_key,
+                record_envelope,
+                done_callback=functools.partial(
+                    self._write_done_callback, record_envelope, write_callback
+                ),
+            )
+            self.report.pending_requests += 1
+        elif self.config.mode == SyncOrAsync.ASYNC:
+            assert isinstance(self.executor, PartitionExecutor)
             partition_key = _get_partition_key(record_envelope)
             self.executor.submit(
                 partition_key,
@@ -1,11 +1,18 @@
+import gzip
+import io
 import json
 import logging
 import pathlib
-from typing import Iterable, Union
+from enum import auto
+from typing import IO, Any, Dict, Iterable, Optional, Tuple, Union, cast
 
-from datahub.configuration.common import ConfigModel
+from pydantic.fields import Field
+
+from datahub.configuration.common import ConfigEnum, ConfigModel, ConfigurationError
 from datahub.emitter.aspect import JSON_CONTENT_TYPE, JSON_PATCH_CONTENT_TYPE
+from datahub.emitter.fast_serialization import json_dumps, to_avro_obj
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
@@ -29,14 +36,105 @@ def _to_obj_for_file(
     if isinstance(obj, MetadataChangeProposalWrapper):
         return obj.to_obj(simplified_structure=simplified_structure)
     elif isinstance(obj, MetadataChangeProposal) and simplified_structure:
-        serialized = obj.to_obj()
+        serialized = to_avro_obj(obj)
         if serialized.get("aspect") and serialized["aspect"].get("contentType") in [
             JSON_CONTENT_TYPE,
             JSON_PATCH_CONTENT_TYPE,
         ]:
             serialized["aspect"] = {"json": json.loads(serialized["aspect"]["value"])}
         return serialized
-    return obj.to_obj()
+    return to_avro_obj(obj)
+
+
+class FileFormat(ConfigEnum):
+    # A single json array of pretty-printed records.
+    JSON = auto()
+    # One compact json record per line.
+    NDJSON = auto()
+    # An avro container file of MetadataChangeProposals.
+    AVRO = auto()
+
+
+class FileCompression(ConfigEnum):
+    NONE = auto()
+    GZIP = auto()
+    ZSTD = auto()
+
+
+_FORMAT_SUFFIXES: Dict[str, FileFormat] = {
+    ".ndjson": FileFormat.NDJSON,
+    ".jsonl": FileFormat.NDJSON,
+    ".avro": FileFormat.AVRO,
+}
+_COMPRESSION_SUFFIXES: Dict[str, FileCompression] = {
+    ".gz": FileCompression.GZIP,
+    ".gzip": FileCompression.GZIP,
+    ".zst": FileCompression.ZSTD,
+    ".zstd": FileCompression.ZSTD,
+}
+_AVRO_CODECS: Dict[FileCompression, str] = {
+    FileCompression.NONE: "null",
+    FileCompression.GZIP: "deflate",
+    FileCompression.ZSTD: "zstandard",
+}
+
+
+def detect_file_format(filename: str) -> Tuple[FileFormat, FileCompression]:
+    """
+    Infers the format and compression of a metadata file from its extension,
+    e.g. `mces.ndjson.gz` is gzip-compressed json lines.
+    """
+
+    suffixes = [suffix.lower() for suffix in pathlib.PurePath(filename).suffixes]
+    compression = FileCompression.NONE
+    if suffixes and suffixes[-1] in _COMPRESSION_SUFFIXES:
+        compression = _COMPRESSION_SUFFIXES[suffixes.pop()]
+    file_format = FileFormat.JSON
+    if suffixes and suffixes[-1] in _FORMAT_SUFFIXES:
+        file_format = _FORMAT_SUFFIXES[suffixes[-1]]
+    return file_format, compression
+
+
+def import_fastavro() -> Any:
+    try:
+        import fastavro
+    except ImportError as e:
+        raise ConfigurationError(
+            "The avro file format requires the fastavro package. "
+            "Install it with `pip install fastavro`."
+        ) from e
+    return fastavro
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ConfigurationError(
+            "zstd compression requires the zstandard package. "
+            "Install it with `pip install zstandard`."
+        ) from e
+    return zstandard
+
+
+def open_metadata_file(
+    path: Union[str, pathlib.Path], mode: str, compression: FileCompression
+) -> IO[bytes]:
+    """Opens a metadata file in binary mode ("rb" or "wb"), (de)compressing it."""
+
+    assert mode in ("rb", "wb")
+    if compression == FileCompression.GZIP:
+        return cast(IO[bytes], gzip.open(path, mode))
+    elif compression == FileCompression.ZSTD:
+        zstandard = _import_zstandard()
+        fh = open(path, mode)
+        if mode == "rb":
+            # The decompression reader doesn't support readline, so we buffer it.
+            return io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(fh, closefd=True)
+            )
+        return zstandard.ZstdCompressor().stream_writer(fh, closefd=True)
+    return open(path, mode)
 
 
 class FileSinkConfig(ConfigModel):
@@ -44,13 +142,51 @@ class FileSinkConfig(ConfigModel):
 
     legacy_nested_json_string: bool = False
 
+    format: Optional[FileFormat] = Field(
+        default=None,
+        description="Output format: json, ndjson or avro. The ndjson format writes one "
+        "compact record per line, and the avro format writes an avro container file of "
+        "MetadataChangeProposals, with MCEs split into one proposal per aspect. "
+        "If not set, the format is inferred from the filename, i.e. .ndjson or .jsonl "
+        "for ndjson, .avro for avro and json otherwise.",
+    )
+    compression: Optional[FileCompression] = Field(
+        default=None,
+        description="Compression to use: none, gzip or zstd. For avro, this picks the "
+        "container's codec. If not set, it is inferred from a .gz or .zst suffix.",
+    )
+    flush_every_n_records: int = Field(
+        default=1000,
+        description="Flush the output every this many records, so that partially "
+        "written files can be read while the ingestion is running.",
+    )
+
 
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
+        detected_format, detected_compression = detect_file_format(self.config.filename)
+        self.format = self.config.format or detected_format
+        compression = self.config.compression or detected_compression
+
         fpath = pathlib.Path(self.config.filename)
-        self.file = fpath.open("w")
-        self.file.write("[\n")
+        self.avro_writer: Optional[Any] = None
+        if self.format == FileFormat.AVRO:
+            # The avro codec takes care of compression.
+            fastavro = import_fastavro()
+            from datahub.metadata.schemas import getMetadataChangeProposalSchema
+
+            self.file = open_metadata_file(fpath, "wb", FileCompression.NONE)
+            self.avro_writer = fastavro.write.Writer(
+                self.file,
+                fastavro.parse_schema(json.loads(getMetadataChangeProposalSchema())),
+                codec=_AVRO_CODECS[compression],
+            )
+        else:
+            self.file = open_metadata_file(fpath, "wb", compression)
+            if self.format == FileFormat.JSON:
+                self.file.write(b"[\n")
         self.wrote_something = False
+        self.records_since_flush = 0
 
     def write_record_async(
         self,
@@ -64,25 +200,57 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        obj = _to_obj_for_file(
-            record, simplified_structure=not self.config.legacy_nested_json_string
-        )
-
-        if self.wrote_something:
-            self.file.write(",\n")
-
-        json.dump(obj, self.file, indent=4)
+        if self.avro_writer is not None:
+            for mcp in _to_mcps_for_avro(record):
+                self.avro_writer.write(to_avro_obj(mcp, tuples=True))
+        else:
+            obj = _to_obj_for_file(
+                record, simplified_structure=not self.config.legacy_nested_json_string
+            )
+            if self.format == FileFormat.NDJSON:
+                self.file.write(json_dumps(obj).encode("utf-8") + b"\n")
+            else:
+                if self.wrote_something:
+                    self.file.write(b",\n")
+                self.file.write(json.dumps(obj, indent=4).encode("utf-8"))
         self.wrote_something = True
 
+        self.records_since_flush += 1
+        if self.records_since_flush >= self.config.flush_every_n_records:
+            self._flush()
+
         self.report.report_record_written(record_envelope)
         if write_callback:
             write_callback.on_success(record_envelope, {})
 
+    def _flush(self) -> None:
+        if self.avro_writer is not None:
+            self.avro_writer.flush()
+        self.file.flush()
+        self.records_since_flush = 0
+
     def close(self):
-        self.file.write("\n]")
+        if self.avro_writer is not None:
+            self.avro_writer.flush()
+        elif self.format == FileFormat.JSON:
+            self.file.write(b"\n]")
         self.file.close()
 
 
+def _to_mcps_for_avro(
+    record: Union[
+        MetadataChangeEvent, MetadataChangeProposal, MetadataChangeProposalWrapper
+    ],
+) -> Iterable[MetadataChangeProposal]:
+    if isinstance(record, MetadataChangeEvent):
+        for mcpw in mcps_from_mce(record):
+            yield mcpw.make_mcp()
+    elif isinstance(record, MetadataChangeProposalWrapper):
+        yield record.make_mcp()
+    else:
+        yield record
+
+
 def write_metadata_file(
     file: pathlib.Path,
     records: Iterable[
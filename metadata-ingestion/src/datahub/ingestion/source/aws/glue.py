@@ -1,5 +1,7 @@
+import itertools
 import logging
 from collections import defaultdict
+from concurrent.futures import Future
 from dataclasses import dataclass, field as dataclass_field
 from typing import (
     Any,
@@ -18,7 +20,8 @@ from urllib.parse import urlparse
 
 import botocore.exceptions
 import yaml
-from pydantic import validator
+from botocore.config import Config
+from pydantic import PositiveInt, validator
 from pydantic.fields import Field
 
 from datahub.configuration.common import AllowDenyPattern
@@ -98,6 +101,7 @@ from datahub.metadata.schema_classes import (
     UpstreamClass,
     UpstreamLineageClass,
 )
+from datahub.utilities.advanced_thread_executor import BackpressureAwareExecutor
 from datahub.utilities.hive_schema_to_avro import get_schema_fields_for_hive_column
 
 logger = logging.getLogger(__name__)
@@ -161,12 +165,25 @@ class GlueSourceConfig(
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
     )
+    max_workers: PositiveInt = Field(
+        default=10,
+        description="Number of threads used to list tables per database, fetch job DAGs and fetch table "
+        "partitions for profiling. Clients use botocore's adaptive retry mode and a connection pool of "
+        "this size unless `retries` or `max_pool_connections` are set in `aws_advanced_config`.",
+    )
 
     def is_profiling_enabled(self) -> bool:
         return self.profiling is not None and is_profiling_enabled(
             self.profiling.operation_config
         )
 
+    def _aws_config(self) -> Config:
+        # Calls fanned out over max_workers threads share a single client, so size its
+        # connection pool to match and let botocore rate limit itself when Glue throttles.
+        return Config(
+            retries={"mode": "adaptive"}, max_pool_connections=self.max_workers
+        ).merge(super()._aws_config())
+
     @property
     def glue_client(self):
         return self.get_glue_client()
@@ -212,6 +229,15 @@ class GlueSourceReport(StaleEntityRemovalSourceReport):
         self.filtered.append(table)
 
 
+@dataclass
+class _DataflowGraphResult:
+    dag: Optional[Dict[str, Any]] = None
+    # The GlueSourceReport counter to increment, and the warning to report, if the
+    # job's DAG could not be fetched.
+    failure_counter: Optional[str] = None
+    warning: Optional[str] = None
+
+
 @platform_name("Glue")
 @config_class(GlueSourceConfig)
 @support_status(SupportStatus.CERTIFIED)
@@ -323,19 +349,38 @@ class GlueSource(StatefulIngestionSourceBase):
                 S3 path to the job's Python script.
         """
 
+        return self._report_dataflow_graph_result(
+            self._fetch_dataflow_graph(script_path), flow_urn
+        )
+
+    def get_job_dataflow_graph(
+        self, job: Dict[str, Any], flow_urn: str
+    ) -> Optional[Dict[str, Any]]:
+        return self._report_dataflow_graph_result(
+            self._fetch_job_dataflow_graph(job), flow_urn
+        )
+
+    def _fetch_job_dataflow_graph(self, job: Dict[str, Any]) -> _DataflowGraphResult:
+        job_script_location = job.get("Command", {}).get("ScriptLocation")
+        if job_script_location is None:
+            return _DataflowGraphResult(
+                failure_counter="num_job_script_location_missing"
+            )
+
+        return self._fetch_dataflow_graph(job_script_location)
+
+    def _fetch_dataflow_graph(self, script_path: str) -> _DataflowGraphResult:
+        # Runs on worker threads, so failures are returned rather than reported.
         # handle a bug in AWS where script path has duplicate prefixes
         if script_path.lower().startswith("s3://s3://"):
             script_path = script_path[5:]
 
         # catch any other cases where the script path is invalid
         if not script_path.startswith("s3://"):
-            self.report_warning(
-                flow_urn,
-                f"Error parsing DAG for Glue job. The script {script_path} is not a valid S3 path.",
+            return _DataflowGraphResult(
+                failure_counter="num_job_script_location_invalid",
+                warning=f"Error parsing DAG for Glue job. The script {script_path} is not a valid S3 path.",
             )
-            self.report.num_job_script_location_invalid += 1
-
-            return None
 
         # extract the script's bucket and key
         url = urlparse(script_path, allow_fragments=False)
@@ -347,28 +392,38 @@ class GlueSource(StatefulIngestionSourceBase):
         try:
             obj = self.s3_client.get_object(Bucket=bucket, Key=key)
         except botocore.exceptions.ClientError as e:
-            self.report_warning(
-                flow_urn,
-                f"Unable to download DAG for Glue job from {script_path}, so job subtasks and lineage will be missing: {e}",
+            return _DataflowGraphResult(
+                failure_counter="num_job_script_failed_download",
+                warning=f"Unable to download DAG for Glue job from {script_path}, so job subtasks and lineage will be missing: {e}",
             )
-            self.report.num_job_script_failed_download += 1
-            return None
         script = obj["Body"].read().decode("utf-8")
 
         try:
             # extract the job DAG from the script
             # see https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/glue.html#Glue.Client.get_dataflow_graph
-            return self.glue_client.get_dataflow_graph(PythonScript=script)
+            return _DataflowGraphResult(
+                dag=self.glue_client.get_dataflow_graph(PythonScript=script)
+            )
 
         # sometimes the Python script can be user-modified and the script is not valid for graph extraction
         except self.glue_client.exceptions.InvalidInputException as e:
-            self.report_warning(
-                flow_urn,
-                f"Error parsing DAG for Glue job. The script {script_path} cannot be processed by Glue (this usually occurs when it has been user-modified): {e}",
+            return _DataflowGraphResult(
+                failure_counter="num_job_script_failed_parsing",
+                warning=f"Error parsing DAG for Glue job. The script {script_path} cannot be processed by Glue (this usually occurs when it has been user-modified): {e}",
             )
-            self.report.num_job_script_failed_parsing += 1
 
-            return None
+    def _report_dataflow_graph_result(
+        self, result: _DataflowGraphResult, flow_urn: str
+    ) -> Optional[Dict[str, Any]]:
+        if result.failure_counter is not None:
+            setattr(
+                self.report,
+                result.failure_counter,
+                getattr(self.report, result.failure_counter) + 1,
+            )
+        if result.warning is not None:
+            self.report_warning(flow_urn, result.warning)
+        return result.dag
 
     def get_s3_uri(self, node_args):
         s3_uri = node_args.get("connection_options", {}).get("path")
@@ -687,11 +742,12 @@ class GlueSource(StatefulIngestionSourceBase):
             if self.source_config.database_pattern.allowed(database["Name"])
         }
 
-        all_tables = [
-            table
-            for database_name in allowed_databases
-            for table in self.get_tables_from_database(database_name)
-        ]
+        tables_futures = BackpressureAwareExecutor.map_ordered(
+            lambda database_name: list(self.get_tables_from_database(database_name)),
+            [(database_name,) for database_name in allowed_databases],
+            max_workers=self.source_config.max_workers,
+        )
+        all_tables = [table for future in tables_futures for table in future.result()]
 
         return allowed_databases, all_tables
 
@@ -817,61 +873,70 @@ class GlueSource(StatefulIngestionSourceBase):
         )
         return mcp
 
-    def get_profile_if_enabled(
-        self, mce: MetadataChangeEventClass, database_name: str, table_name: str
-    ) -> Iterable[MetadataWorkUnit]:
-        # We don't need both checks only the second one
-        # but then lint believes that GlueProfilingConfig can be None
-        if self.source_config.profiling and self.source_config.is_profiling_enabled():
-            # for cross-account ingestion
-            kwargs = dict(
-                DatabaseName=database_name,
-                Name=table_name,
-                CatalogId=self.source_config.catalog_id,
-            )
-            response = self.glue_client.get_table(
-                **{k: v for k, v in kwargs.items() if v}
-            )
+    def get_profile_data(
+        self, database_name: str, table_name: str
+    ) -> Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]:
+        """
+        Fetch the table and, if it is partitioned, its partitions from which the data profile is built.
+        """
 
-            # check if this table is partitioned
-            partition_keys = response["Table"].get("PartitionKeys")
-            if partition_keys:
-                # ingest data profile with partitions
-                # for cross-account ingestion
-                kwargs = dict(
-                    DatabaseName=database_name,
-                    TableName=table_name,
-                    CatalogId=self.source_config.catalog_id,
-                )
-                response = self.glue_client.get_partitions(
-                    **{k: v for k, v in kwargs.items() if v}
-                )
+        # for cross-account ingestion
+        kwargs = dict(
+            DatabaseName=database_name,
+            Name=table_name,
+            CatalogId=self.source_config.catalog_id,
+        )
+        table = self.glue_client.get_table(**{k: v for k, v in kwargs.items() if v})[
+            "Table"
+        ]
+
+        # check if this table is partitioned
+        if not table.get("PartitionKeys"):
+            return table, None
+
+        # for cross-account ingestion
+        kwargs = dict(
+            DatabaseName=database_name,
+            TableName=table_name,
+            CatalogId=self.source_config.catalog_id,
+        )
+        response = self.glue_client.get_partitions(
+            **{k: v for k, v in kwargs.items() if v}
+        )
+        return table, response["Partitions"]
 
-                partitions = response["Partitions"]
-                partition_keys = [k["Name"] for k in partition_keys]
+    def get_profile_workunits(
+        self,
+        mce: MetadataChangeEventClass,
+        table: Dict[str, Any],
+        partitions: Optional[List[Dict[str, Any]]],
+    ) -> Iterable[MetadataWorkUnit]:
+        assert self.source_config.profiling
 
-                for p in partitions:
-                    table_stats = p.get("Parameters", {})
-                    column_stats = p["StorageDescriptor"]["Columns"]
+        if partitions is not None:
+            # ingest data profile with partitions
+            partition_keys = [k["Name"] for k in table["PartitionKeys"]]
 
-                    # only support single partition key
-                    partition_spec = str({partition_keys[0]: p["Values"][0]})
+            for p in partitions:
+                table_stats = p.get("Parameters", {})
+                column_stats = p["StorageDescriptor"]["Columns"]
 
-                    if self.source_config.profiling.partition_patterns.allowed(
-                        partition_spec
-                    ):
-                        yield self._create_profile_mcp(
-                            mce, table_stats, column_stats, partition_spec
-                        ).as_workunit()
-                    else:
-                        continue
-            else:
-                # ingest data profile without partition
-                table_stats = response["Table"]["Parameters"]
-                column_stats = response["Table"]["StorageDescriptor"]["Columns"]
-                yield self._create_profile_mcp(
-                    mce, table_stats, column_stats
-                ).as_workunit()
+                # only support single partition key
+                partition_spec = str({partition_keys[0]: p["Values"][0]})
+
+                if self.source_config.profiling.partition_patterns.allowed(
+                    partition_spec
+                ):
+                    yield self._create_profile_mcp(
+                        mce, table_stats, column_stats, partition_spec
+                    ).as_workunit()
+                else:
+                    continue
+        else:
+            # ingest data profile without partition
+            table_stats = table["Parameters"]
+            column_stats = table["StorageDescriptor"]["Columns"]
+            yield self._create_profile_mcp(mce, table_stats, column_stats).as_workunit()
 
     def gen_database_key(self, database: str) -> DatabaseKey:
         return DatabaseKey(
@@ -934,18 +999,35 @@ class GlueSource(StatefulIngestionSourceBase):
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         database_seen = set()
-        databases, tables = self.get_all_databases_and_tables()
+        databases, all_tables = self.get_all_databases_and_tables()
 
-        for table in tables:
-            database_name = table["DatabaseName"]
-            table_name = table["Name"]
-            full_table_name = f"{database_name}.{table_name}"
+        tables = []
+        for table in all_tables:
+            full_table_name = f"{table['DatabaseName']}.{table['Name']}"
             self.report.report_table_scanned()
             if not self.source_config.database_pattern.allowed(
-                database_name
+                table["DatabaseName"]
             ) or not self.source_config.table_pattern.allowed(full_table_name):
                 self.report.report_table_dropped(full_table_name)
                 continue
+            tables.append(table)
+
+        # The profile of each table is fetched ahead of the table being processed.
+        profile_data_futures: Iterator[Optional[Future]] = (
+            BackpressureAwareExecutor.map_ordered(
+                self.get_profile_data,
+                [(table["DatabaseName"], table["Name"]) for table in tables],
+                max_workers=self.source_config.max_workers,
+            )
+            if self.source_config.profiling
+            and self.source_config.is_profiling_enabled()
+            else itertools.repeat(None)
+        )
+
+        for table, profile_data_future in zip(tables, profile_data_futures):
+            database_name = table["DatabaseName"]
+            table_name = table["Name"]
+            full_table_name = f"{database_name}.{table_name}"
             if database_name not in database_seen:
                 database_seen.add(database_name)
                 yield from self.gen_database_containers(databases[database_name])
@@ -979,7 +1061,10 @@ class GlueSource(StatefulIngestionSourceBase):
             if wu:
                 yield wu
 
-            yield from self.get_profile_if_enabled(mce, database_name, table_name)
+            if profile_data_future is not None:
+                yield from self.get_profile_workunits(
+                    mce, *profile_data_future.result()
+                )
 
         if self.extract_transforms:
             yield from self._transform_extraction()
@@ -987,23 +1072,22 @@ class GlueSource(StatefulIngestionSourceBase):
     def _transform_extraction(self) -> Iterable[MetadataWorkUnit]:
         dags: Dict[str, Optional[Dict[str, Any]]] = {}
         flow_names: Dict[str, str] = {}
-        for job in self.get_all_jobs():
-            flow_urn = mce_builder.make_data_flow_urn(
-                self.platform, job["Name"], self.env
-            )
-
+        jobs = [
+            (job, mce_builder.make_data_flow_urn(self.platform, job["Name"], self.env))
+            for job in self.get_all_jobs()
+        ]
+        # The DAGs are fetched on worker threads, and the report is only updated here.
+        dag_futures = BackpressureAwareExecutor.map_ordered(
+            self._fetch_job_dataflow_graph,
+            [(job,) for job, _ in jobs],
+            max_workers=self.source_config.max_workers,
+        )
+        for (job, flow_urn), dag_future in zip(jobs, dag_futures):
             yield self.get_dataflow_wu(flow_urn, job)
 
-            job_script_location = job.get("Command", {}).get("ScriptLocation")
-
-            dag: Optional[Dict[str, Any]] = None
-
-            if job_script_location is not None:
-                dag = self.get_dataflow_graph(job_script_location, flow_urn)
-            else:
-                self.report.num_job_script_location_missing += 1
-
-            dags[flow_urn] = dag
+            dags[flow_urn] = self._report_dataflow_graph_result(
+                dag_future.result(), flow_urn
+            )
             flow_names[flow_urn] = job["Name"]
         # run a first pass to pick up s3 bucket names and formats
         # in Glue, it's possible for two buckets to have files of different extensions
@@ -736,13 +736,21 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             dataset_name, project_id, bigquery_dataset.labels
         )
 
+        # Skip listing anything that the patterns deny for the entire dataset.
+        identifier_prefix = f"{project_id}.{dataset_name}."
+        include_tables = self.config.include_tables and (
+            self.config.table_pattern.may_allow_prefix(identifier_prefix)
+        )
+        include_views = self.config.include_views and (
+            self.config.view_pattern.may_allow_prefix(identifier_prefix)
+        )
+        include_table_snapshots = self.config.include_table_snapshots and (
+            self.config.table_snapshot_pattern.may_allow_prefix(identifier_prefix)
+        )
+
         columns = None
 
-        if (
-            self.config.include_tables
-            or self.config.include_views
-            or self.config.include_table_snapshots
-        ):
+        if include_tables or include_views or include_table_snapshots:
             columns = self.bigquery_data_dictionary.get_columns_for_dataset(
                 project_id=project_id,
                 dataset_name=dataset_name,
@@ -750,7 +758,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 run_optimized_column_query=self.config.run_optimized_column_query,
             )
 
-        if self.config.include_tables:
+        if include_tables:
             db_tables[dataset_name] = list(
                 self.get_tables_for_dataset(project_id, dataset_name)
             )
@@ -778,7 +786,9 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                         )
                     ),
                 )
-        elif self.store_table_refs:
+        elif self.store_table_refs and self.config.table_pattern.may_allow_prefix(
+            identifier_prefix
+        ):
             # Need table_refs to calculate lineage and usage
             for table_item in self.bigquery_data_dictionary.list_tables(
                 dataset_name, project_id
@@ -800,7 +810,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                         f"Could not create table ref for {table_item.path}: {e}"
                     )
 
-        if self.config.include_views:
+        if include_views:
             db_views[dataset_name] = list(
                 self.bigquery_data_dictionary.get_views_for_dataset(
                     project_id,
@@ -819,7 +829,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                     dataset_name=dataset_name,
                 )
 
-        if self.config.include_table_snapshots:
+        if include_table_snapshots:
             db_snapshots[dataset_name] = list(
                 self.bigquery_data_dictionary.get_snapshots_for_dataset(
                     project_id,
@@ -1,8 +1,9 @@
 import json
 import logging
+import pickle
 from dataclasses import dataclass
 from hashlib import md5
-from typing import Any, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import avro.schema
 import jsonref
@@ -29,6 +30,11 @@ from datahub.utilities.mapping import OperationProcessor
 logger = logging.getLogger(__name__)
 
 
+# The schema string, its references as (name, subject, version) and whether
+# it's a key schema.
+AvroSchemaFingerprint = Tuple[str, Tuple[Tuple[str, str, int], ...], bool]
+
+
 @dataclass
 class JsonSchemaWrapper:
     name: str
@@ -43,6 +49,8 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
     It knows how to get SchemaMetadata of a topic from ConfluentSchemaRegistry
     """
 
+    thread_safe = True
+
     def __init__(
         self, source_config: KafkaSourceConfig, report: KafkaSourceReport
     ) -> None:
@@ -62,6 +70,14 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
         except Exception as e:
             logger.warning(f"Failed to get subjects from schema registry: {e}")
 
+        # Topics often share schemas, so the converted fields of Avro schemas are
+        # memoized by schema content, and referenced schemas by subject. These are
+        # filled from multiple threads; a race only means a schema is converted twice.
+        self._avro_schema_fields_cache: Dict[AvroSchemaFingerprint, bytes] = {}
+        self._reference_schemas_cache: Dict[
+            Tuple[str, Optional[int]], RegisteredSchema
+        ] = {}
+
         self.field_meta_processor = OperationProcessor(
             self.source_config.field_meta_mapping,
             self.source_config.tag_prefix,
@@ -109,6 +125,20 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
                 return subject
         return None
 
+    def _get_reference_schema(
+        self, subject: str, version: Optional[int] = None
+    ) -> RegisteredSchema:
+        key = (subject, version)
+        if key not in self._reference_schemas_cache:
+            self._reference_schemas_cache[key] = (
+                self.schema_registry_client.get_latest_version(subject_name=subject)
+                if version is None
+                else self.schema_registry_client.get_version(
+                    subject_name=subject, version=version
+                )
+            )
+        return self._reference_schemas_cache[key]
+
     @staticmethod
     def _compact_schema(schema_str: str) -> str:
         # Eliminate all white-spaces for a compact representation.
@@ -133,9 +163,7 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
                     f"{ref_subject} is not present in the list of registered subjects with schema registry!"
                 )
 
-            reference_schema = self.schema_registry_client.get_latest_version(
-                subject_name=ref_subject,
-            )
+            reference_schema = self._get_reference_schema(ref_subject)
             schema_seen.add(ref_subject)
             logger.debug(
                 f"ref for {ref_subject} is {reference_schema.schema.schema_str}"
@@ -178,9 +206,7 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             ref_subject: str = schema_ref.subject
             if ref_subject in schema_seen:
                 continue
-            reference_schema: RegisteredSchema = (
-                self.schema_registry_client.get_latest_version(ref_subject)
-            )
+            reference_schema: RegisteredSchema = self._get_reference_schema(ref_subject)
             schema_seen.add(ref_subject)
             all_schemas.append(
                 ProtobufSchema(
@@ -206,10 +232,8 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             ref_subject: str = schema_ref.subject
             if ref_subject in schema_seen:
                 continue
-            reference_schema: RegisteredSchema = (
-                self.schema_registry_client.get_version(
-                    subject_name=ref_subject, version=schema_ref.version
-                )
+            reference_schema: RegisteredSchema = self._get_reference_schema(
+                ref_subject, schema_ref.version
             )
             schema_seen.add(ref_subject)
             all_schemas.extend(
@@ -300,19 +324,7 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
         # Parse the schema and convert it to SchemaFields.
         fields: List[SchemaField] = []
         if schema.schema_type == "AVRO":
-            cleaned_str: str = self.get_schema_str_replace_confluent_ref_avro(schema)
-            avro_schema = avro.schema.parse(cleaned_str)
-
-            # "value.id" or "value.[type=string]id"
-            fields = schema_util.avro_schema_to_mce_fields(
-                avro_schema,
-                is_key_schema=is_key_schema,
-                meta_mapping_processor=self.field_meta_processor
-                if self.source_config.enable_meta_mapping
-                else None,
-                schema_tags_field=self.source_config.schema_tags_field,
-                tag_prefix=self.source_config.tag_prefix,
-            )
+            fields = self._get_avro_schema_fields(schema, is_key_schema)
 
         elif schema.schema_type == "PROTOBUF":
             imported_schemas: List[
@@ -351,6 +363,36 @@ class ConfluentSchemaRegistry(KafkaSchemaRegistryBase):
             )
         return fields
 
+    def _get_avro_schema_fields(
+        self, schema: Schema, is_key_schema: bool
+    ) -> List[SchemaField]:
+        fingerprint: AvroSchemaFingerprint = (
+            schema.schema_str,
+            tuple(
+                (ref.name, ref.subject, ref.version) for ref in schema.references or []
+            ),
+            is_key_schema,
+        )
+        if fingerprint not in self._avro_schema_fields_cache:
+            cleaned_str: str = self.get_schema_str_replace_confluent_ref_avro(schema)
+            avro_schema = avro.schema.parse(cleaned_str)
+
+            # "value.id" or "value.[type=string]id"
+            fields = schema_util.avro_schema_to_mce_fields(
+                avro_schema,
+                is_key_schema=is_key_schema,
+                meta_mapping_processor=self.field_meta_processor
+                if self.source_config.enable_meta_mapping
+                else None,
+                schema_tags_field=self.source_config.schema_tags_field,
+                tag_prefix=self.source_config.tag_prefix,
+            )
+            self._avro_schema_fields_cache[fingerprint] = pickle.dumps(fields)
+
+        # The fields end up in aspects that may be modified further down the
+        # pipeline, so every topic gets its own copy.
+        return pickle.loads(self._avro_schema_fields_cache[fingerprint])
+
     def _get_schema_metadata(
         self, topic: str, platform_urn: str
     ) -> Optional[SchemaMetadata]:
@@ -1,13 +1,15 @@
+import collections
+import concurrent.futures
 import datetime
 import json
 import logging
 import os.path
 import pathlib
+import time
 from dataclasses import dataclass, field
 from enum import auto
 from functools import partial
-from io import BufferedReader
-from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import IO, Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib import parse
 
 import ijson
@@ -18,6 +20,7 @@ from pydantic.fields import Field
 from datahub.configuration.common import ConfigEnum, ConfigModel, ConfigurationError
 from datahub.configuration.validate_field_deprecation import pydantic_field_deprecated
 from datahub.configuration.validate_field_rename import pydantic_renamed_field
+from datahub.emitter.aspect import JSON_CONTENT_TYPE
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.decorators import (
@@ -35,6 +38,13 @@ from datahub.ingestion.api.source import (
 )
 from datahub.ingestion.api.source_helpers import auto_workunit_reporter
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.sink.file import (
+    FileCompression,
+    FileFormat,
+    detect_file_format,
+    import_fastavro,
+    open_metadata_file,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
@@ -43,6 +53,15 @@ from datahub.metadata.schema_classes import UsageAggregationClass
 
 logger = logging.getLogger(__name__)
 
+# With parallelism, files are split into about 4 byte ranges per worker, within
+# these bounds.
+_MIN_PARALLEL_CHUNK_SIZE_BYTES = 1024 * 1024
+_MAX_PARALLEL_CHUNK_SIZE_BYTES = 64 * 1024 * 1024
+
+_DeserializedItem = Union[
+    MetadataChangeEvent, MetadataChangeProposalWrapper, MetadataChangeProposal
+]
+
 
 class FileReadMode(ConfigEnum):
     STREAM = auto()
@@ -72,6 +91,14 @@ class FileSourceConfig(ConfigModel):
         description="When enabled, counts total number of records in the file before starting. Used for accurate estimation of completion time. Turn it off if startup time is too high.",
     )
 
+    parallelism: int = Field(
+        default=1,
+        description="Number of worker processes used to decode and deserialize "
+        "uncompressed ndjson files. Each file is split into byte ranges that are "
+        "processed concurrently, and records are still emitted in file order. Other "
+        "files are read as usual.",
+    )
+
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
     )
@@ -175,7 +202,7 @@ class GenericFileSource(TestableSource):
         self.ctx = ctx
         self.config = config
         self.report = FileSourceReport()
-        self.fp: Optional[BufferedReader] = None
+        self.fp: Optional[IO[bytes]] = None
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -211,25 +238,22 @@ class GenericFileSource(TestableSource):
     def get_workunits_internal(
         self,
     ) -> Iterable[MetadataWorkUnit]:
-        for f in self.get_filenames():
-            for i, obj in self.iterate_generic_file(f):
-                id = f"file://{f}:{i}"
-                if isinstance(
-                    obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)
+        for f, i, obj in self._iterate_generic_files():
+            id = f"file://{f}:{i}"
+            if isinstance(obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)):
+                if (
+                    self.config.aspect is not None
+                    and obj.aspectName is not None
+                    and obj.aspectName != self.config.aspect
                 ):
-                    if (
-                        self.config.aspect is not None
-                        and obj.aspectName is not None
-                        and obj.aspectName != self.config.aspect
-                    ):
-                        continue
-
-                    if isinstance(obj, MetadataChangeProposalWrapper):
-                        yield MetadataWorkUnit(id, mcp=obj)
-                    else:
-                        yield MetadataWorkUnit(id, mcp_raw=obj)
+                    continue
+
+                if isinstance(obj, MetadataChangeProposalWrapper):
+                    yield MetadataWorkUnit(id, mcp=obj)
                 else:
-                    yield MetadataWorkUnit(id, mce=obj)
+                    yield MetadataWorkUnit(id, mcp_raw=obj)
+            else:
+                yield MetadataWorkUnit(id, mce=obj)
 
     def get_report(self):
         return self.report
@@ -244,55 +268,13 @@ class GenericFileSource(TestableSource):
         path_parsed = parse.urlparse(path)
         if path_parsed.scheme not in ("http", "https"):  # A local file
             self.report.current_file_size = os.path.getsize(path)
-            if self.config.read_mode == FileReadMode.AUTO:
-                file_read_mode = (
-                    FileReadMode.BATCH
-                    if self.report.current_file_size
-                    < self.config._minsize_for_streaming_mode_in_bytes
-                    else FileReadMode.STREAM
-                )
-                logger.info(f"Reading file {path} in {file_read_mode} mode")
-            else:
-                file_read_mode = self.config.read_mode
-
-            if file_read_mode == FileReadMode.BATCH:
-                with open(path, "r") as f:
-                    parse_start_time = datetime.datetime.now()
-                    obj_list = json.load(f)
-                    parse_end_time = datetime.datetime.now()
-                    self.report.add_parse_time(parse_end_time - parse_start_time)
-                if not isinstance(obj_list, list):
-                    obj_list = [obj_list]
-                count_start_time = datetime.datetime.now()
-                self.report.current_file_num_elements = len(obj_list)
-                self.report.add_count_time(datetime.datetime.now() - count_start_time)
-                self.report.current_file_elements_read = 0
-                for i, obj in enumerate(obj_list):
-                    yield i, obj
-                    self.report.current_file_elements_read += 1
+            file_format, compression = detect_file_format(path)
+            if file_format == FileFormat.NDJSON:
+                yield from self._iterate_ndjson_file(path, compression)
+            elif file_format == FileFormat.AVRO:
+                yield from self._iterate_avro_file(path)
             else:
-                self.fp = open(path, "rb")
-                if self.config.count_all_before_starting:
-                    count_start_time = datetime.datetime.now()
-                    parse_stream = ijson.parse(self.fp, use_float=True)
-                    total_elements = 0
-                    for row in ijson.items(parse_stream, "item", use_float=True):
-                        total_elements += 1
-                    count_end_time = datetime.datetime.now()
-                    self.report.add_count_time(count_end_time - count_start_time)
-                    self.report.current_file_num_elements = total_elements
-                self.report.current_file_elements_read = 0
-                self.fp.seek(0)
-                parse_start_time = datetime.datetime.now()
-                parse_stream = ijson.parse(self.fp, use_float=True)
-                rows_yielded = 0
-                for row in ijson.items(parse_stream, "item", use_float=True):
-                    parse_end_time = datetime.datetime.now()
-                    self.report.add_parse_time(parse_end_time - parse_start_time)
-                    rows_yielded += 1
-                    self.report.current_file_elements_read += 1
-                    yield rows_yielded, row
-                    parse_start_time = datetime.datetime.now()
+                yield from self._iterate_json_file(path, compression)
         else:
             try:
                 response = requests.get(path)
@@ -310,11 +292,187 @@ class GenericFileSource(TestableSource):
                 yield i, obj
                 self.report.current_file_elements_read += 1
 
+        self._complete_file(path)
+
+    def _complete_file(self, path: str) -> None:
         self.report.files_completed.append(path)
         self.report.num_files_completed += 1
         self.report.total_bytes_read_completed_files += self.report.current_file_size
         self.report.reset_current_file_stats()
 
+    def _iterate_generic_files(self) -> Iterable[Tuple[str, int, _DeserializedItem]]:
+        filenames = self.get_filenames()
+        if self.config.parallelism <= 1:
+            for f in filenames:
+                for i, obj in self.iterate_generic_file(f):
+                    yield f, i, obj
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.config.parallelism
+        ) as executor:
+            for f in filenames:
+                if _is_splittable_file(f):
+                    for i, obj in self._iterate_ndjson_file_parallel(executor, f):
+                        yield f, i, obj
+                else:
+                    for i, obj in self.iterate_generic_file(f):
+                        yield f, i, obj
+
+    def _iterate_ndjson_file_parallel(
+        self, executor: concurrent.futures.Executor, path: str
+    ) -> Iterable[Tuple[int, _DeserializedItem]]:
+        self.report.current_file_name = path
+        self.report.current_file_size = file_size = os.path.getsize(path)
+        if self.config.count_all_before_starting:
+            count_start_time = datetime.datetime.now()
+            with open(path, "rb") as f:
+                self.report.current_file_num_elements = _count_lines(f)
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+        self.report.current_file_elements_read = 0
+
+        chunk_size = min(
+            max(
+                file_size // (self.config.parallelism * 4),
+                _MIN_PARALLEL_CHUNK_SIZE_BYTES,
+            ),
+            _MAX_PARALLEL_CHUNK_SIZE_BYTES,
+        )
+        ranges = iter(range(0, file_size, chunk_size))
+        # Only a bounded number of ranges is in flight, so that memory use doesn't
+        # depend on how far the workers are ahead of the consumer.
+        max_in_flight = self.config.parallelism * 2
+        pending: Deque["concurrent.futures.Future[_RangeResult]"] = collections.deque()
+
+        def submit_next() -> None:
+            start = next(ranges, None)
+            if start is not None:
+                end = start + chunk_size
+                pending.append(executor.submit(_read_ndjson_range, path, start, end))
+
+        for _ in range(max_in_flight):
+            submit_next()
+
+        i = 0
+        while pending:
+            entries, parse_seconds, deserialize_seconds = pending.popleft().result()
+            submit_next()
+            self.report.add_parse_time(datetime.timedelta(seconds=parse_seconds))
+            self.report.add_deserialize_time(
+                datetime.timedelta(seconds=deserialize_seconds)
+            )
+            for item, error in entries:
+                if error is not None:
+                    self.report.report_failure(f"path-{i}", error)
+                elif item is not None:
+                    yield i, item
+                i += 1
+                self.report.current_file_elements_read += 1
+
+        self._complete_file(path)
+
+    def _iterate_json_file(
+        self, path: str, compression: FileCompression
+    ) -> Iterable[Tuple[int, Any]]:
+        if self.config.read_mode == FileReadMode.AUTO:
+            file_read_mode = (
+                FileReadMode.BATCH
+                if self.report.current_file_size
+                < self.config._minsize_for_streaming_mode_in_bytes
+                else FileReadMode.STREAM
+            )
+            logger.info(f"Reading file {path} in {file_read_mode} mode")
+        else:
+            file_read_mode = self.config.read_mode
+
+        if file_read_mode == FileReadMode.BATCH:
+            with open_metadata_file(path, "rb", compression) as f:
+                parse_start_time = datetime.datetime.now()
+                obj_list = json.load(f)
+                parse_end_time = datetime.datetime.now()
+                self.report.add_parse_time(parse_end_time - parse_start_time)
+            if not isinstance(obj_list, list):
+                obj_list = [obj_list]
+            count_start_time = datetime.datetime.now()
+            self.report.current_file_num_elements = len(obj_list)
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+            self.report.current_file_elements_read = 0
+            for i, obj in enumerate(obj_list):
+                yield i, obj
+                self.report.current_file_elements_read += 1
+        else:
+            if self.config.count_all_before_starting:
+                count_start_time = datetime.datetime.now()
+                with open_metadata_file(path, "rb", compression) as f:
+                    parse_stream = ijson.parse(f, use_float=True)
+                    total_elements = 0
+                    for row in ijson.items(parse_stream, "item", use_float=True):
+                        total_elements += 1
+                count_end_time = datetime.datetime.now()
+                self.report.add_count_time(count_end_time - count_start_time)
+                self.report.current_file_num_elements = total_elements
+            self.report.current_file_elements_read = 0
+            # Compressed streams can't always seek, so we open the file again.
+            self.fp = open_metadata_file(path, "rb", compression)
+            parse_start_time = datetime.datetime.now()
+            parse_stream = ijson.parse(self.fp, use_float=True)
+            rows_yielded = 0
+            for row in ijson.items(parse_stream, "item", use_float=True):
+                parse_end_time = datetime.datetime.now()
+                self.report.add_parse_time(parse_end_time - parse_start_time)
+                rows_yielded += 1
+                self.report.current_file_elements_read += 1
+                yield rows_yielded, row
+                parse_start_time = datetime.datetime.now()
+
+    def _iterate_ndjson_file(
+        self, path: str, compression: FileCompression
+    ) -> Iterable[Tuple[int, Any]]:
+        if self.config.count_all_before_starting:
+            count_start_time = datetime.datetime.now()
+            with open_metadata_file(path, "rb", compression) as f:
+                total_elements = _count_lines(f)
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+            self.report.current_file_num_elements = total_elements
+        self.report.current_file_elements_read = 0
+        self.fp = open_metadata_file(path, "rb", compression)
+        parse_start_time = datetime.datetime.now()
+        rows_yielded = 0
+        for line in self.fp:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except Exception as e:
+                # Skip the malformed line, like the parallel reader does.
+                self.report.report_failure(f"path-{rows_yielded}", str(e))
+            else:
+                self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+                yield rows_yielded, row
+            rows_yielded += 1
+            self.report.current_file_elements_read += 1
+            parse_start_time = datetime.datetime.now()
+
+    def _iterate_avro_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        fastavro = import_fastavro()
+        if self.config.count_all_before_starting:
+            count_start_time = datetime.datetime.now()
+            with open(path, "rb") as f:
+                total_elements = sum(
+                    block.num_records for block in fastavro.block_reader(f)
+                )
+            self.report.add_count_time(datetime.datetime.now() - count_start_time)
+            self.report.current_file_num_elements = total_elements
+        self.report.current_file_elements_read = 0
+        self.fp = open(path, "rb")
+        parse_start_time = datetime.datetime.now()
+        for i, record in enumerate(fastavro.reader(self.fp)):
+            row = _avro_record_to_obj(record)
+            self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+            yield i, row
+            self.report.current_file_elements_read += 1
+            parse_start_time = datetime.datetime.now()
+
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
             mce: MetadataChangeEvent = MetadataChangeEvent.from_obj(obj)
@@ -410,6 +568,76 @@ def _from_obj_for_file(
         return item
 
 
+# (deserialized item or None, error), parse seconds, deserialize seconds
+_RangeResult = Tuple[
+    List[Tuple[Optional[_DeserializedItem], Optional[str]]], float, float
+]
+
+
+def _is_splittable_file(path: str) -> bool:
+    if parse.urlparse(path).scheme in ("http", "https"):
+        return False
+    return detect_file_format(path) == (FileFormat.NDJSON, FileCompression.NONE)
+
+
+def _count_lines(f: IO[bytes]) -> int:
+    """Counts the lines in a file by scanning for newlines, without parsing them."""
+
+    count = 0
+    last_block = b""
+    for block in iter(lambda: f.read(1024 * 1024), b""):
+        count += block.count(b"\n")
+        last_block = block
+    if last_block and not last_block.endswith(b"\n"):
+        count += 1
+    return count
+
+
+def _read_ndjson_range(path: str, start: int, end: int) -> _RangeResult:
+    # Runs in a worker process. A line belongs to the range in which it starts.
+    entries: List[Tuple[Optional[_DeserializedItem], Optional[str]]] = []
+    parse_seconds = 0.0
+    deserialize_seconds = 0.0
+    with open(path, "rb") as f:
+        position = start
+        if start > 0:
+            # Skip the remainder of the line that started in the previous range.
+            f.seek(start - 1)
+            position = start - 1 + len(f.readline())
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+
+            parse_start_time = time.perf_counter()
+            try:
+                obj = json.loads(line)
+                deserialize_start_time = time.perf_counter()
+                parse_seconds += deserialize_start_time - parse_start_time
+                entries.append((_from_obj_for_file(obj), None))
+                deserialize_seconds += time.perf_counter() - deserialize_start_time
+            except Exception as e:
+                entries.append((None, str(e)))
+    return entries, parse_seconds, deserialize_seconds
+
+
+def _avro_record_to_obj(record: dict) -> dict:
+    # Avro files hold MCPs with their aspects as raw bytes. JSON aspects are unpacked
+    # like the file sink does, and anything else is passed on as a string.
+    for key in ("aspect", "entityKeyAspect"):
+        generic_aspect = record.get(key)
+        if not generic_aspect:
+            continue
+        if key == "aspect" and generic_aspect.get("contentType") == JSON_CONTENT_TYPE:
+            record[key] = {"json": json.loads(generic_aspect["value"])}
+        elif isinstance(generic_aspect.get("value"), bytes):
+            generic_aspect["value"] = generic_aspect["value"].decode()
+    return record
+
+
 def read_metadata_file(
     file: pathlib.Path,
 ) -> Iterable[
@@ -3,7 +3,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Type, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, cast
 
 import avro.schema
 import confluent_kafka
@@ -63,6 +63,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
 from datahub.metadata.com.linkedin.pegasus2avro.common import Status
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
+from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaMetadata
 from datahub.metadata.schema_classes import (
     BrowsePathsClass,
     DataPlatformInstanceClass,
@@ -71,11 +72,14 @@ from datahub.metadata.schema_classes import (
     OwnershipSourceTypeClass,
     SubTypesClass,
 )
+from datahub.utilities.advanced_thread_executor import BackpressureAwareExecutor
 from datahub.utilities.mapping import Constants, OperationProcessor
 from datahub.utilities.registries.domain_registry import DomainRegistry
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_SCHEMA_REGISTRY_MAX_WORKERS = 10
+
 
 class KafkaTopicConfigKeys(str, Enum):
     MIN_INSYNC_REPLICAS_CONFIG = "min.insync.replicas"
@@ -138,6 +142,13 @@ class KafkaSourceConfig(
         default=False,
         description="Disables the utilization of the TopicRecordNameStrategy for Schema Registry subjects. For more information, visit: https://docs.confluent.io/platform/current/schema-registry/serdes-develop/index.html#handling-differences-between-preregistered-and-client-derived-schemas:~:text=io.confluent.kafka.serializers.subject.TopicRecordNameStrategy",
     )
+    schema_registry_max_workers: Optional[pydantic.PositiveInt] = pydantic.Field(
+        default=None,
+        description="Number of threads used to fetch topic schemas from the schema registry in parallel. "
+        f"Defaults to {_DEFAULT_SCHEMA_REGISTRY_MAX_WORKERS} if the `schema_registry_class` declares that it is "
+        "thread-safe by setting `thread_safe = True`, as the default ConfluentSchemaRegistry does, and to 1 otherwise. "
+        "A custom `schema_registry_class` must be thread-safe to use more than one.",
+    )
 
 
 def get_kafka_consumer(
@@ -297,32 +308,58 @@ class KafkaSource(StatefulIngestionSourceBase, TestableSource):
             ).workunit_processor,
         ]
 
+    def _get_schema_registry_max_workers(self) -> int:
+        if self.source_config.schema_registry_max_workers is not None:
+            return self.source_config.schema_registry_max_workers
+        # Custom schema registries don't necessarily subclass KafkaSchemaRegistryBase.
+        if getattr(self.schema_registry_client, "thread_safe", False):
+            return _DEFAULT_SCHEMA_REGISTRY_MAX_WORKERS
+        return 1
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         topics = self.consumer.list_topics(
             timeout=self.source_config.connection.client_timeout_seconds
         ).topics
         extra_topic_details = self.fetch_extra_topic_details(topics.keys())
 
+        allowed_topics: List[Tuple[str, Optional[TopicMetadata]]] = []
         for t, t_detail in topics.items():
             self.report.report_topic_scanned(t)
             if self.source_config.topic_patterns.allowed(t):
-                try:
-                    yield from self._extract_record(
-                        t, t_detail, extra_topic_details.get(t)
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to extract topic {t}", exc_info=True)
-                    self.report.report_warning(
-                        "topic", f"Exception while extracting topic {t}: {e}"
-                    )
+                allowed_topics.append((t, t_detail))
             else:
                 self.report.report_dropped(t)
 
+        # Fetching schemas is mostly waiting on the schema registry, so it runs
+        # ahead of the topics being extracted.
+        platform_urn = make_data_platform_urn(self.platform)
+        schema_metadata_futures = BackpressureAwareExecutor.map_ordered(
+            self.schema_registry_client.get_schema_metadata,
+            ((t, platform_urn) for t, _ in allowed_topics),
+            max_workers=self._get_schema_registry_max_workers(),
+        )
+        for schema_metadata_future, (t, t_detail) in zip(
+            schema_metadata_futures, allowed_topics
+        ):
+            try:
+                yield from self._extract_record(
+                    t,
+                    t_detail,
+                    extra_topic_details.get(t),
+                    schema_metadata_future.result(),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to extract topic {t}", exc_info=True)
+                self.report.report_warning(
+                    "topic", f"Exception while extracting topic {t}: {e}"
+                )
+
     def _extract_record(
         self,
         topic: str,
         topic_detail: Optional[TopicMetadata],
         extra_topic_config: Optional[Dict[str, ConfigEntry]],
+        schema_metadata: Optional[SchemaMetadata],
     ) -> Iterable[MetadataWorkUnit]:
         logger.debug(f"topic = {topic}")
 
@@ -342,10 +379,7 @@ class KafkaSource(StatefulIngestionSourceBase, TestableSource):
             aspects=[Status(removed=False)],  # we append to this list later on
         )
 
-        # 2. Attach schemaMetadata aspect (pass control to SchemaRegistry)
-        schema_metadata = self.schema_registry_client.get_schema_metadata(
-            topic, platform_urn
-        )
+        # 2. Attach schemaMetadata aspect (fetched from the SchemaRegistry)
         if schema_metadata is not None:
             dataset_snapshot.aspects.append(schema_metadata)
 
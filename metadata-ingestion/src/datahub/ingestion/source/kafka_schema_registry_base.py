@@ -5,6 +5,10 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaMetadata
 
 
 class KafkaSchemaRegistryBase(ABC):
+    # Implementations that can serve get_schema_metadata from multiple threads at once
+    # should set this, so that the schemas of several topics are fetched in parallel.
+    thread_safe: bool = False
+
     @abstractmethod
     def get_schema_metadata(
         self, topic: str, platform_urn: str
@@ -1,10 +1,22 @@
+import functools
+import hashlib
 import pathlib
-from typing import Union
+import pickle
+import sys
+from typing import Optional, Union
 
 import lkml
 import lkml.simple
 import lkml.tree
 
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
+
+if sys.version_info < (3, 10):
+    from importlib_metadata import version
+else:
+    from importlib.metadata import version
+
 # Patch lkml to support the manifest.lkml files.
 # We have to patch both locations because lkml uses a immutable tuple
 # instead of a list for this type.
@@ -18,11 +30,69 @@ lkml.simple.PLURAL_KEYS = (
 lkml.tree.PLURAL_KEYS = lkml.simple.PLURAL_KEYS
 
 
-def load_lkml(path: Union[str, pathlib.Path]) -> dict:
+def load_lkml(
+    path: Union[str, pathlib.Path], cache: Optional["LkmlParseCache"] = None
+) -> dict:
     """Loads a LookML file from disk and returns a dictionary."""
 
+    if cache is not None:
+        return cache.load(path)
+
     # Using this method instead of lkml.load directly ensures
     # that our patches to lkml are applied.
 
     with open(path, "r") as file:
         return lkml.load(file)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser_fingerprint() -> str:
+    # Parsed files are only valid for the lkml version and patches that produced them.
+    return f"{version('lkml')}:{','.join(lkml.simple.PLURAL_KEYS)}"
+
+
+class LkmlParseCache(Closeable):
+    """
+    Caches parsed LookML files, keyed by a hash of their content.
+
+    The same file is loaded many times while resolving includes, and parsing it is
+    much slower than unpickling the parsed dictionary. If a filename is given, the
+    cache is persisted there, so that files which are unchanged since a previous run
+    are not parsed again. Since the key doesn't depend on the file's path, this also
+    works for projects which are cloned to a new temporary directory on every run.
+    """
+
+    def __init__(self, filename: Optional[pathlib.Path] = None):
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = ConnectionWrapper(filename=filename)
+        # The values are stored pickled, so that every load returns a fresh copy
+        # that callers are free to modify.
+        self._parsed_files: FileBackedDict[bytes] = FileBackedDict(
+            shared_connection=self._conn,
+            tablename="lkml_parsed_files",
+            serializer=lambda value: value,
+            deserializer=lambda value: value,
+            should_compress_value=True,
+        )
+
+    def load(self, path: Union[str, pathlib.Path]) -> dict:
+        with open(path, "r") as file:
+            content = file.read()
+        key = hashlib.sha256(
+            f"{_get_parser_fingerprint()}\n{content}".encode()
+        ).hexdigest()
+
+        pickled = self._parsed_files.get(key)
+        if pickled is not None:
+            self.hits += 1
+            return pickle.loads(pickled)
+
+        self.misses += 1
+        parsed = lkml.load(content)
+        self._parsed_files[key] = pickle.dumps(parsed)
+        return parsed
+
+    def close(self) -> None:
+        self._conn.close()
@@ -53,7 +53,7 @@ from datahub.ingestion.source.common.subtypes import (
     DatasetSubTypes,
 )
 from datahub.ingestion.source.git.git_import import GitClone
-from datahub.ingestion.source.looker.lkml_patched import load_lkml
+from datahub.ingestion.source.looker.lkml_patched import LkmlParseCache, load_lkml
 from datahub.ingestion.source.looker.looker_common import (
     CORPUSER_DATAHUB,
     LookerCommonConfig,
@@ -253,6 +253,12 @@ class LookMLSourceConfig(
         False,
         description="When enabled, looker refinement will be processed to adapt an existing view.",
     )
+    lkml_parse_cache_path: Optional[str] = Field(
+        None,
+        description="Path to a file in which parsed LookML files are cached. "
+        "Files are cached by their content, so files which are unchanged since a previous run are not parsed again. "
+        "If not set, parsed files are only reused within a single run.",
+    )
 
     @validator("connection_to_platform_map", pre=True)
     def convert_string_to_connection_def(cls, conn_map):
@@ -324,7 +330,11 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     query_parse_attempts: int = 0
     query_parse_failures: int = 0
     query_parse_failure_views: List[str] = dataclass_field(default_factory=LossyList)
+    lkml_parse_cache_hits: int = 0
+    lkml_parse_cache_misses: int = 0
+    lkml_parse_cache_hit_ratio: Optional[float] = None
     _looker_api: Optional[LookerAPI] = None
+    _lkml_parse_cache: Optional[LkmlParseCache] = None
 
     def report_models_scanned(self) -> None:
         self.models_discovered += 1
@@ -344,6 +354,12 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     def compute_stats(self) -> None:
         if self._looker_api:
             self.api_stats = self._looker_api.compute_stats()
+        if self._lkml_parse_cache:
+            self.lkml_parse_cache_hits = self._lkml_parse_cache.hits
+            self.lkml_parse_cache_misses = self._lkml_parse_cache.misses
+            total = self.lkml_parse_cache_hits + self.lkml_parse_cache_misses
+            if total:
+                self.lkml_parse_cache_hit_ratio = self.lkml_parse_cache_hits / total
         return super().compute_stats()
 
 
@@ -362,6 +378,7 @@ class LookerModel:
         base_projects_folders: Dict[str, pathlib.Path],
         path: str,
         reporter: LookMLSourceReport,
+        lkml_cache: Optional[LkmlParseCache] = None,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -375,6 +392,7 @@ class LookerModel:
             reporter,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
+            lkml_cache=lkml_cache,
         )
         logger.debug(f"{path} has resolved_includes: {resolved_includes}")
         explores = looker_model_dict.get("explores", [])
@@ -386,7 +404,7 @@ class LookerModel:
         ]
         for included_file in explore_files:
             try:
-                parsed = load_lkml(included_file)
+                parsed = load_lkml(included_file, cache=lkml_cache)
                 included_explores = parsed.get("explores", [])
                 explores.extend(included_explores)
             except Exception as e:
@@ -412,6 +430,7 @@ class LookerModel:
         reporter: LookMLSourceReport,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
+        lkml_cache: Optional[LkmlParseCache] = None,
     ) -> List[ProjectInclude]:
         """Resolve ``include`` statements in LookML model files to a list of ``.lkml`` files.
 
@@ -515,7 +534,7 @@ class LookerModel:
                     f"Will be loading {included_file}, traversed here via {traversal_path}"
                 )
                 try:
-                    parsed = load_lkml(included_file)
+                    parsed = load_lkml(included_file, cache=lkml_cache)
                     seen_so_far.add(included_file)
                     if "includes" in parsed:  # we have more includes to resolve!
                         resolved.extend(
@@ -530,6 +549,7 @@ class LookerModel:
                                 traversal_path=traversal_path
                                 + "."
                                 + pathlib.Path(included_file).stem,
+                                lkml_cache=lkml_cache,
                             )
                         )
                 except Exception as e:
@@ -566,6 +586,7 @@ class LookerViewFile:
         base_projects_folder: Dict[str, pathlib.Path],
         raw_file_content: str,
         reporter: LookMLSourceReport,
+        lkml_cache: Optional[LkmlParseCache] = None,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -580,6 +601,7 @@ class LookerViewFile:
             absolute_file_path,
             reporter,
             seen_so_far=seen_so_far,
+            lkml_cache=lkml_cache,
         )
         logger.debug(
             f"resolved_includes for {absolute_file_path} is {resolved_includes}"
@@ -613,11 +635,13 @@ class LookerViewFileLoader:
         root_project_name: Optional[str],
         base_projects_folder: Dict[str, pathlib.Path],
         reporter: LookMLSourceReport,
+        lkml_cache: Optional[LkmlParseCache] = None,
     ) -> None:
         self.viewfile_cache: Dict[str, LookerViewFile] = {}
         self._root_project_name = root_project_name
         self._base_projects_folder = base_projects_folder
         self.reporter = reporter
+        self._lkml_cache = lkml_cache
 
     def is_view_seen(self, path: str) -> bool:
         return path in self.viewfile_cache
@@ -649,7 +673,7 @@ class LookerViewFileLoader:
             return None
         try:
             logger.debug(f"Loading viewfile {path}")
-            parsed = load_lkml(path)
+            parsed = load_lkml(path, cache=self._lkml_cache)
             looker_viewfile = LookerViewFile.from_looker_dict(
                 absolute_file_path=path,
                 looker_view_file_dict=parsed,
@@ -658,6 +682,7 @@ class LookerViewFileLoader:
                 base_projects_folder=self._base_projects_folder,
                 raw_file_content=raw_file_content,
                 reporter=reporter,
+                lkml_cache=self._lkml_cache,
             )
             logger.debug(f"adding viewfile for path {path} to the cache")
             self.viewfile_cache[path] = looker_viewfile
@@ -1486,6 +1511,12 @@ class LookMLSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.source_config = config
         self.reporter = LookMLSourceReport()
+        self.lkml_cache = LkmlParseCache(
+            filename=pathlib.Path(config.lkml_parse_cache_path)
+            if config.lkml_parse_cache_path
+            else None
+        )
+        self.reporter._lkml_parse_cache = self.lkml_cache
 
         # To keep track of projects (containers) which have already been ingested
         self.processed_projects: List[str] = []
@@ -1502,7 +1533,7 @@ class LookMLSource(StatefulIngestionSourceBase):
 
     def _load_model(self, path: str) -> LookerModel:
         logger.debug(f"Loading model from file {path}")
-        parsed = load_lkml(path)
+        parsed = load_lkml(path, cache=self.lkml_cache)
         looker_model = LookerModel.from_looker_dict(
             parsed,
             _BASE_PROJECT_NAME,
@@ -1510,6 +1541,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             self.base_projects_folder,
             path,
             self.reporter,
+            lkml_cache=self.lkml_cache,
         )
         return looker_model
 
@@ -1993,6 +2025,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             self.source_config.project_name,
             self.base_projects_folder,
             self.reporter,
+            lkml_cache=self.lkml_cache,
         )
 
         # Some views can be mentioned by multiple 'include' statements and can be included via different connections.
@@ -2256,3 +2289,7 @@ class LookMLSource(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.reporter
+
+    def close(self) -> None:
+        self.lkml_cache.close()
+        super().close()
@@ -19,6 +19,7 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
+from datahub.utilities.perf_timer import PerfTimer
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +167,9 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
     number_of_workspaces: int = 0
+    m_query_parse_cache_hits: int = 0
+    m_query_parse_cache_misses: int = 0
+    m_query_parse_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -356,6 +360,13 @@ class PowerBiDashboardSourceConfig(
         default=True,
         description="Whether PowerBI native query should be parsed to extract lineage",
     )
+    # Reuse M-Query parse trees across ingestion runs
+    m_query_parse_cache_path: Optional[str] = pydantic.Field(
+        default=None,
+        description="Path to a file in which parsed M-Query expressions are cached. "
+        "Parsing M-Query expressions is slow, so expressions which are unchanged since a previous run are not parsed again. "
+        "If not set, parse trees are only reused within a single run.",
+    )
 
     # convert PowerBI dataset URN to lower-case
     convert_urns_to_lowercase: bool = pydantic.Field(
@@ -1,11 +1,14 @@
 import functools
+import hashlib
 import importlib.resources as pkg_resource
 import logging
-from typing import Dict, List
+import pathlib
+from typing import Dict, List, Optional
 
 import lark
 from lark import Lark, Tree
 
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.powerbi.config import (
     PowerBiDashboardSourceConfig,
@@ -19,18 +22,75 @@ from datahub.ingestion.source.powerbi.m_query.data_classes import (
     TRACE_POWERBI_MQUERY_PARSER,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
+from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
 
 logger = logging.getLogger(__name__)
 
+# Parse trees are large, so only a few are kept deserialized in memory.
+_PARSE_TREE_MEMORY_CACHE_SIZE = 64
+
 
 @functools.lru_cache(maxsize=1)
-def get_lark_parser() -> Lark:
+def _get_grammar() -> str:
     # Read lexical grammar as text
-    grammar: str = pkg_resource.read_text(
+    return pkg_resource.read_text(
         "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_lark_parser() -> Lark:
     # Create lark parser for the grammar text
-    return Lark(grammar, start="let_expression", regex=True)
+    return Lark(_get_grammar(), start="let_expression", regex=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_grammar_fingerprint() -> str:
+    # Cached parse trees are only valid for the grammar and lark version that produced them.
+    return hashlib.sha256(f"{lark.__version__}\n{_get_grammar()}".encode()).hexdigest()
+
+
+class ParseTreeCache(Closeable):
+    """
+    Caches M-Query parse trees, keyed by a hash of the expression and the grammar.
+
+    Many tables share identical expressions, and parsing them with the Earley parser
+    is by far the slowest part of lineage extraction. If a filename is given, the cache
+    is persisted there, so that expressions parsed by previous runs are reused.
+    """
+
+    def __init__(
+        self,
+        reporter: PowerBiDashboardSourceReport,
+        filename: Optional[pathlib.Path] = None,
+    ):
+        self._reporter = reporter
+        self._conn = ConnectionWrapper(filename=filename)
+        self._trees: FileBackedDict[Tree] = FileBackedDict(
+            shared_connection=self._conn,
+            tablename="m_query_parse_trees",
+            cache_max_size=_PARSE_TREE_MEMORY_CACHE_SIZE,
+            should_compress_value=True,
+        )
+
+    def get_or_parse(self, expression: str) -> Tree:
+        key = hashlib.sha256(
+            f"{_get_grammar_fingerprint()}\n{expression}".encode()
+        ).hexdigest()
+
+        parse_tree = self._trees.get(key)
+        if parse_tree is not None:
+            self._reporter.m_query_parse_cache_hits += 1
+            return parse_tree
+
+        self._reporter.m_query_parse_cache_misses += 1
+        with self._reporter.m_query_parse_timer:
+            parse_tree = _parse_expression(expression)
+        self._trees[key] = parse_tree
+        return parse_tree
+
+    def close(self) -> None:
+        self._conn.close()
 
 
 def _parse_expression(expression: str) -> Tree:
@@ -56,6 +116,7 @@ def get_upstream_tables(
     ctx: PipelineContext,
     config: PowerBiDashboardSourceConfig,
     parameters: Dict[str, str] = {},
+    parse_cache: Optional[ParseTreeCache] = None,
 ) -> List[resolver.Lineage]:
     if table.expression is None:
         logger.debug(f"Expression is none for table {table.full_name}")
@@ -64,7 +125,11 @@ def get_upstream_tables(
     parameters = parameters or {}
 
     try:
-        parse_tree: Tree = _parse_expression(table.expression)
+        parse_tree: Tree = (
+            parse_cache.get_or_parse(table.expression)
+            if parse_cache is not None
+            else _parse_expression(table.expression)
+        )
 
         valid, message = validator.validate_parse_tree(
             parse_tree, native_query_enabled=config.native_query_parsing
@@ -4,6 +4,7 @@
 #
 #########################################################
 import logging
+import pathlib
 from typing import Iterable, List, Optional, Tuple, Union
 
 import datahub.emitter.mce_builder as builder
@@ -115,11 +116,13 @@ class Mapper:
         config: PowerBiDashboardSourceConfig,
         reporter: PowerBiDashboardSourceReport,
         dataplatform_instance_resolver: AbstractDataPlatformInstanceResolver,
+        parse_cache: Optional[parser.ParseTreeCache] = None,
     ):
         self.__ctx = ctx
         self.__config = config
         self.__reporter = reporter
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
+        self.__parse_cache = parse_cache
         self.workspace_key: Optional[ContainerKey] = None
 
     @staticmethod
@@ -240,6 +243,7 @@ class Mapper:
             ctx=self.__ctx,
             config=self.__config,
             parameters=parameters,
+            parse_cache=self.__parse_cache,
         )
 
         logger.debug(
@@ -1210,8 +1214,18 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
             )  # Exit pipeline as we are not able to connect to PowerBI API Service. This exit will avoid raising
             # unwanted stacktrace on console
 
+        self.parse_cache = parser.ParseTreeCache(
+            self.reporter,
+            filename=pathlib.Path(self.source_config.m_query_parse_cache_path)
+            if self.source_config.m_query_parse_cache_path
+            else None,
+        )
         self.mapper = Mapper(
-            ctx, config, self.reporter, self.dataplatform_instance_resolver
+            ctx,
+            config,
+            self.reporter,
+            self.dataplatform_instance_resolver,
+            parse_cache=self.parse_cache,
         )
 
         # Create and register the stateful ingestion use-case handler.
@@ -1392,3 +1406,7 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.parse_cache.close()
+        super().close()
@@ -1,5 +1,15 @@
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
+
+# Settings shared by the data lake profilers.
+NUM_SAMPLE_ROWS = 20
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+MAX_HIST_BINS = 25
+
+
+def null_str(value: Any) -> Optional[str]:
+    # str() with a passthrough for None.
+    return str(value) if value is not None else None
 
 
 class Cardinality(Enum):
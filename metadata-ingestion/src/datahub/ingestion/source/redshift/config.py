@@ -2,7 +2,7 @@ import logging
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import root_validator
+from pydantic import NonNegativeInt, root_validator
 from pydantic.fields import Field
 
 from datahub.configuration import ConfigModel
@@ -115,6 +115,12 @@ class RedshiftConfig(
         default=True,
         description="Whether to generate queries entities for the new SQL-based lineage collector.",
     )
+    lineage_v2_sql_parser_workers: NonNegativeInt = Field(
+        default=0,
+        description="Number of worker processes used to parse queries for the new SQL-based lineage collector. "
+        "Parsing is CPU-bound, so this helps on instances with large query logs. If 0, queries are parsed in the "
+        "ingestion process.",
+    )
 
     include_table_lineage: bool = Field(
         default=True, description="Whether table lineage should be ingested."
@@ -65,6 +65,7 @@ class RedshiftSqlLineageV2:
             generate_operations=False,
             usage_config=self.config,
             graph=self.context.graph,
+            sql_parser_workers=self.config.lineage_v2_sql_parser_workers,
         )
         self.report.sql_aggregator = self.aggregator.report
 
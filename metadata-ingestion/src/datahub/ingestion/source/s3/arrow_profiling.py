@@ -0,0 +1,430 @@
+import concurrent.futures
+import random
+import time
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.json
+import pyarrow.parquet
+import ujson
+from avro.datafile import DataFileReader
+from avro.io import DatumReader
+from smart_open import open as smart_open
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
+from datahub.ingestion.source.profiling.common import (
+    MAX_HIST_BINS,
+    NUM_SAMPLE_ROWS,
+    QUANTILES,
+    Cardinality,
+    convert_to_cardinality,
+    null_str,
+)
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+
+ARROW_SUPPORTED_EXTENSIONS = [".parquet", ".csv", ".tsv", ".json", ".jsonl", ".avro"]
+
+# (profile, names of the columns that were not profiled, seconds spent profiling)
+ProfileOutcome = Tuple[DatasetProfileClass, List[str], float]
+
+_FEW_CARDINALITIES = [
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+]
+
+# Deequ's name for null values in histograms, kept so that both engines agree.
+_NULL_HISTOGRAM_VALUE = "NullValue"
+
+# Each worker process creates its own S3 client, set by _init_worker.
+_worker_s3_client: Optional[Any] = None
+
+
+def _table_from_records(records: List[Dict[str, Any]]) -> pa.Table:
+    columns: Dict[str, List[Any]] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, [])
+    return pa.Table.from_pydict(
+        {key: [record.get(key) for record in records] for key in columns}
+    )
+
+
+def _read_table(file: IO[bytes], extension: str) -> pa.Table:
+    if extension == ".csv" or extension == ".tsv":
+        return pyarrow.csv.read_csv(
+            file,
+            parse_options=pyarrow.csv.ParseOptions(
+                delimiter="\t" if extension == ".tsv" else ","
+            ),
+        )
+    elif extension == ".jsonl":
+        return pyarrow.json.read_json(file)
+    elif extension == ".json":
+        # Like the schema inference, accept both JSON arrays and JSON lines.
+        content = file.read()
+        if content.lstrip().startswith(b"["):
+            return _table_from_records(ujson.loads(content))
+        return pyarrow.json.read_json(pa.BufferReader(content))
+    elif extension == ".avro":
+        reader = DataFileReader(file, DatumReader())
+        try:
+            return _table_from_records(list(reader))
+        finally:
+            reader.close()
+    raise ValueError(f"Unsupported extension {extension}")
+
+
+def _is_numeric(type_: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(type_)
+        or pa.types.is_floating(type_)
+        or pa.types.is_decimal(type_)
+    )
+
+
+def _histogram_value(value: Any) -> str:
+    return str(value) if value is not None else _NULL_HISTOGRAM_VALUE
+
+
+class _ArrowTableProfiler:
+    """
+    Profiles a table with PyArrow compute functions.
+
+    This computes the same metrics as the Spark profiler and picks them per column in
+    the same way, so that both engines produce comparable profiles.
+    """
+
+    def __init__(
+        self,
+        schema: pa.Schema,
+        row_count: int,
+        profiling_config: DataLakeProfilerConfig,
+    ):
+        self.profiling_config = profiling_config
+        self.row_count = row_count
+        self.profile = DatasetProfileClass(
+            timestampMillis=get_sys_time(),
+            rowCount=row_count,
+            columnCount=len(schema.names),
+            fieldProfiles=[],
+        )
+        self.columns_to_profile: List[str] = []
+        self.dropped_columns: List[str] = []
+
+        if profiling_config.profile_table_level_only:
+            return
+
+        self.columns_to_profile = [
+            column
+            for column in schema.names
+            if profiling_config._allow_deny_patterns.allowed(column)
+        ]
+        max_fields = profiling_config.max_number_of_fields_to_profile
+        if max_fields is not None and len(self.columns_to_profile) > max_fields:
+            self.dropped_columns = self.columns_to_profile[max_fields:]
+            self.columns_to_profile = self.columns_to_profile[:max_fields]
+
+    def profile_columns(
+        self,
+        table: pa.Table,
+        integer_statistics: Dict[str, Tuple[Any, Any]],
+    ) -> None:
+        sample: Optional[pa.Table] = None
+        if self.profiling_config.include_field_sample_values:
+            indices: Sequence[int] = range(self.row_count)
+            if self.row_count > NUM_SAMPLE_ROWS:
+                indices = sorted(random.Random(0).sample(indices, NUM_SAMPLE_ROWS))
+            sample = table.take(pa.array(indices, type=pa.int64()))
+
+        for column in self.columns_to_profile:
+            column_profile = self._profile_column(
+                column, table.column(column), integer_statistics.get(column)
+            )
+            if sample is not None:
+                column_profile.sampleValues = sorted(
+                    str(value) for value in sample.column(column).to_pylist()
+                )
+            self.profile.fieldProfiles.append(column_profile)  # type: ignore
+
+    def _profile_column(
+        self,
+        column: str,
+        values: pa.ChunkedArray,
+        statistics: Optional[Tuple[Any, Any]],
+    ) -> DatasetFieldProfileClass:
+        column_profile = DatasetFieldProfileClass(fieldPath=column)
+        type_ = values.type
+
+        null_count = values.null_count
+        if pa.types.is_floating(type_):
+            # NaN counts as null, like in the Spark profiler.
+            null_count += pc.sum(pc.is_nan(values)).as_py() or 0
+            values = pc.filter(values, pc.invert(pc.is_nan(values)))
+        non_null_count = self.row_count - null_count
+        null_proportion = null_count / self.row_count if self.row_count > 0 else 0
+        if self.profiling_config.include_field_null_count:
+            column_profile.nullCount = null_count
+            column_profile.nullProportion = null_proportion
+
+        if pa.types.is_nested(type_):
+            # Distinct counts are not supported for structs, lists and maps.
+            return column_profile
+
+        unique_count = pc.count_distinct(values, mode="only_valid").as_py()
+        column_profile.uniqueCount = unique_count
+        column_profile.uniqueProportion = (
+            unique_count / non_null_count if non_null_count > 0 else 0
+        )
+
+        # Same arguments as in the Spark profiler.
+        cardinality = convert_to_cardinality(unique_count, null_proportion)
+
+        if _is_numeric(type_):
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_distinct_value_frequencies(column_profile, values)
+            elif cardinality in [Cardinality.MANY, Cardinality.VERY_MANY]:
+                self._add_min_max(column_profile, values, statistics)
+                self._add_numeric_statistics(column_profile, values)
+                self._add_histogram(column_profile, values, MAX_HIST_BINS)
+        elif pa.types.is_string(type_) or pa.types.is_large_string(type_):
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_distinct_value_frequencies(column_profile, values)
+        elif pa.types.is_date(type_) or pa.types.is_timestamp(type_):
+            self._add_min_max(column_profile, values, statistics)
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_histogram(column_profile, values, None)
+
+        return column_profile
+
+    def _add_min_max(
+        self,
+        column_profile: DatasetFieldProfileClass,
+        values: pa.ChunkedArray,
+        statistics: Optional[Tuple[Any, Any]],
+    ) -> None:
+        if not (
+            self.profiling_config.include_field_min_value
+            or self.profiling_config.include_field_max_value
+        ):
+            return
+
+        if statistics is not None:
+            min_value, max_value = statistics
+        else:
+            min_max = pc.min_max(values)
+            min_value, max_value = min_max["min"].as_py(), min_max["max"].as_py()
+        if self.profiling_config.include_field_min_value:
+            column_profile.min = null_str(min_value)
+        if self.profiling_config.include_field_max_value:
+            column_profile.max = null_str(max_value)
+
+    def _add_numeric_statistics(
+        self, column_profile: DatasetFieldProfileClass, values: pa.ChunkedArray
+    ) -> None:
+        if pa.types.is_decimal(values.type):
+            values = values.cast(pa.float64())
+
+        if self.profiling_config.include_field_mean_value:
+            column_profile.mean = null_str(pc.mean(values).as_py())
+        if self.profiling_config.include_field_stddev_value:
+            column_profile.stdev = null_str(pc.stddev(values).as_py())
+
+        if (
+            self.profiling_config.include_field_median_value
+            or self.profiling_config.include_field_quantiles
+        ):
+            quantiles = pc.tdigest(values, q=QUANTILES).to_pylist()
+            if None in quantiles:
+                return
+            if self.profiling_config.include_field_median_value:
+                column_profile.median = str(quantiles[QUANTILES.index(0.5)])
+            if self.profiling_config.include_field_quantiles:
+                column_profile.quantiles = [
+                    QuantileClass(quantile=str(quantile), value=str(value))
+                    for quantile, value in zip(QUANTILES, quantiles)
+                ]
+
+    def _value_counts(self, values: pa.ChunkedArray) -> List[Tuple[str, int]]:
+        value_counts = pc.value_counts(values)
+        return [
+            (_histogram_value(value), count)
+            for value, count in zip(
+                value_counts.field("values").to_pylist(),
+                value_counts.field("counts").to_pylist(),
+            )
+        ]
+
+    def _add_distinct_value_frequencies(
+        self, column_profile: DatasetFieldProfileClass, values: pa.ChunkedArray
+    ) -> None:
+        if not self.profiling_config.include_field_distinct_value_frequencies:
+            return
+
+        column_profile.distinctValueFrequencies = [
+            ValueFrequencyClass(value=value, frequency=count)
+            for value, count in sorted(self._value_counts(values))
+        ]
+
+    def _add_histogram(
+        self,
+        column_profile: DatasetFieldProfileClass,
+        values: pa.ChunkedArray,
+        max_bins: Optional[int],
+    ) -> None:
+        if max_bins is not None and not self.profiling_config.include_field_histogram:
+            return
+        if (
+            max_bins is None
+            and not self.profiling_config.include_field_distinct_value_frequencies
+        ):
+            return
+
+        # Like Deequ's histogram, only the most frequent values are kept.
+        value_counts = self._value_counts(values)
+        if max_bins is not None:
+            value_counts = sorted(value_counts, key=lambda x: x[1], reverse=True)
+            value_counts = value_counts[:max_bins]
+        value_counts = sorted(value_counts)
+        column_profile.histogram = HistogramClass(
+            [value for value, _ in value_counts],
+            [float(count) for _, count in value_counts],
+        )
+
+
+def _get_integer_statistics(
+    metadata: pyarrow.parquet.FileMetaData, columns: List[str]
+) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Returns the min and max of integer columns whose statistics are present in every
+    row group of the parquet file, so that they don't need to be computed.
+    """
+
+    statistics: Dict[str, Tuple[Any, Any]] = {}
+    if metadata.num_row_groups == 0:
+        return statistics
+
+    leaf_columns = {
+        metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+    }
+    for column in columns:
+        index = leaf_columns.get(column)
+        if index is None:
+            continue
+
+        min_value: Any = None
+        max_value: Any = None
+        for row_group in range(metadata.num_row_groups):
+            column_statistics = metadata.row_group(row_group).column(index).statistics
+            if (
+                column_statistics is None
+                or not column_statistics.has_min_max
+                or column_statistics.physical_type not in ("INT32", "INT64")
+                or column_statistics.logical_type.type not in ("NONE", "INT")
+            ):
+                break
+            min_value = (
+                column_statistics.min
+                if min_value is None
+                else min(min_value, column_statistics.min)
+            )
+            max_value = (
+                column_statistics.max
+                if max_value is None
+                else max(max_value, column_statistics.max)
+            )
+        else:
+            statistics[column] = (min_value, max_value)
+    return statistics
+
+
+def profile_file(
+    path: str,
+    extension: str,
+    profiling_config: DataLakeProfilerConfig,
+    s3_client: Optional[Any] = None,
+) -> ProfileOutcome:
+    start = time.perf_counter()
+    transport_params = {"client": s3_client} if s3_client is not None else None
+    with smart_open(path, "rb", transport_params=transport_params) as file:
+        if extension == ".parquet":
+            # The row count comes from the footer, and only the columns that are
+            # profiled are read.
+            parquet_file = pyarrow.parquet.ParquetFile(file)
+            profiler = _ArrowTableProfiler(
+                parquet_file.schema_arrow,
+                parquet_file.metadata.num_rows,
+                profiling_config,
+            )
+            if profiler.columns_to_profile:
+                profiler.profile_columns(
+                    parquet_file.read(columns=profiler.columns_to_profile),
+                    _get_integer_statistics(
+                        parquet_file.metadata, profiler.columns_to_profile
+                    ),
+                )
+        else:
+            table = _read_table(file, extension)
+            profiler = _ArrowTableProfiler(
+                table.schema, table.num_rows, profiling_config
+            )
+            if profiler.columns_to_profile:
+                profiler.profile_columns(table, {})
+
+    return profiler.profile, profiler.dropped_columns, time.perf_counter() - start
+
+
+def _init_worker(aws_config: Optional[AwsConnectionConfig], verify_ssl: bool) -> None:
+    global _worker_s3_client
+
+    if aws_config is not None:
+        _worker_s3_client = aws_config.get_s3_client(verify_ssl)
+
+
+def _profile_file_in_worker(
+    path: str, extension: str, profiling_config: DataLakeProfilerConfig
+) -> ProfileOutcome:
+    return profile_file(path, extension, profiling_config, _worker_s3_client)
+
+
+class ArrowProfilingPool:
+    """
+    Profiles data lake files with PyArrow in a pool of worker processes.
+
+    Unlike the Spark profiler, this doesn't need a JVM, so that profiling small tables
+    takes milliseconds. Each worker reads and profiles whole tables, so that profiling
+    is spread across tables.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        aws_config: Optional[AwsConnectionConfig],
+        verify_ssl: bool,
+    ):
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(aws_config, verify_ssl),
+        )
+
+    def submit(
+        self, path: str, extension: str, profiling_config: DataLakeProfilerConfig
+    ) -> "concurrent.futures.Future[ProfileOutcome]":
+        return self._executor.submit(
+            _profile_file_in_worker, path, extension, profiling_config
+        )
+
+    def stop(self) -> None:
+        self._executor.shutdown(wait=True)
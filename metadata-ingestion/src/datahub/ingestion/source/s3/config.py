@@ -73,7 +73,7 @@ class DataLakeSourceConfig(
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
     )
     add_partition_columns_to_schema: bool = Field(
         default=False,
@@ -89,6 +89,13 @@ class DataLakeSourceConfig(
         description="Number of files to list to sample for schema inference. This will be ignored if sample_files is set to False in the pathspec.",
     )
 
+    listing_max_workers: pydantic.PositiveInt = Field(
+        default=10,
+        description="Number of threads used to list S3 folders concurrently when sampling files. "
+        "boto3 keeps at most 10 connections per client by default, so raise `max_pool_connections` "
+        "in `aws_config.aws_advanced_config` when increasing this.",
+    )
+
     _rename_path_spec_to_plural = pydantic_renamed_field(
         "path_spec", "path_specs", lambda path_spec: [path_spec]
     )
@@ -1,7 +1,9 @@
+import os
 from typing import Any, Dict, Optional
 
 import pydantic
 from pydantic.fields import Field
+from typing_extensions import Literal
 
 from datahub.configuration import ConfigModel
 from datahub.configuration.common import AllowDenyPattern
@@ -16,6 +18,16 @@ class DataLakeProfilerConfig(ConfigModel):
         default_factory=OperationConfig,
         description="Experimental feature. To specify operation configs.",
     )
+    engine: Literal["spark", "arrow"] = Field(
+        default="spark",
+        description="The engine used for profiling. `spark` profiles tables with PyDeequ in a Spark session. "
+        "`arrow` profiles tables with PyArrow in a pool of processes, without starting Spark, "
+        "which is much faster for small and medium sized tables.",
+    )
+    max_workers: pydantic.PositiveInt = Field(
+        default=os.cpu_count() or 1,
+        description="Number of processes used to profile tables in parallel. Only used by the `arrow` engine.",
+    )
 
     # These settings will override the ones below.
     profile_table_level_only: bool = Field(
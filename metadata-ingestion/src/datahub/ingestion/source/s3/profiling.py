@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import List, Optional
 
 from pandas import DataFrame
 from pydeequ.analyzers import (
@@ -33,8 +33,12 @@ from pyspark.sql.types import (
 
 from datahub.emitter.mce_builder import get_sys_time
 from datahub.ingestion.source.profiling.common import (
+    MAX_HIST_BINS,
+    NUM_SAMPLE_ROWS,
+    QUANTILES,
     Cardinality,
     convert_to_cardinality,
+    null_str,
 )
 from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
@@ -47,15 +51,6 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.telemetry import stats, telemetry
 
-NUM_SAMPLE_ROWS = 20
-QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
-MAX_HIST_BINS = 25
-
-
-def null_str(value: Any) -> Optional[str]:
-    # str() with a passthrough for None.
-    return str(value) if value is not None else None
-
 
 @dataclasses.dataclass
 class _SingleColumnSpec:
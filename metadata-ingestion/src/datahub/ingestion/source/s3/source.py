@@ -1,3 +1,4 @@
+import concurrent.futures
 import dataclasses
 import functools
 import logging
@@ -5,13 +6,12 @@ import os
 import pathlib
 import re
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import PurePath
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import smart_open.compression as so_compression
-from more_itertools import peekable
 from pyspark.conf import SparkConf
 from pyspark.sql import SparkSession
 from pyspark.sql.dataframe import DataFrame
@@ -62,6 +62,11 @@ from datahub.ingestion.source.aws.s3_util import (
     strip_s3_prefix,
 )
 from datahub.ingestion.source.data_lake_common.data_lake_utils import ContainerWUCreator
+from datahub.ingestion.source.s3.arrow_profiling import (
+    ARROW_SUPPORTED_EXTENSIONS,
+    ArrowProfilingPool,
+    ProfileOutcome,
+)
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
@@ -95,8 +100,12 @@ from datahub.metadata.schema_classes import (
     _Aspect,
 )
 from datahub.telemetry import stats, telemetry
+from datahub.utilities.advanced_thread_executor import BackpressureAwareExecutor
 from datahub.utilities.perf_timer import PerfTimer
 
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
@@ -159,6 +168,7 @@ config_options_to_report = [
 
 # profiling flags to emit telemetry for
 profiling_flags_to_report = [
+    "engine",
     "profile_table_level_only",
     "include_field_null_count",
     "include_field_min_value",
@@ -232,12 +242,18 @@ class S3Source(StatefulIngestionSourceBase):
     report: DataLakeSourceReport
     profiling_times_taken: List[float]
     container_WU_creator: ContainerWUCreator
+    profiling_pool: Optional[ArrowProfilingPool]
+    pending_profiles: Deque[
+        Tuple[TableData, str, "concurrent.futures.Future[ProfileOutcome]"]
+    ]
 
     def __init__(self, config: DataLakeSourceConfig, ctx: PipelineContext):
         super().__init__(config, ctx)
         self.source_config = config
         self.report = DataLakeSourceReport()
         self.profiling_times_taken = []
+        self.profiling_pool = None
+        self.pending_profiles = deque()
         config_report = {
             config_option: config.dict().get(config_option)
             for config_option in config_options_to_report
@@ -260,7 +276,14 @@ class S3Source(StatefulIngestionSourceBase):
                     for config_flag in profiling_flags_to_report
                 },
             )
-            self.init_spark()
+            if config.profiling.engine == "arrow":
+                self.profiling_pool = ArrowProfilingPool(
+                    max_workers=config.profiling.max_workers,
+                    aws_config=config.aws_config if self.is_s3_platform() else None,
+                    verify_ssl=config.verify_ssl,
+                )
+            else:
+                self.init_spark()
 
     def init_spark(self):
         os.environ.setdefault("SPARK_VERSION", "3.3")
@@ -402,6 +425,19 @@ class S3Source(StatefulIngestionSourceBase):
         # see https://mungingdata.com/pyspark/avoid-dots-periods-column-names/
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
+    def get_file_extension(self, full_path: str, path_spec: PathSpec) -> str:
+        extension = pathlib.Path(full_path).suffix
+        from datahub.ingestion.source.data_lake_common.path_spec import (
+            SUPPORTED_COMPRESSIONS,
+        )
+
+        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
+            # Removing the compression extension and using the one before that like .json.gz -> .json
+            extension = pathlib.Path(full_path).with_suffix("").suffix
+        if extension == "" and path_spec.default_extension:
+            extension = f".{path_spec.default_extension}"
+        return extension
+
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
         if self.is_s3_platform():
             if self.source_config.aws_config is None:
@@ -421,16 +457,7 @@ class S3Source(StatefulIngestionSourceBase):
 
         fields = []
 
-        extension = pathlib.Path(table_data.full_path).suffix
-        from datahub.ingestion.source.data_lake_common.path_spec import (
-            SUPPORTED_COMPRESSIONS,
-        )
-
-        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
-            # Removing the compression extension and using the one before that like .json.gz -> .json
-            extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
-        if extension == "" and path_spec.default_extension:
-            extension = f".{path_spec.default_extension}"
+        extension = self.get_file_extension(table_data.full_path, path_spec)
 
         try:
             if extension == ".parquet":
@@ -448,7 +475,9 @@ class S3Source(StatefulIngestionSourceBase):
                     max_rows=self.source_config.max_rows, format="jsonl"
                 ).infer_schema(file)
             elif extension == ".json":
-                fields = json.JsonInferrer().infer_schema(file)
+                fields = json.JsonInferrer(
+                    max_rows=self.source_config.max_rows
+                ).infer_schema(file)
             elif extension == ".avro":
                 fields = avro.AvroInferrer().infer_schema(file)
             else:
@@ -579,6 +608,57 @@ class S3Source(StatefulIngestionSourceBase):
             aspect=table_profiler.profile,
         ).as_workunit()
 
+    def submit_table_profile(
+        self, table_data: TableData, dataset_urn: str, path_spec: PathSpec
+    ) -> None:
+        assert self.profiling_pool is not None
+
+        extension = self.get_file_extension(table_data.full_path, path_spec)
+        if extension not in ARROW_SUPPORTED_EXTENSIONS:
+            self.report.report_warning(
+                table_data.full_path,
+                f"file {table_data.full_path} has unsupported extension",
+            )
+            return
+
+        telemetry.telemetry_instance.ping("data_lake_file", {"extension": extension})
+        future = self.profiling_pool.submit(
+            table_data.full_path, extension, self.source_config.profiling
+        )
+        self.pending_profiles.append((table_data, dataset_urn, future))
+
+    def get_pending_table_profiles(self, wait: bool) -> Iterable[MetadataWorkUnit]:
+        # Profiles are emitted in the order in which the tables were submitted.
+        while self.pending_profiles and (wait or self.pending_profiles[0][2].done()):
+            table_data, dataset_urn, future = self.pending_profiles.popleft()
+            try:
+                profile, dropped_columns, time_taken = future.result()
+            except Exception as e:
+                logger.error(e)
+                self.report.report_warning(
+                    table_data.display_name,
+                    f"unable to profile table {table_data.display_name} from file {table_data.full_path}: {e}",
+                )
+                continue
+
+            if dropped_columns:
+                self.report.report_file_dropped(
+                    f"The max_number_of_fields_to_profile={self.source_config.profiling.max_number_of_fields_to_profile} reached. Profile of columns {table_data.full_path}({', '.join(sorted(dropped_columns))})"
+                )
+            telemetry.telemetry_instance.ping(
+                "profile_data_lake_table",
+                {"rows_profiled": stats.discretize(profile.rowCount or 0)},
+            )
+            logger.info(
+                f"Finished profiling {table_data.full_path}; took {time_taken:.3f} seconds"
+            )
+            self.profiling_times_taken.append(time_taken)
+
+            yield MetadataChangeProposalWrapper(
+                entityUrn=dataset_urn,
+                aspect=profile,
+            ).as_workunit()
+
     def _create_table_operation_aspect(self, table_data: TableData) -> OperationClass:
         reported_time = int(time.time() * 1000)
 
@@ -694,7 +774,10 @@ class S3Source(StatefulIngestionSourceBase):
         )
 
         if self.source_config.is_profiling_enabled():
-            yield from self.get_table_profile(table_data, dataset_urn)
+            if self.profiling_pool is not None:
+                self.submit_table_profile(table_data, dataset_urn, path_spec)
+            else:
+                yield from self.get_table_profile(table_data, dataset_urn)
 
     def get_prefix(self, relative_path: str) -> str:
         index = re.search(r"[\*|\{]", relative_path)
@@ -726,47 +809,102 @@ class S3Source(StatefulIngestionSourceBase):
         )
         return table_data
 
-    def resolve_templated_folders(self, bucket_name: str, prefix: str) -> Iterable[str]:
-        folder_split: List[str] = prefix.split("*", 1)
-        # If the len of split is 1 it means we don't have * in the prefix
-        if len(folder_split) == 1:
-            yield prefix
-            return
-
-        folders: Iterable[str] = list_folders(
-            bucket_name, folder_split[0], self.source_config.aws_config
-        )
-        for folder in folders:
-            yield from self.resolve_templated_folders(
-                bucket_name, f"{folder}{folder_split[1]}"
+    def list_folders(
+        self, s3_client: "S3Client", bucket_name: str, prefix: str
+    ) -> List[str]:
+        return list(
+            list_folders(
+                bucket_name, prefix, self.source_config.aws_config, s3_client=s3_client
             )
+        )
+
+    def list_folders_concurrently(
+        self, s3_client: "S3Client", bucket_name: str, prefixes: Iterable[str]
+    ) -> Iterable[str]:
+        """Lists the folders under each of the prefixes, fanning the ListObjectsV2 calls
+        out over a thread pool. Folders are returned in the same order as a sequential listing.
+        """
+        for future in BackpressureAwareExecutor.map_ordered(
+            self.list_folders,
+            ((s3_client, bucket_name, prefix) for prefix in prefixes),
+            max_workers=self.source_config.listing_max_workers,
+        ):
+            yield from future.result()
+
+    def resolve_templated_folders(
+        self, s3_client: "S3Client", bucket_name: str, prefix: str
+    ) -> List[str]:
+        # Every * is resolved by listing the folders matched by the previous one, so
+        # all the prefixes on one level can be listed at the same time. Each level is
+        # resolved fully before the next one starts, so that only one pool of
+        # listing_max_workers threads shares the client's connections at a time.
+        head, *tails = prefix.split("*")
+        folders = [head]
+        for tail in tails:
+            folders = [
+                f"{folder}{tail}"
+                for folder in self.list_folders_concurrently(
+                    s3_client, bucket_name, folders
+                )
+            ]
+        return folders
 
     def get_dir_to_process(
-        self, bucket_name: str, folder: str, path_spec: PathSpec, protocol: str
+        self,
+        s3_client: "S3Client",
+        bucket_name: str,
+        folder: str,
+        path_spec: PathSpec,
+        protocol: str,
     ) -> str:
-        iterator = list_folders(
+        # Only the latest allowed partition on each level is descended into.
+        sorted_dirs = sorted(
+            self.list_folders(s3_client, bucket_name, folder),
+            key=functools.cmp_to_key(partitioned_folder_comparator),
+            reverse=True,
+        )
+        for dir in sorted_dirs:
+            if path_spec.dir_allowed(f"{protocol}{bucket_name}/{dir}/"):
+                return self.get_dir_to_process(
+                    s3_client=s3_client,
+                    bucket_name=bucket_name,
+                    folder=dir + "/",
+                    path_spec=path_spec,
+                    protocol=protocol,
+                )
+        return folder
+
+    def sample_folder(
+        self,
+        s3_client: "S3Client",
+        bucket_name: str,
+        folder: str,
+        path_spec: PathSpec,
+        sample_size: int,
+    ) -> List[Tuple[str, datetime, int]]:
+        logger.info(f"Processing folder: {folder}")
+        protocol = ContainerWUCreator.get_protocol(path_spec.include)
+        dir_to_process = self.get_dir_to_process(
+            s3_client=s3_client,
             bucket_name=bucket_name,
-            prefix=folder,
-            aws_config=self.source_config.aws_config,
+            folder=folder + "/",
+            path_spec=path_spec,
+            protocol=protocol,
         )
-        iterator = peekable(iterator)
-        if iterator:
-            sorted_dirs = sorted(
-                iterator,
-                key=functools.cmp_to_key(partitioned_folder_comparator),
-                reverse=True,
-            )
-            for dir in sorted_dirs:
-                if path_spec.dir_allowed(f"{protocol}{bucket_name}/{dir}/"):
-                    return self.get_dir_to_process(
-                        bucket_name=bucket_name,
-                        folder=dir + "/",
-                        path_spec=path_spec,
-                        protocol=protocol,
-                    )
-            return folder
-        else:
-            return folder
+        logger.info(f"Getting files from folder: {dir_to_process}")
+        dir_to_process = dir_to_process.rstrip("\\")
+        files = []
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=bucket_name,
+            Prefix=dir_to_process,
+            PaginationConfig={"MaxItems": sample_size, "PageSize": PAGE_SIZE},
+        ):
+            for obj in page.get("Contents", []):
+                s3_path = self.create_s3_path(bucket_name, obj["Key"])
+                logger.debug(f"Sampling file: {s3_path}")
+                files.append((s3_path, obj["LastModified"], obj["Size"]))
+        return files
 
     def s3_browser(
         self, path_spec: PathSpec, sample_size: int
@@ -804,42 +942,44 @@ class S3Source(StatefulIngestionSourceBase):
                     max_match = match.group()
 
             table_index = include.find(max_match)
-            for folder in self.resolve_templated_folders(
-                bucket_name, get_bucket_relative_path(include[:table_index])
-            ):
-                try:
-                    for f in list_folders(
-                        bucket_name, f"{folder}", self.source_config.aws_config
-                    ):
-                        logger.info(f"Processing folder: {f}")
-                        protocol = ContainerWUCreator.get_protocol(path_spec.include)
-                        dir_to_process = self.get_dir_to_process(
-                            bucket_name=bucket_name,
-                            folder=f + "/",
-                            path_spec=path_spec,
-                            protocol=protocol,
-                        )
-                        logger.info(f"Getting files from folder: {dir_to_process}")
-                        dir_to_process = dir_to_process.rstrip("\\")
-                        for obj in (
-                            bucket.objects.filter(Prefix=f"{dir_to_process}")
-                            .page_size(PAGE_SIZE)
-                            .limit(sample_size)
-                        ):
-                            s3_path = self.create_s3_path(obj.bucket_name, obj.key)
-                            logger.debug(f"Sampling file: {s3_path}")
-                            yield s3_path, obj.last_modified, obj.size,
-                except Exception as e:
-                    # This odd check if being done because boto does not have a proper exception to catch
-                    # The exception that appears in stacktrace cannot actually be caught without a lot more work
-                    # https://github.com/boto/boto3/issues/1195
-                    if "NoSuchBucket" in repr(e):
-                        logger.debug(f"Got NoSuchBucket exception for {bucket_name}", e)
-                        self.get_report().report_warning(
-                            "Missing bucket", f"No bucket found {bucket_name}"
-                        )
-                    else:
-                        raise e
+            # boto3 clients are thread-safe, so one client is shared by all the listing threads.
+            s3_client = self.source_config.aws_config.get_s3_client(
+                self.source_config.verify_ssl
+            )
+            # The table folders are listed before sampling starts, so the listing and
+            # sampling pools never run at the same time.
+            table_folders = list(
+                self.list_folders_concurrently(
+                    s3_client,
+                    bucket_name,
+                    self.resolve_templated_folders(
+                        s3_client,
+                        bucket_name,
+                        get_bucket_relative_path(include[:table_index]),
+                    ),
+                )
+            )
+            try:
+                for future in BackpressureAwareExecutor.map_ordered(
+                    self.sample_folder,
+                    (
+                        (s3_client, bucket_name, folder, path_spec, sample_size)
+                        for folder in table_folders
+                    ),
+                    max_workers=self.source_config.listing_max_workers,
+                ):
+                    yield from future.result()
+            except Exception as e:
+                # This odd check if being done because boto does not have a proper exception to catch
+                # The exception that appears in stacktrace cannot actually be caught without a lot more work
+                # https://github.com/boto/boto3/issues/1195
+                if "NoSuchBucket" in repr(e):
+                    logger.debug(f"Got NoSuchBucket exception for {bucket_name}", e)
+                    self.get_report().report_warning(
+                        "Missing bucket", f"No bucket found {bucket_name}"
+                    )
+                else:
+                    raise e
         else:
             logger.debug(
                 "No template in the pathspec can't do sampling, fallbacking to do full scan"
@@ -920,6 +1060,8 @@ class S3Source(StatefulIngestionSourceBase):
 
                 for guid, table_data in table_dict.items():
                     yield from self.ingest_table(table_data, path_spec)
+                    yield from self.get_pending_table_profiles(wait=False)
+                yield from self.get_pending_table_profiles(wait=True)
 
             if not self.source_config.is_profiling_enabled():
                 return
@@ -969,3 +1111,8 @@ class S3Source(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.report
+
+    def close(self) -> None:
+        if self.profiling_pool is not None:
+            self.profiling_pool.stop()
+        super().close()
@@ -1,9 +1,9 @@
 import itertools
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterator, List, Type, Union
 
+import ijson
 import jsonlines as jsl
-import ujson
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
 from datahub.ingestion.source.schema_inference.object import construct_schema
@@ -40,25 +40,15 @@ class JsonInferrer(SchemaInferenceBase):
 
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         if self.format == "jsonl":
-            file.seek(0)
-            reader = jsl.Reader(file)
-            datastore = [
-                obj
-                for obj in itertools.islice(
-                    reader.iter(type=dict, skip_invalid=True), self.max_rows
-                )
-            ]
+            datastore = self._read_jsonlines(file)
         else:
             try:
-                datastore = ujson.load(file)
-            except ujson.JSONDecodeError as e:
-                logger.info(f"Got ValueError: {e}. Retry with jsonlines")
-                file.seek(0)
-                reader = jsl.Reader(file)
-                datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
-
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+                datastore = list(
+                    itertools.islice(self._iter_json_values(file), self.max_rows)
+                )
+            except ijson.JSONError as e:
+                logger.info(f"Got JSONError: {e}. Retry with jsonlines")
+                datastore = self._read_jsonlines(file)
 
         schema = construct_schema(datastore, delimiter=".")
         fields: List[SchemaField] = []
@@ -81,3 +71,31 @@ class JsonInferrer(SchemaInferenceBase):
             fields.append(field)
 
         return fields
+
+    def _read_jsonlines(self, file: IO[bytes]) -> List[Any]:
+        file.seek(0)
+        reader = jsl.Reader(file)
+        return list(
+            itertools.islice(reader.iter(type=dict, skip_invalid=True), self.max_rows)
+        )
+
+    @staticmethod
+    def _iter_json_values(file: IO[bytes]) -> Iterator[Any]:
+        """
+        Lazily yields the rows of a json file, which is either a single array of
+        rows or a sequence of top-level values (e.g. one object, or json lines).
+        Only as much of the file is read as is needed for the rows consumed.
+        """
+
+        file.seek(0)
+        events = ijson.parse(file, use_float=True, multiple_values=True)
+        first_event = next(events, None)
+        if first_event is None:
+            return
+
+        prefix, event, _ = first_event
+        events = itertools.chain([first_event], events)
+        if prefix == "" and event == "start_array":
+            yield from ijson.items(events, "item", use_float=True)
+        else:
+            yield from ijson.items(events, "", use_float=True)
@@ -775,9 +775,18 @@ class SnowflakeV2Source(
         if self.config.include_technical_schema:
             yield from self.gen_schema_containers(snowflake_schema, db_name)
 
+        # Skip listing tables or views if the patterns deny everything in this schema.
+        identifier_prefix = self.get_dataset_identifier("", schema_name, db_name)
+        tables_allowed = self.config.table_pattern.may_allow_prefix(identifier_prefix)
+        views_allowed = self.config.view_pattern.may_allow_prefix(identifier_prefix)
+        if not tables_allowed and not views_allowed:
+            self.report.report_dropped(f"{identifier_prefix}*")
+
         if self.config.include_tables:
-            tables = self.fetch_tables_for_schema(
-                snowflake_schema, db_name, schema_name
+            tables = (
+                self.fetch_tables_for_schema(snowflake_schema, db_name, schema_name)
+                if tables_allowed
+                else []
             )
             self.db_tables[schema_name] = tables
 
@@ -795,7 +804,11 @@ class SnowflakeV2Source(
                     )
 
         if self.config.include_views:
-            views = self.fetch_views_for_schema(snowflake_schema, db_name, schema_name)
+            views = (
+                self.fetch_views_for_schema(snowflake_schema, db_name, schema_name)
+                if views_allowed
+                else []
+            )
             if (
                 self.aggregator
                 and self.config.include_view_lineage
@@ -821,7 +834,11 @@ class SnowflakeV2Source(
             for tag in snowflake_schema.tags:
                 yield from self._process_tag(tag)
 
-        if not snowflake_schema.views and not snowflake_schema.tables:
+        if (
+            (tables_allowed or views_allowed)
+            and not snowflake_schema.views
+            and not snowflake_schema.tables
+        ):
             self.report_warning(
                 "No tables/views found in schema. If tables exist, please grant REFERENCES or SELECT permissions on them.",
                 f"{db_name}.{schema_name}",
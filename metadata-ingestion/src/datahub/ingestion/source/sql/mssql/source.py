@@ -8,10 +8,21 @@ import sqlalchemy.dialects.mssql
 
 # This import verifies that the dependencies are available.
 from pydantic.fields import Field
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects.mssql.base import (
+    MSBinary,
+    MSChar,
+    MSNChar,
+    MSNText,
+    MSNVarchar,
+    MSString,
+    MSText,
+    MSVarBinary,
+)
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import ProgrammingError, ResourceClosedError
+from sqlalchemy.sql import sqltypes
 
 from datahub.configuration.common import AllowDenyPattern
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -37,6 +48,7 @@ from datahub.ingestion.source.sql.mssql.job_models import (
     StoredProcedure,
 )
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflection,
     SQLAlchemySource,
     SqlWorkUnit,
     register_custom_type,
@@ -60,6 +72,78 @@ register_custom_type(sqlalchemy.dialects.mssql.SMALLMONEY, NumberTypeClass)
 register_custom_type(sqlalchemy.dialects.mssql.SQL_VARIANT, UnionTypeClass)
 register_custom_type(sqlalchemy.dialects.mssql.UNIQUEIDENTIFIER, StringTypeClass)
 
+# Types that take a length and collation, see MSDialect.get_columns.
+_SIZED_STRING_TYPES = (
+    MSString,
+    MSChar,
+    MSNVarchar,
+    MSNChar,
+    MSText,
+    MSNText,
+    MSBinary,
+    MSVarBinary,
+    sqltypes.LargeBinary,
+)
+
+SCHEMA_COLUMNS_QUERY = """
+SELECT
+  C.TABLE_NAME AS table_name,
+  C.COLUMN_NAME AS name,
+  C.DATA_TYPE AS data_type,
+  C.IS_NULLABLE AS is_nullable,
+  C.CHARACTER_MAXIMUM_LENGTH AS character_maximum_length,
+  C.NUMERIC_PRECISION AS numeric_precision,
+  C.NUMERIC_SCALE AS numeric_scale,
+  C.COLUMN_DEFAULT AS column_default,
+  C.COLLATION_NAME AS collation_name,
+  COLUMNPROPERTY(
+    OBJECT_ID(QUOTENAME(C.TABLE_SCHEMA) + '.' + QUOTENAME(C.TABLE_NAME)),
+    C.COLUMN_NAME,
+    'IsIdentity'
+  ) AS is_identity
+FROM INFORMATION_SCHEMA.COLUMNS AS C
+WHERE C.TABLE_SCHEMA = :schema
+ORDER BY C.TABLE_NAME, C.ORDINAL_POSITION
+"""
+
+SCHEMA_PK_CONSTRAINTS_QUERY = """
+SELECT
+  KC.TABLE_NAME AS table_name,
+  KC.CONSTRAINT_NAME AS name,
+  KC.COLUMN_NAME AS column_name
+FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS TC
+INNER JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS KC
+  ON KC.CONSTRAINT_SCHEMA = TC.CONSTRAINT_SCHEMA
+  AND KC.CONSTRAINT_NAME = TC.CONSTRAINT_NAME
+WHERE TC.CONSTRAINT_TYPE = 'PRIMARY KEY' AND TC.TABLE_SCHEMA = :schema
+ORDER BY KC.TABLE_NAME, KC.ORDINAL_POSITION
+"""
+
+SCHEMA_FOREIGN_KEYS_QUERY = """
+SELECT
+  T.NAME AS table_name,
+  FK.NAME AS name,
+  SCHEMA_NAME(RT.SCHEMA_ID) AS referred_schema,
+  RT.NAME AS referred_table,
+  PC.NAME AS constrained_column,
+  RC.NAME AS referred_column
+FROM sys.foreign_keys AS FK
+INNER JOIN sys.tables AS T
+  ON T.[OBJECT_ID] = FK.PARENT_OBJECT_ID
+INNER JOIN sys.tables AS RT
+  ON RT.[OBJECT_ID] = FK.REFERENCED_OBJECT_ID
+INNER JOIN sys.foreign_key_columns AS FKC
+  ON FKC.CONSTRAINT_OBJECT_ID = FK.[OBJECT_ID]
+INNER JOIN sys.columns AS PC
+  ON PC.[OBJECT_ID] = FKC.PARENT_OBJECT_ID
+  AND PC.COLUMN_ID = FKC.PARENT_COLUMN_ID
+INNER JOIN sys.columns AS RC
+  ON RC.[OBJECT_ID] = FKC.REFERENCED_OBJECT_ID
+  AND RC.COLUMN_ID = FKC.REFERENCED_COLUMN_ID
+WHERE SCHEMA_NAME(T.SCHEMA_ID) = :schema
+ORDER BY T.NAME, FK.NAME, FKC.CONSTRAINT_COLUMN_ID
+"""
+
 
 class SQLServerConfig(BasicSQLAlchemyConfig):
     # defaults
@@ -267,6 +351,77 @@ class SQLServerSource(SQLAlchemySource):
                 column["comment"] = description
         return columns
 
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        if "." in schema:
+            # "database.owner" schemas are reflected table by table.
+            return None
+
+        conn = inspector.bind
+        columns: Dict[str, List[dict]] = {}
+        for row in conn.execute(text(SCHEMA_COLUMNS_QUERY), dict(schema=schema)):
+            columns.setdefault(row["table_name"], []).append(
+                {
+                    "name": row["name"],
+                    "type": self._get_column_type(inspector, row),
+                    "nullable": row["is_nullable"] == "YES",
+                    "default": row["column_default"],
+                    "autoincrement": row["is_identity"] == 1,
+                }
+            )
+
+        pk_constraints: Dict[str, dict] = {}
+        for row in conn.execute(text(SCHEMA_PK_CONSTRAINTS_QUERY), dict(schema=schema)):
+            pk = pk_constraints.setdefault(
+                row["table_name"], {"constrained_columns": [], "name": row["name"]}
+            )
+            pk["constrained_columns"].append(row["column_name"])
+
+        foreign_keys: Dict[str, List[dict]] = {}
+        fk_by_name: Dict[Tuple[str, str], dict] = {}
+        for row in conn.execute(text(SCHEMA_FOREIGN_KEYS_QUERY), dict(schema=schema)):
+            key = (row["table_name"], row["name"])
+            if key not in fk_by_name:
+                fk_by_name[key] = {
+                    "name": row["name"],
+                    "constrained_columns": [],
+                    "referred_schema": row["referred_schema"],
+                    "referred_table": row["referred_table"],
+                    "referred_columns": [],
+                }
+                foreign_keys.setdefault(row["table_name"], []).append(fk_by_name[key])
+            fk_by_name[key]["constrained_columns"].append(row["constrained_column"])
+            fk_by_name[key]["referred_columns"].append(row["referred_column"])
+
+        # Table descriptions are already cached up front, see table_descriptions.
+        return SchemaReflection(
+            columns=columns,
+            pk_constraints=pk_constraints,
+            foreign_keys=foreign_keys,
+        )
+
+    @staticmethod
+    def _get_column_type(inspector: Inspector, row: Any) -> Any:
+        # Mirrors the type construction in MSDialect.get_columns.
+        type_name = row["data_type"]
+        coltype = inspector.dialect.ischema_names.get(type_name)
+        if coltype is None:
+            logger.debug(f"Did not recognize type {type_name} of column {row['name']}")
+            return sqltypes.NULLTYPE
+
+        kwargs: Dict[str, Any] = {}
+        if coltype in _SIZED_STRING_TYPES:
+            charlen = row["character_maximum_length"]
+            kwargs["length"] = None if charlen == -1 else charlen
+            if row["collation_name"]:
+                kwargs["collation"] = row["collation_name"]
+        if issubclass(coltype, sqltypes.Numeric):
+            kwargs["precision"] = row["numeric_precision"]
+            if not issubclass(coltype, sqltypes.Float):
+                kwargs["scale"] = row["numeric_scale"]
+        return coltype(**kwargs)
+
     def get_database_level_workunits(
         self,
         inspector: Inspector,
@@ -1,7 +1,19 @@
+import contextlib
 import logging
 import re
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, NoReturn, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from unittest.mock import patch
 
 # This import verifies that the dependencies are available.
@@ -24,6 +36,7 @@ from datahub.ingestion.api.decorators import (
     support_status,
 )
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflection,
     SQLAlchemySource,
     make_sqlalchemy_type,
 )
@@ -111,6 +124,232 @@ class OracleConfig(BasicSQLAlchemyConfig):
             return regular
 
 
+def _get_columns_query(dialect: Any, dictionary: str, dblink: str = "") -> str:
+    """
+    Returns the column query for the given data dictionary views ("all" or "dba").
+    Callers add filters on col.owner and col.table_name, and an ORDER BY clause.
+    """
+    if not (dialect.server_version_info and dialect.server_version_info < (9,)):
+        # _supports_char_length --> not self._is_oracle_8
+        char_length_col = "char_length"
+    else:
+        char_length_col = "data_length"
+
+    if dialect.server_version_info and dialect.server_version_info >= (12,):
+        identity_cols = f"""\
+            col.default_on_null,
+            (
+                SELECT id.generation_type || ',' || id.IDENTITY_OPTIONS
+                FROM {dictionary}_TAB_IDENTITY_COLS{dblink} id
+                WHERE col.table_name = id.table_name
+                AND col.column_name = id.column_name
+                AND col.owner = id.owner
+            ) AS identity_options"""
+    else:
+        identity_cols = "NULL as default_on_null, NULL as identity_options"
+
+    return f"""
+        SELECT
+            col.column_name,
+            col.data_type,
+            col.{char_length_col},
+            col.data_precision,
+            col.data_scale,
+            col.nullable,
+            col.data_default,
+            com.comments,
+            col.virtual_column,
+            {identity_cols},
+            col.table_name
+        FROM {dictionary}_tab_cols{dblink} col
+        LEFT JOIN {dictionary}_col_comments{dblink} com
+        ON col.table_name = com.table_name
+        AND col.column_name = com.column_name
+        AND col.owner = com.owner
+        WHERE col.hidden_column = 'NO'
+    """
+
+
+def _get_column_info(dialect: Any, row: Any) -> dict:
+    colname = dialect.normalize_name(row[0])
+    orig_colname = row[0]
+    coltype = row[1]
+    length = row[2]
+    precision = row[3]
+    scale = row[4]
+    nullable = row[5] == "Y"
+    default = row[6]
+    comment = row[7]
+    generated = row[8]
+    default_on_nul = row[9]
+    identity_options = row[10]
+
+    if coltype == "NUMBER":
+        if precision is None and scale == 0:
+            coltype = INTEGER()
+        else:
+            coltype = ischema_names.get(coltype)(precision, scale)
+    elif coltype == "FLOAT":
+        # TODO: support "precision" here as "binary_precision"
+        coltype = FLOAT()
+    elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+        coltype = ischema_names.get(coltype)(length)
+    elif "WITH TIME ZONE" in coltype:
+        coltype = TIMESTAMP(timezone=True)
+    else:
+        coltype = re.sub(r"\(\d+\)", "", coltype)
+        try:
+            coltype = ischema_names[coltype]()
+        except KeyError:
+            logger.warning(f"Did not recognize type {coltype} of column {colname}")
+            coltype = sqltypes.NULLTYPE
+
+    if generated == "YES":
+        computed = dict(sqltext=default)
+        default = None
+    else:
+        computed = None
+
+    if identity_options is not None:
+        identity = dialect._parse_identity_options(identity_options, default_on_nul)
+        default = None
+    else:
+        identity = None
+
+    cdict = {
+        "name": colname,
+        "type": coltype,
+        "nullable": nullable,
+        "default": default,
+        "autoincrement": "auto",
+        "comment": comment,
+    }
+    if orig_colname.lower() == orig_colname:
+        cdict["quote"] = True
+    if computed is not None:
+        cdict["computed"] = computed
+    if identity is not None:
+        cdict["identity"] = identity
+    return cdict
+
+
+def _get_constraints_query(dictionary: str, dblink: str = "") -> str:
+    """
+    Returns the constraint query for the given data dictionary views ("all" or
+    "dba"). Callers add filters on ac.owner and ac.table_name, and an ORDER BY clause.
+    """
+    return (
+        "SELECT"
+        "\nac.constraint_name,"  # 0
+        "\nac.constraint_type,"  # 1
+        "\nloc.column_name AS local_column,"  # 2
+        "\nrem.table_name AS remote_table,"  # 3
+        "\nrem.column_name AS remote_column,"  # 4
+        "\nrem.owner AS remote_owner,"  # 5
+        "\nloc.position as loc_pos,"  # 6
+        "\nrem.position as rem_pos,"  # 7
+        "\nac.search_condition,"  # 8
+        "\nac.delete_rule,"  # 9
+        "\nac.table_name"  # 10
+        f"\nFROM {dictionary}_constraints{dblink} ac,"
+        f"\n{dictionary}_cons_columns{dblink} loc,"
+        f"\n{dictionary}_cons_columns{dblink} rem"
+        "\nWHERE ac.constraint_type IN ('R','P', 'U', 'C')"
+        "\nAND ac.owner = loc.owner"
+        "\nAND ac.constraint_name = loc.constraint_name"
+        "\nAND ac.r_owner = rem.owner(+)"
+        "\nAND ac.r_constraint_name = rem.constraint_name(+)"
+        "\nAND (rem.position IS NULL or loc.position=rem.position)"
+    )
+
+
+def _get_pk_constraint_info(
+    dialect: Any, constraint_data: Iterable[sqlalchemy.engine.Row]
+) -> Dict:
+    pkeys = []
+    constraint_name = None
+
+    for row in constraint_data:
+        (
+            cons_name,
+            cons_type,
+            local_column,
+            remote_table,
+            remote_column,
+            remote_owner,
+        ) = row[0:2] + tuple([dialect.normalize_name(x) for x in row[2:6]])
+        if cons_type == "P":
+            if constraint_name is None:
+                constraint_name = dialect.normalize_name(cons_name)
+            pkeys.append(local_column)
+
+    return {"constrained_columns": pkeys, "name": constraint_name}
+
+
+def _get_foreign_keys_info(
+    dialect: Any,
+    constraint_data: Iterable[sqlalchemy.engine.Row],
+    schema: Optional[str],
+    dblink: str = "",
+) -> List:
+    requested_schema = schema  # to check later on
+
+    def fkey_rec():
+        return {
+            "name": None,
+            "constrained_columns": [],
+            "referred_schema": None,
+            "referred_table": None,
+            "referred_columns": [],
+            "options": {},
+        }
+
+    fkeys = defaultdict(fkey_rec)  # type: defaultdict
+
+    for row in constraint_data:
+        (
+            cons_name,
+            cons_type,
+            local_column,
+            remote_table,
+            remote_column,
+            remote_owner,
+        ) = row[0:2] + tuple([dialect.normalize_name(x) for x in row[2:6]])
+
+        cons_name = dialect.normalize_name(cons_name)
+
+        if cons_type == "R":
+            if remote_table is None:
+                logger.warning(
+                    "Got 'None' querying 'table_name' from "
+                    f"dba_cons_columns{dblink} - does the user have "
+                    "proper rights to the table?"
+                )
+
+            rec = fkeys[cons_name]
+            rec["name"] = cons_name
+            local_cols, remote_cols = (
+                rec["constrained_columns"],
+                rec["referred_columns"],
+            )
+
+            if not rec["referred_table"]:
+                rec["referred_table"] = remote_table
+                if (
+                    requested_schema is not None
+                    or dialect.denormalize_name(remote_owner) != schema
+                ):
+                    rec["referred_schema"] = remote_owner
+
+                if row[9] != "NO ACTION":
+                    rec["options"]["ondelete"] = row[9]
+
+            local_cols.append(local_column)
+            remote_cols.append(remote_column)
+
+    return list(fkeys.values())
+
+
 class OracleInspectorObjectWrapper:
     """
     Inspector class wrapper, which queries DBA_TABLES instead of ALL_TABLES
@@ -208,135 +447,18 @@ class OracleInspectorObjectWrapper:
         if schema is None:
             schema = self._inspector_instance.dialect.default_schema_name
 
-        columns = []
-        if not (
-            self._inspector_instance.dialect.server_version_info
-            and self._inspector_instance.dialect.server_version_info < (9,)
-        ):
-            # _supports_char_length --> not self._is_oracle_8
-            char_length_col = "char_length"
-        else:
-            char_length_col = "data_length"
-
-        if (
-            self._inspector_instance.dialect.server_version_info
-            and self._inspector_instance.dialect.server_version_info >= (12,)
-        ):
-            identity_cols = """\
-                col.default_on_null,
-                (
-                    SELECT id.generation_type || ',' || id.IDENTITY_OPTIONS
-                    FROM DBA_TAB_IDENTITY_COLS%(dblink)s id
-                    WHERE col.table_name = id.table_name
-                    AND col.column_name = id.column_name
-                    AND col.owner = id.owner
-                ) AS identity_options""" % {
-                "dblink": dblink
-            }
-        else:
-            identity_cols = "NULL as default_on_null, NULL as identity_options"
-
         params = {"table_name": denormalized_table_name}
 
-        text = """
-            SELECT
-                col.column_name,
-                col.data_type,
-                col.%(char_length_col)s,
-                col.data_precision,
-                col.data_scale,
-                col.nullable,
-                col.data_default,
-                com.comments,
-                col.virtual_column,
-                %(identity_cols)s
-            FROM dba_tab_cols%(dblink)s col
-            LEFT JOIN dba_col_comments%(dblink)s com
-            ON col.table_name = com.table_name
-            AND col.column_name = com.column_name
-            AND col.owner = com.owner
-            WHERE col.table_name = CAST(:table_name AS VARCHAR2(128))
-            AND col.hidden_column = 'NO'
-        """
+        text = _get_columns_query(self._inspector_instance.dialect, "dba", dblink)
+        text += " AND col.table_name = CAST(:table_name AS VARCHAR2(128))"
         if schema is not None:
             params["owner"] = schema
             text += " AND col.owner = :owner "
         text += " ORDER BY col.column_id"
-        text = text % {
-            "dblink": dblink,
-            "char_length_col": char_length_col,
-            "identity_cols": identity_cols,
-        }
 
         c = self._inspector_instance.bind.execute(sql.text(text), params)
 
-        for row in c:
-            colname = self._inspector_instance.dialect.normalize_name(row[0])
-            orig_colname = row[0]
-            coltype = row[1]
-            length = row[2]
-            precision = row[3]
-            scale = row[4]
-            nullable = row[5] == "Y"
-            default = row[6]
-            comment = row[7]
-            generated = row[8]
-            default_on_nul = row[9]
-            identity_options = row[10]
-
-            if coltype == "NUMBER":
-                if precision is None and scale == 0:
-                    coltype = INTEGER()
-                else:
-                    coltype = ischema_names.get(coltype)(precision, scale)
-            elif coltype == "FLOAT":
-                # TODO: support "precision" here as "binary_precision"
-                coltype = FLOAT()
-            elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
-                coltype = ischema_names.get(coltype)(length)
-            elif "WITH TIME ZONE" in coltype:
-                coltype = TIMESTAMP(timezone=True)
-            else:
-                coltype = re.sub(r"\(\d+\)", "", coltype)
-                try:
-                    coltype = ischema_names[coltype]()
-                except KeyError:
-                    logger.warning(
-                        f"Did not recognize type {coltype} of column {colname}"
-                    )
-                    coltype = sqltypes.NULLTYPE
-
-            if generated == "YES":
-                computed = dict(sqltext=default)
-                default = None
-            else:
-                computed = None
-
-            if identity_options is not None:
-                identity = self._inspector_instance.dialect._parse_identity_options(  # type: ignore
-                    identity_options, default_on_nul
-                )
-                default = None
-            else:
-                identity = None
-
-            cdict = {
-                "name": colname,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": "auto",
-                "comment": comment,
-            }
-            if orig_colname.lower() == orig_colname:
-                cdict["quote"] = True
-            if computed is not None:
-                cdict["computed"] = computed
-            if identity is not None:
-                cdict["identity"] = identity
-
-            columns.append(cdict)
-        return columns
+        return [_get_column_info(self._inspector_instance.dialect, row) for row in c]
 
     def get_table_comment(self, table_name: str, schema: Optional[str] = None) -> Dict:
 
@@ -371,39 +493,15 @@ class OracleInspectorObjectWrapper:
     ) -> List[sqlalchemy.engine.Row]:
         params = {"table_name": table_name}
 
-        text = (
-            "SELECT"
-            "\nac.constraint_name,"  # 0
-            "\nac.constraint_type,"  # 1
-            "\nloc.column_name AS local_column,"  # 2
-            "\nrem.table_name AS remote_table,"  # 3
-            "\nrem.column_name AS remote_column,"  # 4
-            "\nrem.owner AS remote_owner,"  # 5
-            "\nloc.position as loc_pos,"  # 6
-            "\nrem.position as rem_pos,"  # 7
-            "\nac.search_condition,"  # 8
-            "\nac.delete_rule"  # 9
-            "\nFROM dba_constraints%(dblink)s ac,"
-            "\ndba_cons_columns%(dblink)s loc,"
-            "\ndba_cons_columns%(dblink)s rem"
-            "\nWHERE ac.table_name = CAST(:table_name AS VARCHAR2(128))"
-            "\nAND ac.constraint_type IN ('R','P', 'U', 'C')"
-        )
+        text = _get_constraints_query("dba", dblink)
+        text += "\nAND ac.table_name = CAST(:table_name AS VARCHAR2(128))"
 
         if schema is not None:
             params["owner"] = schema
             text += "\nAND ac.owner = CAST(:owner AS VARCHAR2(128))"
 
-        text += (
-            "\nAND ac.owner = loc.owner"
-            "\nAND ac.constraint_name = loc.constraint_name"
-            "\nAND ac.r_owner = rem.owner(+)"
-            "\nAND ac.r_constraint_name = rem.constraint_name(+)"
-            "\nAND (rem.position IS NULL or loc.position=rem.position)"
-            "\nORDER BY ac.constraint_name, loc.position"
-        )
+        text += "\nORDER BY ac.constraint_name, loc.position"
 
-        text = text % {"dblink": dblink}
         rp = self._inspector_instance.bind.execute(sql.text(text), params)
         constraint_data = rp.fetchall()
         return constraint_data
@@ -424,31 +522,12 @@ class OracleInspectorObjectWrapper:
         if schema is None:
             schema = self._inspector_instance.dialect.default_schema_name
 
-        pkeys = []
-        constraint_name = None
         constraint_data = self._get_constraint_data(
             denormalized_table_name, schema, dblink
         )
-
-        for row in constraint_data:
-            (
-                cons_name,
-                cons_type,
-                local_column,
-                remote_table,
-                remote_column,
-                remote_owner,
-            ) = row[0:2] + tuple(
-                [self._inspector_instance.dialect.normalize_name(x) for x in row[2:6]]
-            )
-            if cons_type == "P":
-                if constraint_name is None:
-                    constraint_name = self._inspector_instance.dialect.normalize_name(
-                        cons_name
-                    )
-                pkeys.append(local_column)
-
-        return {"constrained_columns": pkeys, "name": constraint_name}
+        return _get_pk_constraint_info(
+            self._inspector_instance.dialect, constraint_data
+        )
 
     def get_foreign_keys(
         self, table_name: str, schema: Optional[str] = None, dblink: str = ""
@@ -466,71 +545,12 @@ class OracleInspectorObjectWrapper:
         if schema is None:
             schema = self._inspector_instance.dialect.default_schema_name
 
-        requested_schema = schema  # to check later on
-
         constraint_data = self._get_constraint_data(
             denormalized_table_name, schema, dblink
         )
-
-        def fkey_rec():
-            return {
-                "name": None,
-                "constrained_columns": [],
-                "referred_schema": None,
-                "referred_table": None,
-                "referred_columns": [],
-                "options": {},
-            }
-
-        fkeys = defaultdict(fkey_rec)  # type: defaultdict
-
-        for row in constraint_data:
-            (
-                cons_name,
-                cons_type,
-                local_column,
-                remote_table,
-                remote_column,
-                remote_owner,
-            ) = row[0:2] + tuple(
-                [self._inspector_instance.dialect.normalize_name(x) for x in row[2:6]]
-            )
-
-            cons_name = self._inspector_instance.dialect.normalize_name(cons_name)
-
-            if cons_type == "R":
-                if remote_table is None:
-                    logger.warning(
-                        "Got 'None' querying 'table_name' from "
-                        f"dba_cons_columns{dblink} - does the user have "
-                        "proper rights to the table?"
-                    )
-
-                rec = fkeys[cons_name]
-                rec["name"] = cons_name
-                local_cols, remote_cols = (
-                    rec["constrained_columns"],
-                    rec["referred_columns"],
-                )
-
-                if not rec["referred_table"]:
-                    rec["referred_table"] = remote_table
-                    if (
-                        requested_schema is not None
-                        or self._inspector_instance.dialect.denormalize_name(
-                            remote_owner
-                        )
-                        != schema
-                    ):
-                        rec["referred_schema"] = remote_owner
-
-                    if row[9] != "NO ACTION":
-                        rec["options"]["ondelete"] = row[9]
-
-                local_cols.append(local_column)
-                remote_cols.append(remote_column)
-
-        return list(fkeys.values())
+        return _get_foreign_keys_info(
+            self._inspector_instance.dialect, constraint_data, schema, dblink
+        )
 
     def get_view_definition(
         self, view_name: str, schema: Optional[str] = None
@@ -625,6 +645,60 @@ class OracleSource(SQLAlchemySource):
                 # To silent the mypy lint error
                 yield cast(Inspector, inspector)
 
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        with super().get_worker_inspector(inspector) as worker_inspector:
+            if self.config.data_dictionary_mode != "ALL":
+                yield cast(Inspector, OracleInspectorObjectWrapper(worker_inspector))
+            else:
+                yield worker_inspector
+
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        # Same queries as OracleInspectorObjectWrapper (and SQLAlchemy's Oracle
+        # dialect), without the per-table filter.
+        dialect = inspector.dialect
+        dictionary = "dba" if self.config.data_dictionary_mode == "DBA" else "all"
+        owner = dialect.denormalize_name(schema)
+        params = {"owner": owner}
+
+        columns: Dict[str, List[dict]] = defaultdict(list)
+        text = _get_columns_query(dialect, dictionary)
+        text += " AND col.owner = :owner ORDER BY col.table_name, col.column_id"
+        for row in inspector.bind.execute(sql.text(text), params):
+            columns[dialect.normalize_name(row[11])].append(
+                _get_column_info(dialect, row)
+            )
+
+        constraint_data: Dict[str, List[sqlalchemy.engine.Row]] = defaultdict(list)
+        text = _get_constraints_query(dictionary)
+        text += (
+            "\nAND ac.owner = CAST(:owner AS VARCHAR2(128))"
+            "\nORDER BY ac.table_name, ac.constraint_name, loc.position"
+        )
+        for row in inspector.bind.execute(sql.text(text), params):
+            constraint_data[dialect.normalize_name(row[10])].append(row)
+
+        text = f"SELECT table_name, comments FROM {dictionary}_tab_comments WHERE owner = :owner"
+        table_comments: Dict[str, Optional[str]] = {
+            dialect.normalize_name(row[0]): row[1]
+            for row in inspector.bind.execute(sql.text(text), params)
+        }
+
+        return SchemaReflection(
+            columns=dict(columns),
+            pk_constraints={
+                table: _get_pk_constraint_info(dialect, rows)
+                for table, rows in constraint_data.items()
+            },
+            foreign_keys={
+                table: _get_foreign_keys_info(dialect, rows, owner)
+                for table, rows in constraint_data.items()
+            },
+            table_comments=table_comments,
+        )
+
     def get_workunits(self):
         with patch.dict(
             "sqlalchemy.dialects.oracle.base.OracleDialect.ischema_names",
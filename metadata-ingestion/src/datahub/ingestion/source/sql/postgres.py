@@ -14,7 +14,7 @@ import sqlalchemy.dialects.postgresql as custom_types
 from geoalchemy2 import Geometry  # noqa: F401
 from pydantic import BaseModel
 from pydantic.fields import Field
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.configuration.common import AllowDenyPattern
@@ -31,6 +31,7 @@ from datahub.ingestion.api.decorators import (
 )
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflection,
     SQLAlchemySource,
     SqlWorkUnit,
     register_custom_type,
@@ -88,6 +89,75 @@ ORDER BY source_schema, source_table;
 """
 
 
+# The queries below reflect a whole namespace at once. They mirror the per-table
+# queries of SQLAlchemy's PostgreSQL dialect, so that the results can be fed
+# through the same column parsing.
+SCHEMA_COLUMNS_QUERY = """
+SELECT c.relname AS table_name
+, a.attname AS name
+, pg_catalog.format_type(a.atttypid, a.atttypmod) AS format_type
+, (
+    SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+    FROM pg_catalog.pg_attrdef d
+    WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum AND a.atthasdef
+) AS default
+, a.attnotnull AS notnull
+, pgd.description AS comment
+, {generated} AS generated
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_catalog.pg_description pgd
+    ON pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum
+WHERE n.nspname = :schema
+AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+AND a.attnum > 0 AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum
+"""
+
+SCHEMA_PK_CONSTRAINTS_QUERY = """
+SELECT c.relname AS table_name
+, r.conname AS name
+, a.attname AS column_name
+FROM pg_catalog.pg_constraint r
+JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+CROSS JOIN LATERAL unnest(r.conkey) WITH ORDINALITY AS k(attnum, ord)
+JOIN pg_catalog.pg_attribute a ON a.attrelid = r.conrelid AND a.attnum = k.attnum
+WHERE n.nspname = :schema AND r.contype = 'p'
+ORDER BY c.relname, k.ord
+"""
+
+SCHEMA_FOREIGN_KEYS_QUERY = """
+SELECT c.relname AS table_name
+, r.conname AS name
+, rn.nspname AS referred_schema
+, rc.relname AS referred_table
+, la.attname AS constrained_column
+, ra.attname AS referred_column
+FROM pg_catalog.pg_constraint r
+JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_catalog.pg_class rc ON rc.oid = r.confrelid
+JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+CROSS JOIN LATERAL unnest(r.conkey, r.confkey) WITH ORDINALITY AS k(conattnum, confattnum, ord)
+JOIN pg_catalog.pg_attribute la ON la.attrelid = r.conrelid AND la.attnum = k.conattnum
+JOIN pg_catalog.pg_attribute ra ON ra.attrelid = r.confrelid AND ra.attnum = k.confattnum
+WHERE n.nspname = :schema AND r.contype = 'f'
+ORDER BY c.relname, r.conname, k.ord
+"""
+
+SCHEMA_TABLE_COMMENTS_QUERY = """
+SELECT c.relname AS table_name
+, pgd.description AS comment
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_catalog.pg_description pgd ON pgd.objoid = c.oid AND pgd.objsubid = 0
+WHERE n.nspname = :schema
+AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+"""
+
+
 class ViewLineageEntry(BaseModel):
     # note that the order matches our query above
     # so pydantic is able to parse the tuple using parse_obj
@@ -268,6 +338,81 @@ class PostgresSource(SQLAlchemySource):
             for item in mcps_from_mce(lineage_mce):
                 yield item.as_workunit()
 
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        dialect = inspector.dialect
+        conn = inspector.bind
+
+        columns: Dict[str, List[dict]] = defaultdict(list)
+        generated = "a.attgenerated" if dialect.server_version_info >= (12,) else "NULL"
+        rows = conn.execute(
+            text(SCHEMA_COLUMNS_QUERY.format(generated=generated)), dict(schema=schema)
+        ).fetchall()
+        if rows:
+            # Same as in PGDialect.get_columns: (name,) keys for types visible on
+            # the search path, (schema, name) keys otherwise.
+            domains = dialect._load_domains(conn)
+            enums = dict(
+                ((rec["name"],), rec)
+                if rec["visible"]
+                else ((rec["schema"], rec["name"]), rec)
+                for rec in dialect._load_enums(conn, schema="*")
+            )
+            for row in rows:
+                columns[row["table_name"]].append(
+                    dialect._get_column_info(
+                        row["name"],
+                        row["format_type"],
+                        row["default"],
+                        row["notnull"],
+                        domains,
+                        enums,
+                        schema,
+                        row["comment"],
+                        row["generated"],
+                        None,
+                    )
+                )
+
+        pk_constraints: Dict[str, dict] = {}
+        for row in conn.execute(text(SCHEMA_PK_CONSTRAINTS_QUERY), dict(schema=schema)):
+            pk = pk_constraints.setdefault(
+                row["table_name"], {"constrained_columns": [], "name": row["name"]}
+            )
+            pk["constrained_columns"].append(row["column_name"])
+
+        foreign_keys: Dict[str, List[dict]] = defaultdict(list)
+        fk_by_name: Dict[Tuple[str, str], dict] = {}
+        for row in conn.execute(text(SCHEMA_FOREIGN_KEYS_QUERY), dict(schema=schema)):
+            key = (row["table_name"], row["name"])
+            if key not in fk_by_name:
+                fk_by_name[key] = {
+                    "name": row["name"],
+                    "constrained_columns": [],
+                    "referred_schema": row["referred_schema"],
+                    "referred_table": row["referred_table"],
+                    "referred_columns": [],
+                    "options": {},
+                }
+                foreign_keys[row["table_name"]].append(fk_by_name[key])
+            fk_by_name[key]["constrained_columns"].append(row["constrained_column"])
+            fk_by_name[key]["referred_columns"].append(row["referred_column"])
+
+        table_comments: Dict[str, Optional[str]] = {
+            row["table_name"]: row["comment"]
+            for row in conn.execute(
+                text(SCHEMA_TABLE_COMMENTS_QUERY), dict(schema=schema)
+            )
+        }
+
+        return SchemaReflection(
+            columns=dict(columns),
+            pk_constraints=pk_constraints,
+            foreign_keys=dict(foreign_keys),
+            table_comments=table_comments,
+        )
+
     def get_identifier(
         self, *, schema: str, entity: str, inspector: Inspector, **kwargs: Any
     ) -> str:
@@ -2,6 +2,7 @@ import contextlib
 import datetime
 import functools
 import logging
+import threading
 import traceback
 from dataclasses import dataclass, field
 from functools import partial
@@ -10,18 +11,21 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     MutableMapping,
     Optional,
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
 
 import sqlalchemy.dialects.postgresql.base
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.row import LegacyRow
 from sqlalchemy.exc import ProgrammingError
@@ -116,6 +120,7 @@ from datahub.sql_parsing.sqlglot_lineage import (
     view_definition_lineage_helper,
 )
 from datahub.telemetry import telemetry
+from datahub.utilities.advanced_thread_executor import BackpressureAwareExecutor
 from datahub.utilities.file_backed_collections import FileBackedDict
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.registries.domain_registry import DomainRegistry
@@ -131,6 +136,13 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 MISSING_COLUMN_INFO = "missing column information"
 
+# Key of the cached SchemaReflection of a schema in the inspector's info_cache.
+_SCHEMA_REFLECTION_CACHE_KEY = "datahub_schema_reflection"
+
+T = TypeVar("T")
+
+_NO_MORE_ITEMS = object()
+
 
 @dataclass
 class SQLSourceReport(StaleEntityRemovalSourceReport, ClassificationReportMixin):
@@ -317,6 +329,88 @@ class ProfileMetadata:
     dataset_name_to_storage_bytes: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class SchemaReflection:
+    """
+    Reflected metadata for all tables and views of a schema, keyed by table name and
+    shaped like the results of the corresponding Inspector methods.
+
+    A mapping left as None was not fetched in bulk, so per-table reflection is used
+    for it. Once a mapping is fetched, tables missing from it are assumed to have no
+    primary key, foreign keys or comment. Tables missing from `columns` still fall
+    back to per-table reflection.
+    """
+
+    columns: Optional[Dict[str, List[dict]]] = None
+    pk_constraints: Optional[Dict[str, dict]] = None
+    foreign_keys: Optional[Dict[str, List[dict]]] = None
+    table_comments: Optional[Dict[str, Optional[str]]] = None
+
+
+class _DatabaseWaitLock:
+    """A lock that its holder gives up while one of its queries runs on the database.
+
+    Schema workers hold it for everything but their queries, so their updates to the
+    report and to the source's caches never race, while the queries still overlap.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def hold(self) -> Iterator[None]:
+        self._lock.acquire()
+        self._local.state = "held"
+        try:
+            yield
+        finally:
+            # A query that failed without reaching on_query_end leaves the lock released.
+            if self._local.state == "held":
+                self._lock.release()
+            self._local.state = None
+
+    def wrap_iterable(self, iterable: Iterable[T]) -> Iterator[T]:
+        # Produces each item of iterable while holding the lock.
+        iterator = iter(iterable)
+        while True:
+            with self.hold():
+                item = next(iterator, _NO_MORE_ITEMS)
+            if item is _NO_MORE_ITEMS:
+                return
+            yield cast(T, item)
+
+    @contextlib.contextmanager
+    def released_during_queries(self, engine: Any) -> Iterator[None]:
+        # Without an engine to listen on, the workers are fully serialized.
+        if not isinstance(engine, Engine):
+            yield
+            return
+
+        listeners = [
+            ("before_cursor_execute", self.on_query_start),
+            ("after_cursor_execute", self.on_query_end),
+            ("handle_error", self.on_query_end),
+        ]
+        for identifier, fn in listeners:
+            event.listen(engine, identifier, fn)
+        try:
+            yield
+        finally:
+            for identifier, fn in listeners:
+                event.remove(engine, identifier, fn)
+
+    def on_query_start(self, *args: Any, **kwargs: Any) -> None:
+        if getattr(self._local, "state", None) == "held":
+            self._local.state = "released"
+            self._lock.release()
+
+    def on_query_end(self, *args: Any, **kwargs: Any) -> None:
+        if getattr(self._local, "state", None) == "released":
+            self._lock.acquire()
+            self._local.state = "held"
+
+
 @capability(
     SourceCapability.CLASSIFICATION,
     "Optionally enabled via `classification.enabled`",
@@ -372,6 +466,8 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             self._view_definition_cache = FileBackedDict[str]()
         else:
             self._view_definition_cache = {}
+        # Serializes everything schema workers do besides waiting on the database.
+        self._schema_worker_lock = _DatabaseWaitLock()
 
     @classmethod
     def test_connection(cls, config_dict: dict) -> TestConnectionReport:
@@ -404,6 +500,14 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             inspector = inspect(conn)
             yield inspector
 
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        # Used when max_workers > 1. Each schema worker gets an inspector with its
+        # own connection from the pool. Subclasses that wrap the inspectors returned
+        # by get_inspectors should wrap this one in the same way.
+        with inspector.engine.connect() as conn:
+            yield inspect(conn)
+
     def get_db_name(self, inspector: Inspector) -> str:
         engine = inspector.engine
 
@@ -520,6 +624,49 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         if self.config.include_views:
             yield from self.loop_views(inspector, schema, self.config)
 
+        self._clear_schema_reflection(inspector, schema)
+
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        """
+        Fetches columns, primary keys, foreign keys and table comments for every table
+        in the schema with a handful of catalog queries, instead of a few queries per
+        table. Only used when `use_bulk_reflection` is enabled. Sources that don't
+        support it return None and use per-table SQLAlchemy reflection.
+        """
+        return None
+
+    def _get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        if not self.config.use_bulk_reflection:
+            return None
+
+        # Cached alongside SQLAlchemy's own reflection cache, so that it shares the
+        # lifetime of the inspector (and its connection).
+        key = (_SCHEMA_REFLECTION_CACHE_KEY, schema)
+        if key not in inspector.info_cache:
+            reflection: Optional[SchemaReflection] = None
+            try:
+                reflection = self.get_schema_reflection(inspector, schema)
+            except Exception as e:
+                logger.debug(
+                    f"Failed to reflect schema {schema} in bulk, falling back to per-table reflection",
+                    exc_info=e,
+                )
+                self.warn(
+                    logger,
+                    schema,
+                    f"unable to reflect schema in bulk due to an error -> {e}",
+                )
+            inspector.info_cache[key] = reflection
+        return inspector.info_cache[key]
+
+    def _clear_schema_reflection(self, inspector: Inspector, schema: str) -> None:
+        if self.config.use_bulk_reflection:
+            inspector.info_cache.pop((_SCHEMA_REFLECTION_CACHE_KEY, schema), None)
+
     def get_workunit_processors(self) -> List[Optional[MetadataWorkUnitProcessor]]:
         return [
             *super().get_workunit_processors(),
@@ -539,10 +686,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
+        max_overflow = sql_config.max_workers if sql_config.max_workers > 1 else 0
         if sql_config.is_profiling_enabled():
-            sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
-            )
+            max_overflow = max(max_overflow, sql_config.profiling.max_workers)
+        if max_overflow:
+            sql_config.options.setdefault("max_overflow", max_overflow)
 
         for inspector in self.get_inspectors():
             profiler = None
@@ -564,20 +712,40 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
                 database=db_name,
             )
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
-
-                yield from self.get_schema_level_workunits(
-                    inspector=inspector,
-                    schema=schema,
-                    database=db_name,
+            if sql_config.max_workers > 1:
+                lock = self._schema_worker_lock
+                schemas = lock.wrap_iterable(
+                    self.get_allowed_schemas(inspector, db_name)
                 )
+                with lock.released_during_queries(inspector.engine):
+                    for future in BackpressureAwareExecutor.map_ordered(
+                        self._extract_schema,
+                        (
+                            (inspector, schema, db_name, profiler is not None)
+                            for schema in schemas
+                        ),
+                        max_workers=sql_config.max_workers,
+                    ):
+                        # The consumers of these work units update the report too.
+                        with lock.hold():
+                            schema_workunits, schema_profile_requests = future.result()
+                            yield from schema_workunits
+                            profile_requests += schema_profile_requests
+            else:
+                for schema in self.get_allowed_schemas(inspector, db_name):
+                    self.add_information_for_schema(inspector, schema)
 
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
+                    yield from self.get_schema_level_workunits(
+                        inspector=inspector,
+                        schema=schema,
+                        database=db_name,
                     )
 
+                    if profiler:
+                        profile_requests += list(
+                            self.loop_profiler_requests(inspector, schema, sql_config)
+                        )
+
             if profiler and profile_requests:
                 yield from self.loop_profiler(
                     profile_requests, profiler, platform=self.platform
@@ -586,31 +754,63 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         if self.config.include_view_lineage:
             yield from self.get_view_lineage()
 
+    def _extract_schema(
+        self,
+        inspector: Inspector,
+        schema: str,
+        database: str,
+        include_profile_requests: bool,
+    ) -> Tuple[List[Union[MetadataWorkUnit, SqlWorkUnit]], List["GEProfilerRequest"]]:
+        # Runs on a worker thread. The work units are buffered so that the caller
+        # can emit them in schema order, keeping each table's work units together.
+        # Apart from its queries, the worker runs under the lock, so that it can
+        # update the report and the source's caches like the serial path does.
+        with self.get_worker_inspector(
+            inspector
+        ) as worker_inspector, self._schema_worker_lock.hold():
+            self.add_information_for_schema(worker_inspector, schema)
+
+            workunits = list(
+                self.get_schema_level_workunits(
+                    inspector=worker_inspector,
+                    schema=schema,
+                    database=database,
+                )
+            )
+
+            profile_requests: List["GEProfilerRequest"] = []
+            if include_profile_requests:
+                profile_requests = list(
+                    self.loop_profiler_requests(worker_inspector, schema, self.config)
+                )
+
+        return workunits, profile_requests
+
     def get_view_lineage(self) -> Iterable[MetadataWorkUnit]:
-        builder = SqlParsingBuilder(
+        with SqlParsingBuilder(
             generate_lineage=True,
             generate_usage_statistics=False,
             generate_operations=False,
-        )
-        for dataset_name in self._view_definition_cache.keys():
-            view_definition = self._view_definition_cache[dataset_name]
-            result = self._run_sql_parser(
-                dataset_name,
-                view_definition,
-                self.schema_resolver,
-            )
-            if result and result.out_tables:
-                # This does not yield any workunits but we use
-                # yield here to execute this method
-                yield from builder.process_sql_parsing_result(
-                    result=result,
-                    query=view_definition,
-                    is_view_ddl=True,
-                    include_column_lineage=self.config.include_view_column_lineage,
+        ) as builder:
+            for dataset_name in self._view_definition_cache.keys():
+                view_definition = self._view_definition_cache[dataset_name]
+                result = self._run_sql_parser(
+                    dataset_name,
+                    view_definition,
+                    self.schema_resolver,
                 )
-            else:
-                self.views_failed_parsing.add(dataset_name)
-        yield from builder.gen_workunits()
+                if result and result.out_tables:
+                    # This does not yield any workunits but we use
+                    # yield here to execute this method
+                    yield from builder.process_sql_parsing_result(
+                        result=result,
+                        query=view_definition,
+                        is_view_ddl=True,
+                        include_column_lineage=self.config.include_view_column_lineage,
+                    )
+                else:
+                    self.views_failed_parsing.add(dataset_name)
+            yield from builder.gen_workunits()
 
     def get_identifier(
         self, *, schema: str, entity: str, inspector: Inspector, **kwargs: Any
@@ -623,6 +823,17 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         else:
             return f"{schema}.{entity}"
 
+    def get_identifier_prefix(
+        self, *, schema: str, inspector: Inspector
+    ) -> Optional[str]:
+        """
+        Returns a prefix shared by the identifiers of every entity in the schema, or
+        None if get_identifier doesn't produce one.
+        """
+        prefix = self.get_identifier(schema=schema, entity="", inspector=inspector)
+        probe = self.get_identifier(schema=schema, entity="_", inspector=inspector)
+        return prefix if probe.startswith(prefix) else None
+
     def get_foreign_key_metadata(
         self,
         dataset_urn: str,
@@ -680,6 +891,12 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         schema: str,
         sql_config: SQLCommonConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        prefix = self.get_identifier_prefix(schema=schema, inspector=inspector)
+        if prefix is not None and not sql_config.table_pattern.may_allow_prefix(prefix):
+            # No table in this schema can pass the table_pattern, so skip listing them.
+            self.report.report_dropped(f"{prefix}*")
+            return
+
         tables_seen: Set[str] = set()
         data_reader = self.make_data_reader(inspector)
         with data_reader or contextlib.nullcontext():
@@ -767,7 +984,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             ).as_workunit()
 
         extra_tags = self.get_extra_tags(inspector, schema, table)
-        pk_constraints: dict = inspector.get_pk_constraint(table, schema)
+        pk_constraints: dict = self._get_pk_constraint(inspector, schema, table)
         foreign_keys = self._get_foreign_keys(dataset_urn, inspector, schema, table)
         schema_fields = self.get_schema_fields(
             dataset_name, columns, pk_constraints, tags=extra_tags
@@ -871,6 +1088,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         # this method and provide a location.
         location: Optional[str] = None
 
+        reflection = self._get_schema_reflection(inspector, schema)
+        if reflection is not None and reflection.table_comments is not None:
+            description = reflection.table_comments.get(table)
+            return description, properties, location
+
         try:
             # SQLAlchemy stubs are incomplete and missing this method.
             # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
@@ -916,7 +1138,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
     ) -> List[dict]:
         columns = []
         try:
-            columns = inspector.get_columns(table, schema)
+            columns = self._get_reflected_columns(inspector, schema, table)
             if len(columns) == 0:
                 self.warn(logger, MISSING_COLUMN_INFO, dataset_name)
         except Exception as e:
@@ -927,13 +1149,38 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             )
         return columns
 
+    def _get_reflected_columns(
+        self, inspector: Inspector, schema: str, table: str
+    ) -> List[dict]:
+        reflection = self._get_schema_reflection(inspector, schema)
+        if (
+            reflection is not None
+            and reflection.columns is not None
+            and table in reflection.columns
+        ):
+            return reflection.columns[table]
+        return inspector.get_columns(table, schema)
+
+    def _get_pk_constraint(self, inspector: Inspector, schema: str, table: str) -> dict:
+        reflection = self._get_schema_reflection(inspector, schema)
+        if reflection is not None and reflection.pk_constraints is not None:
+            return reflection.pk_constraints.get(
+                table, {"constrained_columns": [], "name": None}
+            )
+        return inspector.get_pk_constraint(table, schema)
+
     def _get_foreign_keys(
         self, dataset_urn: str, inspector: Inspector, schema: str, table: str
     ) -> List[ForeignKeyConstraint]:
         try:
+            reflection = self._get_schema_reflection(inspector, schema)
+            if reflection is not None and reflection.foreign_keys is not None:
+                fk_recs = reflection.foreign_keys.get(table, [])
+            else:
+                fk_recs = inspector.get_foreign_keys(table, schema)
             foreign_keys = [
                 self.get_foreign_key_metadata(dataset_urn, schema, fk_rec, inspector)
-                for fk_rec in inspector.get_foreign_keys(table, schema)
+                for fk_rec in fk_recs
             ]
         except KeyError:
             # certain databases like MySQL cause issues due to lower-case/upper-case irregularities
@@ -996,6 +1243,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         schema: str,
         sql_config: SQLCommonConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        prefix = self.get_identifier_prefix(schema=schema, inspector=inspector)
+        if prefix is not None and not sql_config.view_pattern.may_allow_prefix(prefix):
+            self.report.report_dropped(f"{prefix}*")
+            return
+
         try:
             for view in inspector.get_view_names(schema):
                 dataset_name = self.get_identifier(
@@ -1035,7 +1287,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             self.config.env,
         )
         try:
-            columns = inspector.get_columns(view, schema)
+            columns = self._get_reflected_columns(inspector, schema, view)
         except KeyError:
             # For certain types of views, we are unable to fetch the list of columns.
             self.warn(logger, dataset_name, "unable to get schema for this view")
@@ -94,6 +94,21 @@ class SQLCommonConfig(
         description="Whether to use a file backed cache for the view definitions.",
     )
 
+    max_workers: int = Field(
+        default=1,
+        description="Number of schemas to extract concurrently. Each worker uses its own pooled connection. "
+        "Only the queries run concurrently; the rest of the work is serialized. "
+        "Work units are still emitted in schema order, so the work units of a whole schema are held in memory "
+        "until it is emitted. Set to 1 to extract schemas one at a time.",
+    )
+
+    use_bulk_reflection: bool = Field(
+        default=False,
+        description="Whether to read columns, primary keys, foreign keys and table comments for a whole schema "
+        "at once from the system catalog, instead of issuing several queries per table. Speeds up ingestion of "
+        "schemas with many tables. Only supported by some sources; others ignore it.",
+    )
+
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = None
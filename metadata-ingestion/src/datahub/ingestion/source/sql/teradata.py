@@ -882,3 +882,7 @@ ORDER by DataBaseName, TableName;
             yield from self.get_audit_log_mcps(urns=urns)
 
         yield from self.builder.gen_workunits()
+
+    def close(self) -> None:
+        self.builder.close()
+        super().close()
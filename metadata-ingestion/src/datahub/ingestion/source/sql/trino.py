@@ -37,6 +37,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor import schema_util
 from datahub.ingestion.source.common.data_reader import DataReader
 from datahub.ingestion.source.sql.sql_common import (
+    SchemaReflection,
     SQLAlchemySource,
     SqlWorkUnit,
     register_custom_type,
@@ -168,16 +169,39 @@ def _get_columns(self, connection, table_name, schema: str = None, **kw):  # typ
     """
     ).strip()
     res = connection.execute(sql.text(query), schema=schema, table=table_name)
-    columns = []
+    return [_get_column_info(record) for record in res]
+
+
+def _get_column_info(record: Any) -> dict:
+    return dict(
+        name=record.column_name,
+        type=datatype.parse_sqltype(record.data_type),
+        nullable=record.is_nullable == "YES",
+        default=record.column_default,
+        comment=record.comment,
+    )
+
+
+def get_schema_columns(connection: Any, schema: str) -> Dict[str, List[dict]]:
+    # Same as _get_columns, for all tables and views of the schema at once.
+    query = dedent(
+        """
+        SELECT
+            "table_name",
+            "column_name",
+            "data_type",
+            "column_default",
+            UPPER("is_nullable") AS "is_nullable",
+            "comment"
+        FROM "information_schema"."columns"
+        WHERE "table_schema" = :schema
+        ORDER BY "table_name", "ordinal_position" ASC
+    """
+    ).strip()
+    res = connection.execute(sql.text(query), schema=schema)
+    columns: Dict[str, List[dict]] = {}
     for record in res:
-        column = dict(
-            name=record.column_name,
-            type=datatype.parse_sqltype(record.data_type),
-            nullable=record.is_nullable == "YES",
-            default=record.column_default,
-            comment=record.comment,
-        )
-        columns.append(column)
+        columns.setdefault(record.table_name, []).append(_get_column_info(record))
     return columns
 
 
@@ -250,6 +274,13 @@ class TrinoSource(SQLAlchemySource):
         else:
             return super().get_db_name(inspector)
 
+    def get_schema_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        # Trino doesn't report primary or foreign keys, and table comments come
+        # from connector-specific $properties tables, so only columns are batched.
+        return SchemaReflection(columns=get_schema_columns(inspector.bind, schema))
+
     def _get_source_dataset_urn(
         self,
         dataset_name: str,
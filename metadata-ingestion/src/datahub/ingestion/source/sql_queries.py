@@ -167,6 +167,10 @@ class SqlQueriesSource(Source):
         logger.info("Generating workunits")
         yield from self.builder.gen_workunits()
 
+    def close(self) -> None:
+        self.builder.close()
+        super().close()
+
     def _process_query(self, entry: "QueryEntry") -> Iterable[MetadataWorkUnit]:
         self.report.num_queries_parsed += 1
         if self.report.num_queries_parsed % 1000 == 0:
@@ -7,7 +7,7 @@ import logging
 import pickle
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Callable, Generic, Iterable, Optional, Type, TypeVar
 
 import pydantic
 
@@ -19,7 +19,14 @@ from datahub.metadata.schema_classes import (
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
+
+def _bz2_compress_chunked(chunks: Iterable[str]) -> bytes:
+    # This produces the same output as bz2.compress("".join(chunks).encode("utf-8"), 9),
+    # without ever holding the uncompressed payload in memory.
+    compressor = bz2.BZ2Compressor(9)
+    compressed = [compressor.compress(chunk.encode("utf-8")) for chunk in chunks]
+    compressed.append(compressor.flush())
+    return b"".join(compressed)
 
 
 class CheckpointStateBase(ConfigModel):
@@ -35,12 +42,13 @@ class CheckpointStateBase(ConfigModel):
 
     def to_bytes(
         self,
-        compressor: Callable[[bytes], bytes] = functools.partial(
-            bz2.compress, compresslevel=9
-        ),
-        max_allowed_state_size: int = DEFAULT_MAX_STATE_SIZE,
+        compressor: Optional[Callable[[bytes], bytes]] = None,
+        max_allowed_state_size: Optional[int] = None,
     ) -> bytes:
         """
+        By default, the base85-bz2-json payload is compressed with bz2 at level 9.
+        The size of the encoded state is only limited if max_allowed_state_size is set.
+
         NOTE: Binary compression cannot be turned on yet as the current MCPs encode the GeneralizedAspect
         payload using Json encoding which does not support bytes type data. For V1, we go with the utf-8 encoding.
         This also means that double serialization also is not possible to encode version and serde separate from the
@@ -60,7 +68,10 @@ class CheckpointStateBase(ConfigModel):
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
-        if len(encoded_bytes) > max_allowed_state_size:
+        if (
+            max_allowed_state_size is not None
+            and len(encoded_bytes) > max_allowed_state_size
+        ):
             raise ValueError(
                 f"The state size has exceeded the max_allowed_state_size of {max_allowed_state_size}"
             )
@@ -73,9 +84,20 @@ class CheckpointStateBase(ConfigModel):
 
     @staticmethod
     def _to_bytes_base85_json(
-        model: ConfigModel, compressor: Callable[[bytes], bytes]
+        model: "CheckpointStateBase", compressor: Optional[Callable[[bytes], bytes]]
     ) -> bytes:
-        return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
+        if compressor is None:
+            compressed = _bz2_compress_chunked(model._iter_json_chunks())
+        else:
+            compressed = compressor(CheckpointStateBase._to_bytes_utf8(model))
+        return base64.b85encode(compressed)
+
+    def _iter_json_chunks(self) -> Iterable[str]:
+        """
+        Yields the JSON serialization of the state in pieces. States that can grow very large
+        override this, so that the full JSON string never needs to be built.
+        """
+        yield self.json(exclude={"version", "serde"})
 
     def prepare_for_commit(self) -> None:
         """
@@ -196,7 +218,9 @@ class Checkpoint(Generic[StateType]):
             if checkpoint_aspect.state.payload is not None
             else b"{}"
         )
-        state_as_dict = json.loads(state_uncompressed.decode("utf-8"))
+        # json.loads accepts utf-8 bytes directly, which avoids another copy of the
+        # (potentially very large) state.
+        state_as_dict = json.loads(state_uncompressed)
         state_as_dict["version"] = checkpoint_aspect.state.formatVersion
         state_as_dict["serde"] = checkpoint_aspect.state.serde
         return state_class.parse_obj(state_as_dict)
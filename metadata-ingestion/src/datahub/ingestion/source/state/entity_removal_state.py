@@ -1,4 +1,5 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+import json
+from typing import AbstractSet, Any, Dict, Iterable, List, Tuple, Type
 
 import pydantic
 
@@ -8,6 +9,9 @@ from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 from datahub.utilities.dedup_list import deduplicate_list
 from datahub.utilities.urns.urn import guess_entity_type
 
+# When serializing, the urns are converted to JSON this many at a time.
+_URNS_JSON_SLICE_SIZE = 10_000
+
 
 def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
     # mapping would be something like:
@@ -83,6 +87,18 @@ class GenericCheckpointState(CheckpointStateBase):
         self.urns = deduplicate_list(self.urns)
         self._urns_set = set(self.urns)
 
+    def _iter_json_chunks(self) -> Iterable[str]:
+        yield '{"urns": ['
+        for start in range(0, len(self.urns), _URNS_JSON_SLICE_SIZE):
+            if start:
+                yield ", "
+            yield json.dumps(self.urns[start : start + _URNS_JSON_SLICE_SIZE])[1:-1]
+        yield "]"
+
+        # Subclasses may have fields besides the urns.
+        other_fields = self.json(exclude={"version", "serde", "urns"})
+        yield "}" if other_fields == "{}" else f", {other_fields[1:]}"
+
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
         Adds an urn into the list used for tracking the type.
@@ -107,7 +123,9 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream over our urns instead of building sets of both states. The urns are
+        # already deduplicated, and the other state keeps a set of its urns.
+        diff = (urn for urn in self.urns if urn not in other_checkpoint_state._urns_set)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -128,12 +146,12 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
         return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_checkpoint_state.urns
+            new_entities=self._urns_set, old_entities=old_checkpoint_state._urns_set
         )
 
 
 def compute_percent_entities_changed(
-    new_entities: List[str], old_entities: List[str]
+    new_entities: Iterable[str], old_entities: Iterable[str]
 ) -> float:
     (overlap_count, old_count, _,) = _get_entity_overlap_and_cardinalities(
         new_entities=new_entities, old_entities=old_entities
@@ -145,8 +163,18 @@ def compute_percent_entities_changed(
 
 
 def _get_entity_overlap_and_cardinalities(
-    new_entities: List[str], old_entities: List[str]
+    new_entities: Iterable[str], old_entities: Iterable[str]
 ) -> Tuple[int, int, int]:
-    new_set = set(new_entities)
-    old_set = set(old_entities)
-    return len(new_set.intersection(old_set)), len(old_set), len(new_set)
+    # Sets are used as-is, so that callers which already hold them (like the
+    # checkpoint states) don't need to copy millions of urns.
+    new_set = _as_set(new_entities)
+    old_set = _as_set(old_entities)
+    smaller_set, larger_set = sorted([new_set, old_set], key=len)
+    overlap_count = sum(1 for entity in smaller_set if entity in larger_set)
+    return overlap_count, len(old_set), len(new_set)
+
+
+def _as_set(entities: Iterable[str]) -> AbstractSet[str]:
+    if isinstance(entities, AbstractSet):
+        return entities
+    return set(entities)
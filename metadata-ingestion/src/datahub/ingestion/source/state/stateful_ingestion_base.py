@@ -57,7 +57,8 @@ class StatefulIngestionConfig(ConfigModel):
     )
     max_checkpoint_state_size: pydantic.PositiveInt = Field(
         default=2**24,  # 16 MB
-        description="The maximum size of the checkpoint state in bytes. Default is 16MB",
+        description="The maximum size of the checkpoint state in bytes. Default is 16MB. "
+        "The state is stored in a single aspect, so this should not exceed the maximum aspect size of the DataHub server.",
         hidden_from_docs=True,
     )
     state_provider: Optional[DynamicTypedStateProviderConfig] = Field(
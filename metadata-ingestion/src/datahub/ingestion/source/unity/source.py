@@ -960,28 +960,28 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
         ):
             return
         # This is only used for parsing view lineage. Usage, Operations are emitted elsewhere
-        builder = SqlParsingBuilder(
+        with SqlParsingBuilder(
             generate_lineage=True,
             generate_usage_statistics=False,
             generate_operations=False,
-        )
-        for dataset_name in self.view_definitions.keys():
-            view_ref, view_definition = self.view_definitions[dataset_name]
-            result = self._run_sql_parser(
-                view_ref,
-                view_definition,
-                self.sql_parser_schema_resolver,
-            )
-            if result and result.out_tables:
-                # This does not yield any workunits but we use
-                # yield here to execute this method
-                yield from builder.process_sql_parsing_result(
-                    result=result,
-                    query=view_definition,
-                    is_view_ddl=True,
-                    include_column_lineage=self.config.include_view_column_lineage,
+        ) as builder:
+            for dataset_name in self.view_definitions.keys():
+                view_ref, view_definition = self.view_definitions[dataset_name]
+                result = self._run_sql_parser(
+                    view_ref,
+                    view_definition,
+                    self.sql_parser_schema_resolver,
                 )
-        yield from builder.gen_workunits()
+                if result and result.out_tables:
+                    # This does not yield any workunits but we use
+                    # yield here to execute this method
+                    yield from builder.process_sql_parsing_result(
+                        result=result,
+                        query=view_definition,
+                        is_view_ddl=True,
+                        include_column_lineage=self.config.include_view_column_lineage,
+                    )
+            yield from builder.gen_workunits()
 
     def close(self):
         if self.hive_metastore_proxy:
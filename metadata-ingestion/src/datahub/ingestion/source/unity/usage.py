@@ -71,6 +71,8 @@ class UnityCatalogUsageExtractor:
         except Exception as e:
             logger.error("Error processing usage", exc_info=True)
             self.report.report_warning("usage-extraction", str(e))
+        finally:
+            self.usage_aggregator.close()
 
     def _get_workunits_internal(
         self, table_refs: Set[TableReference]
@@ -1,11 +1,9 @@
 import dataclasses
 import logging
-from collections import defaultdict
 from datetime import datetime
 from typing import (
     Callable,
     Counter,
-    Dict,
     Generic,
     Iterable,
     List,
@@ -27,6 +25,7 @@ from datahub.configuration.time_window_config import (
     get_time_bucket,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.com.linkedin.pegasus2avro.dataset import DatasetUsageStatistics
 from datahub.metadata.schema_classes import (
@@ -38,6 +37,8 @@ from datahub.metadata.schema_classes import (
     UsageAggregationClass,
     WindowDurationClass,
 )
+from datahub.utilities.file_backed_collections import FileBackedDict
+from datahub.utilities.lossy_collections import LossyCounter
 from datahub.utilities.sql_formatter import format_sql_query, trim_query
 from datahub.utilities.urns.dataset_urn import DatasetUrn
 from datahub.utilities.urns.urn import guess_entity_type
@@ -49,6 +50,10 @@ ResourceType = TypeVar("ResourceType")
 # The total number of characters allowed across all queries in a single workunit.
 DEFAULT_QUERIES_CHARACTER_LIMIT = 24000
 
+# The UsageAggregator tracks this many times top_n_queries distinct queries per
+# resource and bucket. Queries beyond that are counted approximately.
+_TOP_QUERIES_TRACKING_FACTOR = 10
+
 
 def default_user_urn_builder(email: str) -> str:
     return builder.make_user_urn(email.split("@")[0])
@@ -217,6 +222,11 @@ class BaseUsageConfig(BaseTimeWindowConfig):
     include_top_n_queries: bool = Field(
         default=True, description="Whether to ingest the top_n_queries."
     )
+    aggregation_cache_size: pydantic.PositiveInt = Field(
+        default=2000,
+        description="Maximum number of per-table usage aggregates to keep in memory. "
+        "The rest are spilled to a temporary file on disk.",
+    )
 
     @pydantic.validator("top_n_queries")
     def ensure_top_n_queries_is_not_too_big(cls, v: int, values: dict) -> int:
@@ -230,14 +240,18 @@ class BaseUsageConfig(BaseTimeWindowConfig):
         return v
 
 
-class UsageAggregator(Generic[ResourceType]):
+class UsageAggregator(Closeable, Generic[ResourceType]):
     # TODO: Move over other connectors to use this class
 
     def __init__(self, config: BaseUsageConfig):
         self.config = config
-        self.aggregation: Dict[
-            datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]
-        ] = defaultdict(dict)
+        # Keyed by bucket start time and resource. Only the most recently used
+        # aggregates are kept in memory, so memory use is bounded by the cache size
+        # rather than by the number of resources.
+        self.aggregation = FileBackedDict[GenericAggregatedDataset[ResourceType]](
+            tablename="usage_aggregation",
+            cache_max_size=config.aggregation_cache_size,
+        )
 
     def aggregate_event(
         self,
@@ -250,11 +264,17 @@ class UsageAggregator(Generic[ResourceType]):
         count: int = 1,
     ) -> None:
         floored_ts: datetime = get_time_bucket(start_time, self.config.bucket_duration)
-        self.aggregation[floored_ts].setdefault(
-            resource,
+        self.aggregation.for_mutation(
+            f"{floored_ts.isoformat()}|{resource}",
             GenericAggregatedDataset[ResourceType](
                 bucket_start_time=floored_ts,
                 resource=resource,
+                # Query texts can be large and numerous, so only the frequent ones
+                # are tracked.
+                queryFreq=LossyCounter(
+                    max_elements=self.config.top_n_queries
+                    * _TOP_QUERIES_TRACKING_FACTOR
+                ),
             ),
         ).add_read_entry(
             user,
@@ -268,17 +288,19 @@ class UsageAggregator(Generic[ResourceType]):
         resource_urn_builder: Callable[[ResourceType], str],
         user_urn_builder: Optional[Callable[[str], str]] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        for time_bucket in self.aggregation.values():
-            for aggregate in time_bucket.values():
-                yield aggregate.make_usage_workunit(
-                    bucket_duration=self.config.bucket_duration,
-                    top_n_queries=self.config.top_n_queries,
-                    format_sql_queries=self.config.format_sql_queries,
-                    include_top_n_queries=self.config.include_top_n_queries,
-                    resource_urn_builder=resource_urn_builder,
-                    user_urn_builder=user_urn_builder,
-                    queries_character_limit=self.config.queries_character_limit,
-                )
+        for _, aggregate in self.aggregation.items_snapshot():
+            yield aggregate.make_usage_workunit(
+                bucket_duration=self.config.bucket_duration,
+                top_n_queries=self.config.top_n_queries,
+                format_sql_queries=self.config.format_sql_queries,
+                include_top_n_queries=self.config.include_top_n_queries,
+                resource_urn_builder=resource_urn_builder,
+                user_urn_builder=user_urn_builder,
+                queries_character_limit=self.config.queries_character_limit,
+            )
+
+    def close(self) -> None:
+        self.aggregation.close()
 
 
 @deprecated
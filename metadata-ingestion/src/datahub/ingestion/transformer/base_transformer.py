@@ -1,3 +1,4 @@
+import itertools
 import logging
 from abc import ABCMeta, abstractmethod
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
@@ -8,6 +9,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.graph.client import DataHubGraph
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
@@ -16,6 +18,10 @@ from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 log = logging.getLogger(__name__)
 
+# Number of records (or, at the end of the stream, entities) whose server-side
+# aspects are fetched together.
+_SERVER_ASPECT_PREFETCH_WINDOW = 100
+
 
 def _update_work_unit_id(
     envelope: RecordEnvelope, urn: str, aspect_name: str
@@ -72,6 +78,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def __init__(self):
         self.entity_map: Dict[str, Dict[str, Any]] = {}
+        self._prefetched_urns: List[str] = []
         mixedin = False
         for mixin in [LegacyMCETransformer, SingleAspectTransformer]:
             mixedin = mixedin or isinstance(self, mixin)
@@ -80,6 +87,52 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 f"Class does not implement one of required traits {self.allowed_mixins}"
             )
 
+    def server_aspect_graph(self) -> Optional[DataHubGraph]:
+        """Implement this method to return the graph that the transformer reads the
+        server-side copy of its aspect from, if any. Those reads are then prefetched in
+        batches."""
+        return None
+
+    def _prefetch_server_aspects(self, graph: DataHubGraph, urns: List[str]) -> None:
+        assert isinstance(self, SingleAspectTransformer)
+        if not urns:
+            return
+
+        try:
+            graph.prefetch_aspects(urns, [ASPECT_MAP[self.aspect_name()]])
+            self._prefetched_urns = urns
+        except Exception as e:
+            # The transformer will fall back to fetching the aspects one by one.
+            log.warning(f"Failed to prefetch {self.aspect_name()} aspects: {e}")
+
+    def _clear_prefetched_server_aspects(self, graph: DataHubGraph) -> None:
+        assert isinstance(self, SingleAspectTransformer)
+        if not self._prefetched_urns:
+            return
+
+        graph.clear_prefetched_aspects(
+            self._prefetched_urns, [ASPECT_MAP[self.aspect_name()]]
+        )
+        self._prefetched_urns = []
+
+    def _urn_to_prefetch(self, record: Any) -> Optional[str]:
+        # Only records carrying the transformer's aspect are merged with the server
+        # right away. Other entities are handled at the end of the stream.
+        assert isinstance(self, SingleAspectTransformer)
+        if not self._should_process(record):
+            return None
+        if isinstance(record, MetadataChangeProposalWrapper):
+            if record.aspectName == self.aspect_name() and record.aspect:
+                return record.entityUrn
+        elif isinstance(record, MetadataChangeEventClass) and record.proposedSnapshot:
+            aspect_type = ASPECT_MAP[self.aspect_name()]
+            if (
+                builder.can_add_aspect(record, aspect_type)
+                and builder.get_aspect_if_available(record, aspect_type) is not None
+            ):
+                return record.proposedSnapshot.urn
+        return None
+
     def _should_process(
         self,
         record: Union[
@@ -229,6 +282,29 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def transform(
         self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        graph = self.server_aspect_graph()
+        if graph is None or not isinstance(self, SingleAspectTransformer):
+            yield from self._transform_window(record_envelopes, graph=None)
+            return
+
+        # Transform the records in windows, fetching the server-side aspects needed
+        # by each window with a single request.
+        it = iter(record_envelopes)
+        while True:
+            window = list(itertools.islice(it, _SERVER_ASPECT_PREFETCH_WINDOW))
+            if not window:
+                break
+
+            urns = [self._urn_to_prefetch(envelope.record) for envelope in window]
+            self._prefetch_server_aspects(graph, [urn for urn in urns if urn])
+            yield from self._transform_window(window, graph=graph)
+            self._clear_prefetched_server_aspects(graph)
+
+    def _transform_window(
+        self,
+        record_envelopes: Iterable[RecordEnvelope],
+        graph: Optional[DataHubGraph],
     ) -> Iterable[RecordEnvelope]:
         for envelope in record_envelopes:
             if not self._should_process(envelope.record):
@@ -248,7 +324,20 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 self, SingleAspectTransformer
             ):
                 # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
+                entity_states = list(self.entity_map.items())
+                for i, (urn, state) in enumerate(entity_states):
+                    if graph is not None and i % _SERVER_ASPECT_PREFETCH_WINDOW == 0:
+                        self._clear_prefetched_server_aspects(graph)
+                        self._prefetch_server_aspects(
+                            graph,
+                            [
+                                window_urn
+                                for window_urn, window_state in entity_states[
+                                    i : i + _SERVER_ASPECT_PREFETCH_WINDOW
+                                ]
+                                if "seen" in window_state
+                            ],
+                        )
                     if "seen" in state:
                         # call transform on this entity_urn
                         last_seen_mcp = state["seen"].get("mcp")
@@ -289,6 +378,12 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                             )
 
                     self._mark_processed(urn)
+                if graph is not None:
+                    self._clear_prefetched_server_aspects(graph)
+                    log.info(
+                        f"Server-side aspect prefetching after {type(self).__name__}: "
+                        f"{graph.aspect_prefetch_report.as_string()}"
+                    )
                 yield from self._handle_end_of_stream(envelope=envelope)
 
             yield envelope
@@ -26,6 +26,18 @@ class DatasetTransformer(BaseTransformer, SingleAspectTransformer, metaclass=ABC
     def entity_types(self) -> List[str]:
         return ["dataset"]
 
+    def server_aspect_graph(self) -> Optional[DataHubGraph]:
+        # With PATCH semantics, the transformed aspect is merged with the server's copy.
+        config = getattr(self, "config", None)
+        ctx = getattr(self, "ctx", None)
+        if (
+            isinstance(config, TransformerSemanticsConfigModel)
+            and config.semantics == TransformerSemantics.PATCH
+            and ctx is not None
+        ):
+            return ctx.graph
+        return None
+
 
 class DatasetOwnershipTransformer(DatasetTransformer, metaclass=ABCMeta):
     def aspect_name(self) -> str:
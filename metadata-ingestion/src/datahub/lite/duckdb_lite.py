@@ -1,12 +1,15 @@
 import json
 import logging
 import pathlib
+import re
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import duckdb
 
 from datahub.emitter.aspect import ASPECT_MAP
+from datahub.emitter.fast_serialization import to_avro_obj, to_restli_obj
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.emitter.serialization_helper import post_json_transform
@@ -34,10 +37,134 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.utilities.urns.data_platform_urn import DataPlatformUrn
 from datahub.utilities.urns.dataset_urn import DatasetUrn
+from datahub.utilities.urns.field_paths import (
+    get_simple_field_path_from_v2_field_path,
+)
 from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# Without pyarrow, staged rows are inserted with multi-row statements of this size.
+_STAGING_CHUNK_SIZE = 500
+
+# Buffered edges are flushed after this many entities during a reindex.
+_REINDEX_BATCH_SIZE = 10_000
+
+
+# Buffered search terms are flushed after this many aspects during a reindex.
+_SEARCH_REINDEX_BATCH_SIZE = 10_000
+
+# Free text matches are ranked by the sum of the weights of the fields they hit.
+_SEARCH_FIELD_WEIGHTS = {
+    "urn": 1.0,
+    "name": 4.0,
+    "tag": 2.0,
+    "fieldPath": 2.0,
+    "description": 1.0,
+}
+
+_TAG_URN_PREFIX = "urn:li:tag:"
+
+# (field, term, weight)
+_SearchTerm = Tuple[str, str, float]
+
+
+def _tokenize(text: str) -> Set[str]:
+    return set(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def _get_search_terms(aspect_name: str, aspect_json: Any) -> List[_SearchTerm]:
+    if aspect_name == "urn":
+        assert isinstance(aspect_json, str)
+        texts = [("urn", aspect_json)]
+    elif not isinstance(aspect_json, dict):
+        return []
+    else:
+        texts = []
+        for key, field in [
+            ("name", "name"),
+            ("title", "name"),
+            ("description", "description"),
+        ]:
+            if isinstance(aspect_json.get(key), str):
+                texts.append((field, aspect_json[key]))
+        if aspect_name == "globalTags":
+            for tag in aspect_json.get("tags") or []:
+                tag_urn: str = tag.get("tag", "")
+                if tag_urn.startswith(_TAG_URN_PREFIX):
+                    tag_urn = tag_urn[len(_TAG_URN_PREFIX) :]
+                texts.append(("tag", tag_urn))
+        elif aspect_name == "schemaMetadata":
+            for schema_field in aspect_json.get("fields") or []:
+                field_path = get_simple_field_path_from_v2_field_path(
+                    schema_field.get("fieldPath", "")
+                )
+                texts.append(("fieldPath", field_path))
+
+    # Only the highest weighted field counts for each term.
+    terms: Dict[str, Tuple[str, float]] = {}
+    for field, text in texts:
+        weight = _SEARCH_FIELD_WEIGHTS[field]
+        for term in _tokenize(text):
+            if term not in terms or terms[term][1] < weight:
+                terms[term] = (field, weight)
+    return [(field, term, weight) for term, (field, weight) in terms.items()]
+
+
+def _get_pyarrow() -> Optional[Any]:
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+class _EdgeBatch:
+    """Edges that are buffered during bulk operations, and then written all at once."""
+
+    def __init__(self) -> None:
+        # (src_id, relnship, dst_id) -> (dst_label, remove_existing)
+        self.edges: Dict[Tuple[str, str, str], Tuple[Optional[str], bool]] = {}
+        self._dst_ids: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def add(
+        self,
+        src_id: str,
+        relnship: str,
+        dst_id: str,
+        dst_label: Optional[str],
+        remove_existing: bool,
+    ) -> None:
+        if remove_existing:
+            for other_dst_id in self._dst_ids.pop((src_id, relnship), set()):
+                del self.edges[(src_id, relnship, other_dst_id)]
+        self.edges[(src_id, relnship, dst_id)] = (dst_label, remove_existing)
+        self._dst_ids[(src_id, relnship)].add(dst_id)
+
+    def clear(self) -> None:
+        self.edges.clear()
+        self._dst_ids.clear()
+
+
+class _SearchBatch:
+    """Search terms that are buffered during writes, and then written all at once."""
+
+    def __init__(self) -> None:
+        # (urn, aspect_name) -> terms, which replace all existing terms for the key
+        self.terms: Dict[Tuple[str, str], List[_SearchTerm]] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def add(self, urn: str, aspect_name: str, aspect_json: Any) -> None:
+        self.terms[(urn, aspect_name)] = _get_search_terms(aspect_name, aspect_json)
+
+    def clear(self) -> None:
+        self.terms.clear()
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -52,6 +179,8 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client = duckdb.connect(
             str(fpath), read_only=config.read_only, config=config.options
         )
+        self._edge_batch: Optional[_EdgeBatch] = None
+        self._search_batch = _SearchBatch()
         if not config.read_only:
             self._init_db()
 
@@ -85,6 +214,54 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             "edge_idx", "metadata_edge_v2", ["src_id", "relnship", "dst_id"]
         )
 
+        # An inverted index of the terms in urns, names, descriptions, tags and field
+        # paths, which backs free text search.
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_v2 "
+            "(urn VARCHAR, aspect_name VARCHAR, field VARCHAR, term VARCHAR, weight DOUBLE)"
+        )
+
+        # Staging tables for bulk writes. These only live as long as the connection.
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lite_aspect_staging "
+            "(idx BIGINT, urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lite_v0_update_staging "
+            "(urn VARCHAR, aspect_name VARCHAR, metadata JSON, system_metadata JSON)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lite_edge_staging "
+            "(src_id VARCHAR, relnship VARCHAR, dst_id VARCHAR, dst_label VARCHAR, remove_existing BOOLEAN)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lite_search_key_staging "
+            "(urn VARCHAR, aspect_name VARCHAR)"
+        )
+
+        if not self._has_search_index():
+            # Databases written by older versions have aspects but no search terms.
+            logger.info("Building the search index for existing metadata")
+            self._rebuild_search_index()
+
+    def _has_search_index(self) -> bool:
+        """
+        Whether free text search can use metadata_search_v2. This is not the case when
+        the table is missing or empty while aspects exist, i.e. for databases written by
+        older versions that have not been opened for writing since.
+        """
+
+        has_table = self.duckdb_client.execute(
+            "SELECT count(*) FROM duckdb_tables() WHERE table_name = 'metadata_search_v2' AND NOT temporary"
+        ).fetchone()
+        if not has_table or not has_table[0]:
+            return False
+        row = self.duckdb_client.execute(
+            "SELECT EXISTS (SELECT 1 FROM metadata_search_v2) "
+            "OR NOT EXISTS (SELECT 1 FROM metadata_aspect_v2)"
+        ).fetchone()
+        return bool(row and row[0])
+
     def location(self) -> str:
         return self.config.file
 
@@ -99,140 +276,440 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             MetadataChangeProposalWrapper,
         ],
     ) -> None:
-        writeables: Iterable[MetadataChangeProposalWrapper]
-        if isinstance(record, MetadataChangeProposalWrapper):
-            writeables = [record]
-        elif isinstance(record, MetadataChangeEventClass):
-            writeables = mcps_from_mce(record)
-        else:
-            raise ValueError(
-                f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
-            )
-
+        writeables = self._get_writeables(record)
         if not writeables:
             return
 
         # TODO use `with` for transaction
         self.duckdb_client.begin()
-        for writeable in writeables:
-            needs_write = False
-            try:
-                writeable_dict = writeable.to_obj(simplified_structure=True)
-                exists = self.duckdb_client.execute(
-                    "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
-                    [writeable.entityUrn, writeable.aspectName],
-                )
-                max_row = exists.fetchone()
-                if max_row is None:
-                    new_version = 1
-                    needs_write = True
-                else:
-                    metadata_dict = json.loads(max_row[0])  # type: ignore
-                    system_metadata = json.loads(max_row[1])  # type: ignore
-                    real_version = system_metadata.get("properties", {}).get(
-                        "sysVersion"
+        try:
+            for writeable in writeables:
+                needs_write = False
+                try:
+                    writeable_dict = writeable.to_obj(simplified_structure=True)
+                    exists = self.duckdb_client.execute(
+                        "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
+                        [writeable.entityUrn, writeable.aspectName],
                     )
-                    if real_version is None:
-                        max_version_row = self.duckdb_client.execute(
-                            "SELECT max(version) FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ?",
-                            [writeable.entityUrn, writeable.aspectName],
-                        ).fetchone()
-                        real_version = max_version_row[0]  # type: ignore
-
-                    if writeable_dict["aspect"]["json"] == metadata_dict:
-                        needs_write = False
-                        new_version = real_version
-                    else:
+                    max_row = exists.fetchone()
+                    if max_row is None:
+                        new_version = 1
                         needs_write = True
-                        new_version = real_version + 1
+                    else:
+                        metadata_dict = json.loads(max_row[0])  # type: ignore
+                        system_metadata = json.loads(max_row[1])  # type: ignore
+                        real_version = system_metadata.get("properties", {}).get(
+                            "sysVersion"
+                        )
+                        if real_version is None:
+                            max_version_row = self.duckdb_client.execute(
+                                "SELECT max(version) FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ?",
+                                [writeable.entityUrn, writeable.aspectName],
+                            ).fetchone()
+                            real_version = max_version_row[0]  # type: ignore
 
-                current_time = int(time.time() * 1000.0)
-                created_on = current_time
-                if (
-                    writeable.systemMetadata is not None
-                    and writeable.systemMetadata.lastObserved
-                ):
-                    created_on = writeable.systemMetadata.lastObserved
+                        if writeable_dict["aspect"]["json"] == metadata_dict:
+                            needs_write = False
+                            new_version = real_version
+                        else:
+                            needs_write = True
+                            new_version = real_version + 1
 
-                if writeable.systemMetadata is None:
-                    writeable.systemMetadata = SystemMetadataClass(
-                        lastObserved=created_on, properties={}
-                    )
-                elif writeable.systemMetadata.lastObserved is None:
-                    writeable.systemMetadata.lastObserved = created_on
+                    current_time = int(time.time() * 1000.0)
+                    created_on = current_time
+                    if (
+                        writeable.systemMetadata is not None
+                        and writeable.systemMetadata.lastObserved
+                    ):
+                        created_on = writeable.systemMetadata.lastObserved
 
-                if "properties" not in writeable_dict["systemMetadata"]:
-                    writeable_dict["systemMetadata"]["properties"] = {}
-                writeable_dict["systemMetadata"]["properties"][
-                    "sysVersion"
-                ] = new_version
-                if needs_write:
-                    self.duckdb_client.execute(
-                        query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
-                        parameters=[
-                            writeable.entityUrn,
-                            writeable.aspectName,
-                            new_version,
-                            json.dumps(writeable_dict["aspect"]["json"]),
-                            json.dumps(writeable_dict["systemMetadata"]),
-                            created_on,
-                        ],
-                    )
-                    if not max_row:
+                    if writeable.systemMetadata is None:
+                        writeable.systemMetadata = SystemMetadataClass(
+                            lastObserved=created_on, properties={}
+                        )
+                    elif writeable.systemMetadata.lastObserved is None:
+                        writeable.systemMetadata.lastObserved = created_on
+
+                    if "properties" not in writeable_dict["systemMetadata"]:
+                        writeable_dict["systemMetadata"]["properties"] = {}
+                    writeable_dict["systemMetadata"]["properties"][
+                        "sysVersion"
+                    ] = new_version
+                    if needs_write:
                         self.duckdb_client.execute(
                             query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
                             parameters=[
                                 writeable.entityUrn,
                                 writeable.aspectName,
-                                0,
+                                new_version,
                                 json.dumps(writeable_dict["aspect"]["json"]),
                                 json.dumps(writeable_dict["systemMetadata"]),
                                 created_on,
                             ],
                         )
+                        if not max_row:
+                            self.duckdb_client.execute(
+                                query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
+                                parameters=[
+                                    writeable.entityUrn,
+                                    writeable.aspectName,
+                                    0,
+                                    json.dumps(writeable_dict["aspect"]["json"]),
+                                    json.dumps(writeable_dict["systemMetadata"]),
+                                    created_on,
+                                ],
+                            )
+                        else:
+                            # we update the existing v0 row
+                            self.duckdb_client.execute(
+                                query="UPDATE metadata_aspect_v2 SET metadata = ?, system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
+                                parameters=[
+                                    json.dumps(writeable_dict["aspect"]["json"]),
+                                    json.dumps(writeable_dict["systemMetadata"]),
+                                    writeable.entityUrn,
+                                    writeable.aspectName,
+                                ],
+                            )
                     else:
-                        # we update the existing v0 row
+                        # this is a dup, we still want to update the lastObserved timestamp
+                        if not system_metadata:
+                            system_metadata = {
+                                "lastObserved": writeable.systemMetadata.lastObserved
+                            }
+                        else:
+                            system_metadata[
+                                "lastObserved"
+                            ] = writeable.systemMetadata.lastObserved
                         self.duckdb_client.execute(
-                            query="UPDATE metadata_aspect_v2 SET metadata = ?, system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
+                            query="UPDATE metadata_aspect_v2 SET system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
                             parameters=[
-                                json.dumps(writeable_dict["aspect"]["json"]),
-                                json.dumps(writeable_dict["systemMetadata"]),
+                                json.dumps(system_metadata),
                                 writeable.entityUrn,
                                 writeable.aspectName,
                             ],
                         )
+                except Exception as e:
+                    logger.error(f"Failed to write {writeable}", e)
                 else:
-                    # this is a dup, we still want to update the lastObserved timestamp
-                    if not system_metadata:
-                        system_metadata = {
-                            "lastObserved": writeable.systemMetadata.lastObserved
-                        }
-                    else:
-                        system_metadata[
-                            "lastObserved"
-                        ] = writeable.systemMetadata.lastObserved
-                    self.duckdb_client.execute(
-                        query="UPDATE metadata_aspect_v2 SET system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
-                        parameters=[
-                            json.dumps(system_metadata),
+                    if needs_write:
+                        assert (
+                            writeable.entityUrn
+                            and writeable.aspectName
+                            and writeable.aspect
+                        )
+                        self.post_update_hook(
+                            writeable.entityUrn, writeable.aspectName, writeable.aspect
+                        )
+                        self._index_aspect(
                             writeable.entityUrn,
                             writeable.aspectName,
-                        ],
-                    )
-            except Exception as e:
-                logger.error(f"Failed to write {writeable}", e)
+                            writeable_dict["aspect"]["json"],
+                            is_new_aspect=max_row is None,
+                        )
+
+            self._flush_search_terms()
+            self.duckdb_client.commit()
+        except Exception:
+            self.duckdb_client.rollback()
+            self._search_batch.clear()
+            raise
+
+    @staticmethod
+    def _get_writeables(
+        record: Union[
+            MetadataChangeEventClass,
+            MetadataChangeProposalWrapper,
+        ],
+    ) -> Iterable[MetadataChangeProposalWrapper]:
+        if isinstance(record, MetadataChangeProposalWrapper):
+            return [record]
+        elif isinstance(record, MetadataChangeEventClass):
+            return mcps_from_mce(record)
+        else:
+            raise ValueError(
+                f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
+            )
+
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """
+        Writes all records in a single transaction. Unlike `write`, a failure rolls
+        back the whole batch and is raised, so that callers can retry the records
+        one by one.
+        """
+
+        writeables: List[MetadataChangeProposalWrapper] = []
+        for record in records:
+            writeables.extend(self._get_writeables(record))
+        if not writeables:
+            return
+
+        self._edge_batch = _EdgeBatch()
+        self.duckdb_client.begin()
+        try:
+            # Versions are resolved against the stored v0 rows, so aspects that occur
+            # more than once in the batch are written over multiple rounds.
+            while writeables:
+                seen: Set[Tuple[Optional[str], Optional[str]]] = set()
+                current: List[MetadataChangeProposalWrapper] = []
+                deferred: List[MetadataChangeProposalWrapper] = []
+                for writeable in writeables:
+                    key = (writeable.entityUrn, writeable.aspectName)
+                    (deferred if key in seen else current).append(writeable)
+                    seen.add(key)
+                self._write_aspects(current)
+                writeables = deferred
+            self._flush_edges()
+            self._flush_search_terms()
+            self.duckdb_client.commit()
+        except Exception:
+            self.duckdb_client.rollback()
+            self._search_batch.clear()
+            raise
+        finally:
+            self._edge_batch = None
+
+    def _write_aspects(self, writeables: List[MetadataChangeProposalWrapper]) -> None:
+        # Each (urn, aspect_name) must occur at most once in writeables.
+        aspect_jsons: List[dict] = []
+        created_ons: List[int] = []
+        for writeable in writeables:
+            assert writeable.entityUrn and writeable.aspectName and writeable.aspect
+            aspect_jsons.append(to_restli_obj(writeable.aspect))
+
+            created_on = int(time.time() * 1000.0)
+            if (
+                writeable.systemMetadata is not None
+                and writeable.systemMetadata.lastObserved
+            ):
+                created_on = writeable.systemMetadata.lastObserved
+            if writeable.systemMetadata is None:
+                writeable.systemMetadata = SystemMetadataClass(
+                    lastObserved=created_on, properties={}
+                )
+            elif writeable.systemMetadata.lastObserved is None:
+                writeable.systemMetadata.lastObserved = created_on
+            created_ons.append(created_on)
+
+        self.duckdb_client.execute("DELETE FROM lite_aspect_staging")
+        self._stage_rows(
+            "lite_aspect_staging",
+            ["idx", "urn", "aspect_name"],
+            [
+                (idx, writeable.entityUrn, writeable.aspectName)
+                for idx, writeable in enumerate(writeables)
+            ],
+        )
+        existing = {
+            row[0]: row[1:]
+            for row in self.duckdb_client.execute(
+                "SELECT s.idx, a.metadata, a.system_metadata, "
+                "(SELECT max(m.version) FROM metadata_aspect_v2 m WHERE m.urn = s.urn AND m.aspect_name = s.aspect_name) "
+                "FROM lite_aspect_staging s JOIN metadata_aspect_v2 a "
+                "ON a.urn = s.urn AND a.aspect_name = s.aspect_name AND a.version = 0"
+            ).fetchall()
+        }
+
+        inserts: List[tuple] = []
+        v0_updates: List[tuple] = []
+        for idx, writeable in enumerate(writeables):
+            assert writeable.entityUrn and writeable.aspectName and writeable.aspect
+            assert writeable.systemMetadata is not None
+            aspect_json = aspect_jsons[idx]
+            existing_row = existing.get(idx)
+            stored_system_metadata: dict = {}
+            if existing_row is None:
+                new_version = 1
+                needs_write = True
             else:
-                if needs_write:
-                    assert (
-                        writeable.entityUrn
-                        and writeable.aspectName
-                        and writeable.aspect
+                stored_metadata = json.loads(existing_row[0])
+                stored_system_metadata = json.loads(existing_row[1]) or {}
+                real_version = (stored_system_metadata.get("properties") or {}).get(
+                    "sysVersion"
+                )
+                if real_version is None:
+                    real_version = existing_row[2]
+                needs_write = aspect_json != stored_metadata
+                new_version = real_version + 1 if needs_write else real_version
+
+            if needs_write:
+                system_metadata = to_avro_obj(writeable.systemMetadata)
+                system_metadata["properties"] = {
+                    **(system_metadata.get("properties") or {}),
+                    "sysVersion": new_version,
+                }
+                metadata_str = json.dumps(aspect_json)
+                system_metadata_str = json.dumps(system_metadata)
+                urn, aspect_name = writeable.entityUrn, writeable.aspectName
+                inserts.append(
+                    (
+                        urn,
+                        aspect_name,
+                        new_version,
+                        metadata_str,
+                        system_metadata_str,
+                        created_ons[idx],
                     )
-                    self.post_update_hook(
-                        writeable.entityUrn, writeable.aspectName, writeable.aspect
+                )
+                if existing_row is None:
+                    inserts.append(
+                        (
+                            urn,
+                            aspect_name,
+                            0,
+                            metadata_str,
+                            system_metadata_str,
+                            created_ons[idx],
+                        )
                     )
+                else:
+                    v0_updates.append(
+                        (urn, aspect_name, metadata_str, system_metadata_str)
+                    )
+                self.post_update_hook(urn, aspect_name, writeable.aspect)
+                self._index_aspect(
+                    urn, aspect_name, aspect_json, is_new_aspect=existing_row is None
+                )
+            else:
+                # this is a dup, we still want to update the lastObserved timestamp
+                stored_system_metadata[
+                    "lastObserved"
+                ] = writeable.systemMetadata.lastObserved
+                v0_updates.append(
+                    (
+                        writeable.entityUrn,
+                        writeable.aspectName,
+                        None,
+                        json.dumps(stored_system_metadata),
+                    )
+                )
 
-        self.duckdb_client.commit()
+        self._stage_rows(
+            "metadata_aspect_v2",
+            [
+                "urn",
+                "aspect_name",
+                "version",
+                "metadata",
+                "system_metadata",
+                "createdon",
+            ],
+            inserts,
+        )
+        if v0_updates:
+            self.duckdb_client.execute("DELETE FROM lite_v0_update_staging")
+            self._stage_rows(
+                "lite_v0_update_staging",
+                ["urn", "aspect_name", "metadata", "system_metadata"],
+                v0_updates,
+            )
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 AS a "
+                "SET metadata = coalesce(u.metadata, a.metadata), system_metadata = u.system_metadata "
+                "FROM lite_v0_update_staging AS u "
+                "WHERE a.urn = u.urn AND a.aspect_name = u.aspect_name AND a.version = 0"
+            )
+
+    def _stage_rows(
+        self, table_name: str, columns: List[str], rows: List[tuple]
+    ) -> None:
+        if not rows:
+            return
+
+        pyarrow = _get_pyarrow()
+        if pyarrow is not None:
+            arrow_table = pyarrow.Table.from_arrays(
+                [pyarrow.array(column) for column in zip(*rows)], names=columns
+            )
+            self.duckdb_client.register("lite_arrow_staging", arrow_table)
+            try:
+                self.duckdb_client.execute(
+                    f"INSERT INTO {table_name} SELECT * FROM lite_arrow_staging"
+                )
+            finally:
+                self.duckdb_client.unregister("lite_arrow_staging")
+            return
+
+        placeholders = f"({', '.join('?' * len(columns))})"
+        for start in range(0, len(rows), _STAGING_CHUNK_SIZE):
+            chunk = rows[start : start + _STAGING_CHUNK_SIZE]
+            self.duckdb_client.execute(
+                f"INSERT INTO {table_name} VALUES {', '.join([placeholders] * len(chunk))}",
+                [value for row in chunk for value in row],
+            )
+
+    def _flush_edges(self) -> None:
+        assert self._edge_batch is not None
+        if not self._edge_batch:
+            return
+
+        self.duckdb_client.execute("DELETE FROM lite_edge_staging")
+        self._stage_rows(
+            "lite_edge_staging",
+            ["src_id", "relnship", "dst_id", "dst_label", "remove_existing"],
+            [
+                (*key, dst_label, remove_existing)
+                for key, (dst_label, remove_existing) in self._edge_batch.edges.items()
+            ],
+        )
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_edge_v2 AS e USING lite_edge_staging AS s "
+            "WHERE s.remove_existing AND e.src_id = s.src_id AND e.relnship = s.relnship AND e.dst_id <> s.dst_id"
+        )
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 AS e SET dst_label = s.dst_label "
+            "FROM lite_edge_staging AS s "
+            "WHERE e.src_id = s.src_id AND e.relnship = s.relnship AND e.dst_id = s.dst_id "
+            "AND e.dst_label IS DISTINCT FROM s.dst_label"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 "
+            "SELECT s.src_id, s.relnship, s.dst_id, s.dst_label FROM lite_edge_staging AS s "
+            "WHERE NOT EXISTS (SELECT 1 FROM metadata_edge_v2 AS e "
+            "WHERE e.src_id = s.src_id AND e.relnship = s.relnship AND e.dst_id = s.dst_id)"
+        )
+        self._edge_batch.clear()
+
+    def _index_aspect(
+        self, urn: str, aspect_name: str, aspect_json: dict, is_new_aspect: bool
+    ) -> None:
+        self._search_batch.add(urn, aspect_name, aspect_json)
+        if is_new_aspect:
+            # The terms of the urn never change, so they are only (re)written along
+            # with new aspects of the entity.
+            self._search_batch.add(urn, "urn", urn)
+
+    def _flush_search_terms(self) -> None:
+        if not self._search_batch:
+            return
+
+        self.duckdb_client.execute("DELETE FROM lite_search_key_staging")
+        self._stage_rows(
+            "lite_search_key_staging",
+            ["urn", "aspect_name"],
+            list(self._search_batch.terms.keys()),
+        )
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_search_v2 AS t USING lite_search_key_staging AS k "
+            "WHERE t.urn = k.urn AND t.aspect_name = k.aspect_name"
+        )
+        self._stage_rows(
+            "metadata_search_v2",
+            ["urn", "aspect_name", "field", "term", "weight"],
+            [
+                (urn, aspect_name, *term)
+                for (urn, aspect_name), terms in self._search_batch.terms.items()
+                for term in terms
+            ],
+        )
+        self._search_batch.clear()
 
     def list_ids(self) -> Iterable[str]:
         self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
@@ -288,8 +765,48 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         snippet: bool = True,
     ) -> Iterable[Searchable]:
         if flavor == SearchFlavor.FREE_TEXT:
-            base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
-            for r in self.duckdb_client.execute(base_query).fetchall():
+            # Every term of the query must prefix-match a term of the entity. Entities
+            # are ranked by the weights of the fields that matched, and each matching
+            # aspect of an entity is returned.
+            if not self._has_search_index():
+                logger.warning(
+                    "The search index has not been built yet, so only ids and names are searched. "
+                    "Run `datahub lite reindex` to build it."
+                )
+                for r in self.duckdb_client.execute(
+                    "SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE ? "
+                    "UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 "
+                    "where version = 0 AND metadata->>'$.name' ILIKE ?",
+                    [f"%{query}%", f"%{query}%"],
+                ).fetchall():
+                    yield Searchable(
+                        id=r[0], aspect=r[1], snippet=r[2] if snippet else None
+                    )
+                return
+
+            terms = sorted(_tokenize(query))
+            if not terms:
+                return
+            base_query = (
+                "WITH matches AS ("
+                "SELECT s.urn, s.aspect_name, q.term, max(s.weight) AS weight "
+                "FROM metadata_search_v2 AS s JOIN (SELECT unnest(?::VARCHAR[]) AS term) AS q "
+                "ON starts_with(s.term, q.term) GROUP BY s.urn, s.aspect_name, q.term"
+                "), entities AS ("
+                "SELECT urn, sum(weight) AS score FROM ("
+                "SELECT urn, term, max(weight) AS weight FROM matches GROUP BY urn, term"
+                ") GROUP BY urn HAVING count(*) = ?"
+                ") "
+                "SELECT m.urn, m.aspect_name, a.metadata FROM matches AS m "
+                "JOIN entities AS e ON m.urn = e.urn "
+                "LEFT JOIN metadata_aspect_v2 AS a "
+                "ON a.urn = m.urn AND a.aspect_name = m.aspect_name AND a.version = 0 "
+                "GROUP BY m.urn, m.aspect_name, a.metadata, e.score "
+                "ORDER BY e.score DESC, m.urn, sum(m.weight) DESC, m.aspect_name"
+            )
+            for r in self.duckdb_client.execute(
+                base_query, [terms, len(terms)]
+            ).fetchall():
                 yield Searchable(
                     id=r[0], aspect=r[1], snippet=r[2] if snippet else None
                 )
@@ -324,6 +841,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._edge_batch is not None:
+            self._edge_batch.add(src_id, relnship, dst_id, dst_label, remove_existing)
+            return
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -375,96 +895,68 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client.commit()
 
     def ls(self, path: str) -> List[Browseable]:
-        def get_id_for_name(
-            name: str,
-            allowed_src_ids: Optional[List[str]] = None,
-            expand_search: bool = False,
-        ) -> List[str]:
-            if not expand_search:
-                query = f"SELECT src_id from metadata_edge_v2 where dst_id ='{name}' and relnship = 'name'"
-            else:
-                query = f"SELECT src_id from metadata_edge_v2 where dst_id ILIKE '{name}%' and relnship = 'name'"
-            results = self.duckdb_client.execute(query).fetchall()
-            if not results:
-                return []
-            else:
-                ids_returned = [r[0] for r in results]
-                if allowed_src_ids:
-                    allowed_src_ids_quoted = [f"'{r}'" for r in allowed_src_ids]
-                    query = f"SELECT dst_id from metadata_edge_v2 where src_id IN ({','.join(allowed_src_ids_quoted)})"
-                    allowed_ids = [
-                        r[0] for r in self.duckdb_client.execute(query).fetchall()
-                    ]
-                    ids_returned = [id for id in ids_returned if id in allowed_ids]
-                return ids_returned
-
-        def resolve_name_from_id(maybe_urn: str) -> str:
-            query = f"SELECT dst_id from metadata_edge_v2 where src_id = '{maybe_urn}' and relnship = 'name'"
-            results = self.duckdb_client.execute(query).fetchall()
-            if not results:
-                return maybe_urn
-            else:
-                return results[0][0]
-
         pieces = [p for p in path.split("/") if p]
 
         pieces = ["__root__"] + pieces
 
-        # very lazy walk
+        # Each step of the walk matches the children of all nodes at the current level
+        # at once. Children are matched by name first, and then by id or label.
         in_list = [pieces[0]]
-        in_list_quoted = [f"'{r}'" for r in in_list]
 
         for i, p in enumerate(pieces[1:]):
-            ids = get_id_for_name(p, allowed_src_ids=in_list)
-            if ids:
-                ids_quoted = [f"'{r}'" for r in ids]
-                query = f"SELECT dst_id from metadata_edge_v2 where relnship = 'child' AND src_id IN ({','.join(in_list_quoted)}) and dst_id IN ({','.join(ids_quoted)})"
-            else:
-                query = f"SELECT dst_id from metadata_edge_v2 where relnship = 'child' AND src_id IN ({','.join(in_list_quoted)}) and (dst_id = '{p}' OR dst_label = '{p}')"
-            results = self.duckdb_client.execute(query).fetchall()
+            results = self.duckdb_client.execute(
+                "SELECT c.dst_id, coalesce(bool_or(n.dst_id = ?), false) "
+                "FROM metadata_edge_v2 AS c LEFT JOIN metadata_edge_v2 AS n "
+                "ON n.src_id = c.dst_id AND n.relnship = 'name' "
+                "WHERE c.relnship = 'child' AND list_contains(?, c.src_id) "
+                "AND (c.dst_id = ? OR c.dst_label = ? OR n.dst_id = ?) "
+                "GROUP BY c.dst_id ORDER BY min(c.rowid)",
+                [p, in_list, p, p, p],
+            ).fetchall()
             if not results:
-                ids = get_id_for_name(p, allowed_src_ids=in_list, expand_search=True)
-                alternatives = None
-                if ids:
-                    ids_quoted = [f"'{r}'" for r in ids]
-                    query = f"SELECT dst_id from metadata_edge_v2 where relnship = 'child' AND src_id IN ({','.join(in_list_quoted)}) and dst_id IN ({','.join(ids_quoted)})"
-                    results = self.duckdb_client.execute(query).fetchall()
+                results = self.duckdb_client.execute(
+                    "SELECT c.dst_id, first(n.dst_id ORDER BY n.rowid) "
+                    "FROM metadata_edge_v2 AS c JOIN metadata_edge_v2 AS n "
+                    "ON n.src_id = c.dst_id AND n.relnship = 'name' "
+                    "WHERE c.relnship = 'child' AND list_contains(?, c.src_id) "
+                    "AND n.dst_id ILIKE ? "
+                    "GROUP BY c.dst_id ORDER BY min(c.rowid)",
+                    [in_list, f"{p}%"],
+                ).fetchall()
+                if results:
                     success_path = "/" + "/".join(pieces[1 : i + 1])
-                    results_list = []
-                    for r in results:
-                        r_name = resolve_name_from_id(r[0])
-                        results_list.append(
-                            Browseable(
-                                id=r[0],
-                                name=r_name,
-                                leaf=False,
-                                parents=in_list,
-                                auto_complete=AutoComplete(
-                                    success_path=success_path,
-                                    failed_token=p,
-                                    suggested_path=f"{success_path}/{r_name}".replace(
-                                        "//", "/"
-                                    ),
+                    return [
+                        Browseable(
+                            id=r[0],
+                            name=r[1],
+                            leaf=False,
+                            parents=in_list,
+                            auto_complete=AutoComplete(
+                                success_path=success_path,
+                                failed_token=p,
+                                suggested_path=f"{success_path}/{r[1]}".replace(
+                                    "//", "/"
                                 ),
-                            )
+                            ),
                         )
-                    return results_list
-                raise PathNotFoundException(
-                    f"Path {path} not found at {p} for query: {query}, did you mean {alternatives}"
-                )
-            in_list = [r[0] for r in results]
-            in_list_quoted = [f"'{r}'" for r in in_list]
+                        for r in results
+                    ]
+                raise PathNotFoundException(f"Path {path} not found at {p}")
+            name_matches = [r[0] for r in results if r[1]]
+            in_list = name_matches or [r[0] for r in results]
 
-        query = f"SELECT dst_id, dst_label from metadata_edge_v2 where src_id IN ({','.join(in_list_quoted)}) and relnship = 'child'"
-        results = self.duckdb_client.execute(query).fetchall()
+        results = self.duckdb_client.execute(
+            "SELECT c.dst_id, "
+            "coalesce(nullif(c.dst_label, ''), first(n.dst_id ORDER BY n.rowid), c.dst_id) "
+            "FROM metadata_edge_v2 AS c LEFT JOIN metadata_edge_v2 AS n "
+            "ON n.src_id = c.dst_id AND n.relnship = 'name' "
+            "WHERE c.relnship = 'child' AND list_contains(?, c.src_id) "
+            "GROUP BY c.dst_id, c.dst_label ORDER BY min(c.rowid)",
+            [in_list],
+        ).fetchall()
         if results:
             results_list = [
-                Browseable(
-                    parents=in_list,
-                    id=r[0],
-                    name=r[1] if r[1] else resolve_name_from_id(r[0]),
-                )
-                for r in results
+                Browseable(parents=in_list, id=r[0], name=r[1]) for r in results
             ]
             return results_list
         else:
@@ -478,12 +970,56 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     def reindex(self) -> None:
         self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
         self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self._edge_batch = _EdgeBatch()
+        try:
+            num_entities = 0
+            for urn_aspect_dict in self.get_all_entities(typed=True):
+                for urn, aspect_map in urn_aspect_dict.items():
+                    for aspect_name, aspect_value in aspect_map.items():
+                        assert isinstance(aspect_value, _Aspect)
+                        self.post_update_hook(urn, aspect_name, aspect_value)
+                    self.global_post_update_hook(urn, aspect_map)  # type: ignore
+                num_entities += 1
+                if num_entities % _REINDEX_BATCH_SIZE == 0:
+                    self._commit_edges()
+            self._commit_edges()
+        finally:
+            self._edge_batch = None
+        self._rebuild_search_index()
+
+    def _rebuild_search_index(self) -> None:
+        results = self.duckdb_client.execute(
+            "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 WHERE version = 0 ORDER BY urn"
+        ).fetchall()
+        self.duckdb_client.begin()
+        try:
+            self.duckdb_client.execute("DELETE FROM metadata_search_v2")
+            current_urn = None
+            for urn, aspect_name, metadata in results:
+                self._index_aspect(
+                    urn,
+                    aspect_name,
+                    json.loads(metadata),
+                    is_new_aspect=urn != current_urn,
+                )
+                current_urn = urn
+                if len(self._search_batch) >= _SEARCH_REINDEX_BATCH_SIZE:
+                    self._flush_search_terms()
+            self._flush_search_terms()
+            self.duckdb_client.commit()
+        except Exception:
+            self.duckdb_client.rollback()
+            self._search_batch.clear()
+            raise
+
+    def _commit_edges(self) -> None:
+        self.duckdb_client.begin()
+        try:
+            self._flush_edges()
+            self.duckdb_client.commit()
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
 
     def get_all_entities(
         self, typed: bool = False
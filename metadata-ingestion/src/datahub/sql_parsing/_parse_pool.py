@@ -0,0 +1,118 @@
+import concurrent.futures
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from datahub.metadata.schema_classes import SchemaFieldClass
+from datahub.sql_parsing.schema_resolver import (
+    SchemaInfo,
+    SchemaResolver,
+    SchemaResolverInterface,
+    _SchemaResolverWithExtras,
+)
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult, sqlglot_lineage
+
+TempTableSchemas = Dict[str, Optional[List[SchemaFieldClass]]]
+
+# (parse result, worker pid, seconds spent parsing)
+ParseOutcome = Tuple[SqlParsingResult, int, float]
+
+# Each worker process gets its own copy of the schemas, set by _init_worker.
+_worker_schema_resolver: Optional[SchemaResolver] = None
+
+
+def _init_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    schemas: List[Tuple[str, SchemaInfo]],
+) -> None:
+    global _worker_schema_resolver
+
+    _worker_schema_resolver = SchemaResolver(
+        platform=platform, platform_instance=platform_instance, env=env
+    )
+    for urn, schema_info in schemas:
+        _worker_schema_resolver.add_raw_schema_info(urn, schema_info)
+
+
+def _parse_in_worker(
+    query: str,
+    default_db: Optional[str],
+    default_schema: Optional[str],
+    temp_table_schemas: Dict[str, Optional[SchemaInfo]],
+) -> ParseOutcome:
+    assert _worker_schema_resolver is not None, "worker was not initialized"
+
+    start = time.perf_counter()
+    schema_resolver: SchemaResolverInterface = _worker_schema_resolver
+    if temp_table_schemas:
+        schema_resolver = _SchemaResolverWithExtras(
+            base_resolver=_worker_schema_resolver, extra_schemas=temp_table_schemas
+        )
+
+    parsed = sqlglot_lineage(
+        query,
+        schema_resolver=schema_resolver,
+        default_db=default_db,
+        default_schema=default_schema,
+    )
+    return parsed, os.getpid(), time.perf_counter() - start
+
+
+class SqlParsingPool:
+    """
+    Runs sqlglot_lineage in a pool of worker processes.
+
+    The schemas known to the schema resolver are shipped to each worker once, when
+    the pool starts. Schemas registered afterwards are not visible to the workers,
+    so callers must `stop` the pool when the schema resolver changes. The pool is
+    started again lazily, with a fresh copy of the schemas, on the next `submit`.
+    """
+
+    def __init__(self, max_workers: int, schema_resolver: SchemaResolver):
+        self.max_workers = max_workers
+        self._schema_resolver = schema_resolver
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def submit(
+        self,
+        query: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+        temp_tables: Optional[TempTableSchemas],
+    ) -> "concurrent.futures.Future[ParseOutcome]":
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self._schema_resolver.platform,
+                    self._schema_resolver.platform_instance,
+                    self._schema_resolver.env,
+                    list(self._schema_resolver.get_schema_infos()),
+                ),
+            )
+
+        # Ship the temp tables as plain dicts, which are cheaper to pickle than
+        # schema field aspects.
+        temp_table_schemas = {
+            urn: (
+                SchemaResolver._convert_schema_field_list_to_info(fields)
+                if fields is not None
+                else None
+            )
+            for urn, fields in (temp_tables or {}).items()
+        }
+        return self._executor.submit(
+            _parse_in_worker, query, default_db, default_schema, temp_table_schemas
+        )
+
+    def stop(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -1,6 +1,6 @@
 import contextlib
 import pathlib
-from typing import Dict, List, Optional, Protocol, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Tuple
 
 from typing_extensions import TypedDict
 
@@ -83,6 +83,11 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
     def get_urns(self) -> Set[str]:
         return set(k for k, v in self._schema_cache.items() if v is not None)
 
+    def get_schema_infos(self) -> Iterable[Tuple[str, SchemaInfo]]:
+        for urn, schema_info in self._schema_cache.items_snapshot("NOT is_missing"):
+            assert schema_info is not None
+            yield urn, schema_info
+
     def schema_count(self) -> int:
         return int(
             self._schema_cache.sql_query(
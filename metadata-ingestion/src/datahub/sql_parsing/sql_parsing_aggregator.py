@@ -1,3 +1,5 @@
+import collections
+import concurrent.futures
 import contextlib
 import dataclasses
 import enum
@@ -10,7 +12,17 @@ import tempfile
 import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Optional, Set, Union, cast
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 import datahub.emitter.mce_builder as builder
 import datahub.metadata.schema_classes as models
@@ -29,6 +41,11 @@ from datahub.metadata.urns import (
     QueryUrn,
     SchemaFieldUrn,
 )
+from datahub.sql_parsing._parse_pool import (
+    ParseOutcome,
+    SqlParsingPool,
+    TempTableSchemas,
+)
 from datahub.sql_parsing.schema_resolver import SchemaResolver, SchemaResolverInterface
 from datahub.sql_parsing.sql_parsing_common import QueryType
 from datahub.sql_parsing.sqlglot_lineage import (
@@ -120,6 +137,38 @@ class QueryMetadata:
         )
 
 
+@dataclasses.dataclass
+class _ObservedQuery:
+    query: str
+    default_db: Optional[str]
+    default_schema: Optional[str]
+    query_timestamp: Optional[datetime]
+    user: Optional[CorpUserUrn]
+    session_id: str
+    usage_multiplier: int
+    is_known_temp_table: bool
+    require_out_table_schema: bool
+
+
+@dataclasses.dataclass
+class _PendingObservedQuery:
+    observed_query: _ObservedQuery
+    parse_future: "concurrent.futures.Future[ParseOutcome]"
+
+    # The session's temp tables as of when the query was submitted.
+    temp_table_version: int
+    session_has_temp_tables: bool
+
+
+def _references_any_table(parsed: SqlParsingResult, tables: List[UrnStr]) -> bool:
+    if not tables:
+        return False
+    table_urns = {table.lower() for table in tables}
+    return any(
+        urn.lower() in table_urns for urn in [*parsed.in_tables, *parsed.out_tables]
+    )
+
+
 @dataclasses.dataclass
 class KnownQueryLineageInfo:
     query_text: str
@@ -181,6 +230,16 @@ class SqlAggregatorReport(Report):
     # Usage-related.
     usage_skipped_missing_timestamp: int = 0
 
+    # SQL parsing pool, keyed by worker pid.
+    sql_parser_pool_queries: Dict[str, int] = dataclasses.field(
+        default_factory=lambda: defaultdict(int)
+    )
+    sql_parser_pool_seconds: Dict[str, float] = dataclasses.field(
+        default_factory=lambda: defaultdict(float)
+    )
+    sql_parser_pool_queries_per_second: Optional[Dict[str, float]] = None
+    num_sql_parser_pool_reparsed: int = 0
+
     def compute_stats(self) -> None:
         self.schema_resolver_count = self._aggregator._schema_resolver.schema_count()
         self.num_unique_query_fingerprints = len(self._aggregator._query_map)
@@ -189,6 +248,14 @@ class SqlAggregatorReport(Report):
         self.num_temp_sessions = len(self._aggregator._temp_lineage_map)
         self.num_inferred_temp_schemas = len(self._aggregator._inferred_temp_schemas)
 
+        if self.sql_parser_pool_queries:
+            self.sql_parser_pool_queries_per_second = {
+                worker: round(
+                    count / max(self.sql_parser_pool_seconds[worker], 1e-6), 2
+                )
+                for worker, count in self.sql_parser_pool_queries.items()
+            }
+
         return super().compute_stats()
 
 
@@ -208,6 +275,7 @@ class SqlParsingAggregator(Closeable):
         is_temp_table: Optional[Callable[[UrnStr], bool]] = None,
         format_queries: bool = True,
         query_log: QueryLogSetting = _DEFAULT_QUERY_LOG_SETTING,
+        sql_parser_workers: int = 0,
     ) -> None:
         self.platform = DataPlatformUrn(platform)
         self.platform_instance = platform_instance
@@ -312,11 +380,28 @@ class SqlParsingAggregator(Closeable):
         self._exit_stack.push(self._table_renames)
 
         # Usage aggregator. This will only be initialized if usage statistics are enabled.
-        # TODO: Replace with FileBackedDict.
         self._usage_aggregator: Optional[UsageAggregator[UrnStr]] = None
         if self.generate_usage_statistics:
             assert self.usage_config is not None
             self._usage_aggregator = UsageAggregator(config=self.usage_config)
+            self._exit_stack.push(self._usage_aggregator)
+
+        # The temp tables registered for each session, in order. Used to detect when
+        # a query was parsed without some of its session's temp tables.
+        self._temp_table_changes: Dict[str, List[UrnStr]] = defaultdict(list)
+
+        # Optional pool of processes for parsing observed queries. Only the parsing
+        # happens in parallel. Parsed queries are queued and added to the aggregator
+        # strictly in the order they were observed.
+        self._parse_pool: Optional[SqlParsingPool] = None
+        self._pending_queries: Deque[_PendingObservedQuery] = collections.deque()
+        self._max_pending_queries = 0
+        if sql_parser_workers > 0:
+            self._parse_pool = SqlParsingPool(
+                max_workers=sql_parser_workers, schema_resolver=self._schema_resolver
+            )
+            self._max_pending_queries = sql_parser_workers * 8
+            self._exit_stack.callback(self._stop_parse_pool)
 
     def close(self) -> None:
         self._exit_stack.close()
@@ -333,6 +418,11 @@ class SqlParsingAggregator(Closeable):
         # logic that we previously needed in each source
 
         if self._need_schemas:
+            if self._parse_pool is not None and self._parse_pool.is_running:
+                # The pool's workers have a copy of the schemas from when they were
+                # started, so restart them with the new schema.
+                self._flush_pending_queries()
+                self._parse_pool.stop()
             self._schema_resolver.add_schema_metadata(str(urn), schema)
 
     def register_schemas_from_stream(
@@ -398,6 +488,7 @@ class SqlParsingAggregator(Closeable):
         """
 
         self.report.num_known_query_lineage += 1
+        self._flush_pending_queries()
 
         # Generate a fingerprint for the query.
         query_fingerprint = get_query_fingerprint(
@@ -453,6 +544,7 @@ class SqlParsingAggregator(Closeable):
         """
 
         self.report.num_known_mapping_lineage += 1
+        self._flush_pending_queries()
 
         # We generate a fake "query" object to hold the lineage.
         query_id = self._known_lineage_query_id()
@@ -521,6 +613,10 @@ class SqlParsingAggregator(Closeable):
         map, which will get used in subsequent queries with the same session ID.
 
         This assumes that queries come in order of increasing timestamps.
+
+        If the aggregator was created with sql_parser_workers, the query is parsed in
+        a worker process and only added to the aggregator once all previously
+        observed queries have been added, which may be after this method returns.
         """
 
         self.report.num_observed_queries += 1
@@ -528,11 +624,26 @@ class SqlParsingAggregator(Closeable):
         # All queries with no session ID are assumed to be part of the same session.
         session_id = session_id or _MISSING_SESSION_ID
 
+        observed_query = _ObservedQuery(
+            query=query,
+            default_db=default_db,
+            default_schema=default_schema,
+            query_timestamp=query_timestamp,
+            user=user,
+            session_id=session_id,
+            usage_multiplier=usage_multiplier,
+            is_known_temp_table=is_known_temp_table,
+            require_out_table_schema=require_out_table_schema,
+        )
+
+        if self._parse_pool is not None:
+            self._submit_observed_query(observed_query)
+            return
+
         # Load in the temp tables for this session.
         schema_resolver: SchemaResolverInterface = (
             self._make_schema_resolver_for_session(session_id)
         )
-        session_has_temp_tables = schema_resolver.includes_temp_tables()
 
         # Run the SQL parser.
         parsed = self._run_sql_parser(
@@ -544,6 +655,127 @@ class SqlParsingAggregator(Closeable):
             timestamp=query_timestamp,
             user=user,
         )
+        self._add_parsed_observed_query(
+            observed_query,
+            parsed,
+            session_has_temp_tables=schema_resolver.includes_temp_tables(),
+        )
+
+    def _submit_observed_query(self, observed_query: _ObservedQuery) -> None:
+        assert self._parse_pool is not None
+
+        temp_tables = self._get_temp_table_schemas(observed_query.session_id)
+        if temp_tables:
+            self.report.num_queries_with_temp_tables_in_session += 1
+        pending = _PendingObservedQuery(
+            observed_query=observed_query,
+            parse_future=self._parse_pool.submit(
+                observed_query.query,
+                default_db=observed_query.default_db,
+                default_schema=observed_query.default_schema,
+                temp_tables=temp_tables,
+            ),
+            temp_table_version=len(self._temp_table_changes[observed_query.session_id]),
+            session_has_temp_tables=bool(temp_tables),
+        )
+        self._pending_queries.append(pending)
+
+        # Add parsed queries in order, blocking only when too many are in flight.
+        while self._pending_queries and (
+            len(self._pending_queries) > self._max_pending_queries
+            or self._pending_queries[0].parse_future.done()
+        ):
+            self._add_pending_query(self._pending_queries.popleft())
+
+    def _flush_pending_queries(self) -> None:
+        while self._pending_queries:
+            self._add_pending_query(self._pending_queries.popleft())
+
+    def _stop_parse_pool(self) -> None:
+        for pending in self._pending_queries:
+            pending.parse_future.cancel()
+        self._pending_queries.clear()
+
+        if self._parse_pool is not None:
+            self._parse_pool.stop()
+
+    def _add_pending_query(self, pending: _PendingObservedQuery) -> None:
+        observed_query = pending.observed_query
+        session_id = observed_query.session_id
+
+        # The temp tables that earlier queries in the session registered after this
+        # query was submitted.
+        changed_temp_tables = self._temp_table_changes[session_id][
+            pending.temp_table_version :
+        ]
+
+        parsed: Optional[SqlParsingResult] = None
+        if not pending.parse_future.cancelled():
+            try:
+                parsed, worker_pid, parse_seconds = pending.parse_future.result()
+            except Exception as e:
+                logger.debug(
+                    f"SQL parser pool failed on query {observed_query.query[:100]}: {e}",
+                    exc_info=e,
+                )
+            else:
+                self.report.sql_parser_pool_queries[str(worker_pid)] += 1
+                self.report.sql_parser_pool_seconds[str(worker_pid)] += parse_seconds
+                if _references_any_table(parsed, changed_temp_tables):
+                    parsed = None
+
+        session_has_temp_tables = pending.session_has_temp_tables
+        if changed_temp_tables and not session_has_temp_tables:
+            self.report.num_queries_with_temp_tables_in_session += 1
+            session_has_temp_tables = True
+
+        if parsed is None:
+            # The query references a temp table that an earlier query in the same
+            # session created after this one was parsed, or the worker failed. Parse
+            # it again, like we would have without the pool.
+            self.report.num_sql_parser_pool_reparsed += 1
+            schema_resolver: SchemaResolverInterface = self._schema_resolver
+            temp_tables = self._get_temp_table_schemas(session_id)
+            if temp_tables:
+                schema_resolver = self._schema_resolver.with_temp_tables(temp_tables)
+            parsed = self._run_sql_parser(
+                observed_query.query,
+                default_db=observed_query.default_db,
+                default_schema=observed_query.default_schema,
+                schema_resolver=schema_resolver,
+                session_id=session_id,
+                timestamp=observed_query.query_timestamp,
+                user=observed_query.user,
+            )
+        else:
+            self._record_sql_parser_result(
+                parsed,
+                observed_query.query,
+                default_db=observed_query.default_db,
+                default_schema=observed_query.default_schema,
+                session_id=session_id,
+                timestamp=observed_query.query_timestamp,
+                user=observed_query.user,
+            )
+
+        self._add_parsed_observed_query(
+            observed_query, parsed, session_has_temp_tables=session_has_temp_tables
+        )
+
+    def _add_parsed_observed_query(
+        self,
+        observed_query: _ObservedQuery,
+        parsed: SqlParsingResult,
+        session_has_temp_tables: bool,
+    ) -> None:
+        query = observed_query.query
+        query_timestamp = observed_query.query_timestamp
+        user = observed_query.user
+        session_id = observed_query.session_id
+        usage_multiplier = observed_query.usage_multiplier
+        is_known_temp_table = observed_query.is_known_temp_table
+        require_out_table_schema = observed_query.require_out_table_schema
+
         if parsed.debug_info.error:
             self.report.observed_query_parse_failures.append(
                 f"{parsed.debug_info.error} on query: {query[:100]}"
@@ -640,6 +872,7 @@ class SqlParsingAggregator(Closeable):
             self._temp_lineage_map.for_mutation(session_id, {})[
                 out_table
             ] = query_fingerprint
+            self._temp_table_changes[session_id].append(out_table)
 
         else:
             # Non-temp tables immediately generate lineage.
@@ -666,26 +899,28 @@ class SqlParsingAggregator(Closeable):
         """
 
         self.report.num_table_renames += 1
+        self._flush_pending_queries()
 
         # This will not work if the table is renamed multiple times.
         self._table_renames[original_urn] = new_urn
 
-    def _make_schema_resolver_for_session(
-        self, session_id: str
-    ) -> SchemaResolverInterface:
-        schema_resolver: SchemaResolverInterface = self._schema_resolver
+    def _get_temp_table_schemas(self, session_id: str) -> TempTableSchemas:
+        temp_table_schemas: TempTableSchemas = {}
         if session_id in self._temp_lineage_map:
-            temp_table_schemas: Dict[str, Optional[List[models.SchemaFieldClass]]] = {}
             for temp_table_urn, query_id in self._temp_lineage_map[session_id].items():
                 temp_table_schemas[temp_table_urn] = self._inferred_temp_schemas.get(
                     query_id
                 )
+        return temp_table_schemas
 
-            if temp_table_schemas:
-                schema_resolver = self._schema_resolver.with_temp_tables(
-                    temp_table_schemas
-                )
-                self.report.num_queries_with_temp_tables_in_session += 1
+    def _make_schema_resolver_for_session(
+        self, session_id: str
+    ) -> SchemaResolverInterface:
+        schema_resolver: SchemaResolverInterface = self._schema_resolver
+        temp_table_schemas = self._get_temp_table_schemas(session_id)
+        if temp_table_schemas:
+            schema_resolver = self._schema_resolver.with_temp_tables(temp_table_schemas)
+            self.report.num_queries_with_temp_tables_in_session += 1
 
         return schema_resolver
 
@@ -755,7 +990,27 @@ class SqlParsingAggregator(Closeable):
             default_db=default_db,
             default_schema=default_schema,
         )
+        self._record_sql_parser_result(
+            parsed,
+            query,
+            default_db=default_db,
+            default_schema=default_schema,
+            session_id=session_id,
+            timestamp=timestamp,
+            user=user,
+        )
+        return parsed
 
+    def _record_sql_parser_result(
+        self,
+        parsed: SqlParsingResult,
+        query: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+        session_id: str,
+        timestamp: Optional[datetime],
+        user: Optional[CorpUserUrn],
+    ) -> None:
         # Conditionally log the query.
         if self.query_log == QueryLogSetting.STORE_ALL or (
             self.query_log == QueryLogSetting.STORE_FAILED and parsed.debug_info.error
@@ -777,8 +1032,6 @@ class SqlParsingAggregator(Closeable):
                 exc_info=parsed.debug_info.error,
             )
 
-        return parsed
-
     def _add_to_query_map(
         self, new: QueryMetadata, merge_lineage: bool = False
     ) -> None:
@@ -827,6 +1080,7 @@ class SqlParsingAggregator(Closeable):
     def gen_metadata(self) -> Iterable[MetadataChangeProposalWrapper]:
         # diff from v1 - we generate operations here, and it also
         # generates MCPWs instead of workunits
+        self._flush_pending_queries()
         yield from self._gen_lineage_mcps()
         yield from self._gen_usage_statistics_mcps()
         yield from self._gen_operation_mcps()
@@ -3,8 +3,11 @@ from __future__ import annotations
 import collections
 import concurrent.futures
 import logging
+import queue
+import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
 from threading import BoundedSemaphore
 from typing import (
     Any,
@@ -13,10 +16,14 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
+    NamedTuple,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
+    Union,
 )
 
 from datahub.ingestion.api.closeable import Closeable
@@ -24,6 +31,8 @@ from datahub.ingestion.api.closeable import Closeable
 logger = logging.getLogger(__name__)
 _R = TypeVar("_R")
 _PARTITION_EXECUTOR_FLUSH_SLEEP_INTERVAL = 0.05
+_DEFAULT_BATCHER_MIN_PROCESS_INTERVAL = timedelta(seconds=30)
+_DEFAULT_BATCHER_READ_FROM_PENDING_INTERVAL = timedelta(seconds=1)
 
 
 class PartitionExecutor(Closeable):
@@ -160,6 +169,233 @@ class PartitionExecutor(Closeable):
         self.shutdown()
 
 
+class _BatchPartitionWorkItem(NamedTuple):
+    key: str
+    args: tuple
+    future: Future
+    done_callback: Optional[Callable[[Future], None]]
+
+
+class _BatchCompleted(NamedTuple):
+    keys: Set[str]
+
+
+_BatchInboxItem = Union[_BatchPartitionWorkItem, _BatchCompleted, None]
+
+
+class BatchPartitionExecutor(Closeable):
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        # Receives a list of the *args tuples passed to submit(). It may return
+        # a list with one entry per item, in which case a non-None entry is
+        # treated as the failure of that specific item.
+        process_batch: Callable[
+            [List[tuple]], Optional[Sequence[Optional[BaseException]]]
+        ],
+        max_per_batch: int = 100,
+        min_process_interval: timedelta = _DEFAULT_BATCHER_MIN_PROCESS_INTERVAL,
+        read_from_pending_interval: timedelta = _DEFAULT_BATCHER_READ_FROM_PENDING_INTERVAL,
+    ) -> None:
+        """Similar to PartitionExecutor, but processes requests in batches.
+
+        Requests are accumulated by a background "clearinghouse" thread, which
+        groups them into batches of at most max_per_batch items. A batch is
+        dispatched once it is full, once min_process_interval has elapsed since
+        the last dispatch, or when flush() is called.
+
+        Ordering guarantees are the same as PartitionExecutor: requests with the
+        same key are processed in submission order, and a key will never be part
+        of two batches that are executing at the same time.
+
+        Args:
+            max_workers: The maximum number of batches to process concurrently.
+            max_pending: The maximum number of pending (e.g. not yet batched) requests.
+                Once exceeded, submit() will block.
+            process_batch: The function used to process a batch of requests.
+            max_per_batch: The maximum number of requests in a single batch.
+            min_process_interval: The maximum amount of time to wait for a
+                batch to fill up before dispatching it anyways.
+            read_from_pending_interval: How frequently the clearinghouse wakes up
+                to check for dispatchable work.
+        """
+        assert max_per_batch > 0
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_per_batch = max_per_batch
+        self.process_batch = process_batch
+        self.min_process_interval = min_process_interval
+        self.read_from_pending_interval = read_from_pending_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Each request will hold a permit from this semaphore until it's complete.
+        # Batches that are executing are allowed on top of max_pending.
+        self._permits = max_pending + max_workers * max_per_batch
+        self._semaphore = BoundedSemaphore(self._permits)
+
+        # All communication with the clearinghouse thread goes through this queue.
+        # Backpressure is handled by the semaphore, so the queue itself is unbounded.
+        self._inbox: queue.Queue[_BatchInboxItem] = queue.Queue()
+        self._flush_requested = threading.Event()
+        self._shutdown = False
+
+        self._clearinghouse = threading.Thread(
+            target=self._clearinghouse_worker,
+            name="batch-partition-executor-clearinghouse",
+            daemon=True,
+        )
+        self._clearinghouse.start()
+
+    def submit(
+        self,
+        key: str,
+        *args: Any,
+        done_callback: Optional[Callable[[Future], None]] = None,
+    ) -> None:
+        """Enqueue a request. The args will be passed to process_batch as a tuple."""
+
+        if self._shutdown:
+            raise RuntimeError(
+                "cannot submit to a BatchPartitionExecutor after shutdown"
+            )
+
+        self._semaphore.acquire()
+
+        future: Future = Future()
+        if done_callback:
+            future.add_done_callback(done_callback)
+        self._inbox.put(_BatchPartitionWorkItem(key, args, future, done_callback))
+
+    def _clearinghouse_worker(self) -> None:
+        keys_in_flight: Set[str] = set()
+        pending: Deque[_BatchPartitionWorkItem] = collections.deque()
+        batches_in_flight = 0
+        last_dispatch = time.perf_counter()
+        stopping = False
+
+        def _handle(item: _BatchInboxItem) -> None:
+            nonlocal batches_in_flight, stopping
+            if item is None:
+                stopping = True
+            elif isinstance(item, _BatchCompleted):
+                batches_in_flight -= 1
+                keys_in_flight.difference_update(item.keys)
+            else:
+                pending.append(item)
+
+        def _build_batch() -> List[_BatchPartitionWorkItem]:
+            # Walk the pending list in order. Once a key is skipped, all later
+            # requests for that key must be skipped as well to preserve ordering.
+            batch: List[_BatchPartitionWorkItem] = []
+            blocked_keys: Set[str] = set()
+            remaining: Deque[_BatchPartitionWorkItem] = collections.deque()
+            while pending:
+                item = pending.popleft()
+                if (
+                    len(batch) < self.max_per_batch
+                    and item.key not in keys_in_flight
+                    and item.key not in blocked_keys
+                ):
+                    batch.append(item)
+                else:
+                    blocked_keys.add(item.key)
+                    remaining.append(item)
+            pending.extend(remaining)
+            return batch
+
+        while not (stopping and not pending and batches_in_flight == 0):
+            try:
+                _handle(
+                    self._inbox.get(
+                        timeout=self.read_from_pending_interval.total_seconds()
+                    )
+                )
+                while True:
+                    _handle(self._inbox.get_nowait())
+            except queue.Empty:
+                pass
+
+            while pending and batches_in_flight < self.max_workers:
+                eager = stopping or self._flush_requested.is_set()
+                if (
+                    not eager
+                    and len(pending) < self.max_per_batch
+                    and time.perf_counter() - last_dispatch
+                    < self.min_process_interval.total_seconds()
+                ):
+                    break
+
+                batch = _build_batch()
+                if not batch:
+                    # Everything that's pending is blocked on an in-flight key.
+                    break
+
+                batch_keys = {item.key for item in batch}
+                keys_in_flight.update(batch_keys)
+                batches_in_flight += 1
+                last_dispatch = time.perf_counter()
+                self._executor.submit(self._process_batch_wrapper, batch, batch_keys)
+
+    def _process_batch_wrapper(
+        self, batch: List[_BatchPartitionWorkItem], batch_keys: Set[str]
+    ) -> None:
+        try:
+            results: Sequence[Optional[BaseException]]
+            try:
+                batch_results = self.process_batch([item.args for item in batch])
+                if batch_results is None:
+                    results = [None] * len(batch)
+                else:
+                    results = batch_results
+                    assert len(results) == len(
+                        batch
+                    ), "process_batch must return one result per item"
+            except Exception as e:
+                logger.debug(f"Batch of {len(batch)} requests failed: {e}")
+                results = [e] * len(batch)
+
+            for item, error in zip(batch, results):
+                if error is None:
+                    item.future.set_result(None)
+                else:
+                    item.future.set_exception(error)
+        finally:
+            for _ in batch:
+                self._semaphore.release()
+            self._inbox.put(_BatchCompleted(batch_keys))
+
+    def flush(self) -> None:
+        """Wait for all pending requests to complete."""
+
+        self._flush_requested.set()
+        try:
+            # Acquiring every permit means that every request has completed.
+            for _i in range(self._permits):
+                self._semaphore.acquire()
+            for _i in range(self._permits):
+                self._semaphore.release()
+        finally:
+            self._flush_requested.clear()
+
+    def shutdown(self) -> None:
+        """Process all pending requests, and then stop the worker threads."""
+
+        if self._shutdown:
+            return
+
+        self.flush()
+        self._shutdown = True
+        self._inbox.put(None)
+        self._clearinghouse.join()
+        self._executor.shutdown(wait=True)
+
+    def close(self) -> None:
+        self.shutdown()
+
+
 class BackpressureAwareExecutor:
     # This couldn't be a real executor because the semantics of submit wouldn't really make sense.
     # In this variant, if we blocked on submit, then we would also be blocking the thread that
@@ -229,3 +465,54 @@ class BackpressureAwareExecutor:
                 yield future
 
             assert not pending_futures
+
+    @classmethod
+    def map_ordered(
+        cls,
+        fn: Callable[..., _R],
+        args_list: Iterable[Tuple[Any, ...]],
+        max_workers: int,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Future[_R]]:
+        """Like map, but yields the futures in the same order as args_list.
+
+        At most max_pending tasks are submitted ahead of the one that the
+        consumer is waiting on, so a slow task holds back the results that
+        follow it. If the consumer stops early, tasks that have not started
+        yet are cancelled.
+
+        Args:
+            fn: The function to apply to each input.
+            args_list: The list of inputs, as tuples of arguments to fn.
+            max_workers: The maximum number of threads to use.
+            max_pending: The maximum number of submitted but not yet consumed
+                tasks. If not set, it will be set to 2*max_workers.
+
+        Returns:
+            An iterable of futures, in input order. As with map, the caller is
+            responsible for handling exceptions.
+        """
+
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        assert max_pending >= max_workers
+
+        pending_futures: Deque[Future[_R]] = collections.deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for args in args_list:
+                    if len(pending_futures) >= max_pending:
+                        head = pending_futures.popleft()
+                        concurrent.futures.wait([head])
+                        yield head
+
+                    pending_futures.append(executor.submit(fn, *args))
+
+                while pending_futures:
+                    head = pending_futures.popleft()
+                    concurrent.futures.wait([head])
+                    yield head
+            finally:
+                for future in pending_futures:
+                    future.cancel()
@@ -1,5 +1,7 @@
+import heapq
+import itertools
 import random
-from typing import Dict, Generic, Iterator, List, Set, TypeVar, Union
+from typing import Counter, Dict, Generic, Iterator, List, Set, Tuple, TypeVar, Union
 
 from datahub.configuration.pydantic_migration_helpers import PYDANTIC_VERSION_2
 
@@ -147,3 +149,60 @@ class LossyDict(Dict[_KT, _VT], Generic[_KT, _VT]):
     def dropped_keys_count(self) -> int:
         """Returns the number of keys that have been dropped from this dictionary."""
         return self._overflow
+
+
+class LossyCounter(Counter[_KT], Generic[_KT]):
+    """
+    A counter that only tracks a bounded number of elements, using the Space-Saving
+    heavy hitters algorithm.
+
+    Counts are exact until more than max_elements distinct elements have been seen.
+    After that, a new element replaces the least frequent one and inherits its
+    count, so counts may be overestimated by at most that count. Elements whose true
+    count exceeds total / max_elements are always retained, so `most_common(n)` stays
+    accurate for n much smaller than max_elements.
+
+    The least frequent element is found with a lazily maintained min-heap of
+    (count, seq, key) entries, so updates and evictions are O(log n) amortized.
+    """
+
+    def __init__(self, max_elements: int = 100) -> None:
+        super().__init__()
+        self.max_elements = max_elements
+        self.sampled = False
+        # Entries go stale when their key is updated or removed; they are skipped
+        # on eviction and dropped whenever the heap is rebuilt.
+        self._heap: List[Tuple[int, int, _KT]] = []
+        self._seq = itertools.count()
+
+    def __setitem__(self, __k: _KT, __v: int) -> None:
+        if not super().__contains__(__k) and super().__len__() >= self.max_elements:
+            self.sampled = True
+            __v += super().pop(self._pop_min_key())
+        super().__setitem__(__k, __v)
+        heapq.heappush(self._heap, (__v, next(self._seq), __k))
+        if len(self._heap) > 2 * super().__len__() + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(v, next(self._seq), k) for k, v in super().items()]
+        heapq.heapify(self._heap)
+
+    def _pop_min_key(self) -> _KT:
+        while True:
+            if not self._heap:
+                # Only reachable if the dict was modified without __setitem__.
+                self._rebuild_heap()
+            count, _, key = heapq.heappop(self._heap)
+            if super().__contains__(key) and super().__getitem__(key) == count:
+                return key
+
+    def __reduce__(self):  # type: ignore
+        # Counter pickles itself as a plain dict of counts, which would lose the bound.
+        return (
+            self.__class__,
+            (self.max_elements,),
+            {"sampled": self.sampled},
+            None,
+            iter(dict(self).items()),
+        )
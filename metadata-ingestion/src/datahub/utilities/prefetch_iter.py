@@ -0,0 +1,60 @@
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_ITEM = "item"
+_DONE = "done"
+_ERROR = "error"
+
+# How often a blocked producer checks whether the consumer went away.
+_PUT_POLL_SECONDS = 0.1
+
+
+def prefetch_iter(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """Materializes the source iterator in a background thread, buffering up to
+    `depth` items ahead of the consumer. Exceptions raised by the source iterator
+    are re-raised to the consumer. If depth is 0, the source is iterated inline.
+
+    If the consumer stops early, the background thread stops after the item it is
+    currently producing.
+    """
+
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buffer: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def _put(entry: Tuple[str, Any]) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put((_ITEM, item)):
+                    return
+            _put((_DONE, None))
+        except BaseException as e:
+            _put((_ERROR, e))
+
+    producer = threading.Thread(target=_produce, name="prefetch_iter", daemon=True)
+    producer.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _DONE:
+                return
+            elif kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stopped.set()
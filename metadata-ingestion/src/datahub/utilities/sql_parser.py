@@ -1,14 +1,32 @@
+import atexit
+import contextlib
+import functools
 import logging
 import multiprocessing
+import multiprocessing.connection
+import os
+import threading
 import traceback
-from multiprocessing import Process, Queue
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
 from datahub.utilities.sql_parser_base import SQLParser
 
 logger = logging.getLogger(__name__)
 
+# The worker pool is shared by all parsers in the process.
+_POOL_SIZE = int(
+    os.getenv("DATAHUB_SQL_PARSER_POOL_SIZE", str(min(4, os.cpu_count() or 1)))
+)
+_MAX_QUERIES_PER_WORKER = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_QUERIES_PER_WORKER", "1000")
+)
+_QUERY_TIMEOUT_SECONDS = float(os.getenv("DATAHUB_SQL_PARSER_TIMEOUT", "60"))
+_RESULT_CACHE_SIZE = int(os.getenv("DATAHUB_SQL_PARSER_CACHE_SIZE", "1000"))
+
+_pool: Optional["_ParserWorkerPool"] = None
+_pool_lock = threading.Lock()
+
 
 def sql_lineage_parser_impl_func_wrapper(
     queue: Optional[multiprocessing.Queue], sql_query: str, use_raw_names: bool = False
@@ -73,16 +91,8 @@ class SqlLineageSQLParser(SQLParser):
         # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
         # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
         # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(queue, sql_query, use_raw_names),
-        )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
-        if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
-        return tables, columns
+        tables, columns = _get_tables_columns_cached(sql_query, use_raw_names)
+        return list(tables), list(columns)
 
     def get_tables(self) -> List[str]:
         return self.tables
@@ -91,4 +101,166 @@ class SqlLineageSQLParser(SQLParser):
         return self.columns
 
 
+_ParseResult = Tuple[List[str], List[str], Optional[Tuple[BaseException, str]]]
+
+
+def _parser_worker_main(
+    conn: multiprocessing.connection.Connection, parse_fn: Callable[..., Any]
+) -> None:
+    # Parses queries until the parent sends None or goes away.
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        sql_query, use_raw_names = request
+        conn.send(parse_fn(None, sql_query, use_raw_names))
+
+
+class _ParserWorker:
+    """A worker process that parses one query at a time for the caller that holds it."""
+
+    def __init__(self, parse_fn: Callable[..., Any]) -> None:
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_parser_worker_main,
+            args=(child_conn, parse_fn),
+            name="sql-parser-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.num_queries = 0
+
+    def parse(
+        self, sql_query: str, use_raw_names: bool, timeout: float
+    ) -> _ParseResult:
+        self.num_queries += 1
+        self.conn.send((sql_query, use_raw_names))
+
+        # The process sentinel becomes ready when the worker exits, so a crash is
+        # noticed right away instead of after the timeout.
+        ready = multiprocessing.connection.wait(
+            [self.conn, self.process.sentinel], timeout=timeout
+        )
+        if self.conn in ready:
+            try:
+                return self.conn.recv()
+            except EOFError:
+                pass
+        elif not ready:
+            raise TimeoutError(f"SQL parsing did not finish within {timeout} seconds")
+        self.process.join()
+        raise RuntimeError(
+            f"SQL parser worker exited with code {self.process.exitcode}"
+        )
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def close(self, graceful: bool = True) -> None:
+        # Idle workers are asked to exit, while hung ones are killed right away.
+        if graceful and self.process.is_alive():
+            with contextlib.suppress(OSError):
+                self.conn.send(None)
+            self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class _ParserWorkerPool:
+    """
+    A bounded set of long-lived parser processes. Each query checks out a worker for
+    its whole duration, so a worker that times out or crashes is replaced without
+    affecting queries that other threads are running.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_queries_per_worker: int,
+        parse_fn: Callable[..., Any] = sql_lineage_parser_impl_func_wrapper,
+    ) -> None:
+        self.max_queries_per_worker = max_queries_per_worker
+        self.parse_fn = parse_fn
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[_ParserWorker] = []
+        self._lock = threading.Lock()
+
+    def parse(
+        self, sql_query: str, use_raw_names: bool, timeout: float
+    ) -> _ParseResult:
+        with self._slots:
+            worker = self._checkout()
+            healthy = False
+            try:
+                result = worker.parse(sql_query, use_raw_names, timeout)
+                healthy = True
+                return result
+            finally:
+                if healthy and worker.num_queries < self.max_queries_per_worker:
+                    with self._lock:
+                        self._idle.append(worker)
+                else:
+                    # Workers are also replaced after a fixed number of queries, so
+                    # that memory leaked by sqllineage is given back.
+                    worker.close(graceful=healthy)
+
+    def _checkout(self) -> _ParserWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+                worker.close()
+        return _ParserWorker(self.parse_fn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+def _get_pool() -> _ParserWorkerPool:
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = _ParserWorkerPool(
+                size=_POOL_SIZE, max_queries_per_worker=_MAX_QUERIES_PER_WORKER
+            )
+        return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@functools.lru_cache(maxsize=_RESULT_CACHE_SIZE)
+def _get_tables_columns_cached(
+    sql_query: str, use_raw_names: bool
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # Failures raise instead of returning, so they are not cached.
+    tables, columns, exception_details = _get_pool().parse(
+        sql_query, use_raw_names, timeout=_QUERY_TIMEOUT_SECONDS
+    )
+    if exception_details is not None:
+        exception, exception_traceback = exception_details
+        raise RuntimeError(
+            f"Sub-process exception: {exception_traceback}"
+        ) from exception
+    return tuple(tables), tuple(columns)
+
+
 DefaultSQLParser = SqlLineageSQLParser
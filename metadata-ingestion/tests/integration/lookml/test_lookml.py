@@ -12,6 +12,7 @@ from looker_sdk.sdk.api40.models import DBConnection
 from datahub.configuration.common import PipelineExecutionError
 from datahub.ingestion.run.pipeline import Pipeline
 from datahub.ingestion.source.file import read_metadata_file
+from datahub.ingestion.source.looker.lkml_patched import LkmlParseCache
 from datahub.ingestion.source.looker.lookml_source import (
     LookerModel,
     LookerRefinementResolver,
@@ -864,3 +865,32 @@ def test_manifest_parser(pytestconfig: pytest.Config) -> None:
 
     manifest = load_lkml(manifest_file)
     assert manifest
+
+
+def test_lkml_parse_cache(pytestconfig: pytest.Config, tmp_path: pathlib.Path) -> None:
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/lookml"
+    view_file = test_resources_dir / "lkml_samples/foo.view.lkml"
+    cache_path = tmp_path / "lkml_parse_cache.db"
+
+    cache = LkmlParseCache(filename=cache_path)
+    parsed = load_lkml(view_file, cache=cache)
+    assert parsed == load_lkml(view_file)
+
+    # Every load returns a fresh copy, so callers can't corrupt the cache.
+    parsed["views"].clear()
+    assert load_lkml(view_file, cache=cache) == load_lkml(view_file)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    # The same content is found by a later run, even under a different path.
+    copied_view_file = tmp_path / "copy.view.lkml"
+    copied_view_file.write_text(view_file.read_text())
+    cache = LkmlParseCache(filename=cache_path)
+    assert load_lkml(copied_view_file, cache=cache) == load_lkml(view_file)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    # Changed files are parsed again.
+    copied_view_file.write_text("view: changed {}\n")
+    assert load_lkml(copied_view_file, cache=cache) == {"views": [{"name": "changed"}]}
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
@@ -763,3 +763,42 @@ def test_sqlglot_parser():
         assert lineage[0].column_lineage[i].downstream.table is None
         assert lineage[0].column_lineage[i].downstream.column == column
         assert lineage[0].column_lineage[i].upstreams == []
+
+
+def test_parse_cache_reuses_parse_trees(tmp_path):
+    table: powerbi_data_classes.Table = powerbi_data_classes.Table(
+        expression=M_QUERIES[0],
+        name="virtual_order_table",
+        full_name="OrderDataSet.virtual_order_table",
+    )
+    ctx, config, platform_instance_resolver = get_default_instances()
+    cache_path = tmp_path / "m_query_parse_cache.db"
+
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.ParseTreeCache(reporter, filename=cache_path)
+    for _ in range(2):
+        lineage: List[Lineage] = parser.get_upstream_tables(
+            table,
+            reporter,
+            ctx=ctx,
+            config=config,
+            platform_instance_resolver=platform_instance_resolver,
+            parse_cache=parse_cache,
+        )
+        assert (
+            lineage[0].upstreams[0].urn
+            == "urn:li:dataset:(urn:li:dataPlatform:snowflake,pbi_test.test.testtable,PROD)"
+        )
+    parse_cache.close()
+    assert reporter.m_query_parse_cache_misses == 1
+    assert reporter.m_query_parse_cache_hits == 1
+
+    # A later run reuses the parse tree persisted by the previous one.
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.ParseTreeCache(reporter, filename=cache_path)
+    assert parse_cache.get_or_parse(M_QUERIES[0]) == parser._parse_expression(
+        M_QUERIES[0]
+    )
+    parse_cache.close()
+    assert reporter.m_query_parse_cache_misses == 0
+    assert reporter.m_query_parse_cache_hits == 1
@@ -0,0 +1,76 @@
+import logging
+import os
+import pathlib
+import tempfile
+from typing import List
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.sink.file import FileSink
+from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.test_serialization import generate_schema_metadata
+
+FILENAMES = [
+    "output.json",
+    "output.json.gz",
+    "output.ndjson",
+    "output.ndjson.gz",
+    "output.ndjson.zst",
+    "output.avro",
+    "output.avro.zst",
+]
+
+
+def generate_mcps(num_mcps: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)",
+            aspect=generate_schema_metadata(num_fields=100),
+        )
+        for i in range(num_mcps)
+    ]
+
+
+def run_test():
+    mcps = generate_mcps(num_mcps=2000)
+    ctx = PipelineContext(run_id="file-format-benchmark")
+    print(f"Writing and reading {len(mcps)} MCPs with 100 schema fields each")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for filename in FILENAMES:
+            path = pathlib.Path(tmp_dir) / filename
+            try:
+                sink = FileSink.create({"filename": str(path)}, ctx)
+            except Exception as e:
+                print(f"{filename}: skipped ({e})")
+                continue
+
+            with PerfTimer() as write_timer:
+                for mcp in mcps:
+                    envelope = RecordEnvelope(mcp, metadata={})
+                    sink.write_record_async(envelope, NoopWriteCallback())
+                sink.close()
+            size_mb = os.path.getsize(path) / 1_000_000
+
+            source = GenericFileSource(
+                ctx, FileSourceConfig(path=str(path), count_all_before_starting=False)
+            )
+            with PerfTimer() as read_timer:
+                num_read = sum(1 for _ in source.iterate_generic_file(str(path)))
+            source.close()
+            assert num_read == len(mcps)
+
+            print(
+                f"{filename}: {size_mb:.1f} MB, "
+                f"write {size_mb / write_timer.elapsed_seconds():.1f} MB/s, "
+                f"read {size_mb / read_timer.elapsed_seconds():.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
@@ -0,0 +1,46 @@
+import logging
+import pathlib
+import tempfile
+
+from datahub.ingestion.source.powerbi.config import PowerBiDashboardSourceReport
+from datahub.ingestion.source.powerbi.m_query import parser
+from datahub.utilities.perf_timer import PerfTimer
+from tests.integration.powerbi.test_m_parser import M_QUERIES
+
+
+def run_test():
+    print(f"Parsing {len(M_QUERIES)} M-Query expressions")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = pathlib.Path(tmp_dir) / "m_query_parse_cache.db"
+
+        # The first run parses every expression and persists the parse trees.
+        reporter = PowerBiDashboardSourceReport()
+        parse_cache = parser.ParseTreeCache(reporter, filename=cache_path)
+        with PerfTimer() as cold_timer:
+            for expression in M_QUERIES:
+                parse_cache.get_or_parse(expression)
+        parse_cache.close()
+        print(
+            f"Cold run: {cold_timer.elapsed_seconds():.2f} seconds, "
+            f"{reporter.m_query_parse_cache_misses} expressions parsed"
+        )
+
+        # A later run only reads the persisted parse trees.
+        reporter = PowerBiDashboardSourceReport()
+        parse_cache = parser.ParseTreeCache(reporter, filename=cache_path)
+        with PerfTimer() as warm_timer:
+            for expression in M_QUERIES:
+                parse_cache.get_or_parse(expression)
+        parse_cache.close()
+        print(
+            f"Warm run: {warm_timer.elapsed_seconds():.2f} seconds, "
+            f"{reporter.m_query_parse_cache_hits} parse trees reused"
+        )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
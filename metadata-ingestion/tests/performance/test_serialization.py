@@ -0,0 +1,61 @@
+import logging
+
+from datahub.emitter.fast_serialization import json_dumps, to_restli_obj
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.metadata.schema_classes import (
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StringTypeClass,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+
+def generate_schema_metadata(num_fields: int) -> SchemaMetadataClass:
+    return SchemaMetadataClass(
+        schemaName="wide_table",
+        platform="urn:li:dataPlatform:hive",
+        version=0,
+        hash="",
+        platformSchema=OtherSchemaClass(rawSchema=""),
+        fields=[
+            SchemaFieldClass(
+                fieldPath=f"struct_{i // 100}.column_{i}",
+                type=SchemaFieldDataTypeClass(type=StringTypeClass()),
+                nativeDataType="VARCHAR(50)",
+                description=f"Description for column {i}",
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+def run_test():
+    num_aspects = 50
+    aspects = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)",
+            aspect=generate_schema_metadata(num_fields=5000),
+        ).make_mcp()
+        for i in range(num_aspects)
+    ]
+    print(f"Serializing {num_aspects} MCPs with 5000 schema fields each")
+
+    with PerfTimer() as timer:
+        for mcp in aspects:
+            json_dumps(pre_json_transform(mcp.to_obj()))
+        print(f"Default path: {timer.elapsed_seconds():.2f} seconds")
+
+    with PerfTimer() as timer:
+        for mcp in aspects:
+            json_dumps(to_restli_obj(mcp))
+        print(f"Single-pass path: {timer.elapsed_seconds():.2f} seconds")
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
@@ -49,3 +49,63 @@ def test_case_sensitivity():
     pattern = AllowDenyPattern(allow=["Foo.myTable"], ignoreCase=False)
     assert not pattern.allowed("foo.mytable")
     assert pattern.allowed("Foo.myTable")
+
+
+def test_multiple_patterns():
+    pattern = AllowDenyPattern(
+        allow=["foo\\..*", "bar\\.mytable"], deny=["foo\\.secret.*", "foo\\.tmp_.*"]
+    )
+    assert pattern.allowed("foo.table")
+    assert pattern.allowed("bar.mytable")
+    assert not pattern.allowed("bar.other")
+    assert not pattern.allowed("foo.secret_table")
+    assert not pattern.allowed("foo.tmp_1")
+
+
+def test_patterns_with_backreferences():
+    pattern = AllowDenyPattern(allow=["(a)\\1", "b"], ignoreCase=False)
+    assert pattern.allowed("aa")
+    assert pattern.allowed("b")
+    assert not pattern.allowed("ab")
+
+
+def test_pattern_updates_are_respected():
+    pattern = AllowDenyPattern(allow=["foo"])
+    assert not pattern.allowed("bar")
+    pattern.allow.append("bar")
+    assert pattern.allowed("bar")
+    pattern.deny = ["bar"]
+    assert not pattern.allowed("bar")
+
+
+def test_may_allow_prefix():
+    assert AllowDenyPattern.allow_all().may_allow_prefix("db.schema.")
+    assert not AllowDenyPattern(allow=[]).may_allow_prefix("db.schema.")
+
+    pattern = AllowDenyPattern(
+        allow=["db\\.public\\..*", "db.analytics.events"],
+        deny=["db\\.public\\.tmp_.*"],
+    )
+    assert pattern.may_allow_prefix("db.public.")
+    assert pattern.may_allow_prefix("DB.PUBLIC.")
+    assert pattern.may_allow_prefix("db.analytics.")
+    assert pattern.may_allow_prefix("db.")
+    assert not pattern.may_allow_prefix("db.staging.")
+    assert not pattern.may_allow_prefix("other.public.")
+    assert not pattern.may_allow_prefix("db.public.tmp_")
+
+
+def test_may_allow_prefix_is_conservative():
+    # Anchors and lookaheads depend on what follows the prefix, so they can't
+    # be used to deny it.
+    pattern = AllowDenyPattern(deny=["db\\.schema$", "db\\.(?!public)"])
+    assert pattern.may_allow_prefix("db.schema")
+    assert pattern.may_allow_prefix("db.")
+
+    # Optional characters are not part of the required prefix.
+    pattern = AllowDenyPattern(allow=["dbx?\\.public"], ignoreCase=False)
+    assert pattern.may_allow_prefix("db.")
+    assert not pattern.may_allow_prefix("DB.")
+
+    pattern = AllowDenyPattern(allow=["(db|warehouse)\\.public"])
+    assert pattern.may_allow_prefix("anything.")
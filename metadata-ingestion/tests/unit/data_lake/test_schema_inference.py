@@ -98,6 +98,33 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+def test_infer_schema_json_stops_at_max_rows():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(bytes(test_table.to_json(orient="records"), encoding="utf-8"))
+        # Rows after the first max_rows are not part of the inferred schema.
+        file.seek(-1, 2)
+        file.write(b',{"extra_field": 1}]')
+        file.seek(0)
+
+        fields = json.JsonInferrer(max_rows=3).infer_schema(file)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+
+
+def test_infer_schema_json_with_jsonlines_content():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(test_table.to_json(orient="records", lines=True), encoding="utf-8")
+        )
+        file.seek(0)
+
+        fields = json.JsonInferrer().infer_schema(file)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 
 from datahub.ingestion.graph.client import (
@@ -5,7 +6,7 @@ from datahub.ingestion.graph.client import (
     DataHubGraph,
     _graphql_entity_type,
 )
-from datahub.metadata.schema_classes import CorpUserEditableInfoClass
+from datahub.metadata.schema_classes import CorpUserEditableInfoClass, StatusClass
 
 
 @patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
@@ -26,6 +27,82 @@ def test_get_aspect(mock_test_connection):
         assert editable is not None
 
 
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_entities_by_filter(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    dataset_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,db.table,PROD)"
+    tag_urn = "urn:li:tag:foo"
+    query_urn = "urn:li:query:bar"
+    pages = [
+        {
+            "scrollAcrossEntities": {
+                "nextScrollId": "page2",
+                "searchResults": [
+                    {
+                        "entity": {
+                            "urn": dataset_urn,
+                            "aspects": [
+                                {"aspectName": "status", "payload": '{"removed": true}'}
+                            ],
+                        }
+                    },
+                    {"entity": {"urn": tag_urn, "aspects": []}},
+                ],
+            }
+        },
+        {
+            "scrollAcrossEntities": {
+                "nextScrollId": None,
+                # Query entities don't expose raw aspects in GraphQL.
+                "searchResults": [{"entity": {"urn": query_urn}}],
+            }
+        },
+    ]
+    with patch.object(
+        graph, "execute_graphql", side_effect=pages
+    ) as mock_execute_graphql, patch.object(
+        graph,
+        "get_entity_raw",
+        return_value={"aspects": {"status": {"value": {"removed": False}}}},
+    ) as mock_get_entity_raw:
+        entities = list(
+            graph.get_entities_by_filter(aspects=[StatusClass], prefetch_depth=2)
+        )
+
+    assert entities == [
+        (dataset_urn, {"status": StatusClass(removed=True)}),
+        (tag_urn, {"status": None}),
+        (query_urn, {"status": StatusClass(removed=False)}),
+    ]
+    assert mock_execute_graphql.call_count == 2
+    assert mock_execute_graphql.call_args.kwargs["variables"]["scrollId"] == "page2"
+    mock_get_entity_raw.assert_called_once_with(query_urn, ["status"])
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_urns_by_filter_fetches_pages_inline_by_default(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    calling_threads = []
+
+    def execute_graphql(*args, **kwargs):
+        calling_threads.append(threading.current_thread())
+        return {
+            "scrollAcrossEntities": {
+                "nextScrollId": None,
+                "searchResults": [{"entity": {"urn": "urn:li:tag:foo"}}],
+            }
+        }
+
+    with patch.object(graph, "execute_graphql", side_effect=execute_graphql):
+        urns = list(graph.get_urns_by_filter(entity_types=["tag"]))
+
+    assert urns == ["urn:li:tag:foo"]
+    # Without prefetching, the graph's session is only used from the caller's thread.
+    assert calling_threads == [threading.current_thread()]
+
+
 def test_graphql_entity_types():
     # FIXME: This is a subset of all the types, but it's enough to get us ok coverage.
 
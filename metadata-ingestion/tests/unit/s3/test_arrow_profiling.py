@@ -0,0 +1,97 @@
+import json
+import pathlib
+
+import pyarrow as pa
+import pyarrow.parquet
+
+from datahub.ingestion.source.s3.arrow_profiling import profile_file
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.metadata.schema_classes import ValueFrequencyClass
+
+test_table = pa.table(
+    {
+        "id": list(range(100)),
+        "category": [["a", "b", None][i % 3] for i in range(100)],
+        "score": [float("nan") if i % 10 == 0 else i / 2 for i in range(100)],
+    }
+)
+
+
+def write_parquet(tmp_path: pathlib.Path) -> str:
+    path = str(tmp_path / "table.parquet")
+    pyarrow.parquet.write_table(test_table, path, row_group_size=30)
+    return path
+
+
+def test_profile_parquet(tmp_path: pathlib.Path) -> None:
+    profile, dropped_columns, _ = profile_file(
+        write_parquet(tmp_path), ".parquet", DataLakeProfilerConfig(enabled=True)
+    )
+
+    assert profile.rowCount == 100
+    assert profile.columnCount == 3
+    assert dropped_columns == []
+    assert profile.fieldProfiles is not None
+    id_profile, category_profile, score_profile = profile.fieldProfiles
+
+    assert id_profile.fieldPath == "id"
+    assert id_profile.uniqueCount == 100
+    assert id_profile.nullCount == 0
+    assert (id_profile.min, id_profile.max, id_profile.mean) == ("0", "99", "49.5")
+    assert id_profile.quantiles is not None and len(id_profile.quantiles) == 5
+    assert id_profile.sampleValues is not None and len(id_profile.sampleValues) == 20
+
+    assert category_profile.uniqueCount == 2
+    assert category_profile.nullCount == 33
+    assert category_profile.distinctValueFrequencies == [
+        ValueFrequencyClass(value="NullValue", frequency=33),
+        ValueFrequencyClass(value="a", frequency=34),
+        ValueFrequencyClass(value="b", frequency=33),
+    ]
+
+    # NaN values are counted as nulls.
+    assert score_profile.nullCount == 10
+    assert score_profile.uniqueCount == 90
+
+
+def test_profile_table_level_only(tmp_path: pathlib.Path) -> None:
+    profile, _, _ = profile_file(
+        write_parquet(tmp_path),
+        ".parquet",
+        DataLakeProfilerConfig(enabled=True, profile_table_level_only=True),
+    )
+
+    assert profile.rowCount == 100
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles == []
+
+
+def test_profile_max_number_of_fields(tmp_path: pathlib.Path) -> None:
+    profile, dropped_columns, _ = profile_file(
+        write_parquet(tmp_path),
+        ".parquet",
+        DataLakeProfilerConfig(enabled=True, max_number_of_fields_to_profile=1),
+    )
+
+    assert [field.fieldPath for field in profile.fieldProfiles or []] == ["id"]
+    assert dropped_columns == ["category", "score"]
+
+
+def test_profile_csv_and_json(tmp_path: pathlib.Path) -> None:
+    csv_path = tmp_path / "table.csv"
+    csv_path.write_text("a,b\n" + "\n".join(f"{i},{i % 2}" for i in range(10)))
+    json_path = tmp_path / "table.json"
+    json_path.write_text(json.dumps([{"a": i, "b": i % 2} for i in range(10)]))
+
+    for path, extension in [(csv_path, ".csv"), (json_path, ".json")]:
+        profile, _, _ = profile_file(
+            str(path), extension, DataLakeProfilerConfig(enabled=True)
+        )
+
+        assert profile.rowCount == 10
+        assert profile.columnCount == 2
+        assert profile.fieldProfiles is not None
+        assert profile.fieldProfiles[1].distinctValueFrequencies == [
+            ValueFrequencyClass(value="0", frequency=5),
+            ValueFrequencyClass(value="1", frequency=5),
+        ]
@@ -1,5 +1,14 @@
+import threading
+import time
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.data_lake_common.path_spec import PathSpec
-from datahub.ingestion.source.s3.source import partitioned_folder_comparator
+from datahub.ingestion.source.s3.source import S3Source, partitioned_folder_comparator
 
 
 def test_partition_comparator_numeric_folder_name():
@@ -91,3 +100,102 @@ def test_path_spec_dir_allowed():
 
     path = "s3://my-bucket/my-folder/year=2022/month=10/day=10/"
     assert path_spec.dir_allowed(path) is False, f"{path} should be denied"
+
+
+@mock_s3
+@pytest.mark.parametrize("listing_max_workers", [1, 4])
+def test_s3_browser_samples_latest_partition(listing_max_workers):
+    s3_client = boto3.client(
+        "s3",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    )
+    s3_client.create_bucket(Bucket="my-bucket")
+    tables = [f"table{i}" for i in range(5)]
+    for table in tables:
+        for year in [2022, 2023]:
+            for month in [2, 10]:
+                s3_client.put_object(
+                    Bucket="my-bucket",
+                    Key=f"data/{table}/year={year}/month={month}/part.csv",
+                    Body=b"a,b\n1,2\n",
+                )
+
+    source = S3Source.create(
+        {
+            "path_specs": [
+                {"include": "s3://my-bucket/data/{table}/year=*/month=*/*.csv"}
+            ],
+            "aws_config": {
+                "aws_access_key_id": "test",
+                "aws_secret_access_key": "test",
+                "aws_region": "us-east-1",
+            },
+            "listing_max_workers": listing_max_workers,
+        },
+        PipelineContext(run_id="s3-source-test"),
+    )
+    path_spec = source.source_config.path_specs[0]
+
+    # Only the latest partition of each table is listed, in the same order for any
+    # number of workers.
+    assert [path for path, _, _ in source.s3_browser(path_spec, sample_size=10)] == [
+        f"s3://my-bucket/data/{table}/year=2023/month=10/part.csv" for table in tables
+    ]
+
+
+@mock_s3
+def test_s3_browser_listing_concurrency_is_bounded():
+    s3_client = boto3.client(
+        "s3",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    )
+    s3_client.create_bucket(Bucket="my-bucket")
+    for dept in range(4):
+        for table in range(4):
+            s3_client.put_object(
+                Bucket="my-bucket",
+                Key=f"data/dept{dept}/table{table}/year=2023/part.csv",
+                Body=b"a,b\n1,2\n",
+            )
+
+    source = S3Source.create(
+        {
+            "path_specs": [{"include": "s3://my-bucket/data/*/{table}/*/*.csv"}],
+            "aws_config": {
+                "aws_access_key_id": "test",
+                "aws_secret_access_key": "test",
+                "aws_region": "us-east-1",
+            },
+            "listing_max_workers": 2,
+        },
+        PipelineContext(run_id="s3-source-test"),
+    )
+    path_spec = source.source_config.path_specs[0]
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    list_folders = S3Source.list_folders
+
+    def tracked_list_folders(self, *args):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        try:
+            time.sleep(0.01)
+            return list_folders(self, *args)
+        finally:
+            with lock:
+                running -= 1
+
+    with patch.object(S3Source, "list_folders", tracked_list_folders):
+        paths = [path for path, _, _ in source.s3_browser(path_spec, sample_size=10)]
+
+    assert len(paths) == 16
+    # Listing levels and sampling run one after another, never stacking their pools.
+    assert max_running <= 2
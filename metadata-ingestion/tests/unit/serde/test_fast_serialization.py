@@ -0,0 +1,79 @@
+import json
+import pathlib
+
+import pytest
+from avrogen import avrojson
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.fast_serialization import to_avro_obj, to_restli_obj
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.ingestion.source.file import read_metadata_file
+
+_SERDE_DIR = pathlib.Path(__file__).parent
+
+
+@pytest.mark.parametrize(
+    "json_filename",
+    [
+        "test_serde_large.json",
+        "test_serde_chart_snapshot.json",
+        "test_serde_profile.json",
+        "test_serde_patch.json",
+    ],
+)
+def test_fast_serialization_matches_default(json_filename: str) -> None:
+    items = list(read_metadata_file(_SERDE_DIR / json_filename))
+    assert items
+
+    for item in items:
+        obj = (
+            item.make_mcp() if isinstance(item, MetadataChangeProposalWrapper) else item
+        )
+
+        # Compare the JSON strings so that key ordering is checked too.
+        assert json.dumps(to_restli_obj(obj)) == json.dumps(
+            pre_json_transform(obj.to_obj())
+        )
+        assert json.dumps(to_avro_obj(obj)) == json.dumps(obj.to_obj())
+        assert to_avro_obj(obj, tuples=True) == obj.to_obj(tuples=True)
+
+
+def test_fast_serialization_simplified_mcp() -> None:
+    mcpw = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:corpuser:foo",
+        aspect=models.CorpUserInfoClass(
+            active=True,
+            customProperties={"a": "b"},
+        ),
+    )
+
+    expected = mcpw.make_mcp().to_obj()
+    expected["aspect"] = {"json": pre_json_transform(mcpw.aspect.to_obj())}  # type: ignore
+    assert json.dumps(mcpw.to_obj(simplified_structure=True)) == json.dumps(expected)
+
+
+def test_fast_serialization_field_discriminator() -> None:
+    cost = models.CostClass(
+        costType=models.CostTypeClass.ORG_COST_TYPE,
+        cost=models.CostCostClass(
+            fieldDiscriminator=models.CostCostDiscriminatorClass.costCode,
+            costCode="sampleCostCode",
+        ),
+    )
+
+    assert to_restli_obj(cost) == pre_json_transform(cost.to_obj())
+    assert to_avro_obj(cost) == cost.to_obj()
+
+
+def test_fast_serialization_type_error() -> None:
+    info = models.DataFlowInfoClass(
+        name="hello_datahub",
+        # This is a type error - custom properties should be a Dict[str, str].
+        customProperties={"x": 1},  # type: ignore
+    )
+
+    with pytest.raises(avrojson.AvroTypeException):
+        to_restli_obj(info)
+    with pytest.raises(avrojson.AvroTypeException):
+        to_avro_obj(info)
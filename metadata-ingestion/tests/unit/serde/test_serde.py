@@ -12,9 +12,15 @@ from freezegun import freeze_time
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
 from datahub.emitter import mce_builder
+from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.run.pipeline import Pipeline
-from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    GenericFileSource,
+    read_metadata_file,
+)
 from datahub.metadata.schema_classes import MetadataChangeEventClass
 from datahub.metadata.schemas import getMetadataChangeEventSchema
 from tests.test_helpers import mce_helpers
@@ -63,6 +69,128 @@ def test_serde_to_json(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize(
+    "compact_filename",
+    ["output.ndjson", "output.ndjson.gz", "output.jsonl.zst"],
+)
+def test_serde_through_ndjson(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path, compact_filename: str
+) -> None:
+    if compact_filename.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    compact_file = tmp_path / compact_filename
+    output_file = tmp_path / "output.json"
+
+    for source_file, sink_file in [
+        (golden_file, compact_file),
+        (compact_file, output_file),
+    ]:
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "file", "config": {"path": str(source_file)}},
+                "sink": {"type": "file", "config": {"filename": str(sink_file)}},
+                "run_id": "serde_test",
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=f"{output_file}",
+        golden_path=golden_file,
+    )
+
+
+@freeze_time(FROZEN_TIME)
+def test_parallel_ndjson_read(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path
+) -> None:
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    ndjson_file = tmp_path / "output.ndjson"
+
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"path": str(golden_file)}},
+            "sink": {"type": "file", "config": {"filename": str(ndjson_file)}},
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    def read_workunits(parallelism: int) -> list:
+        source = GenericFileSource(
+            ctx=PipelineContext(run_id="serde_test"),
+            config=FileSourceConfig(path=str(ndjson_file), parallelism=parallelism),
+        )
+        return [(wu.id, wu.metadata) for wu in source.get_workunits_internal()]
+
+    # Use tiny byte ranges, so that most records straddle a range boundary.
+    with patch("datahub.ingestion.source.file._MIN_PARALLEL_CHUNK_SIZE_BYTES", 100):
+        assert read_workunits(parallelism=2) == read_workunits(parallelism=1)
+
+
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize("parallelism", [1, 2])
+def test_ndjson_read_skips_malformed_lines(
+    tmp_path: pathlib.Path, parallelism: int
+) -> None:
+    ndjson_file = tmp_path / "output.ndjson"
+    mcp = {
+        "entityType": "dataset",
+        "entityUrn": "urn:li:dataset:(urn:li:dataPlatform:mysql,db.table,PROD)",
+        "changeType": "UPSERT",
+        "aspectName": "status",
+        "aspect": {"json": {"removed": False}},
+    }
+    ndjson_file.write_text(
+        "\n".join([json.dumps(mcp), "{not json", json.dumps(mcp)]) + "\n"
+    )
+
+    source = GenericFileSource(
+        ctx=PipelineContext(run_id="serde_test"),
+        config=FileSourceConfig(path=str(ndjson_file), parallelism=parallelism),
+    )
+    workunits = list(source.get_workunits_internal())
+
+    assert len(workunits) == 2
+    assert len(source.report.failures) == 1
+
+
+@freeze_time(FROZEN_TIME)
+def test_serde_through_avro_file(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path
+) -> None:
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    avro_file = tmp_path / "output.avro"
+
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"path": str(golden_file)}},
+            "sink": {"type": "file", "config": {"filename": str(avro_file)}},
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    # The avro format stores MCEs as one MCP per aspect.
+    expected = [
+        mcp
+        for mce in read_metadata_file(golden_file)
+        for mcp in mcps_from_mce(mce)  # type: ignore
+    ]
+    source = GenericFileSource(
+        ctx=PipelineContext(run_id="serde_test"),
+        config=FileSourceConfig(path=str(avro_file)),
+    )
+    assert [item for _, item in source.iterate_generic_file(str(avro_file))] == expected
+
+
 @pytest.mark.parametrize(
     "json_filename",
     [
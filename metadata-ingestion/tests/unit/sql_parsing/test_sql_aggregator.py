@@ -202,6 +202,44 @@ def test_multistep_temp_table(pytestconfig: pytest.Config) -> None:
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_multistep_temp_table_with_parse_pool(pytestconfig: pytest.Config) -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        sql_parser_workers=2,
+    )
+
+    # Same queries as test_multistep_temp_table. Later queries depend on temp tables
+    # created by earlier ones, so the output must match the sequential run.
+    for query in [
+        "create table #temp1 as select a, 2*b as b from upstream1",
+        "create table #temp2 as select b, c from upstream2",
+        "create temp table staging_foo as select up1.a, up1.b, up2.c from #temp1 up1 left join #temp2 up2 on up1.b = up2.b where up1.b > 0",
+        "insert into table prod_foo\nselect * from staging_foo",
+    ]:
+        aggregator.add_observed_query(
+            query=query,
+            default_db="dev",
+            default_schema="public",
+            session_id="session1",
+        )
+
+    mcps = list(aggregator.gen_metadata())
+    aggregator.close()
+
+    assert aggregator.report.num_observed_queries_failed == 0
+    # Only the last two queries read temp tables, so at most those are re-parsed.
+    assert aggregator.report.num_sql_parser_pool_reparsed <= 2
+    mce_helpers.check_goldens_stream(
+        pytestconfig,
+        outputs=mcps,
+        golden_path=RESOURCE_DIR / "test_multistep_temp_table.json",
+    )
+
+
 @freeze_time(FROZEN_TIME)
 def test_overlapping_inserts_from_temp_tables(pytestconfig: pytest.Config) -> None:
     aggregator = SqlParsingAggregator(
@@ -1,9 +1,11 @@
+import json
 from datetime import datetime, timezone
 from typing import Dict, List
 
 import pydantic
 import pytest
 
+from datahub.ingestion.source.state import entity_removal_state
 from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
@@ -158,6 +160,45 @@ def test_supported_encodings():
     test_serde_idempotence(test_state)
 
 
+def test_state_size_limit() -> None:
+    # Large enough to exceed the previous fixed limit of 4MB.
+    state = BaseSQLAlchemyCheckpointState(serde="utf-8")
+    for i in range(100_000):
+        state.add_checkpoint_urn(
+            type="table",
+            urn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,db.schema.table_{i},PROD)",
+        )
+
+    encoded = state.to_bytes()
+    assert len(encoded) > 2**22
+
+    with pytest.raises(ValueError, match="max_allowed_state_size"):
+        state.to_bytes(max_allowed_state_size=2**22)
+
+
+@pytest.mark.parametrize("num_urns", [0, 10])
+def test_generic_state_is_serialized_in_chunks(
+    monkeypatch: pytest.MonkeyPatch, num_urns: int
+) -> None:
+    monkeypatch.setattr(entity_removal_state, "_URNS_JSON_SLICE_SIZE", 3)
+    state = BaseSQLAlchemyCheckpointState()
+    for i in range(num_urns):
+        state.add_checkpoint_urn(
+            type="table",
+            urn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,db.schema.table_{i},PROD)",
+        )
+
+    chunks = list(state._iter_json_chunks())
+    assert json.loads("".join(chunks)) == json.loads(
+        state.json(exclude={"version", "serde"})
+    )
+
+    checkpoint_state = IngestionCheckpointStateClass(
+        formatVersion=state.version, serde=state.serde, payload=state.to_bytes()
+    )
+    _assert_checkpoint_deserialization(checkpoint_state, state)
+
+
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
 
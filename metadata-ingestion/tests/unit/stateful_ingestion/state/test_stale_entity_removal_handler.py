@@ -3,6 +3,7 @@ from typing import Dict, List, Tuple
 import pytest
 
 from datahub.ingestion.source.state.entity_removal_state import (
+    GenericCheckpointState,
     compute_percent_entities_changed,
 )
 
@@ -46,3 +47,23 @@ def test_change_percent(
         new_entities=new_entities, old_entities=old_entities
     )
     assert actual_percent_change == expected_percent_change
+
+
+@pytest.mark.parametrize(
+    "new_entities, old_entities, expected_percent_change",
+    new_old_ent_tests.values(),
+    ids=new_old_ent_tests.keys(),
+)
+def test_change_percent_of_checkpoint_states(
+    new_entities: EntList, old_entities: EntList, expected_percent_change: float
+) -> None:
+    new_state = GenericCheckpointState(urns=new_entities)
+    old_state = GenericCheckpointState(urns=old_entities)
+
+    assert new_state.get_percent_entities_changed(old_state) == expected_percent_change
+    stale_entities = old_state.get_urns_not_in(
+        type="*", other_checkpoint_state=new_state
+    )
+    assert list(stale_entities) == [
+        entity for entity in old_entities if entity not in new_entities
+    ]
@@ -0,0 +1,102 @@
+import pathlib
+from typing import List, Optional, Tuple
+
+import pytest
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_lite import DataHubLiteSink
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.metadata.schema_classes import DatasetPropertiesClass
+
+customers_urn = make_dataset_urn("mysql", "db.customers")
+orders_urn = make_dataset_urn("mysql", "db.orders")
+# Not a valid dataset urn, so writing a name for it fails.
+bad_urn = "urn:li:dataset:(urn:li:dataPlatform:mysql,db.bad)"
+
+
+class _RecordingCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.successes: List[Optional[str]] = []
+        self.failures: List[Tuple[Optional[str], Exception]] = []
+
+    def on_success(
+        self, record_envelope: RecordEnvelope, success_metadata: dict
+    ) -> None:
+        self.successes.append(record_envelope.record.entityUrn)
+
+    def on_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        failure_exception: Exception,
+        failure_metadata: dict,
+    ) -> None:
+        self.failures.append((record_envelope.record.entityUrn, failure_exception))
+
+
+def _write(
+    tmp_path: pathlib.Path, urns: List[str], batch_size: int
+) -> Tuple[DataHubLiteSink, _RecordingCallback]:
+    sink = DataHubLiteSink.create(
+        {
+            "type": "duckdb",
+            "config": {"file": str(tmp_path / "lite.duckdb")},
+            "batch_size": batch_size,
+        },
+        PipelineContext(run_id="test-lite-sink"),
+    )
+    callback = _RecordingCallback()
+    for urn in urns:
+        sink.write_record_async(
+            RecordEnvelope(
+                MetadataChangeProposalWrapper(
+                    entityUrn=urn, aspect=DatasetPropertiesClass(name=urn)
+                ),
+                metadata={},
+            ),
+            callback,
+        )
+    return sink, callback
+
+
+def _stored_urns(tmp_path: pathlib.Path) -> List[str]:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb")))
+    try:
+        return sorted(
+            urn for urn in lite.list_ids() if urn.startswith("urn:li:dataset:")
+        )
+    finally:
+        lite.duckdb_client.close()
+
+
+def test_lite_sink_writes_in_batches(tmp_path: pathlib.Path) -> None:
+    sink, callback = _write(tmp_path, [customers_urn, orders_urn], batch_size=3)
+
+    # Records are buffered until the batch is full or the sink is closed.
+    assert callback.successes == []
+    sink.close()
+
+    assert callback.successes == [customers_urn, orders_urn]
+    assert callback.failures == []
+    assert sink.report.total_records_written == 2
+    assert _stored_urns(tmp_path) == [customers_urn, orders_urn]
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_lite_sink_isolates_failed_records(
+    tmp_path: pathlib.Path, batch_size: int
+) -> None:
+    sink, callback = _write(
+        tmp_path, [customers_urn, bad_urn, orders_urn], batch_size=batch_size
+    )
+    sink.close()
+
+    # The batch is retried one record at a time, so only the bad record fails.
+    assert callback.successes == [customers_urn, orders_urn]
+    assert [urn for urn, _ in callback.failures] == [bad_urn]
+    assert sink.report.total_records_written == 2
+    assert len(sink.report.failures) == 1
+    assert _stored_urns(tmp_path) == [customers_urn, orders_urn]
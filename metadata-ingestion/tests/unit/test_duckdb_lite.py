@@ -0,0 +1,219 @@
+import pathlib
+from typing import List, Tuple
+
+import pytest
+
+from datahub.emitter.mce_builder import make_dataset_urn, make_tag_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite, _EdgeBatch
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import PathNotFoundException, SearchFlavor
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    GlobalTagsClass,
+    TagAssociationClass,
+)
+
+customers_urn = make_dataset_urn("mysql", "db.customers")
+orders_urn = make_dataset_urn("mysql", "db.orders")
+# Not a valid dataset urn, so writing a name for it fails.
+bad_urn = "urn:li:dataset:(urn:li:dataPlatform:mysql,db.bad)"
+
+
+def make_lite(tmp_path: pathlib.Path, read_only: bool = False) -> DuckDBLite:
+    return DuckDBLite(
+        DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb"), read_only=read_only)
+    )
+
+
+def write_datasets(lite: DuckDBLite) -> None:
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=customers_urn,
+            aspect=DatasetPropertiesClass(
+                name="customers", description="Everyone who placed an order"
+            ),
+        )
+    )
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=orders_urn,
+            aspect=DatasetPropertiesClass(
+                name="orders", description="Orders placed by each customer"
+            ),
+        )
+    )
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=orders_urn,
+            aspect=GlobalTagsClass(
+                tags=[TagAssociationClass(tag=make_tag_urn("finance"))]
+            ),
+        )
+    )
+
+
+def search_ids(lite: DuckDBLite, query: str) -> List[str]:
+    ids: List[str] = []
+    for searchable in lite.search(query, SearchFlavor.FREE_TEXT):
+        if searchable.id not in ids:
+            ids.append(searchable.id)
+    return ids
+
+
+def test_search_index(tmp_path: pathlib.Path) -> None:
+    lite = make_lite(tmp_path)
+    write_datasets(lite)
+
+    # Name matches rank above description matches, and terms match as prefixes.
+    assert search_ids(lite, "customer") == [customers_urn, orders_urn]
+    assert search_ids(lite, "ORD") == [orders_urn, customers_urn]
+    assert search_ids(lite, "finance") == [orders_urn]
+    # Every term of the query must match.
+    assert search_ids(lite, "orders finance") == [orders_urn]
+    assert search_ids(lite, "customer finance") == [orders_urn]
+    assert search_ids(lite, "customers finance") == []
+
+    # Rewriting an aspect replaces its terms.
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=orders_urn, aspect=GlobalTagsClass(tags=[])
+        )
+    )
+    assert search_ids(lite, "finance") == []
+
+
+def test_search_index_backfill(tmp_path: pathlib.Path) -> None:
+    lite = make_lite(tmp_path)
+    write_datasets(lite)
+    # Databases written by older versions don't have the search table.
+    lite.duckdb_client.execute("DROP TABLE metadata_search_v2")
+    lite.duckdb_client.close()
+
+    # Read-only opens fall back to matching ids and names.
+    lite = make_lite(tmp_path, read_only=True)
+    assert sorted(search_ids(lite, "orders")) == [orders_urn]
+    assert search_ids(lite, "finance") == []
+    lite.duckdb_client.close()
+
+    # The first writable open builds the index.
+    lite = make_lite(tmp_path)
+    assert search_ids(lite, "finance") == [orders_urn]
+    assert search_ids(lite, "customer") == [customers_urn, orders_urn]
+    lite.duckdb_client.close()
+
+    lite = make_lite(tmp_path, read_only=True)
+    assert search_ids(lite, "finance") == [orders_urn]
+    lite.duckdb_client.close()
+
+
+def name_edges(lite: DuckDBLite) -> List[Tuple[str, str]]:
+    return lite.duckdb_client.execute(
+        "SELECT src_id, dst_id FROM metadata_edge_v2 WHERE relnship = 'name' "
+        "ORDER BY src_id"
+    ).fetchall()
+
+
+def properties(urn: str, name: str) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=urn, aspect=DatasetPropertiesClass(name=name)
+    )
+
+
+def test_edge_batch() -> None:
+    batch = _EdgeBatch()
+    batch.add("a", "name", "x", "label-x", remove_existing=False)
+    batch.add("a", "name", "y", None, remove_existing=False)
+    batch.add("b", "name", "z", None, remove_existing=False)
+    assert len(batch) == 3
+
+    # Replaces the other edges with the same source and relationship.
+    batch.add("a", "name", "x", "new-label", remove_existing=True)
+    assert batch.edges == {
+        ("a", "name", "x"): ("new-label", True),
+        ("b", "name", "z"): (None, False),
+    }
+
+    batch.clear()
+    assert len(batch) == 0
+
+
+def test_write_batch(tmp_path: pathlib.Path) -> None:
+    lite = make_lite(tmp_path)
+    lite.write_batch(
+        [
+            properties(customers_urn, "customers"),
+            properties(orders_urn, "orders"),
+            # Aspects that occur more than once in a batch each get a version.
+            properties(orders_urn, "all_orders"),
+        ]
+    )
+
+    aspect = lite.get(orders_urn, ["datasetProperties"], details=True)
+    assert aspect is not None
+    dataset_properties = aspect["datasetProperties"]
+    assert isinstance(dataset_properties, dict)
+    assert dataset_properties["name"] == "all_orders"
+    assert dataset_properties["__systemMetadata"]["properties"]["sysVersion"] == 2
+
+    # Edges are flushed with the batch, and the last name replaces earlier ones.
+    assert name_edges(lite) == [
+        (customers_urn, "customers"),
+        (orders_urn, "all_orders"),
+    ]
+    assert search_ids(lite, "all") == [orders_urn]
+    lite.close()
+
+
+def test_write_batch_rolls_back_on_failure(tmp_path: pathlib.Path) -> None:
+    lite = make_lite(tmp_path)
+    with pytest.raises(Exception):
+        lite.write_batch(
+            [
+                properties(customers_urn, "customers"),
+                properties(bad_urn, "bad"),
+                properties(orders_urn, "orders"),
+            ]
+        )
+
+    assert lite.get(customers_urn, None) is None
+    assert name_edges(lite) == []
+    assert search_ids(lite, "customers") == []
+
+    # The failed record also fails on its own, without affecting later writes.
+    with pytest.raises(Exception):
+        lite.write(properties(bad_urn, "bad"))
+    lite.write_batch([properties(customers_urn, "customers")])
+    lite.write(properties(orders_urn, "orders"))
+    assert lite.get(bad_urn, None) is None
+    assert name_edges(lite) == [(customers_urn, "customers"), (orders_urn, "orders")]
+    assert search_ids(lite, "customers") == [customers_urn]
+    assert search_ids(lite, "orders") == [orders_urn]
+    lite.close()
+
+
+def test_ls(tmp_path: pathlib.Path) -> None:
+    lite = make_lite(tmp_path)
+    write_datasets(lite)
+    lite.reindex()
+
+    assert [(b.id, b.name) for b in lite.ls("/")] == [
+        ("urn:li:systemNode:databases", "databases")
+    ]
+    assert [b.name for b in lite.ls("/databases")] == ["mysql"]
+
+    datasets = lite.ls("/databases/mysql/instances/default/datasets")
+    assert sorted((b.id, b.name, b.leaf) for b in datasets) == [
+        (customers_urn, "customers", False),
+        (orders_urn, "orders", False),
+    ]
+
+    [leaf] = lite.ls("/databases/mysql/instances/default/datasets/orders")
+    assert (leaf.id, leaf.name, leaf.leaf) == (orders_urn, "orders", True)
+
+    [suggestion] = lite.ls("/databases/my")
+    assert suggestion.auto_complete is not None
+    assert suggestion.auto_complete.suggested_path == "/databases/mysql"
+
+    with pytest.raises(PathNotFoundException):
+        lite.ls("/databases/postgres")
@@ -1,6 +1,7 @@
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 from unittest.mock import patch
 
 import pydantic
@@ -66,6 +67,8 @@ def glue_source(platform_instance: Optional[str] = None) -> GlueSource:
             platform_instance=platform_instance,
             use_s3_bucket_tags=True,
             use_s3_object_tags=True,
+            # Stubbed responses must be requested in the order they were added.
+            max_workers=1,
         ),
     )
 
@@ -223,6 +226,70 @@ def test_ignore_resource_links(ignore_resource_links, all_databases_and_tables_r
         assert source.get_all_databases_and_tables() == all_databases_and_tables_result
 
 
+def test_get_all_databases_and_tables_preserves_order():
+    source = GlueSource(
+        ctx=PipelineContext(run_id="glue-source-test"),
+        config=GlueSourceConfig(aws_region="us-west-2", max_workers=4),
+    )
+    database_names = [f"db-{i}" for i in range(8)]
+
+    def get_tables_from_database(database_name: str) -> List[Dict]:
+        # Make the earlier databases finish last.
+        time.sleep(0.01 * (len(database_names) - database_names.index(database_name)))
+        return [{"DatabaseName": database_name, "Name": f"table-{i}"} for i in range(2)]
+
+    with Stubber(source.glue_client) as glue_stubber, patch.object(
+        source, "get_tables_from_database", side_effect=get_tables_from_database
+    ):
+        glue_stubber.add_response(
+            "get_databases",
+            {"DatabaseList": [{"Name": name} for name in database_names]},
+            {},
+        )
+
+        databases, tables = source.get_all_databases_and_tables()
+
+    assert list(databases) == database_names
+    assert [(t["DatabaseName"], t["Name"]) for t in tables] == [
+        (name, f"table-{i}") for name in database_names for i in range(2)
+    ]
+
+
+def test_transform_extraction_reports_dag_failures():
+    source = GlueSource(
+        ctx=PipelineContext(run_id="glue-source-test"),
+        config=GlueSourceConfig(
+            aws_region="us-west-2", extract_transforms=True, max_workers=4
+        ),
+    )
+    jobs = [{"Name": f"job-missing-{i}", "Command": {}} for i in range(4)] + [
+        {"Name": f"job-invalid-{i}", "Command": {"ScriptLocation": "not-s3"}}
+        for i in range(4)
+    ]
+
+    with patch.object(source, "get_all_jobs", return_value=jobs), patch.object(
+        source, "get_dataflow_wu"
+    ):
+        list(source._transform_extraction())
+
+    # The DAGs are fetched by the workers, but every failure is still counted.
+    assert source.report.num_job_script_location_missing == 4
+    assert source.report.num_job_script_location_invalid == 4
+    assert len(source.report.warnings) == 4
+
+
+def test_glue_client_uses_adaptive_retries():
+    config = GlueSourceConfig(aws_region="us-west-2", max_workers=20)
+    assert config.glue_client.meta.config.retries["mode"] == "adaptive"
+    assert config.glue_client.meta.config.max_pool_connections == 20
+
+    config = GlueSourceConfig(
+        aws_region="us-west-2",
+        aws_advanced_config={"retries": {"mode": "standard"}},
+    )
+    assert config.glue_client.meta.config.retries["mode"] == "standard"
+
+
 def test_platform_must_be_valid():
     with pytest.raises(pydantic.ValidationError):
         GlueSource(
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from typing import Dict
+
+
+def _get_import_times(code: str) -> Dict[str, int]:
+    """Runs code in a fresh interpreter and returns the cumulative import time, in microseconds, of each module it imported."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like `import time:       self [us] |  cumulative | imported package`.
+    import_times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self_time, cumulative, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_schema_classes_are_loaded_lazily() -> None:
+    import_times = _get_import_times("import datahub.metadata.schema_classes")
+
+    assert "datahub.metadata.schema_classes" in import_times
+    assert "datahub.metadata._schema_classes" not in import_times
+
+
+def test_schemas_are_parsed_lazily() -> None:
+    code = """
+import sys
+import datahub.emitter.mcp
+
+schema_classes = sys.modules["datahub.metadata._schema_classes"]
+assert not getattr(schema_classes, "__SCHEMAS"), "schemas were parsed on import"
+
+schema_classes.StatusClass(removed=False).validate()
+assert getattr(schema_classes, "__SCHEMAS"), "schemas were not parsed on use"
+"""
+    _get_import_times(code)
+
+
+def test_star_import_only_exports_schema_classes() -> None:
+    code = """
+from datahub.metadata.schema_classes import *
+
+assert StatusClass
+assert ASPECT_CLASSES and ASPECT_NAME_MAP and KEY_ASPECTS
+assert "importlib" not in globals()
+assert "get_schema_type" not in globals()
+"""
+    _get_import_times(code)
@@ -7,6 +7,7 @@ import pytest
 from confluent_kafka.schema_registry.schema_registry_client import (
     RegisteredSchema,
     Schema,
+    SchemaReference,
 )
 from freezegun import freeze_time
 
@@ -22,7 +23,9 @@ from datahub.emitter.mce_builder import (
 )
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.extractor import schema_util
 from datahub.ingestion.source.kafka import KafkaSource, KafkaSourceConfig
+from datahub.ingestion.source.kafka_schema_registry_base import KafkaSchemaRegistryBase
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.schema_classes import (
     BrowsePathsClass,
@@ -203,6 +206,56 @@ def test_kafka_source_workunits_no_platform_instance(mock_kafka, mock_admin_clie
     assert f"/prod/{PLATFORM}" in browse_path_aspects[0].paths
 
 
+class _CustomSchemaRegistry(KafkaSchemaRegistryBase):
+    @classmethod
+    def create(cls, config, report):
+        return cls()
+
+    def get_schema_metadata(self, topic, platform_urn):
+        return None
+
+
+@pytest.mark.parametrize(
+    "config,expected_max_workers",
+    [
+        ({}, 10),
+        ({"schema_registry_max_workers": 4}, 4),
+        # Custom schema registries aren't assumed to be thread-safe.
+        (
+            {
+                "schema_registry_class": "tests.unit.test_kafka_source._CustomSchemaRegistry"
+            },
+            1,
+        ),
+        (
+            {
+                "schema_registry_class": "tests.unit.test_kafka_source._CustomSchemaRegistry",
+                "schema_registry_max_workers": 4,
+            },
+            4,
+        ),
+    ],
+)
+@patch(
+    "datahub.ingestion.source.confluent_schema_registry.SchemaRegistryClient",
+    autospec=True,
+)
+@patch("datahub.ingestion.source.kafka.confluent_kafka.Consumer", autospec=True)
+def test_kafka_source_schema_registry_max_workers(
+    mock_kafka_consumer,
+    mock_schema_registry_client,
+    mock_admin_client,
+    config,
+    expected_max_workers,
+):
+    kafka_source = KafkaSource.create(
+        {"connection": {"bootstrap": "localhost:9092"}, **config},
+        PipelineContext(run_id="test"),
+    )
+    assert kafka_source._get_schema_registry_max_workers() == expected_max_workers
+    kafka_source.close()
+
+
 @patch("datahub.ingestion.source.kafka.confluent_kafka.Consumer", autospec=True)
 def test_close(mock_kafka, mock_admin_client):
     mock_kafka_instance = mock_kafka.return_value
@@ -676,3 +729,89 @@ def test_kafka_source_topic_meta_mappings(
             "urn:li:glossaryTerm:double_meta_property",
         ]
     )
+
+
+@patch(
+    "datahub.ingestion.source.confluent_schema_registry.SchemaRegistryClient",
+    autospec=True,
+)
+@patch("datahub.ingestion.source.kafka.confluent_kafka.Consumer", autospec=True)
+def test_kafka_source_shared_schemas_are_converted_once(
+    mock_kafka_consumer, mock_schema_registry_client, mock_admin_client
+):
+    topics = [f"topic{i}" for i in range(5)]
+    shared_schema = RegisteredSchema(
+        schema_id="schema_id_1",
+        schema=Schema(
+            schema_str='{"type":"record", "name":"SharedValue", "namespace": "test.acryl", "fields": [{"name":"ref", "type": "test.acryl.Ref"}]}',
+            schema_type="AVRO",
+            references=[
+                SchemaReference(name="test.acryl.Ref", subject="ref-value", version=1)
+            ],
+        ),
+        subject="shared-value",
+        version=1,
+    )
+    ref_schema = RegisteredSchema(
+        schema_id="schema_id_2",
+        schema=Schema(
+            schema_str='{"type":"record", "name":"Ref", "namespace": "test.acryl", "fields": [{"name":"id", "type": "string"}]}',
+            schema_type="AVRO",
+        ),
+        subject="ref-value",
+        version=1,
+    )
+
+    mock_kafka_instance = mock_kafka_consumer.return_value
+    mock_cluster_metadata = MagicMock()
+    mock_cluster_metadata.topics = {topic: None for topic in topics}
+    mock_kafka_instance.list_topics.return_value = mock_cluster_metadata
+
+    mock_schema_registry_client.return_value.get_subjects.return_value = [
+        f"{topic}-value" for topic in topics
+    ] + ["ref-value"]
+    fetched_subjects = []
+
+    def mock_get_latest_version(subject_name: str) -> Optional[RegisteredSchema]:
+        fetched_subjects.append(subject_name)
+        return ref_schema if subject_name == "ref-value" else shared_schema
+
+    mock_schema_registry_client.return_value.get_latest_version = (
+        mock_get_latest_version
+    )
+
+    ctx = PipelineContext(run_id="test")
+    kafka_source = KafkaSource.create(
+        {
+            "connection": {"bootstrap": "localhost:9092"},
+            # With more workers, topics racing on the same schema may convert it twice.
+            "schema_registry_max_workers": 1,
+        },
+        ctx,
+    )
+    with patch(
+        "datahub.ingestion.source.confluent_schema_registry.schema_util.avro_schema_to_mce_fields",
+        wraps=schema_util.avro_schema_to_mce_fields,
+    ) as avro_schema_to_mce_fields:
+        workunits = list(kafka_source.get_workunits())
+
+    schema_metadatas = [
+        aspect
+        for wu in workunits
+        if isinstance(wu.metadata, MetadataChangeEvent)
+        for aspect in wu.metadata.proposedSnapshot.aspects
+        if isinstance(aspect, SchemaMetadataClass)
+    ]
+    assert [s.schemaName for s in schema_metadatas] == topics
+    assert avro_schema_to_mce_fields.call_count == 1
+    assert fetched_subjects.count("ref-value") == 1
+
+    # Every topic gets its own copy of the memoized fields.
+    first_fields, *other_fields = [s.fields for s in schema_metadatas]
+    assert [f.fieldPath for f in first_fields] == [
+        "[version=2.0].[type=SharedValue].[type=Ref].ref",
+        "[version=2.0].[type=SharedValue].[type=Ref].ref.[type=string].id",
+    ]
+    for fields in other_fields:
+        assert fields == first_fields
+        assert fields[0] is not first_fields[0]
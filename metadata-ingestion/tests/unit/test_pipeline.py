@@ -6,6 +6,7 @@ import pytest
 from freezegun import freeze_time
 
 from datahub.configuration.common import DynamicTypedConfig
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.committable import CommitPolicy, Committable
 from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.source import Source, SourceReport
@@ -202,6 +203,44 @@ class TestPipeline(object):
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_pipelined_preserves_order(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyWorkUnits"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {
+                    "pipelined_execution": True,
+                    "pipelined_execution_queue_size": 2,
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        assert [
+            record_envelope.record.entityUrn
+            for record_envelope in sink_report.received_records
+        ] == [wu.get_urn() for wu in FakeSourceWithManyWorkUnits.make_workunits()]
+
+        assert pipeline.cli_report.pipeline_stages is not None
+        stages = pipeline.cli_report.as_obj()["pipeline_stages"]
+        assert set(stages.keys()) == {"source", "transform", "sink"}
+        for stage in stages.values():
+            assert "busy_time_seconds" in stage
+            assert "idle_time_seconds" in stage
+        # The sink stage also receives the end-of-stream records.
+        assert stages["sink"]["items_processed"] == 51
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
@@ -405,6 +444,22 @@ class FakeSource(Source):
         pass
 
 
+class FakeSourceWithManyWorkUnits(FakeSource):
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.work_units = self.make_workunits()
+
+    @staticmethod
+    def make_workunits() -> List[MetadataWorkUnit]:
+        return [
+            MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:test_platform,test{i},PROD)",
+                aspect=StatusClass(removed=False),
+            ).as_workunit()
+            for i in range(50)
+        ]
+
+
 class FakeSourceWithWarnings(FakeSource):
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
@@ -0,0 +1,51 @@
+import logging
+import threading
+from typing import Iterable
+
+import pytest
+
+from datahub.ingestion.run.pipeline_stages import (
+    PipelineStageReport,
+    StageQueue,
+    start_stage,
+)
+
+
+def test_stage_failure_is_passed_to_consumer() -> None:
+    stop_event = threading.Event()
+    output: StageQueue[int] = StageQueue(1, stop_event)
+
+    def produce() -> Iterable[int]:
+        yield 1
+        raise ValueError("source failed")
+
+    stage = start_stage("source", PipelineStageReport(), produce, output)
+    items = []
+    with pytest.raises(ValueError, match="source failed"):
+        for item in output.consume(PipelineStageReport()):
+            items.append(item)
+    stage.join(timeout=10)
+
+    assert items == [1]
+    assert stage.undelivered_failure is None
+
+
+def test_stage_failure_after_stop_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    stop_event = threading.Event()
+    output: StageQueue[int] = StageQueue(1, stop_event)
+    stopped = threading.Event()
+
+    def produce() -> Iterable[int]:
+        # Fails only once the consumer has already given up on the pipeline.
+        stopped.wait(timeout=10)
+        raise ValueError("source failed")
+        yield
+
+    stage = start_stage("source", PipelineStageReport(), produce, output)
+    stop_event.set()
+    stopped.set()
+    with caplog.at_level(logging.ERROR):
+        stage.join(timeout=10)
+
+    assert isinstance(stage.undelivered_failure, ValueError)
+    assert "Pipeline stage source failed" in caplog.text
@@ -1,5 +1,11 @@
+from typing import List
+
+import pytest
+
 from datahub.emitter import rest_emitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.metadata.schema_classes import StatusClass
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -42,3 +48,78 @@ def test_datahub_rest_emitter_extra_params():
     )
     assert emitter._session.headers.get("key1") == "value1"
     assert emitter._session.headers.get("key2") == "value2"
+
+
+def _make_status_mcps(count: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)",
+            aspect=StatusClass(removed=False),
+        )
+        for i in range(count)
+    ]
+
+
+def test_datahub_rest_emitter_emit_mcps_chunking(requests_mock):
+    requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch")
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    mcps = _make_status_mcps(rest_emitter.BATCH_INGEST_MAX_PAYLOAD_LENGTH + 5)
+    assert emitter.emit_mcps(mcps) == 2
+    assert emitter.batch_ingest_supported is True
+
+    payloads = [request.json() for request in requests_mock.request_history]
+    assert [len(payload["proposals"]) for payload in payloads] == [
+        rest_emitter.BATCH_INGEST_MAX_PAYLOAD_LENGTH,
+        5,
+    ]
+    assert payloads[1]["proposals"][-1]["entityUrn"] == mcps[-1].entityUrn
+
+
+def test_datahub_rest_emitter_emit_mcps_payload_size(requests_mock, monkeypatch):
+    requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch")
+    monkeypatch.setattr(rest_emitter, "_MAX_BATCH_INGEST_PAYLOAD_SIZE", 1000)
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    assert emitter.emit_mcps(_make_status_mcps(10)) > 1
+    for request in requests_mock.request_history:
+        assert len(request.text) < 1000 + len('{"proposals": []}')
+
+
+def test_datahub_rest_emitter_emit_mcps_fallback(requests_mock):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", status_code=404
+    )
+    single_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT, retry_max_times=1)
+    assert emitter.emit_mcps(_make_status_mcps(3)) == 3
+    assert emitter.batch_ingest_supported is False
+    assert single_mock.call_count == 3
+
+    # Once we know batching is unsupported, we shouldn't try it again.
+    assert emitter.emit_mcps(_make_status_mcps(2)) == 2
+    assert single_mock.call_count == 5
+
+
+def test_datahub_rest_emitter_emit_mcps_partial_failure(requests_mock, monkeypatch):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        [
+            {"status_code": 200},
+            {"status_code": 422, "json": {"message": "invalid aspect"}},
+        ],
+    )
+    monkeypatch.setattr(rest_emitter, "BATCH_INGEST_MAX_PAYLOAD_LENGTH", 2)
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    with pytest.raises(rest_emitter.BatchEmitError) as exc_info:
+        emitter.emit_mcps(_make_status_mcps(5))
+
+    # Only the first request's proposals were written.
+    assert exc_info.value.num_emitted == 2
+    assert exc_info.value.num_requests == 1
+    assert exc_info.value.info == {"message": "invalid aspect"}
+    assert requests_mock.call_count == 2
@@ -1,11 +1,20 @@
 import json
+from typing import List, Optional, Tuple
 
 import pytest
 import requests
 
 import datahub.metadata.schema_classes as models
+from datahub.emitter import rest_emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_rest import (
+    DatahubRestSink,
+    DatahubRestSinkConfig,
+    SyncOrAsync,
+)
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -259,3 +268,135 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+class _RecordingCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.successes: List[Optional[str]] = []
+        self.failures: List[Tuple[Optional[str], Exception, dict]] = []
+
+    def on_success(
+        self, record_envelope: RecordEnvelope, success_metadata: dict
+    ) -> None:
+        self.successes.append(record_envelope.record.entityUrn)
+
+    def on_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        failure_exception: Exception,
+        failure_metadata: dict,
+    ) -> None:
+        self.failures.append(
+            (record_envelope.record.entityUrn, failure_exception, failure_metadata)
+        )
+
+
+def _write_batch(
+    requests_mock, mcps: List[MetadataChangeProposalWrapper]
+) -> Tuple[DatahubRestSink, _RecordingCallback]:
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+    sink = DatahubRestSink(
+        PipelineContext(run_id="rest-sink-test"),
+        DatahubRestSinkConfig(
+            server=MOCK_GMS_ENDPOINT,
+            mode=SyncOrAsync.ASYNC_BATCH,
+            # Dispatch exactly one batch, once all records are submitted.
+            max_per_batch=len(mcps),
+            max_batch_wait_sec=60,
+        ),
+    )
+    callback = _RecordingCallback()
+    for mcp in mcps:
+        sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+    sink.close()
+    return sink, callback
+
+
+def _make_status_mcps(count: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        for i in range(count)
+    ]
+
+
+def test_datahub_rest_sink_async_batch(requests_mock):
+    batch_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch"
+    )
+    mcps = _make_status_mcps(4)
+
+    sink, callback = _write_batch(requests_mock, mcps)
+
+    assert sorted(callback.successes) == sorted(mcp.entityUrn for mcp in mcps)
+    assert callback.failures == []
+    assert batch_mock.call_count == 1
+    assert len(batch_mock.last_request.json()["proposals"]) == 4
+    assert sink.report.async_batches_prepared == 1
+    assert sink.report.async_batches_requests == 1
+    assert sink.report.async_batch_records_written == 4
+    assert sink.report.async_batch_size_histogram == {"3-4": 1}
+
+
+def test_datahub_rest_sink_async_batch_partial_failure(requests_mock, monkeypatch):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        [
+            {"status_code": 200},
+            {"status_code": 422, "json": {"message": "invalid aspect"}},
+        ],
+    )
+    monkeypatch.setattr(rest_emitter, "BATCH_INGEST_MAX_PAYLOAD_LENGTH", 2)
+    mcps = _make_status_mcps(4)
+
+    sink, callback = _write_batch(requests_mock, mcps)
+
+    # The records of the first request were written.
+    assert sorted(callback.successes) == [mcps[0].entityUrn, mcps[1].entityUrn]
+    assert sorted(urn for urn, _, _ in callback.failures) == [
+        mcps[2].entityUrn,
+        mcps[3].entityUrn,
+    ]
+    # Each failure is reported with the urn of its own record.
+    for urn, exception, failure_metadata in callback.failures:
+        assert failure_metadata["urn"] == urn
+        assert failure_metadata["message"] == "invalid aspect"
+    assert callback.failures[0][1] is not callback.failures[1][1]
+    assert sorted(failure["info"]["urn"] for failure in sink.report.failures) == [
+        mcps[2].entityUrn,
+        mcps[3].entityUrn,
+    ]
+    assert sink.report.async_batch_records_written == 2
+
+
+def test_datahub_rest_sink_async_batch_fallback(requests_mock):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", status_code=404
+    )
+    single_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal",
+        [
+            {"status_code": 200},
+            {"status_code": 422, "json": {"message": "invalid aspect"}},
+            {"status_code": 200},
+        ],
+    )
+    mcps = _make_status_mcps(3)
+
+    sink, callback = _write_batch(requests_mock, mcps)
+
+    # Without batch support, records are emitted one by one in submission order,
+    # and a failure only affects its own record.
+    assert single_mock.call_count == 3
+    assert [
+        request.json()["proposal"]["entityUrn"]
+        for request in single_mock.request_history
+    ] == [mcp.entityUrn for mcp in mcps]
+    assert sorted(callback.successes) == [mcps[0].entityUrn, mcps[2].entityUrn]
+    assert [(urn, metadata["urn"]) for urn, _, metadata in callback.failures] == [
+        (mcps[1].entityUrn, mcps[1].entityUrn)
+    ]
+    assert sink.emitter.batch_ingest_supported is False
+    assert sink.report.async_batch_records_written == 2
@@ -39,3 +39,16 @@ class FakeSource(Source):
 
     def close(self) -> None:
         return super().close()
+
+
+def test_workunit_processor_timings():
+    source = FakeSource(PipelineContext(run_id="test-workunit-processor-timings"))
+    workunits = list(source.get_workunits())
+
+    assert len(workunits) == 1
+    assert list(source.get_report().workunit_processor_seconds) == [
+        "get_workunits_internal",
+        "auto_status_aspect",
+        "auto_materialize_referenced_tags",
+        "auto_workunit_reporter",
+    ]
@@ -1,13 +1,23 @@
-from typing import Dict
+import contextlib
+import threading
+import time
+from typing import Dict, Iterator, Optional
 from unittest import mock
 
 import pytest
 
-from datahub.ingestion.source.sql.sql_common import PipelineContext, SQLAlchemySource
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.source.sql.sql_common import (
+    PipelineContext,
+    SchemaReflection,
+    SQLAlchemySource,
+    _DatabaseWaitLock,
+)
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sqlalchemy_uri_mapper import (
     get_platform_from_sqlalchemy_uri,
 )
+from datahub.metadata.schema_classes import StatusClass
 
 
 class _TestSQLAlchemyConfig(SQLCommonConfig):
@@ -22,9 +32,9 @@ class _TestSQLAlchemySource(SQLAlchemySource):
         return cls(config, ctx, "TEST")
 
 
-def get_test_sql_alchemy_source():
+def get_test_sql_alchemy_source(config_dict: Optional[dict] = None):
     return _TestSQLAlchemySource.create(
-        config_dict={}, ctx=PipelineContext(run_id="test_ctx")
+        config_dict=config_dict or {}, ctx=PipelineContext(run_id="test_ctx")
     )
 
 
@@ -134,3 +144,137 @@ def test_test_connection_failure():
     assert not report.basic_connectivity.capable
     assert report.basic_connectivity.failure_reason
     assert "Connection refused" in report.basic_connectivity.failure_reason
+
+
+def test_concurrent_schema_extraction_preserves_order():
+    source = get_test_sql_alchemy_source({"max_workers": 4})
+    schemas = [f"schema{i}" for i in range(8)]
+    worker_inspectors = []
+    running = []
+    max_running = 0
+
+    @contextlib.contextmanager
+    def get_worker_inspector(inspector: mock.Mock) -> Iterator[mock.Mock]:
+        worker_inspector = mock.Mock()
+        worker_inspectors.append(worker_inspector)
+        yield worker_inspector
+
+    def get_schema_level_workunits(inspector, schema, database):
+        nonlocal max_running
+        assert inspector in worker_inspectors
+        running.append(schema)
+        max_running = max(max_running, len(running))
+        # Earlier schemas are slower, so they'd finish last without ordering.
+        time.sleep(0.02 * (len(schemas) - int(schema[len("schema") :])))
+        running.remove(schema)
+        for table in ["a", "b"]:
+            yield MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:TEST,{schema}.{table},PROD)",
+                aspect=StatusClass(removed=False),
+            ).as_workunit()
+
+    with mock.patch.object(
+        source, "get_inspectors", return_value=[mock.Mock()]
+    ), mock.patch.object(source, "get_db_name", return_value="db"), mock.patch.object(
+        source, "get_database_level_workunits", return_value=[]
+    ), mock.patch.object(
+        source, "get_allowed_schemas", return_value=schemas
+    ), mock.patch.object(
+        source, "get_worker_inspector", side_effect=get_worker_inspector
+    ), mock.patch.object(
+        source, "get_schema_level_workunits", side_effect=get_schema_level_workunits
+    ):
+        urns = [wu.get_urn() for wu in source.get_workunits_internal()]
+
+    assert urns == [
+        f"urn:li:dataset:(urn:li:dataPlatform:TEST,{schema}.{table},PROD)"
+        for schema in schemas
+        for table in ["a", "b"]
+    ]
+    assert len(worker_inspectors) == len(schemas)
+    # Without queries to wait on, the workers never run at the same time.
+    assert max_running == 1
+
+
+def test_database_wait_lock_is_released_during_queries():
+    lock = _DatabaseWaitLock()
+    in_query = threading.Event()
+    query_done = threading.Event()
+    held_by_other_thread = []
+
+    def worker() -> None:
+        with lock.hold():
+            lock.on_query_start()
+            in_query.set()
+            query_done.wait(timeout=10)
+            lock.on_query_end()
+        # A query that fails without reaching on_query_end doesn't leak the lock.
+        with lock.hold():
+            lock.on_query_start()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert in_query.wait(timeout=10)
+    with lock.hold():
+        held_by_other_thread.append(True)
+    query_done.set()
+    thread.join(timeout=10)
+
+    assert held_by_other_thread == [True]
+    with lock.hold():
+        pass
+    # Queries outside of hold() are ignored.
+    lock.on_query_start()
+    lock.on_query_end()
+    assert list(lock.wrap_iterable([1, 2])) == [1, 2]
+
+
+def test_bulk_reflection_with_fallback():
+    source = get_test_sql_alchemy_source({"use_bulk_reflection": True})
+    inspector = mock.Mock()
+    inspector.info_cache = {}
+    reflection = SchemaReflection(
+        columns={"cached": [{"name": "id"}]},
+        pk_constraints={"cached": {"constrained_columns": ["id"], "name": "pk"}},
+        foreign_keys={},
+    )
+
+    with mock.patch.object(
+        source, "get_schema_reflection", return_value=reflection
+    ) as get_schema_reflection:
+        assert source._get_columns("db.s.cached", inspector, "s", "cached") == [
+            {"name": "id"}
+        ]
+        assert source._get_pk_constraint(inspector, "s", "cached")["name"] == "pk"
+        assert source._get_foreign_keys("urn", inspector, "s", "cached") == []
+        inspector.get_columns.assert_not_called()
+        inspector.get_pk_constraint.assert_not_called()
+        inspector.get_foreign_keys.assert_not_called()
+
+        # Tables without a primary key are covered by the reflection, but tables
+        # without columns and mappings that weren't fetched fall back.
+        assert source._get_pk_constraint(inspector, "s", "other") == {
+            "constrained_columns": [],
+            "name": None,
+        }
+        source._get_columns("db.s.other", inspector, "s", "other")
+        inspector.get_columns.assert_called_once_with("other", "s")
+        source.get_table_properties(inspector, "s", "cached")
+        inspector.get_table_comment.assert_called_once_with("cached", "s")
+
+        assert get_schema_reflection.call_count == 1
+        source._clear_schema_reflection(inspector, "s")
+        assert inspector.info_cache == {}
+
+
+def test_bulk_reflection_failure_falls_back():
+    source = get_test_sql_alchemy_source({"use_bulk_reflection": True})
+    inspector = mock.Mock()
+    inspector.info_cache = {}
+    inspector.get_columns.return_value = [{"name": "id"}]
+
+    with mock.patch.object(
+        source, "get_schema_reflection", side_effect=Exception("permission denied")
+    ):
+        assert source._get_columns("db.s.t", inspector, "s", "t") == [{"name": "id"}]
+    assert source.report.warnings
@@ -1176,6 +1176,70 @@ def test_ownership_patching_with_different_types_2(mock_time):
     ]
 
 
+@mock.patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_ownership_patching_prefetches_server_ownership(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    pipeline_context = PipelineContext(run_id="test_ownership_prefetch")
+    pipeline_context.graph = graph
+    transformer = SimpleAddDatasetOwnership.create(
+        {
+            "owner_urns": [builder.make_user_urn("foo")],
+            "semantics": TransformerSemantics.PATCH,
+        },
+        pipeline_context,
+    )
+    urns = [
+        builder.make_dataset_urn("bigquery", f"example{i}", "PROD") for i in range(3)
+    ]
+    server_ownership = gen_owners([builder.make_user_urn("baz")])
+
+    with mock.patch.object(
+        graph,
+        "get_entities_raw",
+        return_value={
+            urns[0]: {"aspects": {"ownership": {"value": server_ownership.to_obj()}}},
+            urns[1]: {"aspects": {}},
+        },
+    ) as mock_get_entities_raw, mock.patch("requests.Session.get") as mock_get:
+        # The last urn is missing from the batch response, so it's fetched on its own.
+        mock_get.return_value.status_code = 404
+        outputs = list(
+            transformer.transform(
+                [
+                    RecordEnvelope(
+                        make_generic_dataset_mcp(entity_urn=urn), metadata={}
+                    )
+                    for urn in urns
+                ]
+                + [RecordEnvelope(EndOfStream(), metadata={})]
+            )
+        )
+
+    mock_get_entities_raw.assert_called_once_with(urns, ["ownership"])
+    assert mock_get.call_count == 1
+
+    owners = {
+        output.record.entityUrn: sorted(
+            owner.owner for owner in output.record.aspect.owners
+        )
+        for output in outputs
+        if isinstance(output.record, MetadataChangeProposalWrapper)
+        and isinstance(output.record.aspect, models.OwnershipClass)
+    }
+    assert owners == {
+        urns[0]: [builder.make_user_urn("baz"), builder.make_user_urn("foo")],
+        urns[1]: [builder.make_user_urn("foo")],
+        urns[2]: [builder.make_user_urn("foo")],
+    }
+
+    report = graph.aspect_prefetch_report
+    assert report.prefetch_requests == 1
+    assert report.aspects_prefetched == 2
+    assert report.aspects_served == 2
+    assert report.aspects_unused == 0
+
+
 PROPERTIES_TO_ADD = {"my_new_property": "property value"}
 
 
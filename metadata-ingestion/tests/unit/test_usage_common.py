@@ -14,6 +14,7 @@ from datahub.ingestion.source.usage.usage_common import (
     DEFAULT_QUERIES_CHARACTER_LIMIT,
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregator,
     convert_usage_aggregation_class,
 )
 from datahub.metadata.schema_classes import (
@@ -197,6 +198,67 @@ def test_make_usage_workunit():
     assert du.topSqlQueries.pop() == test_query
 
 
+def test_usage_aggregator_spills_to_disk():
+    config = BaseUsageConfig(
+        bucket_duration=BucketDuration.DAY, top_n_queries=2, aggregation_cache_size=2
+    )
+    with UsageAggregator[_TestTableRef](config) as aggregator:
+        for i in range(10):
+            for day in [1, 2]:
+                aggregator.aggregate_event(
+                    resource=f"test_db.test_schema.table_{i}",
+                    start_time=datetime(2020, 1, day),
+                    query=f"select * from table_{i}",
+                    user="test_email@test.com",
+                    fields=["col"],
+                )
+
+        workunits = list(aggregator.generate_workunits(_simple_urn_builder))
+
+    assert len(workunits) == 20
+    for wu in workunits:
+        assert isinstance(wu.metadata, MetadataChangeProposalWrapper)
+        du = wu.metadata.aspect
+        assert isinstance(du, DatasetUsageStatisticsClass)
+        assert du.totalSqlQueries == 1
+        assert du.uniqueUserCount == 1
+        assert du.topSqlQueries and len(du.topSqlQueries) == 1
+
+
+def test_usage_aggregator_tracks_frequent_queries():
+    config = BaseUsageConfig(bucket_duration=BucketDuration.DAY, top_n_queries=2)
+    with UsageAggregator[_TestTableRef](config) as aggregator:
+        # Many rare queries, which exceed the number of tracked queries.
+        for i in range(100):
+            aggregator.aggregate_event(
+                resource="test_db.test_schema.test_table",
+                start_time=datetime(2020, 1, 1),
+                query=f"select {i} from test_table",
+                user=None,
+                fields=[],
+            )
+        for query in ["select a from test_table", "select b from test_table"]:
+            aggregator.aggregate_event(
+                resource="test_db.test_schema.test_table",
+                start_time=datetime(2020, 1, 1),
+                query=query,
+                user=None,
+                fields=[],
+                count=50,
+            )
+
+        [wu] = list(aggregator.generate_workunits(_simple_urn_builder))
+
+    assert isinstance(wu.metadata, MetadataChangeProposalWrapper)
+    du = wu.metadata.aspect
+    assert isinstance(du, DatasetUsageStatisticsClass)
+    assert du.totalSqlQueries == 102
+    assert du.topSqlQueries == [
+        "select a from test_table",
+        "select b from test_table",
+    ]
+
+
 def test_query_formatting():
     test_email = "test_email@test.com"
     test_query = "select * from foo where id in (select id from bar);"
@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 from datahub.emitter.aspect import JSON_CONTENT_TYPE, JSON_PATCH_CONTENT_TYPE
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -108,3 +109,36 @@ def test_get_aspects_of_type_mcpc():
     )
     wu = MetadataWorkUnit(id="id", mcp_raw=mcpc)
     assert wu.get_aspect_of_type(StatusClass) is None
+
+
+def test_get_aspects_of_type_mcpc_decodes_once():
+    aspect = StatusClass(False)
+    mcpc = MetadataChangeProposalClass(
+        entityUrn="urn:li:container:asdf",
+        entityType="container",
+        changeType=ChangeTypeClass.UPSERT,
+        aspectName=StatusClass.ASPECT_NAME,
+        aspect=GenericAspectClass(
+            value=json.dumps(aspect.to_obj()).encode(),
+            contentType=JSON_CONTENT_TYPE,
+        ),
+    )
+    wu = MetadataWorkUnit(id="id", mcp_raw=mcpc)
+
+    with mock.patch.object(
+        MetadataChangeProposalWrapper,
+        "try_from_mcpc",
+        wraps=MetadataChangeProposalWrapper.try_from_mcpc,
+    ) as try_from_mcpc:
+        assert wu.get_aspect_of_type(StatusClass) == aspect
+        assert wu.get_aspect_of_type(StatusClass) == aspect
+        assert try_from_mcpc.call_count == 1
+
+        # Replacing the serialized aspect invalidates the decoded one.
+        updated_aspect = StatusClass(True)
+        mcpc.aspect = GenericAspectClass(
+            value=json.dumps(updated_aspect.to_obj()).encode(),
+            contentType=JSON_CONTENT_TYPE,
+        )
+        assert wu.get_aspect_of_type(StatusClass) == updated_aspect
+        assert try_from_mcpc.call_count == 2
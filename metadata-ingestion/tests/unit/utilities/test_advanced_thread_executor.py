@@ -1,8 +1,11 @@
 import time
 from concurrent.futures import Future
+from datetime import timedelta
+from typing import List, Optional, Tuple
 
 from datahub.utilities.advanced_thread_executor import (
     BackpressureAwareExecutor,
+    BatchPartitionExecutor,
     PartitionExecutor,
 )
 from datahub.utilities.perf_timer import PerfTimer
@@ -73,6 +76,73 @@ def test_partitioned_executor_bounding():
         assert len(done_tasks) == 16
 
 
+def test_batch_partition_executor():
+    batches: List[List[Tuple[str, int]]] = []
+    executing_keys: List[str] = []
+
+    def process_batch(batch: List[tuple]) -> List[Optional[BaseException]]:
+        keys = [key for key, _ in batch]
+        assert not set(keys) & set(executing_keys), "partitioning not working"
+        executing_keys.extend(keys)
+        batches.append(list(batch))
+        time.sleep(0.1)
+        for key in keys:
+            executing_keys.remove(key)
+        return [ValueError(i) if i % 5 == 0 else None for _, i in batch]
+
+    failed = []
+    succeeded = []
+
+    def on_done(future: Future) -> None:
+        if future.exception():
+            failed.append(future.exception())
+        else:
+            succeeded.append(future)
+
+    with BatchPartitionExecutor(
+        max_workers=2,
+        max_pending=20,
+        process_batch=process_batch,
+        max_per_batch=4,
+        min_process_interval=timedelta(seconds=0.5),
+        read_from_pending_interval=timedelta(seconds=0.05),
+    ) as executor:
+        for i in range(30):
+            key = f"key{i % 3}"
+            executor.submit(key, key, i, done_callback=on_done)
+        executor.flush()
+
+        assert len(failed) == 6
+        assert len(succeeded) == 24
+        assert all(len(batch) <= 4 for batch in batches)
+
+        # Requests with the same key must be processed in submission order.
+        last_seen = {}
+        for batch in batches:
+            for key, i in batch:
+                assert last_seen.get(key, -1) < i
+                last_seen[key] = i
+
+
+def test_batch_partition_executor_whole_batch_failure():
+    def process_batch(batch: List[tuple]) -> None:
+        raise ValueError("batch failed")
+
+    done: List[Future] = []
+    with BatchPartitionExecutor(
+        max_workers=1,
+        max_pending=10,
+        process_batch=process_batch,
+        max_per_batch=10,
+        read_from_pending_interval=timedelta(seconds=0.05),
+    ) as executor:
+        for i in range(5):
+            executor.submit(f"key{i}", i, done_callback=done.append)
+
+    assert len(done) == 5
+    assert all(isinstance(f.exception(), ValueError) for f in done)
+
+
 def test_backpressure_aware_executor_simple():
     def task(i):
         return i
@@ -126,3 +196,38 @@ def test_backpressure_aware_executor_advanced():
         # Validate that the entire process took about 5-10x the task duration.
         # That's because we have 2 workers and 10 tasks.
         assert 5 * task_duration < timer.elapsed_seconds() < 10 * task_duration
+
+
+def test_backpressure_aware_executor_ordered():
+    def task(i: int) -> int:
+        # Earlier tasks take longer, so they'd complete last if run unordered.
+        time.sleep(0.05 * (5 - i))
+        return i
+
+    with PerfTimer() as timer:
+        results = [
+            future.result()
+            for future in BackpressureAwareExecutor.map_ordered(
+                task, ((i,) for i in range(5)), max_workers=5
+            )
+        ]
+    assert results == list(range(5))
+    assert timer.elapsed_seconds() < 0.05 * 5 * 2
+
+
+def test_backpressure_aware_executor_ordered_early_exit():
+    executed = set()
+
+    def task(i: int) -> int:
+        time.sleep(0.1)
+        executed.add(i)
+        return i
+
+    results = BackpressureAwareExecutor.map_ordered(
+        task, ((i,) for i in range(20)), max_workers=2, max_pending=2
+    )
+    assert next(results).result() == 0
+    results.close()  # type: ignore
+
+    # Only the tasks that were already submitted may have run.
+    assert len(executed) <= 3
@@ -1,10 +1,16 @@
+import pickle
 import random
 import re
 import time
 
 import pytest
 
-from datahub.utilities.lossy_collections import LossyDict, LossyList, LossySet
+from datahub.utilities.lossy_collections import (
+    LossyCounter,
+    LossyDict,
+    LossyList,
+    LossySet,
+)
 
 
 @pytest.mark.parametrize("length, sampling", [(10, False), (100, True)])
@@ -81,3 +87,47 @@ def test_lossydict_sampling(length, sampling, sub_length):
 
     for k, v in l.items():
         assert len(v) == element_length_map[k]
+
+
+def test_lossycounter_keeps_heavy_hitters():
+    c: LossyCounter[str] = LossyCounter(max_elements=10)
+    for i in range(5):
+        c[f"item_{i}"] += 1
+    assert not c.sampled
+    assert c["item_0"] == 1
+
+    for i in range(1000):
+        c[f"rare_{i}"] += 1
+        if i % 2 == 0:
+            c["frequent"] += 1
+    c.update(["other_frequent"] * 1000)
+
+    assert c.sampled
+    assert len(c) == 10
+    assert [key for key, _ in c.most_common(2)] == ["other_frequent", "frequent"]
+
+    c2 = pickle.loads(pickle.dumps(c))
+    assert c2 == c
+    assert c2.max_elements == 10
+    c2["new_item"] += 1
+    assert len(c2) == 10
+
+
+def test_lossycounter_evicts_minimum_after_updates_and_deletes():
+    c: LossyCounter[str] = LossyCounter(max_elements=3)
+    c["a"] = 5
+    c["b"] = 1
+    c["c"] = 3
+    # Leaves stale heap entries behind for "b" and "a".
+    c["b"] = 7
+    del c["a"]
+    c["a"] = 2
+
+    c["d"] += 1
+    assert c == {"b": 7, "c": 3, "d": 3}
+
+    # Counts are conserved and the heap stays bounded over a long stream.
+    for i in range(10_000):
+        c[f"key_{i % 50}"] += 1
+    assert sum(c.values()) == 10_000 + 13
+    assert len(c._heap) <= 2 * len(c) + 64
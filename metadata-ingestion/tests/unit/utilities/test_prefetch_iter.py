@@ -0,0 +1,57 @@
+import threading
+import time
+from typing import Iterable, List
+
+import pytest
+
+from datahub.utilities.prefetch_iter import prefetch_iter
+
+
+def test_prefetch_iter_preserves_order():
+    assert list(prefetch_iter(range(100), depth=3)) == list(range(100))
+    assert list(prefetch_iter(range(100), depth=0)) == list(range(100))
+    assert list(prefetch_iter([], depth=2)) == []
+
+
+def test_prefetch_iter_runs_ahead_of_consumer():
+    produced: List[int] = []
+
+    def source() -> Iterable[int]:
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    it = prefetch_iter(source(), depth=2)
+    assert next(it) == 0
+    time.sleep(0.2)
+
+    # The buffer holds two items and the producer is blocked on the third.
+    assert produced == [0, 1, 2, 3]
+    assert list(it) == list(range(1, 10))
+
+
+def test_prefetch_iter_propagates_errors():
+    def source() -> Iterable[int]:
+        yield 1
+        raise ValueError("page failed")
+
+    it = prefetch_iter(source(), depth=2)
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="page failed"):
+        next(it)
+
+
+def test_prefetch_iter_stops_producer_on_close():
+    finished = threading.Event()
+
+    def source() -> Iterable[int]:
+        try:
+            yield from range(1000)
+        finally:
+            finished.set()
+
+    it = prefetch_iter(source(), depth=1)
+    assert next(it) == 0
+    it.close()  # type: ignore
+
+    assert finished.wait(timeout=5)
@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from datahub.utilities import sql_parser
+from datahub.utilities.sql_parser import _ParserWorkerPool
+
+
+def _parse_for_test(
+    queue: Any, sql_query: str, use_raw_names: bool
+) -> Tuple[List[str], List[str], Optional[Tuple[BaseException, str]]]:
+    if sql_query == "hang":
+        time.sleep(60)
+    elif sql_query == "crash":
+        os._exit(1)
+    return [sql_query], [str(os.getpid())], None
+
+
+@pytest.fixture
+def pool():
+    pool = _ParserWorkerPool(size=2, max_queries_per_worker=2, parse_fn=_parse_for_test)
+    yield pool
+    pool.close()
+
+
+def _worker_pid(pool: _ParserWorkerPool, sql_query: str = "select 1") -> str:
+    tables, columns, _ = pool.parse(sql_query, False, timeout=30)
+    assert tables == [sql_query]
+    return columns[0]
+
+
+def test_worker_pool_reuses_and_recycles_workers(pool):
+    pids = [_worker_pid(pool) for _ in range(4)]
+
+    # Each worker handles max_queries_per_worker queries before it is replaced.
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+
+
+def test_worker_pool_timeout(pool):
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        pool.parse("hang", False, timeout=0.5)
+    assert time.perf_counter() - start < 10
+
+    # The hung worker is replaced.
+    _worker_pid(pool)
+
+
+def test_worker_pool_crash_is_detected_immediately(pool):
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match="exited with code 1"):
+        pool.parse("crash", False, timeout=60)
+    assert time.perf_counter() - start < 10
+
+    _worker_pid(pool)
+
+
+def test_worker_pool_failure_does_not_affect_other_queries(pool):
+    errors: List[BaseException] = []
+
+    def run_hang() -> None:
+        try:
+            pool.parse("hang", False, timeout=1)
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run_hang)
+    thread.start()
+    # Meanwhile, the other worker keeps serving queries.
+    for i in range(3):
+        _worker_pid(pool, f"select {i}")
+    assert thread.is_alive()
+    thread.join()
+
+    assert [type(e) for e in errors] == [TimeoutError]
+    _worker_pid(pool)
+
+
+def test_parse_results_are_cached(monkeypatch):
+    calls: List[str] = []
+
+    class _CountingPool:
+        def parse(self, sql_query: str, use_raw_names: bool, timeout: float) -> Any:
+            calls.append(sql_query)
+            if sql_query == "bad":
+                return [], [], (ValueError("bad query"), "traceback")
+            return ["t"], ["c"], None
+
+    monkeypatch.setattr(sql_parser, "_get_pool", _CountingPool)
+    sql_parser._get_tables_columns_cached.cache_clear()
+    try:
+        for _ in range(3):
+            assert sql_parser._get_tables_columns_cached("select 1", False) == (
+                ("t",),
+                ("c",),
+            )
+        assert calls == ["select 1"]
+        assert sql_parser._get_tables_columns_cached.cache_info().hits == 2
+
+        # Failures are not cached.
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Sub-process exception") as e:
+                sql_parser._get_tables_columns_cached("bad", False)
+            assert isinstance(e.value.__cause__, ValueError)
+        assert calls == ["select 1", "bad", "bad"]
+    finally:
+        sql_parser._get_tables_columns_cached.cache_clear()